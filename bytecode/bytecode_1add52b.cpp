@@ -4,76 +4,147 @@
 
 // clang-format off
 #include "bytecode_1add52b.h"
+#include "bytecode/bytecode_instrumentation.h"
+#include "bytecode/bytecode_table.h"
 
-static const Pair<String, Pair<int, int>> funcs[] = {
-	{ "sin", Pair<int, int>(1, 1) },
-	{ "cos", Pair<int, int>(1, 1) },
-	{ "tan", Pair<int, int>(1, 1) },
-	{ "sinh", Pair<int, int>(1, 1) },
-	{ "cosh", Pair<int, int>(1, 1) },
-	{ "tanh", Pair<int, int>(1, 1) },
-	{ "asin", Pair<int, int>(1, 1) },
-	{ "acos", Pair<int, int>(1, 1) },
-	{ "atan", Pair<int, int>(1, 1) },
-	{ "atan2", Pair<int, int>(2, 2) },
-	{ "sqrt", Pair<int, int>(1, 1) },
-	{ "fmod", Pair<int, int>(2, 2) },
-	{ "fposmod", Pair<int, int>(2, 2) },
-	{ "floor", Pair<int, int>(1, 1) },
-	{ "ceil", Pair<int, int>(1, 1) },
-	{ "round", Pair<int, int>(1, 1) },
-	{ "abs", Pair<int, int>(1, 1) },
-	{ "sign", Pair<int, int>(1, 1) },
-	{ "pow", Pair<int, int>(2, 2) },
-	{ "log", Pair<int, int>(1, 1) },
-	{ "exp", Pair<int, int>(1, 1) },
-	{ "is_nan", Pair<int, int>(1, 1) },
-	{ "is_inf", Pair<int, int>(1, 1) },
-	{ "ease", Pair<int, int>(2, 2) },
-	{ "decimals", Pair<int, int>(1, 1) },
-	{ "stepify", Pair<int, int>(2, 2) },
-	{ "lerp", Pair<int, int>(3, 3) },
-	{ "dectime", Pair<int, int>(3, 3) },
-	{ "randomize", Pair<int, int>(0, 0) },
-	{ "randi", Pair<int, int>(0, 0) },
-	{ "randf", Pair<int, int>(0, 0) },
-	{ "rand_range", Pair<int, int>(2, 2) },
-	{ "seed", Pair<int, int>(1, 1) },
-	{ "rand_seed", Pair<int, int>(1, 1) },
-	{ "deg2rad", Pair<int, int>(1, 1) },
-	{ "rad2deg", Pair<int, int>(1, 1) },
-	{ "linear2db", Pair<int, int>(1, 1) },
-	{ "db2linear", Pair<int, int>(1, 1) },
-	{ "max", Pair<int, int>(2, 2) },
-	{ "min", Pair<int, int>(2, 2) },
-	{ "clamp", Pair<int, int>(3, 3) },
-	{ "nearest_po2", Pair<int, int>(1, 1) },
-	{ "weakref", Pair<int, int>(1, 1) },
-	{ "funcref", Pair<int, int>(2, 2) },
-	{ "convert", Pair<int, int>(2, 2) },
-	{ "typeof", Pair<int, int>(1, 1) },
-	{ "type_exists", Pair<int, int>(1, 1) },
-	{ "str", Pair<int, int>(1, INT_MAX) },
-	{ "print", Pair<int, int>(0, INT_MAX) },
-	{ "printt", Pair<int, int>(0, INT_MAX) },
-	{ "prints", Pair<int, int>(0, INT_MAX) },
-	{ "printerr", Pair<int, int>(0, INT_MAX) },
-	{ "printraw", Pair<int, int>(0, INT_MAX) },
-	{ "var2str", Pair<int, int>(1, 1) },
-	{ "str2var", Pair<int, int>(1, 1) },
-	{ "var2bytes", Pair<int, int>(1, 1) },
-	{ "bytes2var", Pair<int, int>(1, 1) },
-	{ "range", Pair<int, int>(1, 3) },
-	{ "load", Pair<int, int>(1, 1) },
-	{ "inst2dict", Pair<int, int>(1, 1) },
-	{ "dict2inst", Pair<int, int>(1, 1) },
-	{ "hash", Pair<int, int>(1, 1) },
-	{ "Color8", Pair<int, int>(3, 4) },
-	{ "print_stack", Pair<int, int>(0, 0) },
-	{ "instance_from_id", Pair<int, int>(1, 1) },
+static constexpr GDScriptDecompFunction funcs[] = {
+	{ "sin", 1, 1 },
+	{ "cos", 1, 1 },
+	{ "tan", 1, 1 },
+	{ "sinh", 1, 1 },
+	{ "cosh", 1, 1 },
+	{ "tanh", 1, 1 },
+	{ "asin", 1, 1 },
+	{ "acos", 1, 1 },
+	{ "atan", 1, 1 },
+	{ "atan2", 2, 2 },
+	{ "sqrt", 1, 1 },
+	{ "fmod", 2, 2 },
+	{ "fposmod", 2, 2 },
+	{ "floor", 1, 1 },
+	{ "ceil", 1, 1 },
+	{ "round", 1, 1 },
+	{ "abs", 1, 1 },
+	{ "sign", 1, 1 },
+	{ "pow", 2, 2 },
+	{ "log", 1, 1 },
+	{ "exp", 1, 1 },
+	{ "is_nan", 1, 1 },
+	{ "is_inf", 1, 1 },
+	{ "ease", 2, 2 },
+	{ "decimals", 1, 1 },
+	{ "stepify", 2, 2 },
+	{ "lerp", 3, 3 },
+	{ "dectime", 3, 3 },
+	{ "randomize", 0, 0 },
+	{ "randi", 0, 0 },
+	{ "randf", 0, 0 },
+	{ "rand_range", 2, 2 },
+	{ "seed", 1, 1 },
+	{ "rand_seed", 1, 1 },
+	{ "deg2rad", 1, 1 },
+	{ "rad2deg", 1, 1 },
+	{ "linear2db", 1, 1 },
+	{ "db2linear", 1, 1 },
+	{ "max", 2, 2 },
+	{ "min", 2, 2 },
+	{ "clamp", 3, 3 },
+	{ "nearest_po2", 1, 1 },
+	{ "weakref", 1, 1 },
+	{ "funcref", 2, 2 },
+	{ "convert", 2, 2 },
+	{ "typeof", 1, 1 },
+	{ "type_exists", 1, 1 },
+	{ "str", 1, INT_MAX },
+	{ "print", 0, INT_MAX },
+	{ "printt", 0, INT_MAX },
+	{ "prints", 0, INT_MAX },
+	{ "printerr", 0, INT_MAX },
+	{ "printraw", 0, INT_MAX },
+	{ "var2str", 1, 1 },
+	{ "str2var", 1, 1 },
+	{ "var2bytes", 1, 1 },
+	{ "bytes2var", 1, 1 },
+	{ "range", 1, 3 },
+	{ "load", 1, 1 },
+	{ "inst2dict", 1, 1 },
+	{ "dict2inst", 1, 1 },
+	{ "hash", 1, 1 },
+	{ "Color8", 3, 4 },
+	{ "print_stack", 0, 0 },
+	{ "instance_from_id", 1, 1 },
+};
+
+static constexpr int num_funcs = sizeof(funcs) / sizeof(funcs[0]);
+
+static constexpr int funcs_sorted[] = {
+	62, // Color8
+	16, // abs
+	7, // acos
+	6, // asin
+	8, // atan
+	9, // atan2
+	56, // bytes2var
+	14, // ceil
+	40, // clamp
+	44, // convert
+	1, // cos
+	4, // cosh
+	37, // db2linear
+	24, // decimals
+	27, // dectime
+	34, // deg2rad
+	60, // dict2inst
+	23, // ease
+	20, // exp
+	13, // floor
+	11, // fmod
+	12, // fposmod
+	43, // funcref
+	61, // hash
+	59, // inst2dict
+	64, // instance_from_id
+	22, // is_inf
+	21, // is_nan
+	26, // lerp
+	36, // linear2db
+	58, // load
+	19, // log
+	38, // max
+	39, // min
+	41, // nearest_po2
+	18, // pow
+	48, // print
+	63, // print_stack
+	51, // printerr
+	52, // printraw
+	50, // prints
+	49, // printt
+	35, // rad2deg
+	31, // rand_range
+	33, // rand_seed
+	30, // randf
+	29, // randi
+	28, // randomize
+	57, // range
+	15, // round
+	32, // seed
+	17, // sign
+	0, // sin
+	3, // sinh
+	10, // sqrt
+	25, // stepify
+	47, // str
+	54, // str2var
+	2, // tan
+	5, // tanh
+	46, // type_exists
+	45, // typeof
+	55, // var2bytes
+	53, // var2str
+	42, // weakref
 };
 
-static constexpr int num_funcs = sizeof(funcs) / sizeof(Pair<String, Pair<int, int>>);
 enum Token {
 	TK_EMPTY,
 	TK_IDENTIFIER,
@@ -167,10 +238,11 @@ int GDScriptDecomp_1add52b::get_token_max() const {
 	return TK_MAX;
 }
 String GDScriptDecomp_1add52b::get_function_name(int p_func) const {
+	GDRE_INSTRUMENT_LOOKUP(bytecode_rev, LOOKUP_GET_FUNCTION_NAME);
 	if (p_func < 0 || p_func >= num_funcs) {
 		return "";
 	}
-	return funcs[p_func].first;
+	return funcs[p_func].name;
 }
 
 int GDScriptDecomp_1add52b::get_function_count() const {
@@ -180,206 +252,256 @@ Pair<int, int> GDScriptDecomp_1add52b::get_function_arg_count(int p_func) const
 	if (p_func < 0 || p_func >= num_funcs) {
 		return Pair<int, int>(-1, -1);
 	}
-	return funcs[p_func].second;
+	return Pair<int, int>(funcs[p_func].min_args, funcs[p_func].max_args);
 }
 
 
 int GDScriptDecomp_1add52b::get_function_index(const String &p_func) const {
-	for (int i = 0; i < num_funcs; i++) {
-		if (funcs[i].first == p_func) {
-			return i;
+	GDRE_INSTRUMENT_LOOKUP(bytecode_rev, LOOKUP_GET_FUNCTION_INDEX);
+	int lo = 0;
+	int hi = num_funcs;
+	while (lo < hi) {
+		int mid = (lo + hi) / 2;
+		const char *name = funcs[funcs_sorted[mid]].name;
+		if (p_func == name) {
+			return funcs_sorted[mid];
+		}
+		if (p_func < name) {
+			hi = mid;
+		} else {
+			lo = mid + 1;
 		}
 	}
 	return -1;
 }
 
+static constexpr GDScriptDecomp::GlobalToken local_to_global[] = {
+	GDScriptDecomp::GlobalToken::G_TK_EMPTY, // TK_EMPTY
+	GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER, // TK_IDENTIFIER
+	GDScriptDecomp::GlobalToken::G_TK_CONSTANT, // TK_CONSTANT
+	GDScriptDecomp::GlobalToken::G_TK_SELF, // TK_SELF
+	GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE, // TK_BUILT_IN_TYPE
+	GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC, // TK_BUILT_IN_FUNC
+	GDScriptDecomp::GlobalToken::G_TK_OP_IN, // TK_OP_IN
+	GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL, // TK_OP_EQUAL
+	GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL, // TK_OP_NOT_EQUAL
+	GDScriptDecomp::GlobalToken::G_TK_OP_LESS, // TK_OP_LESS
+	GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL, // TK_OP_LESS_EQUAL
+	GDScriptDecomp::GlobalToken::G_TK_OP_GREATER, // TK_OP_GREATER
+	GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL, // TK_OP_GREATER_EQUAL
+	GDScriptDecomp::GlobalToken::G_TK_OP_AND, // TK_OP_AND
+	GDScriptDecomp::GlobalToken::G_TK_OP_OR, // TK_OP_OR
+	GDScriptDecomp::GlobalToken::G_TK_OP_NOT, // TK_OP_NOT
+	GDScriptDecomp::GlobalToken::G_TK_OP_ADD, // TK_OP_ADD
+	GDScriptDecomp::GlobalToken::G_TK_OP_SUB, // TK_OP_SUB
+	GDScriptDecomp::GlobalToken::G_TK_OP_MUL, // TK_OP_MUL
+	GDScriptDecomp::GlobalToken::G_TK_OP_DIV, // TK_OP_DIV
+	GDScriptDecomp::GlobalToken::G_TK_OP_MOD, // TK_OP_MOD
+	GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT, // TK_OP_SHIFT_LEFT
+	GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT, // TK_OP_SHIFT_RIGHT
+	GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN, // TK_OP_ASSIGN
+	GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD, // TK_OP_ASSIGN_ADD
+	GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB, // TK_OP_ASSIGN_SUB
+	GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL, // TK_OP_ASSIGN_MUL
+	GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV, // TK_OP_ASSIGN_DIV
+	GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD, // TK_OP_ASSIGN_MOD
+	GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT, // TK_OP_ASSIGN_SHIFT_LEFT
+	GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT, // TK_OP_ASSIGN_SHIFT_RIGHT
+	GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND, // TK_OP_ASSIGN_BIT_AND
+	GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR, // TK_OP_ASSIGN_BIT_OR
+	GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR, // TK_OP_ASSIGN_BIT_XOR
+	GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND, // TK_OP_BIT_AND
+	GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR, // TK_OP_BIT_OR
+	GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR, // TK_OP_BIT_XOR
+	GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT, // TK_OP_BIT_INVERT
+	GDScriptDecomp::GlobalToken::G_TK_CF_IF, // TK_CF_IF
+	GDScriptDecomp::GlobalToken::G_TK_CF_ELIF, // TK_CF_ELIF
+	GDScriptDecomp::GlobalToken::G_TK_CF_ELSE, // TK_CF_ELSE
+	GDScriptDecomp::GlobalToken::G_TK_CF_FOR, // TK_CF_FOR
+	GDScriptDecomp::GlobalToken::G_TK_CF_DO, // TK_CF_DO
+	GDScriptDecomp::GlobalToken::G_TK_CF_WHILE, // TK_CF_WHILE
+	GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH, // TK_CF_SWITCH
+	GDScriptDecomp::GlobalToken::G_TK_CF_CASE, // TK_CF_CASE
+	GDScriptDecomp::GlobalToken::G_TK_CF_BREAK, // TK_CF_BREAK
+	GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE, // TK_CF_CONTINUE
+	GDScriptDecomp::GlobalToken::G_TK_CF_PASS, // TK_CF_PASS
+	GDScriptDecomp::GlobalToken::G_TK_CF_RETURN, // TK_CF_RETURN
+	GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION, // TK_PR_FUNCTION
+	GDScriptDecomp::GlobalToken::G_TK_PR_CLASS, // TK_PR_CLASS
+	GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS, // TK_PR_EXTENDS
+	GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY, // TK_PR_ONREADY
+	GDScriptDecomp::GlobalToken::G_TK_PR_TOOL, // TK_PR_TOOL
+	GDScriptDecomp::GlobalToken::G_TK_PR_STATIC, // TK_PR_STATIC
+	GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT, // TK_PR_EXPORT
+	GDScriptDecomp::GlobalToken::G_TK_PR_SETGET, // TK_PR_SETGET
+	GDScriptDecomp::GlobalToken::G_TK_PR_CONST, // TK_PR_CONST
+	GDScriptDecomp::GlobalToken::G_TK_PR_VAR, // TK_PR_VAR
+	GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD, // TK_PR_PRELOAD
+	GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT, // TK_PR_ASSERT
+	GDScriptDecomp::GlobalToken::G_TK_PR_YIELD, // TK_PR_YIELD
+	GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL, // TK_PR_SIGNAL
+	GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT, // TK_PR_BREAKPOINT
+	GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE, // TK_PR_REMOTE
+	GDScriptDecomp::GlobalToken::G_TK_PR_SYNC, // TK_PR_SYNC
+	GDScriptDecomp::GlobalToken::G_TK_PR_MASTER, // TK_PR_MASTER
+	GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE, // TK_PR_SLAVE
+	GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN, // TK_BRACKET_OPEN
+	GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE, // TK_BRACKET_CLOSE
+	GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN, // TK_CURLY_BRACKET_OPEN
+	GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE, // TK_CURLY_BRACKET_CLOSE
+	GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN, // TK_PARENTHESIS_OPEN
+	GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE, // TK_PARENTHESIS_CLOSE
+	GDScriptDecomp::GlobalToken::G_TK_COMMA, // TK_COMMA
+	GDScriptDecomp::GlobalToken::G_TK_SEMICOLON, // TK_SEMICOLON
+	GDScriptDecomp::GlobalToken::G_TK_PERIOD, // TK_PERIOD
+	GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK, // TK_QUESTION_MARK
+	GDScriptDecomp::GlobalToken::G_TK_COLON, // TK_COLON
+	GDScriptDecomp::GlobalToken::G_TK_NEWLINE, // TK_NEWLINE
+	GDScriptDecomp::GlobalToken::G_TK_CONST_PI, // TK_CONST_PI
+	GDScriptDecomp::GlobalToken::G_TK_ERROR, // TK_ERROR
+	GDScriptDecomp::GlobalToken::G_TK_EOF, // TK_EOF
+	GDScriptDecomp::GlobalToken::G_TK_CURSOR, // TK_CURSOR
+};
+static_assert(sizeof(local_to_global) / sizeof(local_to_global[0]) == TK_MAX);
+
+static constexpr int global_to_local[] = {
+	TK_EMPTY, // G_TK_EMPTY
+	TK_IDENTIFIER, // G_TK_IDENTIFIER
+	TK_CONSTANT, // G_TK_CONSTANT
+	TK_SELF, // G_TK_SELF
+	TK_BUILT_IN_TYPE, // G_TK_BUILT_IN_TYPE
+	TK_BUILT_IN_FUNC, // G_TK_BUILT_IN_FUNC
+	TK_OP_IN, // G_TK_OP_IN
+	TK_OP_EQUAL, // G_TK_OP_EQUAL
+	TK_OP_NOT_EQUAL, // G_TK_OP_NOT_EQUAL
+	TK_OP_LESS, // G_TK_OP_LESS
+	TK_OP_LESS_EQUAL, // G_TK_OP_LESS_EQUAL
+	TK_OP_GREATER, // G_TK_OP_GREATER
+	TK_OP_GREATER_EQUAL, // G_TK_OP_GREATER_EQUAL
+	TK_OP_AND, // G_TK_OP_AND
+	TK_OP_OR, // G_TK_OP_OR
+	TK_OP_NOT, // G_TK_OP_NOT
+	TK_OP_ADD, // G_TK_OP_ADD
+	TK_OP_SUB, // G_TK_OP_SUB
+	TK_OP_MUL, // G_TK_OP_MUL
+	TK_OP_DIV, // G_TK_OP_DIV
+	TK_OP_MOD, // G_TK_OP_MOD
+	TK_OP_SHIFT_LEFT, // G_TK_OP_SHIFT_LEFT
+	TK_OP_SHIFT_RIGHT, // G_TK_OP_SHIFT_RIGHT
+	TK_OP_ASSIGN, // G_TK_OP_ASSIGN
+	TK_OP_ASSIGN_ADD, // G_TK_OP_ASSIGN_ADD
+	TK_OP_ASSIGN_SUB, // G_TK_OP_ASSIGN_SUB
+	TK_OP_ASSIGN_MUL, // G_TK_OP_ASSIGN_MUL
+	TK_OP_ASSIGN_DIV, // G_TK_OP_ASSIGN_DIV
+	TK_OP_ASSIGN_MOD, // G_TK_OP_ASSIGN_MOD
+	TK_OP_ASSIGN_SHIFT_LEFT, // G_TK_OP_ASSIGN_SHIFT_LEFT
+	TK_OP_ASSIGN_SHIFT_RIGHT, // G_TK_OP_ASSIGN_SHIFT_RIGHT
+	TK_OP_ASSIGN_BIT_AND, // G_TK_OP_ASSIGN_BIT_AND
+	TK_OP_ASSIGN_BIT_OR, // G_TK_OP_ASSIGN_BIT_OR
+	TK_OP_ASSIGN_BIT_XOR, // G_TK_OP_ASSIGN_BIT_XOR
+	TK_OP_BIT_AND, // G_TK_OP_BIT_AND
+	TK_OP_BIT_OR, // G_TK_OP_BIT_OR
+	TK_OP_BIT_XOR, // G_TK_OP_BIT_XOR
+	TK_OP_BIT_INVERT, // G_TK_OP_BIT_INVERT
+	TK_CF_IF, // G_TK_CF_IF
+	TK_CF_ELIF, // G_TK_CF_ELIF
+	TK_CF_ELSE, // G_TK_CF_ELSE
+	TK_CF_FOR, // G_TK_CF_FOR
+	TK_CF_WHILE, // G_TK_CF_WHILE
+	TK_CF_BREAK, // G_TK_CF_BREAK
+	TK_CF_CONTINUE, // G_TK_CF_CONTINUE
+	TK_CF_PASS, // G_TK_CF_PASS
+	TK_CF_RETURN, // G_TK_CF_RETURN
+	-1, // G_TK_CF_MATCH
+	TK_PR_FUNCTION, // G_TK_PR_FUNCTION
+	TK_PR_CLASS, // G_TK_PR_CLASS
+	-1, // G_TK_PR_CLASS_NAME
+	TK_PR_EXTENDS, // G_TK_PR_EXTENDS
+	-1, // G_TK_PR_IS
+	TK_PR_ONREADY, // G_TK_PR_ONREADY
+	TK_PR_TOOL, // G_TK_PR_TOOL
+	TK_PR_STATIC, // G_TK_PR_STATIC
+	TK_PR_EXPORT, // G_TK_PR_EXPORT
+	TK_PR_SETGET, // G_TK_PR_SETGET
+	TK_PR_CONST, // G_TK_PR_CONST
+	TK_PR_VAR, // G_TK_PR_VAR
+	-1, // G_TK_PR_AS
+	-1, // G_TK_PR_VOID
+	-1, // G_TK_PR_ENUM
+	TK_PR_PRELOAD, // G_TK_PR_PRELOAD
+	TK_PR_ASSERT, // G_TK_PR_ASSERT
+	TK_PR_YIELD, // G_TK_PR_YIELD
+	TK_PR_SIGNAL, // G_TK_PR_SIGNAL
+	TK_PR_BREAKPOINT, // G_TK_PR_BREAKPOINT
+	TK_PR_REMOTE, // G_TK_PR_REMOTE
+	TK_PR_SYNC, // G_TK_PR_SYNC
+	TK_PR_MASTER, // G_TK_PR_MASTER
+	TK_PR_SLAVE, // G_TK_PR_SLAVE
+	-1, // G_TK_PR_PUPPET
+	-1, // G_TK_PR_REMOTESYNC
+	-1, // G_TK_PR_MASTERSYNC
+	-1, // G_TK_PR_PUPPETSYNC
+	TK_BRACKET_OPEN, // G_TK_BRACKET_OPEN
+	TK_BRACKET_CLOSE, // G_TK_BRACKET_CLOSE
+	TK_CURLY_BRACKET_OPEN, // G_TK_CURLY_BRACKET_OPEN
+	TK_CURLY_BRACKET_CLOSE, // G_TK_CURLY_BRACKET_CLOSE
+	TK_PARENTHESIS_OPEN, // G_TK_PARENTHESIS_OPEN
+	TK_PARENTHESIS_CLOSE, // G_TK_PARENTHESIS_CLOSE
+	TK_COMMA, // G_TK_COMMA
+	TK_SEMICOLON, // G_TK_SEMICOLON
+	TK_PERIOD, // G_TK_PERIOD
+	TK_QUESTION_MARK, // G_TK_QUESTION_MARK
+	TK_COLON, // G_TK_COLON
+	-1, // G_TK_DOLLAR
+	-1, // G_TK_FORWARD_ARROW
+	TK_NEWLINE, // G_TK_NEWLINE
+	TK_CONST_PI, // G_TK_CONST_PI
+	-1, // G_TK_CONST_TAU
+	-1, // G_TK_WILDCARD
+	-1, // G_TK_CONST_INF
+	-1, // G_TK_CONST_NAN
+	TK_ERROR, // G_TK_ERROR
+	TK_EOF, // G_TK_EOF
+	TK_CURSOR, // G_TK_CURSOR
+	-1, // G_TK_PR_SLAVESYNC
+	TK_CF_DO, // G_TK_CF_DO
+	TK_CF_CASE, // G_TK_CF_CASE
+	TK_CF_SWITCH, // G_TK_CF_SWITCH
+	-1, // G_TK_ANNOTATION
+	-1, // G_TK_AMPERSAND_AMPERSAND
+	-1, // G_TK_PIPE_PIPE
+	-1, // G_TK_BANG
+	-1, // G_TK_STAR_STAR
+	-1, // G_TK_STAR_STAR_EQUAL
+	-1, // G_TK_CF_WHEN
+	-1, // G_TK_PR_AWAIT
+	-1, // G_TK_PR_NAMESPACE
+	-1, // G_TK_PR_SUPER
+	-1, // G_TK_PR_TRAIT
+	-1, // G_TK_PERIOD_PERIOD
+	-1, // G_TK_UNDERSCORE
+	-1, // G_TK_INDENT
+	-1, // G_TK_DEDENT
+	-1, // G_TK_VCS_CONFLICT_MARKER
+	-1, // G_TK_BACKTICK
+	TK_MAX, // G_TK_MAX
+};
+static_assert(sizeof(global_to_local) / sizeof(global_to_local[0]) == GDScriptDecomp::GlobalToken::G_TK_MAX + 1);
+
 GDScriptDecomp::GlobalToken GDScriptDecomp_1add52b::get_global_token(int p_token) const {
+	GDRE_INSTRUMENT_LOOKUP(bytecode_rev, LOOKUP_GET_GLOBAL_TOKEN);
 	p_token = p_token & TOKEN_MASK;
-	if (p_token < 0 || p_token >= TK_MAX) {
+	if (p_token >= TK_MAX) {
 		return GDScriptDecomp::GlobalToken::G_TK_MAX;
 	}
-	switch(Token(p_token)) {
-		case TK_EMPTY: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
-		case TK_IDENTIFIER: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
-		case TK_CONSTANT: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
-		case TK_SELF: return GDScriptDecomp::GlobalToken::G_TK_SELF;
-		case TK_BUILT_IN_TYPE: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
-		case TK_BUILT_IN_FUNC: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
-		case TK_OP_IN: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
-		case TK_OP_EQUAL: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
-		case TK_OP_NOT_EQUAL: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
-		case TK_OP_LESS: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
-		case TK_OP_LESS_EQUAL: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
-		case TK_OP_GREATER: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
-		case TK_OP_GREATER_EQUAL: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
-		case TK_OP_AND: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
-		case TK_OP_OR: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
-		case TK_OP_NOT: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
-		case TK_OP_ADD: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
-		case TK_OP_SUB: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
-		case TK_OP_MUL: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
-		case TK_OP_DIV: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
-		case TK_OP_MOD: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
-		case TK_OP_SHIFT_LEFT: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
-		case TK_OP_SHIFT_RIGHT: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
-		case TK_OP_ASSIGN: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
-		case TK_OP_ASSIGN_ADD: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
-		case TK_OP_ASSIGN_SUB: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
-		case TK_OP_ASSIGN_MUL: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
-		case TK_OP_ASSIGN_DIV: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
-		case TK_OP_ASSIGN_MOD: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
-		case TK_OP_ASSIGN_SHIFT_LEFT: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
-		case TK_OP_ASSIGN_SHIFT_RIGHT: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
-		case TK_OP_ASSIGN_BIT_AND: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
-		case TK_OP_ASSIGN_BIT_OR: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
-		case TK_OP_ASSIGN_BIT_XOR: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
-		case TK_OP_BIT_AND: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
-		case TK_OP_BIT_OR: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
-		case TK_OP_BIT_XOR: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
-		case TK_OP_BIT_INVERT: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
-		case TK_CF_IF: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
-		case TK_CF_ELIF: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
-		case TK_CF_ELSE: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
-		case TK_CF_FOR: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
-		case TK_CF_DO: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
-		case TK_CF_WHILE: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
-		case TK_CF_SWITCH: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
-		case TK_CF_CASE: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
-		case TK_CF_BREAK: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
-		case TK_CF_CONTINUE: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
-		case TK_CF_PASS: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
-		case TK_CF_RETURN: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
-		case TK_PR_FUNCTION: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
-		case TK_PR_CLASS: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
-		case TK_PR_EXTENDS: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
-		case TK_PR_ONREADY: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
-		case TK_PR_TOOL: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
-		case TK_PR_STATIC: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
-		case TK_PR_EXPORT: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
-		case TK_PR_SETGET: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
-		case TK_PR_CONST: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
-		case TK_PR_VAR: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
-		case TK_PR_PRELOAD: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
-		case TK_PR_ASSERT: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
-		case TK_PR_YIELD: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
-		case TK_PR_SIGNAL: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
-		case TK_PR_BREAKPOINT: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
-		case TK_PR_REMOTE: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
-		case TK_PR_SYNC: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
-		case TK_PR_MASTER: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
-		case TK_PR_SLAVE: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
-		case TK_BRACKET_OPEN: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
-		case TK_BRACKET_CLOSE: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
-		case TK_CURLY_BRACKET_OPEN: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
-		case TK_CURLY_BRACKET_CLOSE: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
-		case TK_PARENTHESIS_OPEN: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
-		case TK_PARENTHESIS_CLOSE: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
-		case TK_COMMA: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
-		case TK_SEMICOLON: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
-		case TK_PERIOD: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
-		case TK_QUESTION_MARK: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
-		case TK_COLON: return GDScriptDecomp::GlobalToken::G_TK_COLON;
-		case TK_NEWLINE: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
-		case TK_CONST_PI: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
-		case TK_ERROR: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
-		case TK_EOF: return GDScriptDecomp::GlobalToken::G_TK_EOF;
-		case TK_CURSOR: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
-		case TK_MAX: return GDScriptDecomp::GlobalToken::G_TK_MAX;
-		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
-	}
-	return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	return local_to_global[p_token];
 }
 
 int GDScriptDecomp_1add52b::get_local_token_val(GDScriptDecomp::GlobalToken p_token) const {
-	switch(p_token) {
-		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return (int) TK_EMPTY;
-		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return (int) TK_IDENTIFIER;
-		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return (int) TK_CONSTANT;
-		case GDScriptDecomp::GlobalToken::G_TK_SELF: return (int) TK_SELF;
-		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return (int) TK_BUILT_IN_TYPE;
-		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return (int) TK_BUILT_IN_FUNC;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return (int) TK_OP_IN;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return (int) TK_OP_EQUAL;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return (int) TK_OP_NOT_EQUAL;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return (int) TK_OP_LESS;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return (int) TK_OP_LESS_EQUAL;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return (int) TK_OP_GREATER;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return (int) TK_OP_GREATER_EQUAL;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return (int) TK_OP_AND;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return (int) TK_OP_OR;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return (int) TK_OP_NOT;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return (int) TK_OP_ADD;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return (int) TK_OP_SUB;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return (int) TK_OP_MUL;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return (int) TK_OP_DIV;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return (int) TK_OP_MOD;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return (int) TK_OP_SHIFT_LEFT;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return (int) TK_OP_SHIFT_RIGHT;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return (int) TK_OP_ASSIGN;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return (int) TK_OP_ASSIGN_ADD;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return (int) TK_OP_ASSIGN_SUB;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return (int) TK_OP_ASSIGN_MUL;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return (int) TK_OP_ASSIGN_DIV;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return (int) TK_OP_ASSIGN_MOD;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return (int) TK_OP_ASSIGN_SHIFT_LEFT;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return (int) TK_OP_ASSIGN_SHIFT_RIGHT;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return (int) TK_OP_ASSIGN_BIT_AND;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return (int) TK_OP_ASSIGN_BIT_OR;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return (int) TK_OP_ASSIGN_BIT_XOR;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return (int) TK_OP_BIT_AND;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return (int) TK_OP_BIT_OR;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return (int) TK_OP_BIT_XOR;
-		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return (int) TK_OP_BIT_INVERT;
-		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return (int) TK_CF_IF;
-		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return (int) TK_CF_ELIF;
-		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return (int) TK_CF_ELSE;
-		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return (int) TK_CF_FOR;
-		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return (int) TK_CF_DO;
-		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return (int) TK_CF_WHILE;
-		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return (int) TK_CF_SWITCH;
-		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return (int) TK_CF_CASE;
-		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return (int) TK_CF_BREAK;
-		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return (int) TK_CF_CONTINUE;
-		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return (int) TK_CF_PASS;
-		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return (int) TK_CF_RETURN;
-		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return (int) TK_PR_FUNCTION;
-		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return (int) TK_PR_CLASS;
-		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return (int) TK_PR_EXTENDS;
-		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return (int) TK_PR_ONREADY;
-		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return (int) TK_PR_TOOL;
-		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return (int) TK_PR_STATIC;
-		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return (int) TK_PR_EXPORT;
-		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return (int) TK_PR_SETGET;
-		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return (int) TK_PR_CONST;
-		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return (int) TK_PR_VAR;
-		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return (int) TK_PR_PRELOAD;
-		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return (int) TK_PR_ASSERT;
-		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return (int) TK_PR_YIELD;
-		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return (int) TK_PR_SIGNAL;
-		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return (int) TK_PR_BREAKPOINT;
-		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return (int) TK_PR_REMOTE;
-		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return (int) TK_PR_SYNC;
-		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return (int) TK_PR_MASTER;
-		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return (int) TK_PR_SLAVE;
-		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return (int) TK_BRACKET_OPEN;
-		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return (int) TK_BRACKET_CLOSE;
-		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return (int) TK_CURLY_BRACKET_OPEN;
-		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return (int) TK_CURLY_BRACKET_CLOSE;
-		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return (int) TK_PARENTHESIS_OPEN;
-		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return (int) TK_PARENTHESIS_CLOSE;
-		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return (int) TK_COMMA;
-		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return (int) TK_SEMICOLON;
-		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return (int) TK_PERIOD;
-		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return (int) TK_QUESTION_MARK;
-		case GDScriptDecomp::GlobalToken::G_TK_COLON: return (int) TK_COLON;
-		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return (int) TK_NEWLINE;
-		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return (int) TK_CONST_PI;
-		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return (int) TK_ERROR;
-		case GDScriptDecomp::GlobalToken::G_TK_EOF: return (int) TK_EOF;
-		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return (int) TK_CURSOR;
-		case GDScriptDecomp::GlobalToken::G_TK_MAX: return (int) TK_MAX;
-		default: return -1;
+	GDRE_INSTRUMENT_LOOKUP(bytecode_rev, LOOKUP_GET_LOCAL_TOKEN_VAL);
+	if ((unsigned int)p_token > GDScriptDecomp::GlobalToken::G_TK_MAX) {
+		return -1;
 	}
-	return -1;
+	return global_to_local[p_token];
 }
 
@@ -4,6 +4,7 @@
 
 #include "bytecode_base.h"
 
+#include "bytecode/bytecode_instrumentation.h"
 #include "bytecode/bytecode_versions.h"
 #include "bytecode/gdscript_tokenizer_compat.h"
 #include "compat/file_access_encrypted_v3.h"
@@ -17,6 +18,7 @@
 #include "core/error/error_macros.h"
 #include "core/io/file_access.h"
 #include "core/io/file_access_encrypted.h"
+#include "core/io/json.h"
 #include "core/io/marshalls.h"
 #include "core/object/class_db.h"
 #include "modules/gdscript/gdscript_tokenizer_buffer.h"
@@ -69,6 +71,11 @@ void GDScriptDecomp::_bind_methods() {
 	ClassDB::bind_static_method("GDScriptDecomp", D_METHOD("read_bytecode_version", "path"), &GDScriptDecomp::read_bytecode_version);
 	ClassDB::bind_static_method("GDScriptDecomp", D_METHOD("read_bytecode_version_encrypted", "path", "engine_ver_major", "key"), &GDScriptDecomp::read_bytecode_version_encrypted);
 	ClassDB::bind_static_method("GDScriptDecomp", D_METHOD("get_bytecode_versions"), &GDScriptDecomp::get_bytecode_versions);
+	ClassDB::bind_static_method("GDScriptDecomp", D_METHOD("is_lookup_instrumentation_enabled"), &GDScriptDecomp::is_lookup_instrumentation_enabled);
+	ClassDB::bind_static_method("GDScriptDecomp", D_METHOD("set_lookup_timing_enabled", "enabled"), &GDScriptDecomp::set_lookup_timing_enabled);
+	ClassDB::bind_static_method("GDScriptDecomp", D_METHOD("get_lookup_counts"), &GDScriptDecomp::get_lookup_counts);
+	ClassDB::bind_static_method("GDScriptDecomp", D_METHOD("get_lookup_counts_json"), &GDScriptDecomp::get_lookup_counts_json);
+	ClassDB::bind_static_method("GDScriptDecomp", D_METHOD("reset_lookup_counts"), &GDScriptDecomp::reset_lookup_counts);
 }
 
 void GDScriptDecomp::_ensure_space(String &p_code) {
@@ -371,6 +378,10 @@ Ref<GDScriptDecomp> GDScriptDecomp::create_decomp_for_commit(uint64_t p_commit_h
 	return Ref<GDScriptDecomp>(::create_decomp_for_commit(p_commit_hash));
 }
 
+Ref<GDScriptDecomp> GDScriptDecomp::get_shared_decomp_for_commit(uint64_t p_commit_hash) {
+	return ::get_shared_decomp_for_commit(p_commit_hash);
+}
+
 int GDScriptDecomp::read_bytecode_version(const String &p_path) {
 	Vector<uint8_t> p_buffer;
 	Ref<FileAccess> f = FileAccess::open(p_path, FileAccess::READ);
@@ -1206,7 +1217,27 @@ bool GDScriptDecomp::is_token_builtin_func(int p_pos, const Vector<uint32_t> &p_
 	return is_token_func_call(p_pos, p_tokens);
 }
 
+GDScriptDecomp::BytecodeTestResult GDScriptDecomp::test_script_state(const ScriptState &p_state, bool print_verbose) {
+	int p_token_max = 0;
+	int p_func_max = 0;
+	return _test_script_state(p_state, p_token_max, p_func_max, print_verbose);
+}
+
 GDScriptDecomp::BytecodeTestResult GDScriptDecomp::_test_bytecode(Vector<uint8_t> p_buffer, int &r_tok_max, int &r_func_max, bool print_verbosely) {
+	error_message = "";
+	ScriptState script_state;
+	//Load bytecode
+	Error err = get_script_state(p_buffer, script_state);
+	if (err) {
+		if (print_verbosely) {
+			print_line(vformat("Bytecode test for %s (%07x) failed on line %d: ", get_engine_version(), get_bytecode_rev(), 0) + "Failed to get identifiers, constants, and tokens");
+		}
+		return BytecodeTestResult::BYTECODE_TEST_CORRUPT;
+	}
+	return _test_script_state(script_state, r_tok_max, r_func_max, print_verbosely);
+}
+
+GDScriptDecomp::BytecodeTestResult GDScriptDecomp::_test_script_state(const ScriptState &script_state, int &r_tok_max, int &r_func_max, bool print_verbosely) {
 #define ERR_TEST_FAILED(x)            \
 	error_message = x;                \
 	if (print_verbosely) {            \
@@ -1231,20 +1262,11 @@ GDScriptDecomp::BytecodeTestResult GDScriptDecomp::_test_bytecode(Vector<uint8_t
 		return p_id == -1 ? "preload" : get_function_name(p_id);
 	};
 
-	ScriptState script_state;
-	//Load bytecode
-	Error err = get_script_state(p_buffer, script_state);
-	if (err) {
-		if (print_verbosely) {
-			print_failed_verbose_func("Failed to get identifiers, constants, and tokens");
-		}
-		return BytecodeTestResult::BYTECODE_TEST_CORRUPT;
-	}
-	Vector<StringName> &identifiers = script_state.identifiers;
-	Vector<Variant> &constants = script_state.constants;
-	Vector<uint32_t> &tokens = script_state.tokens;
-	VMap<uint32_t, uint32_t> &lines = script_state.lines;
-	VMap<uint32_t, uint32_t> &columns = script_state.columns;
+	const Vector<StringName> &identifiers = script_state.identifiers;
+	const Vector<Variant> &constants = script_state.constants;
+	const Vector<uint32_t> &tokens = script_state.tokens;
+	const VMap<uint32_t, uint32_t> &lines = script_state.lines;
+	const VMap<uint32_t, uint32_t> &columns = script_state.columns;
 	int version = script_state.bytecode_version;
 	int bytecode_version = get_bytecode_version();
 	int FUNC_MAX = get_function_count();
@@ -1253,7 +1275,6 @@ GDScriptDecomp::BytecodeTestResult GDScriptDecomp::_test_bytecode(Vector<uint8_t
 		ERR_TEST_FAILED("Bytecode version mismatch: " + itos(version) + " != " + itos(bytecode_version));
 	}
 
-	ERR_FAIL_COND_V_MSG(err != OK, BYTECODE_TEST_CORRUPT, "Failed to get identifiers, constants, and tokens");
 	auto get_line_func([&](int i) {
 		if (lines.has(i)) {
 			return lines[i];
@@ -1748,57 +1769,52 @@ Vector<String> GDScriptDecomp::get_bytecode_versions() {
 	return ret;
 }
 
+bool GDScriptDecomp::is_lookup_instrumentation_enabled() {
+	return GDScriptDecompInstrumentation::is_enabled();
+}
+
+void GDScriptDecomp::set_lookup_timing_enabled(bool p_enabled) {
+	GDScriptDecompInstrumentation::set_timing_enabled(p_enabled);
+}
+
+Dictionary GDScriptDecomp::get_lookup_counts() {
+	return GDScriptDecompInstrumentation::get_counts();
+}
+
+String GDScriptDecomp::get_lookup_counts_json() {
+	return JSON::stringify(get_lookup_counts(), "\t");
+}
+
+void GDScriptDecomp::reset_lookup_counts() {
+	GDScriptDecompInstrumentation::reset();
+}
+
 // static Ref<GDScriptDecomp> create_decomp_for_version(String ver);
 Ref<GDScriptDecomp> GDScriptDecomp::create_decomp_for_version(String str_ver, bool p_force) {
-	bool include_dev = false;
 	Ref<GodotVer> ver = GodotVer::parse(str_ver);
 	ERR_FAIL_COND_V_MSG(ver.is_null() || ver->get_major() == 0, Ref<GDScriptDecomp>(), "Invalid version: " + str_ver);
-	if (ver->get_prerelease().contains("dev")) {
-		include_dev = true;
-	}
-	auto versions = get_decomp_versions(include_dev, ver->get_major());
-	versions.reverse();
+	GDScriptDecompVersionNumber number = GDScriptDecompVersionNumber::from_godot_ver(ver);
 	// Exact match for dev versions
-	if (include_dev) {
+	if (number.prerelease == GDScriptDecompVersionNumber::PRERELEASE_DEV) {
 		str_ver = ver->as_tag();
-		for (auto &v : versions) {
-			bool has_max = !v.max_version.is_empty();
-			if (v.min_version == str_ver || (has_max && v.max_version == str_ver)) {
+		for (int i = num_decomp_versions - 1; i >= 0; i--) {
+			const GDScriptDecompVersion &v = decomp_versions[i];
+			if (v.min_number.major != number.major) {
+				continue;
+			}
+			if (v.min_version == str_ver || (v.has_max_version() && v.max_version == str_ver)) {
 				return Ref<GDScriptDecomp>(create_decomp_for_commit(v.commit));
 			}
 		}
-		ERR_FAIL_COND_V_MSG(include_dev, Ref<GDScriptDecomp>(), "No version found for: " + str_ver);
+		ERR_FAIL_V_MSG(Ref<GDScriptDecomp>(), "No version found for: " + str_ver);
 	}
 	if (p_force && ver->get_major() == 4 && ver->get_minor() < 3 && (ver->get_minor() != 0 || !ver->is_prerelease())) {
 		return Ref<GDScriptDecomp>(create_decomp_for_version("4.3.0"));
 	}
-	Ref<GodotVer> prev_ver = nullptr;
-	int prev_ver_commit = 0;
-	for (auto &curr_version : versions) {
-		Ref<GodotVer> min_ver = curr_version.get_min_version();
-		if (ver->eq(min_ver)) {
-			return Ref<GDScriptDecomp>(create_decomp_for_commit(curr_version.commit));
-		}
-
-		if (ver->gt(min_ver) && !curr_version.max_version.is_empty()) {
-			Ref<GodotVer> max_ver = curr_version.get_max_version();
-			if (ver->lte(max_ver)) {
-				return Ref<GDScriptDecomp>(create_decomp_for_commit(curr_version.commit));
-			}
-		}
-		if (prev_ver_commit > 0 && ver->lt(min_ver) && ver->gte(prev_ver)) {
-			// 3.4 -> 3.2
-			if (ver->get_major() == prev_ver->get_major()) {
-				return Ref<GDScriptDecomp>(create_decomp_for_commit(prev_ver_commit));
-			}
-		}
-		prev_ver = min_ver;
-		prev_ver_commit = curr_version.commit;
-	}
-	if (ver->get_major() == prev_ver->get_major() && ver->gte(prev_ver)) {
-		return Ref<GDScriptDecomp>(create_decomp_for_commit(prev_ver_commit));
-	}
-	ERR_FAIL_V_MSG(Ref<GDScriptDecomp>(), "No version found for: " + str_ver);
+	// 3.4 -> 3.2
+	int idx = find_decomp_version_index(number);
+	ERR_FAIL_COND_V_MSG(idx == -1, Ref<GDScriptDecomp>(), "No version found for: " + str_ver);
+	return Ref<GDScriptDecomp>(create_decomp_for_commit(decomp_versions[idx].commit));
 }
 
 template <typename T>
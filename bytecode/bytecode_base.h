@@ -211,9 +211,20 @@ protected:
 public:
 	static Vector<String> get_bytecode_versions();
 
+	// The lookup counters of a `gdre_instrumentation=yes` build, see `GDScriptDecompInstrumentation`.
+	static bool is_lookup_instrumentation_enabled();
+	static void set_lookup_timing_enabled(bool p_enabled);
+	static Dictionary get_lookup_counts();
+	static String get_lookup_counts_json();
+	static void reset_lookup_counts();
+
 	virtual Error decompile_buffer(Vector<uint8_t> p_buffer);
 	virtual BytecodeTestResult _test_bytecode(Vector<uint8_t> p_buffer, int &p_token_max, int &p_func_max, bool print_verbose = false);
 	BytecodeTestResult test_bytecode(Vector<uint8_t> p_buffer, bool print_verbose = false);
+	// Same as `_test_bytecode`/`test_bytecode`, for a buffer that's already been parsed with `get_script_state`.
+	// The parse only depends on `get_variant_ver_major()`, so one `ScriptState` can be tested against several revisions.
+	BytecodeTestResult _test_script_state(const ScriptState &p_state, int &p_token_max, int &p_func_max, bool print_verbose = false);
+	BytecodeTestResult test_script_state(const ScriptState &p_state, bool print_verbose = false);
 
 	virtual String get_function_name(int p_func) const = 0;
 	virtual int get_function_count() const = 0;
@@ -240,6 +251,8 @@ public:
 	Error decompile_byte_code_encrypted(const String &p_path, Vector<uint8_t> p_key);
 	Error decompile_byte_code(const String &p_path);
 	static Ref<GDScriptDecomp> create_decomp_for_commit(uint64_t p_commit_hash);
+	// Only for reading the revision's info and tables; see `get_shared_decomp_for_commit` in bytecode_versions.h.
+	static Ref<GDScriptDecomp> get_shared_decomp_for_commit(uint64_t p_commit_hash);
 	static Ref<GDScriptDecomp> create_decomp_for_version(String ver, bool p_force = false);
 	Vector<uint8_t> compile_code_string(const String &p_code);
 	Error debug_print(Vector<uint8_t> p_buffer);
@@ -0,0 +1,175 @@
+// This file is automatically generated by `bytecode_generator.py`
+// Do not edit this file directly, as it will be overwritten.
+// Instead, edit `bytecode_generator.py` and run it to generate this file.
+
+// clang-format off
+#include "bytecode/bytecode_discriminators.h"
+
+// bytecode version 2
+static const GDScriptArityRange arities_8cab401[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 0, 0 } };
+static const GDScriptArityRange arities_703004f[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 0, 0 } };
+static const GDScriptArityRange arities_31ce3c5[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 0, 0 } };
+static const GDScriptArityRange arities_8c1731b[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 0, 0 } };
+static const GDScriptDiscriminatorCandidate candidates_2[] = {
+	{ 0x8cab401, 0, { 0xffffffffffffffff, 0x00000000000005ff, 0x0000000000000000, 0x0000000000000000 }, 56, arities_8cab401 }, // 1.0-dev5
+	{ 0x703004f, 1, { 0xffffffffffffffff, 0x00000000000002ff, 0x0000000000000000, 0x0000000000000000 }, 56, arities_703004f }, // 1.0-dev4
+	{ 0x31ce3c5, 1, { 0xffffffffffffffff, 0x00000000000002ff, 0x0000000000000000, 0x0000000000000000 }, 55, arities_31ce3c5 }, // 1.0-dev3
+	{ 0x8c1731b, 1, { 0xffffffffffffffff, 0x00000000000002ff, 0x0000000000000000, 0x0000000000000000 }, 54, arities_8c1731b }, // 1.0-dev2
+};
+static const GDScriptCallSignature call_signatures_2[] = {
+	{ 5, 69, 50, 65, 66, 61, 62, 63, 64, 67, -1, -1, 72, -1 },
+	{ 5, 68, 50, 64, 65, 60, 61, 62, 63, 66, -1, -1, 71, -1 },
+};
+
+// bytecode version 3
+static const GDScriptArityRange arities_be46be7[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 0, 0 }, { 1, 1 } };
+static const GDScriptArityRange arities_97f34a1[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 0, 0 }, { 1, 1 } };
+static const GDScriptArityRange arities_2185c01[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 0, 0 } };
+static const GDScriptArityRange arities_e82dc40[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 0, 0 } };
+static const GDScriptDiscriminatorCandidate candidates_3[] = {
+	{ 0xbe46be7, 0, { 0xffffffffffffffff, 0x0000000000000bff, 0x0000000000000000, 0x0000000000000000 }, 60, arities_be46be7 }, // 1.1-dev3
+	{ 0x97f34a1, 0, { 0xffffffffffffffff, 0x0000000000000bff, 0x0000000000000000, 0x0000000000000000 }, 60, arities_97f34a1 }, // 1.1-dev2
+	{ 0x2185c01, 0, { 0xffffffffffffffff, 0x0000000000000bff, 0x0000000000000000, 0x0000000000000000 }, 58, arities_2185c01 }, // 1.1-dev1
+	{ 0xe82dc40, 1, { 0xffffffffffffffff, 0x0000000000000bff, 0x0000000000000000, 0x0000000000000000 }, 56, arities_e82dc40 }, // 1.0.0-stable
+};
+static const GDScriptCallSignature call_signatures_3[] = {
+	{ 5, 70, 50, 66, 67, 62, 63, 64, 65, 68, -1, -1, 73, 76 },
+	{ 5, 70, 50, 66, 67, 62, 63, 64, 65, 68, -1, -1, 73, -1 },
+};
+
+// bytecode version 10
+static const GDScriptArityRange arities_ed80f45[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 1, 1 } };
+static const GDScriptArityRange arities_85585c7[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 1, 1 } };
+static const GDScriptArityRange arities_7124599[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 0, 0 }, { 1, 1 } };
+static const GDScriptArityRange arities_23441ec[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 0, 0 }, { 1, 1 } };
+static const GDScriptDiscriminatorCandidate candidates_10[] = {
+	{ 0xed80f45, 0, { 0xffffffffffffffff, 0x0000000000017fff, 0x0000000000000000, 0x0000000000000000 }, 66, arities_ed80f45 }, // 2.1.3-stable
+	{ 0x85585c7, 1, { 0xffffffffffffffff, 0x000000000000bfff, 0x0000000000000000, 0x0000000000000000 }, 66, arities_85585c7 }, // 2.1.2-stable
+	{ 0x7124599, 1, { 0xffffffffffffffff, 0x000000000000bfff, 0x0000000000000000, 0x0000000000000000 }, 65, arities_7124599 }, // 2.1.0-stable
+	{ 0x23441ec, 1, { 0xffffffffffffffff, 0x000000000000bfff, 0x0000000000000000, 0x0000000000000000 }, 64, arities_23441ec }, // 2.0.0-stable
+};
+static const GDScriptCallSignature call_signatures_10[] = {
+	{ 5, 74, 50, 70, 71, 66, 67, 68, 69, 72, -1, -1, 77, 81 },
+	{ 5, 73, 50, 69, 70, 65, 66, 67, 68, 71, -1, -1, 76, 80 },
+};
+
+// bytecode version 11
+static const GDScriptArityRange arities_8b912d1[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 1, 1 } };
+static const GDScriptArityRange arities_23381a5[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 1, 1 } };
+static const GDScriptArityRange arities_513c026[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 0, 0 }, { 1, 1 } };
+static const GDScriptArityRange arities_4ee82a2[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 0, 0 }, { 1, 1 } };
+static const GDScriptArityRange arities_1add52b[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 0, 0 }, { 1, 1 } };
+static const GDScriptDiscriminatorCandidate candidates_11[] = {
+	{ 0x8b912d1, 0, { 0xffffffffffffffff, 0x00000000002fffff, 0x0000000000000000, 0x0000000000000000 }, 67, arities_8b912d1 }, // 3.0-dev5
+	{ 0x23381a5, 1, { 0xffffffffffffffff, 0x000000000017ffff, 0x0000000000000000, 0x0000000000000000 }, 67, arities_23381a5 }, // 3.0-dev4
+	{ 0x513c026, 1, { 0xffffffffffffffff, 0x000000000017ffff, 0x0000000000000000, 0x0000000000000000 }, 66, arities_513c026 }, // 3.0-dev3
+	{ 0x4ee82a2, 1, { 0xffffffffffffffff, 0x000000000017ffff, 0x0000000000000000, 0x0000000000000000 }, 65, arities_4ee82a2 }, // 3.0-dev2
+	{ 0x1add52b, 2, { 0xffffffffffffffff, 0x00000000000bffff, 0x0000000000000000, 0x0000000000000000 }, 65, arities_1add52b }, // 3.0-dev1
+};
+static const GDScriptCallSignature call_signatures_11[] = {
+	{ 5, 78, 50, 74, 75, 70, 71, 72, 73, 76, -1, -1, 82, 86 },
+	{ 5, 78, 50, 74, 75, 70, 71, 72, 73, 76, -1, -1, 81, 85 },
+	{ 5, 77, 50, 73, 74, 69, 70, 71, 72, 75, -1, -1, 80, 84 },
+};
+
+// bytecode version 12
+static const GDScriptArityRange arities_8e35d93[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 5, 5 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 0, 0 }, { 1, 1 }, { 1, 1 }, { 1, 1 } };
+static const GDScriptArityRange arities_3ea6d9f[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 5, 5 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 0, 0 }, { 1, 1 }, { 1, 1 }, { 1, 1 } };
+static const GDScriptArityRange arities_a56d6ff[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 5, 5 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 0, 0 }, { 1, 1 }, { 1, 1 }, { 1, 1 } };
+static const GDScriptArityRange arities_ff1e7cf[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 5, 5 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 1, 1 }, { 1, 1 }, { 1, 1 } };
+static const GDScriptArityRange arities_054a2ac[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 5, 5 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 1, 1 }, { 1, 1 } };
+static const GDScriptArityRange arities_91ca725[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 5, 5 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 3 }, { 3, 3 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 1, 1 }, { 1, 1 } };
+static const GDScriptArityRange arities_216a8aa[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 5, 5 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 3 }, { 3, 3 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 1, 1 }, { 1, 1 } };
+static const GDScriptArityRange arities_d28da86[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 5, 5 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 1, 1 }, { 1, 1 } };
+static const GDScriptArityRange arities_c6120e7[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 1, 1 }, { 1, 1 } };
+static const GDScriptArityRange arities_015d36d[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 1, 1 } };
+static const GDScriptArityRange arities_5e938f0[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 1, 1 } };
+static const GDScriptArityRange arities_c24c739[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 1, 1 } };
+static const GDScriptArityRange arities_f8a7c46[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 1, 1 } };
+static const GDScriptArityRange arities_62273e5[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 1, 1 } };
+static const GDScriptDiscriminatorCandidate candidates_12[] = {
+	{ 0x8e35d93, 0, { 0xffffffffffffffff, 0x000000005fffffff, 0x0000000000000000, 0x0000000000000000 }, 80, arities_8e35d93 }, // 3.1-dev4
+	{ 0x3ea6d9f, 1, { 0xffffffffffffffff, 0x000000000bffffff, 0x0000000000000000, 0x0000000000000000 }, 80, arities_3ea6d9f }, // 3.1-dev3
+	{ 0xa56d6ff, 1, { 0xffffffffffffffff, 0x000000000bffffff, 0x0000000000000000, 0x0000000000000000 }, 79, arities_a56d6ff }, // 3.1-dev2
+	{ 0xff1e7cf, 1, { 0xffffffffffffffff, 0x000000000bffffff, 0x0000000000000000, 0x0000000000000000 }, 78, arities_ff1e7cf }, // 3.1-dev1
+	{ 0x054a2ac, 1, { 0xffffffffffffffff, 0x000000000bffffff, 0x0000000000000000, 0x0000000000000000 }, 77, arities_054a2ac }, // 3.0.0-stable
+	{ 0x91ca725, 1, { 0xffffffffffffffff, 0x000000000bffffff, 0x0000000000000000, 0x0000000000000000 }, 75, arities_91ca725 }, // 3.0-dev14
+	{ 0x216a8aa, 2, { 0xffffffffffffffff, 0x0000000005ffffff, 0x0000000000000000, 0x0000000000000000 }, 75, arities_216a8aa }, // 3.0-dev13
+	{ 0xd28da86, 2, { 0xffffffffffffffff, 0x0000000005ffffff, 0x0000000000000000, 0x0000000000000000 }, 73, arities_d28da86 }, // 3.0-dev12
+	{ 0xc6120e7, 2, { 0xffffffffffffffff, 0x0000000005ffffff, 0x0000000000000000, 0x0000000000000000 }, 71, arities_c6120e7 }, // 3.0-dev11
+	{ 0x015d36d, 2, { 0xffffffffffffffff, 0x0000000005ffffff, 0x0000000000000000, 0x0000000000000000 }, 70, arities_015d36d }, // 3.0-dev10
+	{ 0x5e938f0, 3, { 0xffffffffffffffff, 0x0000000002ffffff, 0x0000000000000000, 0x0000000000000000 }, 70, arities_5e938f0 }, // 3.0-dev9
+	{ 0xc24c739, 4, { 0xffffffffffffffff, 0x0000000000bfffff, 0x0000000000000000, 0x0000000000000000 }, 70, arities_c24c739 }, // 3.0-dev8
+	{ 0xf8a7c46, 5, { 0xffffffffffffffff, 0x00000000005fffff, 0x0000000000000000, 0x0000000000000000 }, 70, arities_f8a7c46 }, // 3.0-dev7
+	{ 0x62273e5, 6, { 0xffffffffffffffff, 0x00000000002fffff, 0x0000000000000000, 0x0000000000000000 }, 70, arities_62273e5 }, // 3.0-dev6
+};
+static const GDScriptCallSignature call_signatures_12[] = {
+	{ 5, 83, 51, 79, 80, 75, 76, 77, 78, 81, -1, -1, 87, 95 },
+	{ 5, 80, 51, 76, 77, 72, 73, 74, 75, 78, -1, -1, 84, 92 },
+	{ 5, 80, 51, 76, 77, 72, 73, 74, 75, 78, -1, -1, 84, 91 },
+	{ 5, 79, 51, 75, 76, 71, 72, 73, 74, 77, -1, -1, 83, 90 },
+	{ 5, 79, 51, 75, 76, 71, 72, 73, 74, 77, -1, -1, 83, 88 },
+	{ 5, 79, 51, 75, 76, 71, 72, 73, 74, 77, -1, -1, 83, 87 },
+	{ 5, 78, 50, 74, 75, 70, 71, 72, 73, 76, -1, -1, 82, 86 },
+};
+
+// bytecode version 13
+static const GDScriptArityRange arities_f3f05dc[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 3, 3 }, { 5, 5 }, { 3, 3 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 0, 0 }, { 1, 1 }, { 1, 1 }, { 1, 1 } };
+static const GDScriptArityRange arities_506df14[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 3, 3 }, { 5, 5 }, { 3, 3 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 0, 0 }, { 1, 1 }, { 1, 1 }, { 1, 1 } };
+static const GDScriptArityRange arities_a7aad78[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 3, 3 }, { 5, 5 }, { 3, 3 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 0, 0 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 } };
+static const GDScriptArityRange arities_5565f55[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 3, 3 }, { 5, 5 }, { 3, 3 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 0, 0 }, { 1, 1 }, { 1, 1 }, { 1, 1 } };
+static const GDScriptArityRange arities_6694c11[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 3, 3 }, { 5, 5 }, { 3, 3 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 0, 0 }, { 1, 1 }, { 1, 1 }, { 1, 1 } };
+static const GDScriptArityRange arities_a60f242[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 5, 5 }, { 3, 3 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 0, 0 }, { 1, 1 }, { 1, 1 }, { 1, 1 } };
+static const GDScriptArityRange arities_c00427a[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 5, 5 }, { 3, 3 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 0, 0 }, { 1, 1 }, { 1, 1 }, { 1, 1 } };
+static const GDScriptArityRange arities_620ec47[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 5, 5 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 0, 0 }, { 1, 1 }, { 1, 1 }, { 1, 1 } };
+static const GDScriptArityRange arities_7f7d97f[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 5, 5 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 0, 0 }, { 1, 1 }, { 1, 1 }, { 1, 1 } };
+static const GDScriptArityRange arities_514a3fb[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 5, 5 }, { 3, 3 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 0, 0 }, { 1, 1 }, { 1, 1 }, { 1, 1 } };
+static const GDScriptArityRange arities_1a36141[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 5, 5 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 0, 0 }, { 1, 1 }, { 1, 1 }, { 1, 1 } };
+static const GDScriptArityRange arities_1ca61a3[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 5, 5 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 0, 0 }, { 1, 1 }, { 1, 1 }, { 1, 1 } };
+static const GDScriptArityRange arities_d6b31da[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 5, 5 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 0, 0 }, { 1, 1 }, { 1, 1 }, { 1, 1 } };
+static const GDScriptArityRange arities_8aab9a0[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 5, 5 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 0, 0 }, { 1, 1 }, { 1, 1 }, { 1, 1 } };
+static const GDScriptArityRange arities_a3f1ee5[] = { { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 1, 1 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 5, 5 }, { 3, 3 }, { 0, 0 }, { 0, 0 }, { 0, 0 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 3, 3 }, { 2, 2 }, { 2, 2 }, { 3, 3 }, { 1, 1 }, { 1, 1 }, { 2, 2 }, { 2, 2 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 0, INT_MAX }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 3 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 1, 1 }, { 3, 4 }, { 1, 2 }, { 0, 0 }, { 0, 0 }, { 1, 1 }, { 1, 1 }, { 1, 1 } };
+static const GDScriptDiscriminatorCandidate candidates_13[] = {
+	{ 0xf3f05dc, 0, { 0xffffffffffffffff, 0x000000005fffffff, 0x0000000000000000, 0x0000000000000000 }, 89, arities_f3f05dc }, // 4.0-dev2
+	{ 0x506df14, 1, { 0xffffffffffffffff, 0x000000017fffffff, 0x0000000000000000, 0x0000000000000000 }, 89, arities_506df14 }, // 4.0-dev1
+	{ 0xa7aad78, 1, { 0xffffffffffffffff, 0x000000017fffffff, 0x0000000000000000, 0x0000000000000000 }, 91, arities_a7aad78 }, // 3.5.0-stable
+	{ 0x5565f55, 1, { 0xffffffffffffffff, 0x000000017fffffff, 0x0000000000000000, 0x0000000000000000 }, 90, arities_5565f55 }, // 3.2.0-stable
+	{ 0x6694c11, 1, { 0xffffffffffffffff, 0x000000017fffffff, 0x0000000000000000, 0x0000000000000000 }, 89, arities_6694c11 }, // 3.2-dev5
+	{ 0xa60f242, 1, { 0xffffffffffffffff, 0x000000017fffffff, 0x0000000000000000, 0x0000000000000000 }, 88, arities_a60f242 }, // 3.2-dev4
+	{ 0xc00427a, 1, { 0xffffffffffffffff, 0x000000017fffffff, 0x0000000000000000, 0x0000000000000000 }, 87, arities_c00427a }, // 3.2-dev3
+	{ 0x620ec47, 1, { 0xffffffffffffffff, 0x000000017fffffff, 0x0000000000000000, 0x0000000000000000 }, 86, arities_620ec47 }, // 3.2-dev2
+	{ 0x7f7d97f, 1, { 0xffffffffffffffff, 0x000000017fffffff, 0x0000000000000000, 0x0000000000000000 }, 85, arities_7f7d97f }, // 3.2-dev1
+	{ 0x514a3fb, 1, { 0xffffffffffffffff, 0x000000017fffffff, 0x0000000000000000, 0x0000000000000000 }, 83, arities_514a3fb }, // 3.1.1-stable
+	{ 0x1a36141, 1, { 0xffffffffffffffff, 0x000000017fffffff, 0x0000000000000000, 0x0000000000000000 }, 82, arities_1a36141 }, // 3.1.0-stable
+	{ 0x1ca61a3, 2, { 0xffffffffffffffff, 0x0000000bffffffff, 0x0000000000000000, 0x0000000000000000 }, 82, arities_1ca61a3 }, // 3.1-beta1
+	{ 0xd6b31da, 2, { 0xffffffffffffffff, 0x0000000bffffffff, 0x0000000000000000, 0x0000000000000000 }, 80, arities_d6b31da }, // 3.1-dev7
+	{ 0x8aab9a0, 3, { 0xffffffffffffffff, 0x00000005ffffffff, 0x0000000000000000, 0x0000000000000000 }, 80, arities_8aab9a0 }, // 3.1-dev6
+	{ 0xa3f1ee5, 4, { 0xffffffffffffffff, 0x00000000bfffffff, 0x0000000000000000, 0x0000000000000000 }, 80, arities_a3f1ee5 }, // 3.1-dev5
+};
+static const GDScriptCallSignature call_signatures_13[] = {
+	{ 5, 82, 48, 78, 79, 74, 75, 76, 77, 80, -1, -1, 87, 95 },
+	{ 5, 84, 48, 80, 81, 76, 77, 78, 79, 82, -1, -1, 89, 97 },
+	{ 5, 87, 51, 83, 84, 79, 80, 81, 82, 85, -1, -1, 92, 100 },
+	{ 5, 86, 51, 82, 83, 78, 79, 80, 81, 84, -1, -1, 91, 99 },
+	{ 5, 84, 51, 80, 81, 76, 77, 78, 79, 82, -1, -1, 88, 96 },
+};
+
+const GDScriptRevisionDiscriminators gdscript_revision_discriminators[] = {
+	{ 2, 4, candidates_2, 2, call_signatures_2 },
+	{ 3, 4, candidates_3, 2, call_signatures_3 },
+	{ 10, 4, candidates_10, 2, call_signatures_10 },
+	{ 11, 5, candidates_11, 3, call_signatures_11 },
+	{ 12, 14, candidates_12, 7, call_signatures_12 },
+	{ 13, 15, candidates_13, 5, call_signatures_13 },
+};
+
+const int gdscript_revision_discriminators_count = sizeof(gdscript_revision_discriminators) / sizeof(GDScriptRevisionDiscriminators);
+
+const GDScriptRevisionDiscriminators *get_revision_discriminators(int p_bytecode_version) {
+	for (int i = 0; i < gdscript_revision_discriminators_count; i++) {
+		if (gdscript_revision_discriminators[i].bytecode_version == p_bytecode_version) {
+			return &gdscript_revision_discriminators[i];
+		}
+	}
+	return nullptr;
+}
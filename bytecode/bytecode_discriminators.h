@@ -0,0 +1,58 @@
+/*************************************************************************/
+/*  bytecode_discriminators.h                                            */
+/*************************************************************************/
+#pragma once
+
+#include "bytecode/bytecode_base.h"
+
+// The local IDs of the tokens that `GDScriptDecomp::is_token_builtin_func` and
+// `GDScriptDecomp::get_func_arg_count_and_params` look at, -1 if the revision doesn't have the token.
+// Revisions that share a signature find the same built-in calls in a token stream.
+struct GDScriptCallSignature {
+	int16_t builtin_func;
+	int16_t period;
+	int16_t pr_function;
+	int16_t parenthesis_open;
+	int16_t parenthesis_close;
+	int16_t bracket_open;
+	int16_t bracket_close;
+	int16_t curly_bracket_open;
+	int16_t curly_bracket_close;
+	int16_t comma;
+	int16_t indent;
+	int16_t dedent;
+	int16_t newline;
+	int16_t cursor;
+};
+
+struct GDScriptArityRange {
+	int min_args;
+	int max_args;
+};
+
+// What a revision accepts, as far as it can be checked without looking at the order of the tokens.
+struct GDScriptDiscriminatorCandidate {
+	uint64_t bytecode_rev;
+	int call_signature; // index into `GDScriptRevisionDiscriminators::call_signatures`
+	// bit `t % 64` of word `t / 64` is set if `test_bytecode` doesn't fail on local token `t` just for being there
+	uint64_t valid_tokens[4];
+	// built-in function IDs are contiguous, so `func_count` is the set of valid IDs
+	int func_count;
+	const GDScriptArityRange *arities; // `func_count` entries
+};
+
+// The revisions that share a bytecode version, which are the ones `test_bytecode` has to tell apart.
+// `bytecode_generator.py` writes one of these for every bytecode version with more than one revision into `bytecode_discriminators.cpp`.
+struct GDScriptRevisionDiscriminators {
+	int bytecode_version;
+	int candidate_count;
+	const GDScriptDiscriminatorCandidate *candidates;
+	int call_signature_count;
+	const GDScriptCallSignature *call_signatures;
+};
+
+extern const GDScriptRevisionDiscriminators gdscript_revision_discriminators[];
+extern const int gdscript_revision_discriminators_count;
+
+// Returns nullptr if there's only one revision with this bytecode version.
+const GDScriptRevisionDiscriminators *get_revision_discriminators(int p_bytecode_version);
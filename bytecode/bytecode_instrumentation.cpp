@@ -0,0 +1,197 @@
+/*************************************************************************/
+/*  bytecode_instrumentation.cpp                                         */
+/*************************************************************************/
+
+#include "bytecode_instrumentation.h"
+
+#include "core/os/mutex.h"
+#include "core/variant/dictionary.h"
+
+#include <chrono>
+
+namespace {
+
+constexpr int MAX_REVISIONS = 128;
+
+const char *const lookup_names[GDScriptDecompInstrumentation::LOOKUP_MAX] = {
+	"get_global_token",
+	"get_local_token_val",
+	"get_function_index",
+	"get_function_name",
+};
+
+// Only the owning thread writes its counters, so they're bumped with a relaxed load and store instead of an atomic add;
+// they're atomics so that `get_counts` can read them from another thread.
+struct ThreadCounters {
+	uint32_t revs[MAX_REVISIONS] = {};
+	std::atomic<int> rev_count = 0;
+	std::atomic<uint64_t> calls[MAX_REVISIONS][GDScriptDecompInstrumentation::LOOKUP_MAX] = {};
+	std::atomic<uint64_t> nsec[MAX_REVISIONS][GDScriptDecompInstrumentation::LOOKUP_MAX] = {};
+	int last_slot = -1;
+	ThreadCounters *prev = nullptr;
+	ThreadCounters *next = nullptr;
+
+	ThreadCounters(bool p_register);
+	~ThreadCounters();
+
+	int get_slot(uint32_t p_rev);
+};
+
+Mutex counters_mutex;
+ThreadCounters *thread_list = nullptr;
+// the counts of the threads that have exited
+ThreadCounters retired_counters(false);
+
+_FORCE_INLINE_ void _add(std::atomic<uint64_t> &r_counter, uint64_t p_value) {
+	r_counter.store(r_counter.load(std::memory_order_relaxed) + p_value, std::memory_order_relaxed);
+}
+
+void _merge(ThreadCounters &r_into, const ThreadCounters &p_from) {
+	int count = p_from.rev_count.load(std::memory_order_acquire);
+	for (int i = 0; i < count; i++) {
+		int slot = r_into.get_slot(p_from.revs[i]);
+		if (slot < 0) {
+			continue;
+		}
+		for (int j = 0; j < GDScriptDecompInstrumentation::LOOKUP_MAX; j++) {
+			_add(r_into.calls[slot][j], p_from.calls[i][j].load(std::memory_order_relaxed));
+			_add(r_into.nsec[slot][j], p_from.nsec[i][j].load(std::memory_order_relaxed));
+		}
+	}
+}
+
+void _clear(ThreadCounters &r_counters) {
+	int count = r_counters.rev_count.load(std::memory_order_acquire);
+	for (int i = 0; i < count; i++) {
+		for (int j = 0; j < GDScriptDecompInstrumentation::LOOKUP_MAX; j++) {
+			r_counters.calls[i][j].store(0, std::memory_order_relaxed);
+			r_counters.nsec[i][j].store(0, std::memory_order_relaxed);
+		}
+	}
+}
+
+ThreadCounters::ThreadCounters(bool p_register) {
+	if (!p_register) {
+		return;
+	}
+	MutexLock lock(counters_mutex);
+	next = thread_list;
+	if (thread_list) {
+		thread_list->prev = this;
+	}
+	thread_list = this;
+}
+
+ThreadCounters::~ThreadCounters() {
+	if (this == &retired_counters) {
+		return;
+	}
+	MutexLock lock(counters_mutex);
+	_merge(retired_counters, *this);
+	if (prev) {
+		prev->next = next;
+	} else {
+		thread_list = next;
+	}
+	if (next) {
+		next->prev = prev;
+	}
+}
+
+int ThreadCounters::get_slot(uint32_t p_rev) {
+	if (last_slot >= 0 && revs[last_slot] == p_rev) {
+		return last_slot;
+	}
+	int count = rev_count.load(std::memory_order_relaxed);
+	for (int i = 0; i < count; i++) {
+		if (revs[i] == p_rev) {
+			last_slot = i;
+			return i;
+		}
+	}
+	if (count == MAX_REVISIONS) {
+		return -1;
+	}
+	revs[count] = p_rev;
+	rev_count.store(count + 1, std::memory_order_release);
+	last_slot = count;
+	return count;
+}
+
+thread_local ThreadCounters thread_counters(true);
+
+} // namespace
+
+std::atomic<bool> GDScriptDecompInstrumentation::timing_enabled = false;
+
+uint64_t GDScriptDecompInstrumentation::_get_ticks_nsec() {
+	return std::chrono::duration_cast<std::chrono::nanoseconds>(std::chrono::steady_clock::now().time_since_epoch()).count();
+}
+
+void GDScriptDecompInstrumentation::record(uint32_t p_rev, Lookup p_lookup, uint64_t p_nsec) {
+	ThreadCounters &counters = thread_counters;
+	int slot = counters.get_slot(p_rev);
+	if (unlikely(slot < 0)) {
+		return;
+	}
+	_add(counters.calls[slot][p_lookup], 1);
+	if (p_nsec) {
+		_add(counters.nsec[slot][p_lookup], p_nsec);
+	}
+}
+
+bool GDScriptDecompInstrumentation::is_enabled() {
+#ifdef GDRE_INSTRUMENTATION_ENABLED
+	return true;
+#else
+	return false;
+#endif
+}
+
+void GDScriptDecompInstrumentation::set_timing_enabled(bool p_enabled) {
+	timing_enabled.store(p_enabled, std::memory_order_relaxed);
+}
+
+bool GDScriptDecompInstrumentation::is_timing_enabled() {
+	return timing_enabled.load(std::memory_order_relaxed);
+}
+
+Dictionary GDScriptDecompInstrumentation::get_counts() {
+	ThreadCounters totals(false);
+	{
+		MutexLock lock(counters_mutex);
+		_merge(totals, retired_counters);
+		for (ThreadCounters *counters = thread_list; counters; counters = counters->next) {
+			_merge(totals, *counters);
+		}
+	}
+	Dictionary revisions;
+	int count = totals.rev_count.load(std::memory_order_relaxed);
+	for (int i = 0; i < count; i++) {
+		Dictionary lookups;
+		for (int j = 0; j < LOOKUP_MAX; j++) {
+			uint64_t calls = totals.calls[i][j].load(std::memory_order_relaxed);
+			if (calls == 0) {
+				continue;
+			}
+			Dictionary entry;
+			entry["calls"] = calls;
+			entry["nsec"] = totals.nsec[i][j].load(std::memory_order_relaxed);
+			lookups[lookup_names[j]] = entry;
+		}
+		revisions[String::num_uint64(totals.revs[i], 16)] = lookups;
+	}
+	Dictionary ret;
+	ret["enabled"] = is_enabled();
+	ret["timing"] = is_timing_enabled();
+	ret["revisions"] = revisions;
+	return ret;
+}
+
+void GDScriptDecompInstrumentation::reset() {
+	MutexLock lock(counters_mutex);
+	_clear(retired_counters);
+	for (ThreadCounters *counters = thread_list; counters; counters = counters->next) {
+		_clear(*counters);
+	}
+}
@@ -0,0 +1,70 @@
+/*************************************************************************/
+/*  bytecode_instrumentation.h                                           */
+/*************************************************************************/
+#pragma once
+
+#include "core/typedefs.h"
+
+#include <stdint.h>
+#include <atomic>
+
+class Dictionary;
+
+// Per-thread call counters (and, optionally, timers) for the token and function lookups of every revision.
+// They're only compiled in with `scons gdre_instrumentation=yes`, which defines `GDRE_INSTRUMENTATION_ENABLED`;
+// without it `GDRE_INSTRUMENT_LOOKUP` expands to nothing and the lookups are the same as if it weren't there.
+class GDScriptDecompInstrumentation {
+public:
+	enum Lookup {
+		LOOKUP_GET_GLOBAL_TOKEN,
+		LOOKUP_GET_LOCAL_TOKEN_VAL,
+		LOOKUP_GET_FUNCTION_INDEX,
+		LOOKUP_GET_FUNCTION_NAME,
+		LOOKUP_MAX,
+	};
+
+private:
+	static std::atomic<bool> timing_enabled;
+
+	static uint64_t _get_ticks_nsec();
+
+public:
+	// Records one call of `p_lookup` on revision `p_rev` for the calling thread.
+	static void record(uint32_t p_rev, Lookup p_lookup, uint64_t p_nsec);
+
+	// Counts `GDRE_INSTRUMENT_LOOKUP`'s enclosing call, and times it if timing is enabled.
+	class Scope {
+		uint32_t rev;
+		Lookup lookup;
+		uint64_t start = 0;
+
+	public:
+		_FORCE_INLINE_ Scope(uint32_t p_rev, Lookup p_lookup) :
+				rev(p_rev), lookup(p_lookup) {
+			if (timing_enabled.load(std::memory_order_relaxed)) {
+				start = _get_ticks_nsec();
+			}
+		}
+		_FORCE_INLINE_ ~Scope() {
+			record(rev, lookup, start ? _get_ticks_nsec() - start : 0);
+		}
+	};
+
+	// False unless this build was made with `gdre_instrumentation=yes`.
+	static bool is_enabled();
+	static void set_timing_enabled(bool p_enabled);
+	static bool is_timing_enabled();
+
+	// The counts of every thread so far, including threads that have exited:
+	// `{ "enabled": bool, "timing": bool, "revisions": { "<rev>": { "<lookup>": { "calls": int, "nsec": int } } } }`
+	static Dictionary get_counts();
+	// Only call this while nothing is decompiling; a thread in the middle of a lookup may keep its old count.
+	static void reset();
+};
+
+#ifdef GDRE_INSTRUMENTATION_ENABLED
+#define GDRE_INSTRUMENT_LOOKUP(m_rev, m_lookup) \
+	GDScriptDecompInstrumentation::Scope _instrument_scope(m_rev, GDScriptDecompInstrumentation::m_lookup)
+#else
+#define GDRE_INSTRUMENT_LOOKUP(m_rev, m_lookup)
+#endif
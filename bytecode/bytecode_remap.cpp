@@ -0,0 +1,144 @@
+/*************************************************************************/
+/*  bytecode_remap.cpp                                                   */
+/*************************************************************************/
+
+#include "bytecode_remap.h"
+
+#include "compat/variant_decoder_compat.h"
+
+static int _get_variant_max(int p_ver_major) {
+	if (p_ver_major <= 2) {
+		return V2Type::VARIANT_MAX;
+	} else if (p_ver_major == 3) {
+		return V3Type::VARIANT_MAX;
+	}
+	return Variant::VARIANT_MAX;
+}
+
+static int _convert_variant_type(int p_type, int p_from_major, int p_to_major) {
+	if (p_from_major == p_to_major) {
+		return p_type;
+	}
+	Variant::Type type = p_from_major >= 4 ? Variant::Type(p_type) : VariantDecoderCompat::convert_variant_type_from_old(p_type, p_from_major);
+	if (type < 0 || type >= Variant::VARIANT_MAX) {
+		return -1;
+	}
+	return p_to_major >= 4 ? int(type) : VariantDecoderCompat::convert_variant_type_to_old(type, p_to_major);
+}
+
+Error GDScriptRevisionRemap::init(const Ref<GDScriptDecomp> &p_from, const Ref<GDScriptDecomp> &p_to) {
+	ERR_FAIL_COND_V(p_from.is_null() || p_to.is_null(), ERR_INVALID_PARAMETER);
+	from_rev = p_from->get_bytecode_rev();
+	to_rev = p_to->get_bytecode_rev();
+
+	int token_max = MIN(p_from->get_token_max(), (int)GDScriptDecomp::TOKEN_MASK + 1);
+	identity = p_from->get_token_max() == p_to->get_token_max();
+	for (int i = 0; i <= (int)GDScriptDecomp::TOKEN_MASK; i++) {
+		tokens[i] = i;
+		value_kinds[i] = VALUE_UNMAPPED;
+	}
+	for (int i = 0; i < token_max; i++) {
+		GDScriptDecomp::GlobalToken global = p_from->get_global_token(i);
+		int local = global == GDScriptDecomp::G_TK_MAX ? -1 : p_to->get_local_token_val(global);
+		if (local < 0 || local > (int)GDScriptDecomp::TOKEN_MASK) {
+			identity = false;
+			continue;
+		}
+		tokens[i] = local;
+		identity = identity && local == i;
+		if (global == GDScriptDecomp::G_TK_BUILT_IN_FUNC) {
+			value_kinds[i] = VALUE_FUNCTION;
+		} else if (global == GDScriptDecomp::G_TK_BUILT_IN_TYPE && p_from->get_variant_ver_major() != p_to->get_variant_ver_major()) {
+			value_kinds[i] = VALUE_TYPE;
+		} else {
+			value_kinds[i] = VALUE_AS_IS;
+		}
+	}
+
+	int func_count = p_from->get_function_count();
+	identity = identity && func_count == p_to->get_function_count();
+	funcs.resize(func_count);
+	for (int i = 0; i < func_count; i++) {
+		int func = p_to->get_function_index(p_from->get_function_name(i));
+		funcs.write[i] = func;
+		identity = identity && func == i;
+	}
+
+	int from_major = p_from->get_variant_ver_major();
+	int to_major = p_to->get_variant_ver_major();
+	identity = identity && from_major == to_major;
+	types.clear();
+	if (from_major != to_major) {
+		int type_count = _get_variant_max(from_major);
+		types.resize(type_count);
+		for (int i = 0; i < type_count; i++) {
+			types.write[i] = _convert_variant_type(i, from_major, to_major);
+		}
+	}
+	return OK;
+}
+
+int GDScriptRevisionRemap::remap_token(int p_token) const {
+	if (p_token < 0 || p_token > (int)GDScriptDecomp::TOKEN_MASK || value_kinds[p_token] == VALUE_UNMAPPED) {
+		return -1;
+	}
+	return tokens[p_token];
+}
+
+int GDScriptRevisionRemap::remap_function(int p_func) const {
+	if (p_func < 0 || p_func >= funcs.size()) {
+		return -1;
+	}
+	return funcs[p_func];
+}
+
+bool GDScriptRevisionRemap::_remap_value(uint32_t &r_token, ValueKind p_kind, UnmappedReason &r_reason) const {
+	int value = r_token >> GDScriptDecomp::TOKEN_BITS;
+	int mapped = -1;
+	switch (p_kind) {
+		case VALUE_AS_IS:
+			return true;
+		case VALUE_FUNCTION:
+			mapped = value < funcs.size() ? funcs[value] : -1;
+			r_reason = UNMAPPED_FUNCTION;
+			break;
+		case VALUE_TYPE:
+			mapped = value < types.size() ? types[value] : -1;
+			r_reason = UNMAPPED_TYPE;
+			break;
+		case VALUE_UNMAPPED:
+			r_reason = UNMAPPED_TOKEN;
+			return false;
+	}
+	if (mapped < 0) {
+		return false;
+	}
+	r_token = (r_token & GDScriptDecomp::TOKEN_MASK) | (uint32_t(mapped) << GDScriptDecomp::TOKEN_BITS);
+	return true;
+}
+
+Error GDScriptRevisionRemap::remap_tokens(const Vector<uint32_t> &p_tokens, Vector<uint32_t> &r_tokens, Vector<Unmapped> &r_unmapped) const {
+	r_unmapped.clear();
+	if (identity) {
+		r_tokens = p_tokens;
+		return OK;
+	}
+	int count = p_tokens.size();
+	r_tokens.resize(count);
+	const uint32_t *src = p_tokens.ptr();
+	uint32_t *dst = r_tokens.ptrw();
+	for (int i = 0; i < count; i++) {
+		uint32_t token = src[i];
+		uint32_t local = token & GDScriptDecomp::TOKEN_MASK;
+		dst[i] = (token & ~uint32_t(GDScriptDecomp::TOKEN_MASK)) | tokens[local];
+		// only built-in functions and types carry a value that depends on the revision
+		if (unlikely(value_kinds[local] != VALUE_AS_IS)) {
+			UnmappedReason reason = UNMAPPED_TOKEN;
+			if (!_remap_value(dst[i], value_kinds[local], reason)) {
+				dst[i] = token;
+				r_unmapped.push_back({ i, reason });
+			}
+		}
+	}
+	return r_unmapped.is_empty() ? OK : ERR_UNAVAILABLE;
+}
@@ -0,0 +1,61 @@
+/*************************************************************************/
+/*  bytecode_remap.h                                                     */
+/*************************************************************************/
+#pragma once
+
+#include "bytecode/bytecode_base.h"
+
+// Translates the tokens of a `GDScriptDecomp::ScriptState` from one bytecode revision to another.
+// The tables are derived from the two revisions' `get_global_token`/`get_local_token_val` and function names
+// instead of going through `GlobalToken` for every token, so build one per pair of revisions and reuse it.
+class GDScriptRevisionRemap {
+public:
+	// Why a token couldn't be mapped.
+	enum UnmappedReason {
+		UNMAPPED_TOKEN, // the target revision doesn't have the token
+		UNMAPPED_FUNCTION, // the target revision doesn't have the built-in function
+		UNMAPPED_TYPE, // the target revision's Variant doesn't have the built-in type
+	};
+
+	struct Unmapped {
+		int position; // index into the token buffer
+		UnmappedReason reason;
+	};
+
+private:
+	enum ValueKind : uint8_t {
+		VALUE_AS_IS,
+		VALUE_FUNCTION,
+		VALUE_TYPE,
+		VALUE_UNMAPPED,
+	};
+
+	uint64_t from_rev = 0;
+	uint64_t to_rev = 0;
+	bool identity = false;
+	// local token in `from` -> local token in `to`; what to do with the value above `TOKEN_BITS`
+	uint8_t tokens[GDScriptDecomp::TOKEN_MASK + 1] = {};
+	ValueKind value_kinds[GDScriptDecomp::TOKEN_MASK + 1] = {};
+	Vector<int> funcs; // built-in function ID in `from` -> ID in `to`, -1 if `to` doesn't have it
+	Vector<int> types; // built-in type in `from`'s Variant -> `to`'s Variant, -1 if `to` doesn't have it
+
+	bool _remap_value(uint32_t &r_token, ValueKind p_kind, UnmappedReason &r_reason) const;
+
+public:
+	Error init(const Ref<GDScriptDecomp> &p_from, const Ref<GDScriptDecomp> &p_to);
+
+	uint64_t get_from_rev() const { return from_rev; }
+	uint64_t get_to_rev() const { return to_rev; }
+	// True if the token buffers of the two revisions are interchangeable.
+	bool is_identity() const { return identity; }
+
+	// Local token of `to` for local token `p_token` of `from`, -1 if there isn't one.
+	int remap_token(int p_token) const;
+	// Built-in function ID of `to` for built-in function `p_func` of `from`, -1 if there isn't one.
+	int remap_function(int p_func) const;
+
+	// Converts every token in `p_tokens`, in one pass over the buffer.
+	// Tokens that can't be mapped are copied unchanged and reported in `r_unmapped` instead of stopping the conversion;
+	// returns ERR_UNAVAILABLE if there are any.
+	Error remap_tokens(const Vector<uint32_t> &p_tokens, Vector<uint32_t> &r_tokens, Vector<Unmapped> &r_unmapped) const;
+};
@@ -0,0 +1,105 @@
+/*************************************************************************/
+/*  bytecode_table.cpp                                                   */
+/*************************************************************************/
+
+#include "bytecode_table.h"
+
+#include "bytecode/bytecode_instrumentation.h"
+
+static Vector<GDScriptDecomp::GlobalToken> _token_vector(const uint8_t *p_tokens, int p_count) {
+	Vector<GDScriptDecomp::GlobalToken> ret;
+	ret.resize(p_count);
+	for (int i = 0; i < p_count; i++) {
+		ret.write[i] = GDScriptDecomp::GlobalToken(p_tokens[i]);
+	}
+	return ret;
+}
+
+static Vector<String> _string_vector(const char *const *p_strings, int p_count) {
+	Vector<String> ret;
+	ret.resize(p_count);
+	for (int i = 0; i < p_count; i++) {
+		ret.write[i] = p_strings[i];
+	}
+	return ret;
+}
+
+Vector<GDScriptDecomp::GlobalToken> GDScriptDecompTable::get_added_tokens() const {
+	return _token_vector(revision->added_tokens, revision->added_token_count);
+}
+
+Vector<GDScriptDecomp::GlobalToken> GDScriptDecompTable::get_removed_tokens() const {
+	return _token_vector(revision->removed_tokens, revision->removed_token_count);
+}
+
+Vector<String> GDScriptDecompTable::get_added_functions() const {
+	return _string_vector(revision->added_functions, revision->added_function_count);
+}
+
+Vector<String> GDScriptDecompTable::get_removed_functions() const {
+	return _string_vector(revision->removed_functions, revision->removed_function_count);
+}
+
+Vector<String> GDScriptDecompTable::get_function_arg_count_changed() const {
+	return _string_vector(revision->arg_count_changed, revision->arg_count_changed_count);
+}
+
+String GDScriptDecompTable::get_function_name(int p_func) const {
+	GDRE_INSTRUMENT_LOOKUP(revision->bytecode_rev, LOOKUP_GET_FUNCTION_NAME);
+	if (p_func < 0 || p_func >= revision->func_count) {
+		return "";
+	}
+	return revision->funcs[p_func].name;
+}
+
+int GDScriptDecompTable::get_function_count() const {
+	return revision->func_count;
+}
+
+Pair<int, int> GDScriptDecompTable::get_function_arg_count(int p_func) const {
+	if (p_func < 0 || p_func >= revision->func_count) {
+		return Pair<int, int>(-1, -1);
+	}
+	return Pair<int, int>(revision->funcs[p_func].min_args, revision->funcs[p_func].max_args);
+}
+
+int GDScriptDecompTable::get_token_max() const {
+	return revision->token_max;
+}
+
+int GDScriptDecompTable::get_function_index(const String &p_func) const {
+	GDRE_INSTRUMENT_LOOKUP(revision->bytecode_rev, LOOKUP_GET_FUNCTION_INDEX);
+	int lo = 0;
+	int hi = revision->func_count;
+	while (lo < hi) {
+		int mid = (lo + hi) / 2;
+		int idx = revision->funcs_sorted[mid];
+		const char *name = revision->funcs[idx].name;
+		if (p_func == name) {
+			return idx;
+		}
+		if (p_func < name) {
+			hi = mid;
+		} else {
+			lo = mid + 1;
+		}
+	}
+	return -1;
+}
+
+GDScriptDecomp::GlobalToken GDScriptDecompTable::get_global_token(int p_token) const {
+	GDRE_INSTRUMENT_LOOKUP(revision->bytecode_rev, LOOKUP_GET_GLOBAL_TOKEN);
+	p_token = p_token & TOKEN_MASK;
+	if (p_token >= revision->token_max) {
+		return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+	return GDScriptDecomp::GlobalToken(revision->local_to_global[p_token]);
+}
+
+int GDScriptDecompTable::get_local_token_val(GDScriptDecomp::GlobalToken p_token) const {
+	GDRE_INSTRUMENT_LOOKUP(revision->bytecode_rev, LOOKUP_GET_LOCAL_TOKEN_VAL);
+	if ((unsigned int)p_token > GDScriptDecomp::GlobalToken::G_TK_MAX) {
+		return -1;
+	}
+	return revision->global_to_local[p_token];
+}
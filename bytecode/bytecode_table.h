@@ -0,0 +1,78 @@
+/*************************************************************************/
+/*  bytecode_table.h                                                     */
+/*************************************************************************/
+#pragma once
+
+#include "bytecode/bytecode_base.h"
+
+struct GDScriptDecompFunction {
+	const char *name;
+	int min_args;
+	int max_args;
+};
+
+// Everything that differs between bytecode revisions, as read-only data.
+// `bytecode_generator.py --table` writes one of these for every revision into `bytecode_table_data.cpp`.
+struct GDScriptDecompRevision {
+	int bytecode_rev;
+	int bytecode_version;
+	int engine_ver_major;
+	int variant_ver_major;
+	int parent;
+	const char *engine_version;
+	const char *max_engine_version;
+
+	int token_max;
+	const uint8_t *local_to_global; // `token_max` entries
+	const int8_t *global_to_local; // `G_TK_MAX + 1` entries, -1 if the token isn't in this revision
+
+	int func_count;
+	const GDScriptDecompFunction *funcs;
+	const uint8_t *funcs_sorted; // indices into `funcs`, sorted by name
+
+	int added_token_count;
+	const uint8_t *added_tokens;
+	int removed_token_count;
+	const uint8_t *removed_tokens;
+	int added_function_count;
+	const char *const *added_functions;
+	int removed_function_count;
+	const char *const *removed_functions;
+	int arg_count_changed_count;
+	const char *const *arg_count_changed;
+};
+
+// A decompiler that reads all of its revision-specific behaviour from a `GDScriptDecompRevision`.
+class GDScriptDecompTable : public GDScriptDecomp {
+	GDCLASS(GDScriptDecompTable, GDScriptDecomp);
+
+protected:
+	const GDScriptDecompRevision *revision = nullptr;
+
+	static void _bind_methods() {}
+
+	virtual Vector<GlobalToken> get_added_tokens() const override;
+	virtual Vector<GlobalToken> get_removed_tokens() const override;
+	virtual Vector<String> get_added_functions() const override;
+	virtual Vector<String> get_removed_functions() const override;
+	virtual Vector<String> get_function_arg_count_changed() const override;
+
+public:
+	virtual String get_function_name(int p_func) const override;
+	virtual int get_function_count() const override;
+	virtual Pair<int, int> get_function_arg_count(int p_func) const override;
+	virtual int get_token_max() const override;
+	virtual int get_function_index(const String &p_func) const override;
+	virtual GDScriptDecomp::GlobalToken get_global_token(int p_token) const override;
+	virtual int get_local_token_val(GDScriptDecomp::GlobalToken p_token) const override;
+	virtual int get_bytecode_version() const override { return revision->bytecode_version; }
+	virtual int get_bytecode_rev() const override { return revision->bytecode_rev; }
+	virtual int get_engine_ver_major() const override { return revision->engine_ver_major; }
+	virtual int get_variant_ver_major() const override { return revision->variant_ver_major; }
+	virtual int get_parent() const override { return revision->parent; }
+	virtual String get_engine_version() const override { return revision->engine_version; }
+	virtual String get_max_engine_version() const override { return revision->max_engine_version; }
+
+	GDScriptDecompTable(const GDScriptDecompRevision *p_revision = nullptr) :
+			revision(p_revision) {}
+};
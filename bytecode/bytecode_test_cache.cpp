@@ -0,0 +1,262 @@
+/*************************************************************************/
+/*  bytecode_test_cache.cpp                                              */
+/*************************************************************************/
+
+#include "bytecode_test_cache.h"
+
+#include "bytecode/bytecode_versions.h"
+#include "core/io/dir_access.h"
+#include "core/io/file_access.h"
+#include "core/templates/hashfuncs.h"
+#include "core/templates/local_vector.h"
+#include "editor/gdre_version.gen.h"
+#include "utility/common.h"
+#include "utility/gdre_settings.h"
+
+namespace {
+constexpr uint32_t CACHE_MAGIC = 0x43544447; // "GDTC"
+constexpr uint32_t CACHE_FORMAT_VERSION = 3;
+// Bump this whenever a change to `test_bytecode` or `BytecodeTester` can change which revisions pass a script, so that
+// development builds (which don't change `GDRE_VERSION`) don't reuse results from before the change.
+constexpr uint32_t TEST_LOGIC_VERSION = 1;
+// a second, unrelated seed, so that the two halves of the key are independent hashes
+constexpr uint32_t HASH_SEED_2 = 0x9e3779b9;
+} // namespace
+
+Mutex BytecodeTestCache::mutex;
+HashMap<uint64_t, BytecodeTestCache::Entry> BytecodeTestCache::entries;
+uint64_t BytecodeTestCache::clock = 0;
+int BytecodeTestCache::max_entries = BytecodeTestCache::DEFAULT_MAX_ENTRIES;
+bool BytecodeTestCache::enabled = true;
+bool BytecodeTestCache::loaded = false;
+bool BytecodeTestCache::dirty = false;
+String BytecodeTestCache::path_override;
+
+uint64_t BytecodeTestCache::hash_buffer(const Vector<uint8_t> &p_buffer) {
+	uint64_t lo = hash_murmur3_buffer(p_buffer.ptr(), p_buffer.size());
+	uint64_t hi = hash_murmur3_buffer(p_buffer.ptr(), p_buffer.size(), HASH_SEED_2);
+	return (hi << 32) | lo;
+}
+
+String BytecodeTestCache::get_cache_path() {
+	if (!path_override.is_empty()) {
+		return path_override;
+	}
+	if (!GDRESettings::get_singleton()) {
+		return "";
+	}
+	return GDRESettings::get_singleton()->get_gdre_user_path().path_join("bytecode_test_cache.bin");
+}
+
+static bool _read_revs(const Ref<FileAccess> &f, Vector<uint32_t> &r_revs) {
+	uint32_t count = f->get_32();
+	// a script can't be tested on more revisions than there are, so anything bigger means the file is corrupt
+	if (count > (uint32_t)num_decomp_versions || f->get_position() + (uint64_t)count * 4 > f->get_length()) {
+		return false;
+	}
+	r_revs.resize(count);
+	for (uint32_t i = 0; i < count; i++) {
+		r_revs.write[i] = f->get_32();
+	}
+	return true;
+}
+
+static void _store_revs(const Ref<FileAccess> &f, const Vector<uint32_t> &p_revs) {
+	f->store_32(p_revs.size());
+	for (uint32_t rev : p_revs) {
+		f->store_32(rev);
+	}
+}
+
+// Called with the mutex held.
+void BytecodeTestCache::_load() {
+	loaded = true;
+	String path = get_cache_path();
+	if (path.is_empty() || !FileAccess::exists(path)) {
+		return;
+	}
+	Ref<FileAccess> f = FileAccess::open(path, FileAccess::READ);
+	ERR_FAIL_COND_MSG(f.is_null(), "Failed to open bytecode test cache: " + path);
+	if (f->get_32() != CACHE_MAGIC || f->get_32() != CACHE_FORMAT_VERSION) {
+		WARN_PRINT("Ignoring bytecode test cache with an unknown format: " + path);
+		return;
+	}
+	if (f->get_pascal_string() != bytecode_table_hash || f->get_pascal_string() != GDRE_VERSION || f->get_32() != TEST_LOGIC_VERSION) {
+		// the revision tables or the tests changed, so any of the results might have; it's rewritten on the next save
+		print_verbose("Bytecode revision tables or tests changed, discarding the bytecode test cache");
+		dirty = true;
+		return;
+	}
+	uint32_t count = f->get_32();
+	for (uint32_t i = 0; i < count && !f->eof_reached(); i++) {
+		uint64_t key = f->get_64();
+		Entry entry;
+		entry.size = f->get_32();
+		entry.last_used = f->get_64();
+		if (!_read_revs(f, entry.tested) || !_read_revs(f, entry.passed)) {
+			WARN_PRINT("Bytecode test cache is corrupt, ignoring the rest of it: " + path);
+			break;
+		}
+		clock = MAX(clock, entry.last_used);
+		entries.insert(key, entry);
+	}
+	ERR_FAIL_COND_MSG(f->get_error() != OK && f->get_error() != ERR_FILE_EOF, "Error reading bytecode test cache: " + path);
+}
+
+// Called with the mutex held. Drops the least recently used entries until there are `max_entries` of them.
+void BytecodeTestCache::_evict() {
+	if ((int)entries.size() <= max_entries) {
+		return;
+	}
+	LocalVector<uint64_t> last_used;
+	last_used.reserve(entries.size());
+	for (const KeyValue<uint64_t, Entry> &E : entries) {
+		last_used.push_back(E.value.last_used);
+	}
+	last_used.sort();
+	// `last_used` is unique, it's bumped on every use
+	uint64_t oldest_kept = max_entries > 0 ? last_used[last_used.size() - max_entries] : UINT64_MAX;
+	LocalVector<uint64_t> evicted;
+	for (const KeyValue<uint64_t, Entry> &E : entries) {
+		if (E.value.last_used < oldest_kept) {
+			evicted.push_back(E.key);
+		}
+	}
+	for (uint64_t key : evicted) {
+		entries.erase(key);
+	}
+	dirty = true;
+}
+
+bool BytecodeTestCache::get_results(const Vector<uint8_t> &p_buffer, uint64_t p_hash, Vector<uint32_t> &r_tested, Vector<uint32_t> &r_passed) {
+	MutexLock lock(mutex);
+	if (!loaded) {
+		_load();
+	}
+	Entry *entry = entries.getptr(p_hash);
+	if (!entry || entry->size != (uint32_t)p_buffer.size()) {
+		return false;
+	}
+	// only kept on disk if something else changes too, a hit alone doesn't make the file worth rewriting
+	entry->last_used = ++clock;
+	r_tested = entry->tested;
+	r_passed = entry->passed;
+	return true;
+}
+
+void BytecodeTestCache::add_results(const Vector<uint8_t> &p_buffer, uint64_t p_hash, const Vector<uint32_t> &p_tested, const Vector<uint32_t> &p_passed) {
+	MutexLock lock(mutex);
+	if (!loaded) {
+		_load();
+	}
+	Entry *entry = entries.getptr(p_hash);
+	if (!entry || entry->size != (uint32_t)p_buffer.size()) {
+		entry = &entries.insert(p_hash, Entry())->value;
+		entry->size = p_buffer.size();
+	}
+	entry->last_used = ++clock;
+	for (uint32_t rev : p_tested) {
+		if (!entry->tested.has(rev)) {
+			entry->tested.push_back(rev);
+		}
+	}
+	for (uint32_t rev : p_passed) {
+		if (!entry->passed.has(rev)) {
+			entry->passed.push_back(rev);
+		}
+	}
+	dirty = true;
+	// evicting sorts every entry, so let it go a little over before doing it
+	if ((int)entries.size() > max_entries + max_entries / 8) {
+		_evict();
+	}
+}
+
+void BytecodeTestCache::set_cache_path(const String &p_path) {
+	MutexLock lock(mutex);
+	path_override = p_path;
+	entries.clear();
+	clock = 0;
+	loaded = false;
+	dirty = false;
+}
+
+void BytecodeTestCache::set_enabled(bool p_enabled) {
+	MutexLock lock(mutex);
+	enabled = p_enabled;
+}
+
+bool BytecodeTestCache::is_enabled() {
+	MutexLock lock(mutex);
+	return enabled;
+}
+
+void BytecodeTestCache::set_max_entries(int p_max_entries) {
+	MutexLock lock(mutex);
+	max_entries = MAX(p_max_entries, 0);
+	_evict();
+}
+
+int BytecodeTestCache::get_max_entries() {
+	MutexLock lock(mutex);
+	return max_entries;
+}
+
+int BytecodeTestCache::get_size() {
+	MutexLock lock(mutex);
+	if (!loaded) {
+		_load();
+	}
+	return entries.size();
+}
+
+void BytecodeTestCache::clear() {
+	MutexLock lock(mutex);
+	entries.clear();
+	clock = 0;
+	// don't load what's on disk over the top of this
+	loaded = true;
+	dirty = true;
+}
+
+Error BytecodeTestCache::save() {
+	MutexLock lock(mutex);
+	if (!dirty) {
+		return OK;
+	}
+	String path = get_cache_path();
+	if (path.is_empty()) {
+		return ERR_UNCONFIGURED;
+	}
+	_evict();
+	Error err = gdre::ensure_dir(path.get_base_dir());
+	ERR_FAIL_COND_V_MSG(err != OK, err, "Failed to create directory for bytecode test cache: " + path);
+	// written to a temporary file first, so that a crash part-way through doesn't leave a truncated cache
+	String tmp_path = path + ".tmp";
+	Ref<FileAccess> f = FileAccess::open(tmp_path, FileAccess::WRITE, &err);
+	ERR_FAIL_COND_V_MSG(f.is_null(), err, "Failed to open bytecode test cache for writing: " + tmp_path);
+	f->store_32(CACHE_MAGIC);
+	f->store_32(CACHE_FORMAT_VERSION);
+	f->store_pascal_string(bytecode_table_hash);
+	f->store_pascal_string(GDRE_VERSION);
+	f->store_32(TEST_LOGIC_VERSION);
+	f->store_32(entries.size());
+	for (const KeyValue<uint64_t, Entry> &E : entries) {
+		f->store_64(E.key);
+		f->store_32(E.value.size);
+		f->store_64(E.value.last_used);
+		_store_revs(f, E.value.tested);
+		_store_revs(f, E.value.passed);
+	}
+	err = f->get_error();
+	f.unref();
+	ERR_FAIL_COND_V_MSG(err != OK, err, "Failed to write bytecode test cache: " + tmp_path);
+	Ref<DirAccess> da = DirAccess::create(DirAccess::ACCESS_FILESYSTEM);
+	if (FileAccess::exists(path)) {
+		da->remove(path);
+	}
+	err = da->rename(tmp_path, path);
+	ERR_FAIL_COND_V_MSG(err != OK, err, "Failed to replace bytecode test cache: " + path);
+	dirty = false;
+	return OK;
+}
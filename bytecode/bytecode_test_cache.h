@@ -0,0 +1,64 @@
+/*************************************************************************/
+/*  bytecode_test_cache.h                                                */
+/*************************************************************************/
+#pragma once
+
+#include "core/os/mutex.h"
+#include "core/string/ustring.h"
+#include "core/templates/hash_map.h"
+#include "core/templates/vector.h"
+
+// The revisions that were tested on each script, and which of them passed `test_bytecode`, kept on disk between runs
+// so that reopening the same game (or a patch that only changes a few scripts) only has to test the scripts (and
+// revisions) it hasn't seen.
+// Scripts are looked up by a hash of their (decrypted) contents, and the whole cache is dropped whenever
+// `bytecode_table_hash` changes, i.e. whenever `misc/bytecode_versions.json` does.
+// When there are more than `max_entries` scripts, the least recently used ones are dropped.
+class BytecodeTestCache {
+public:
+	static constexpr int DEFAULT_MAX_ENTRIES = 65536;
+
+private:
+	struct Entry {
+		uint32_t size = 0;
+		uint64_t last_used = 0;
+		Vector<uint32_t> tested;
+		// always a subset of `tested`
+		Vector<uint32_t> passed;
+	};
+
+	static Mutex mutex;
+	static HashMap<uint64_t, Entry> entries;
+	static uint64_t clock;
+	static int max_entries;
+	static bool enabled;
+	static bool loaded;
+	static bool dirty;
+	static String path_override;
+
+	static void _load();
+	static void _evict();
+
+public:
+	static uint64_t hash_buffer(const Vector<uint8_t> &p_buffer);
+
+	// False if `p_buffer` hasn't been tested yet.
+	static bool get_results(const Vector<uint8_t> &p_buffer, uint64_t p_hash, Vector<uint32_t> &r_tested, Vector<uint32_t> &r_passed);
+	// Adds the results of testing `p_tested` on `p_buffer` to what's already known about it.
+	static void add_results(const Vector<uint8_t> &p_buffer, uint64_t p_hash, const Vector<uint32_t> &p_tested, const Vector<uint32_t> &p_passed);
+
+	static void set_enabled(bool p_enabled);
+	static bool is_enabled();
+	static void set_max_entries(int p_max_entries);
+	static int get_max_entries();
+	static int get_size();
+	// Forgets every script, including the ones on disk the next time it's saved.
+	static void clear();
+
+	static String get_cache_path();
+	// Uses `p_path` instead of the file in the GDRE user directory (or goes back to it, if empty). Whatever is in memory
+	// is dropped without being saved, and the cache is loaded from the new path the next time it's used.
+	static void set_cache_path(const String &p_path);
+	// Writes the cache to `get_cache_path` if anything was added since it was loaded.
+	static Error save();
+};
@@ -1,10 +1,28 @@
 #include "bytecode/bytecode_tester.h"
 #include "bytecode/bytecode_base.h"
+#include "bytecode/bytecode_discriminators.h"
+#include "bytecode/bytecode_test_cache.h"
 #include "bytecode/bytecode_versions.h"
 #include "core/io/file_access.h"
+#include "core/io/marshalls.h"
+#include "core/object/worker_thread_pool.h"
 #include "utility/gdre_settings.h"
 #include "utility/godotver.h"
 
+#include <atomic>
+
+// A script read (and, for `.gde`, decrypted) once, and shared by every pass over the candidate revisions.
+struct BytecodeFile {
+	String path;
+	Vector<uint8_t> buffer; // empty if it couldn't be read
+	int bytecode_version = -1; // same as `GDScriptDecomp::read_bytecode_version(_encrypted)`
+};
+
+static Vector<BytecodeFile> _load_bytecode_files(const Vector<String> &p_paths);
+static int _get_bytecode_version(const Vector<BytecodeFile> &p_files);
+static Vector<Ref<GDScriptDecomp>> _get_possible_decomps(const Vector<BytecodeFile> &p_files, bool p_include_dev, bool print_verbosely);
+static uint64_t _generic_test(const Vector<BytecodeFile> &p_files, int ver_major_hint, int ver_minor_hint, bool include_dev, bool print_log_on_fail);
+
 /***********2.1 testing ********
  discontintuities in the functions for bytecode 10 starts here (-1 means varargs):
 
@@ -146,6 +164,60 @@ built-in func divergence for bytecode version 13 (3.1.x only)
 // TODO: add this
 */
 
+static Vector<BytecodeFile> _load_bytecode_files(const Vector<String> &p_paths) {
+	Vector<BytecodeFile> files;
+	files.resize(p_paths.size());
+	Vector<uint8_t> key;
+	bool have_key = false;
+	for (int i = 0; i < p_paths.size(); i++) {
+		BytecodeFile &file = files.write[i];
+		file.path = p_paths[i];
+		if (file.path.get_extension().to_lower() == "gde") {
+			if (!have_key) {
+				key = GDRESettings::get_singleton()->get_encryption_key();
+				have_key = true;
+			}
+			Error err = GDScriptDecomp::get_buffer_encrypted(file.path, 3, key, file.buffer);
+			if (err) {
+				file.buffer.clear();
+				file.bytecode_version = err == ERR_UNAUTHORIZED ? -2 : -1;
+				WARN_PRINT("Could not read encrypted bytecode file: " + file.path);
+				continue;
+			}
+		} else {
+			file.buffer = FileAccess::get_file_as_bytes(file.path);
+			if (file.buffer.size() == 0) {
+				WARN_PRINT("Could not read bytecode file: " + file.path);
+				continue;
+			}
+		}
+		const uint8_t *buf = file.buffer.ptr();
+		if (file.buffer.size() >= 24 && buf[0] == 'G' && buf[1] == 'D' && buf[2] == 'S' && buf[3] == 'C') {
+			file.bytecode_version = decode_uint32(&buf[4]);
+		}
+	}
+	return files;
+}
+
+static int _get_bytecode_version(const Vector<BytecodeFile> &p_files) {
+	int bytecode_version = 0;
+	for (const BytecodeFile &file : p_files) {
+		if (file.bytecode_version == -2) {
+			return -2; // encryption error
+		}
+		if (file.bytecode_version == -1) {
+			continue;
+		}
+		if (bytecode_version == 0) {
+			bytecode_version = file.bytecode_version;
+		} else if (file.bytecode_version != bytecode_version) {
+			// Hell no.
+			return -1;
+		}
+	}
+	return bytecode_version;
+}
+
 int BytecodeTester::get_bytecode_version(const Vector<String> &bytecode_files) {
 	int bytecode_version = 0;
 	if (bytecode_files.size() == 0) {
@@ -176,11 +248,16 @@ int BytecodeTester::get_bytecode_version(const Vector<String> &bytecode_files) {
 }
 
 uint64_t BytecodeTester::generic_test(const Vector<String> &p_paths, int ver_major_hint, int ver_minor_hint, bool include_dev, bool print_log_on_fail) {
-	int detected_bytecode_version = get_bytecode_version(p_paths);
+	// every file is read once here, then shared by the dev-version retry and the verbose rerun
+	return _generic_test(_load_bytecode_files(p_paths), ver_major_hint, ver_minor_hint, include_dev, print_log_on_fail);
+}
+
+static uint64_t _generic_test(const Vector<BytecodeFile> &p_files, int ver_major_hint, int ver_minor_hint, bool include_dev, bool print_log_on_fail) {
+	int detected_bytecode_version = _get_bytecode_version(p_files);
 	ERR_FAIL_COND_V_MSG(detected_bytecode_version == -1, {}, "Inconsistent byecode versions across files!!!");
 	ERR_FAIL_COND_V_MSG(detected_bytecode_version <= 0, {}, "Could not read bytecode version from files.");
 
-	Vector<Ref<GDScriptDecomp>> decomp_versions = BytecodeTester::get_possible_decomps(p_paths, include_dev);
+	Vector<Ref<GDScriptDecomp>> decomp_versions = _get_possible_decomps(p_files, include_dev, false);
 	if (decomp_versions.size() == 1) {
 		// easy
 		return decomp_versions[0]->get_bytecode_rev();
@@ -188,12 +265,12 @@ uint64_t BytecodeTester::generic_test(const Vector<String> &p_paths, int ver_maj
 	if (decomp_versions.size() == 0) {
 		if (!include_dev) {
 			// try again with the dev versions
-			return generic_test(p_paths, ver_major_hint, ver_minor_hint, true, print_log_on_fail);
+			return _generic_test(p_files, ver_major_hint, ver_minor_hint, true, print_log_on_fail);
 		}
 		// else fail
 		if (print_log_on_fail) {
 			// run the tests with print_verbose = true to put out a decent error log of what happened.
-			BytecodeTester::get_possible_decomps(p_paths, include_dev, true);
+			_get_possible_decomps(p_files, include_dev, true);
 		}
 		ERR_FAIL_V_MSG(0, "Failed to detect GDScript revision for bytecode version " + vformat("%d", detected_bytecode_version) + ", engine version " + vformat("%d.%d", ver_major_hint, ver_minor_hint) + ", please report this issue on GitHub.");
 	}
@@ -232,9 +309,9 @@ uint64_t BytecodeTester::test_files_2_1(const Vector<String> &p_paths) {
 	bool _85585c7_passed = false;
 	bool _7124599_failed = false;
 	bool _7124599_passed = false;
-	Ref<GDScriptDecomp_ed80f45> decomp_ed80f45 = memnew(GDScriptDecomp_ed80f45);
-	Ref<GDScriptDecomp_85585c7> decomp_85585c7 = memnew(GDScriptDecomp_85585c7);
-	Ref<GDScriptDecomp_7124599> decomp_7124599 = memnew(GDScriptDecomp_7124599);
+	Ref<GDScriptDecomp> decomp_ed80f45 = GDScriptDecomp::create_decomp_for_commit(0xed80f45);
+	Ref<GDScriptDecomp> decomp_85585c7 = GDScriptDecomp::create_decomp_for_commit(0x85585c7);
+	Ref<GDScriptDecomp> decomp_7124599 = GDScriptDecomp::create_decomp_for_commit(0x7124599);
 	int func_max = 0;
 	int token_max = 0;
 	for (String path : p_paths) {
@@ -348,9 +425,9 @@ uint64_t BytecodeTester::test_files_3_1(const Vector<String> &p_paths, const Vec
 	bool _1ca61a3_failed = false;
 	bool _1ca61a3_passed = false;
 
-	Ref<GDScriptDecomp_514a3fb> decomp_514a3fb = memnew(GDScriptDecomp_514a3fb);
-	Ref<GDScriptDecomp_1a36141> decomp_1a36141 = memnew(GDScriptDecomp_1a36141);
-	Ref<GDScriptDecomp_1ca61a3> decomp_1ca61a3 = memnew(GDScriptDecomp_1ca61a3);
+	Ref<GDScriptDecomp> decomp_514a3fb = GDScriptDecomp::create_decomp_for_commit(0x514a3fb);
+	Ref<GDScriptDecomp> decomp_1a36141 = GDScriptDecomp::create_decomp_for_commit(0x1a36141);
+	Ref<GDScriptDecomp> decomp_1ca61a3 = GDScriptDecomp::create_decomp_for_commit(0x1ca61a3);
 	int func_max = 0;
 	int token_max = 0;
 
@@ -488,48 +565,476 @@ uint64_t BytecodeTester::test_files(const Vector<String> &p_paths, int ver_major
 	return rev;
 }
 
-Vector<Ref<GDScriptDecomp>> get_possibles_from_set(const Vector<String> &bytecode_files, const Vector<Ref<GDScriptDecomp>> &decomps, bool print_verbosely = false) {
-	Vector<Ref<GDScriptDecomp>> passed;
+// Mirrors `GDScriptDecomp::get_func_arg_count_and_params` for every revision with this call signature.
+static int _get_call_arg_count(const GDScriptCallSignature &p_sig, int p_pos, const Vector<uint32_t> &p_tokens) {
+	int bracket_open = 0;
+	int arg_count = 0;
+	int curr_arg_size = 0;
+	int pos = p_pos + 2;
+	int t = -1;
+	for (; pos < p_tokens.size(); pos++) {
+		t = p_tokens[pos] & GDScriptDecomp::TOKEN_MASK;
+		if (t == p_sig.bracket_open || t == p_sig.curly_bracket_open || t == p_sig.parenthesis_open) {
+			bracket_open++;
+		} else if (t == p_sig.bracket_close || t == p_sig.curly_bracket_close || t == p_sig.parenthesis_close) {
+			bracket_open--;
+		} else if (t == p_sig.comma && bracket_open == 0) {
+			arg_count++;
+		}
+		if (bracket_open == -1) {
+			if (curr_arg_size > 0) {
+				arg_count++;
+			}
+			break;
+		}
+		if (t != p_sig.indent && t != p_sig.dedent && t != p_sig.newline && t != p_sig.cursor) {
+			curr_arg_size++;
+		}
+	}
+	if (pos == p_tokens.size() || t != p_sig.parenthesis_close) {
+		return -1;
+	}
+	return arg_count;
+}
 
-	for (const auto &decomp : decomps) {
-		bool failed = false;
-		for (const String &file : bytecode_files) {
-			Vector<uint8_t> buffer;
-			if (file.get_extension().to_lower() == "gde") {
-				Error err = GDScriptDecomp::get_buffer_encrypted(file, 3, GDRESettings::get_singleton()->get_encryption_key(), buffer);
-				if (err) {
-					WARN_PRINT("Could not read encrypted bytecode file: " + file);
-					continue;
-				}
-			} else {
-				buffer = FileAccess::get_file_as_bytes(file);
-				if (buffer.size() == 0) {
-					WARN_PRINT("Could not read bytecode file: " + file);
+// The built-in calls in a token stream, as found by every revision with the same call signature.
+struct CallSummary {
+	bool truncated_call = false; // a call with nothing after the open parenthesis, which `_test_bytecode` always fails
+	int max_func_id = -1;
+	// the fewest and most arguments each function ID was called with; min > max if it wasn't called
+	int min_arg_count[GDScriptDecomp::TOKEN_MASK + 1];
+	int max_arg_count[GDScriptDecomp::TOKEN_MASK + 1];
+
+	void build(const GDScriptCallSignature &p_sig, const Vector<uint32_t> &p_tokens, bool p_count_args) {
+		for (int f = 0; f <= GDScriptDecomp::TOKEN_MASK; f++) {
+			min_arg_count[f] = INT_MAX;
+			max_arg_count[f] = INT_MIN;
+		}
+		for (int i = 0; i < p_tokens.size(); i++) {
+			// same conditions as `GDScriptDecomp::is_token_builtin_func`
+			if ((int)(p_tokens[i] & GDScriptDecomp::TOKEN_MASK) != p_sig.builtin_func) {
+				continue;
+			}
+			if (i > 0) {
+				int prev = p_tokens[i - 1] & GDScriptDecomp::TOKEN_MASK;
+				if (prev == p_sig.period || prev == p_sig.pr_function) {
 					continue;
 				}
 			}
-			auto result = decomp->test_bytecode(buffer, print_verbosely);
-			if (result == GDScriptDecomp::BYTECODE_TEST_FAIL || result == GDScriptDecomp::BYTECODE_TEST_CORRUPT) {
-				if (print_verbosely) {
-					print_line("\t Test failed on file " + file);
+			if (i + 1 >= p_tokens.size() || (int)(p_tokens[i + 1] & GDScriptDecomp::TOKEN_MASK) != p_sig.parenthesis_open) {
+				continue;
+			}
+			if (i + 2 >= p_tokens.size()) {
+				truncated_call = true;
+				return;
+			}
+			int func_id = p_tokens[i] >> GDScriptDecomp::TOKEN_BITS;
+			max_func_id = MAX(max_func_id, func_id);
+			if (p_count_args && func_id <= GDScriptDecomp::TOKEN_MASK) {
+				int arg_count = _get_call_arg_count(p_sig, i, p_tokens);
+				min_arg_count[func_id] = MIN(min_arg_count[func_id], arg_count);
+				max_arg_count[func_id] = MAX(max_arg_count[func_id], arg_count);
+			}
+		}
+	}
+};
+
+// Everything about a parsed buffer that the generated discriminators can be checked against; built once per buffer
+// and shared by every candidate.
+struct BytecodeSummary {
+	uint32_t token_histogram[GDScriptDecomp::TOKEN_MASK + 1] = {};
+	uint64_t present_tokens[4] = {};
+	Vector<CallSummary> calls; // one per call signature
+
+	void build(const GDScriptRevisionDiscriminators &p_disc, const Vector<uint32_t> &p_tokens) {
+		for (uint32_t token : p_tokens) {
+			token_histogram[token & GDScriptDecomp::TOKEN_MASK]++;
+		}
+		for (int t = 0; t <= GDScriptDecomp::TOKEN_MASK; t++) {
+			if (token_histogram[t] > 0) {
+				present_tokens[t / 64] |= uint64_t(1) << (t % 64);
+			}
+		}
+		// the argument count is only checked before GDScript 2.0
+		bool count_args = p_disc.bytecode_version < GDScriptDecomp::GDSCRIPT_2_0_VERSION;
+		calls.resize(p_disc.call_signature_count);
+		for (int s = 0; s < p_disc.call_signature_count; s++) {
+			calls.write[s].build(p_disc.call_signatures[s], p_tokens, count_args);
+		}
+	}
+
+	// False if `test_bytecode` is certain to fail for this candidate.
+	bool check(const GDScriptDiscriminatorCandidate &p_candidate) const {
+		for (int w = 0; w < 4; w++) {
+			if (present_tokens[w] & ~p_candidate.valid_tokens[w]) {
+				return false;
+			}
+		}
+		const CallSummary &call = calls[p_candidate.call_signature];
+		if (call.truncated_call || call.max_func_id >= p_candidate.func_count) {
+			return false;
+		}
+		for (int f = 0; f <= call.max_func_id; f++) {
+			if (call.min_arg_count[f] <= call.max_arg_count[f] && (call.min_arg_count[f] < p_candidate.arities[f].min_args || call.max_arg_count[f] > p_candidate.arities[f].max_args)) {
+				return false;
+			}
+		}
+		return true;
+	}
+};
+
+// Parses `p_buffer` once for each variant version among `p_decomps` and calls `p_func(decomp, state, passed_discriminators)`
+// for each of them; `state` is nullptr if the buffer couldn't be parsed.
+template <typename F>
+static void _for_each_candidate(const Vector<uint8_t> &p_buffer, const Vector<Ref<GDScriptDecomp>> &p_decomps, bool p_use_discriminators, F p_func) {
+	const GDScriptRevisionDiscriminators *disc = p_use_discriminators && p_decomps.size() > 1 ? get_revision_discriminators(p_decomps[0]->get_bytecode_version()) : nullptr;
+	Vector<bool> done;
+	done.resize(p_decomps.size());
+	done.fill(false);
+	for (int i = 0; i < p_decomps.size(); i++) {
+		if (done[i]) {
+			continue;
+		}
+		// The token stream only depends on how the constants are decoded.
+		int variant_ver_major = p_decomps[i]->get_variant_ver_major();
+		GDScriptDecomp::ScriptState state;
+		bool parsed = p_decomps[i]->get_script_state(p_buffer, state) == OK;
+		BytecodeSummary summary;
+		bool summarized = parsed && disc && state.bytecode_version == disc->bytecode_version;
+		if (summarized) {
+			summary.build(*disc, state.tokens);
+		}
+		for (int j = i; j < p_decomps.size(); j++) {
+			if (done[j] || p_decomps[j]->get_variant_ver_major() != variant_ver_major) {
+				continue;
+			}
+			done.write[j] = true;
+			bool passed = true;
+			if (summarized) {
+				for (int c = 0; c < disc->candidate_count; c++) {
+					if (disc->candidates[c].bytecode_rev == (uint64_t)p_decomps[j]->get_bytecode_rev()) {
+						passed = summary.check(disc->candidates[c]);
+						break;
+					}
 				}
-				failed = true;
+			}
+			p_func(p_decomps[j], parsed ? &state : nullptr, passed);
+		}
+	}
+}
+
+Vector<Ref<GDScriptDecomp>> BytecodeTester::narrow_candidates(const Vector<uint8_t> &p_buffer, const Vector<Ref<GDScriptDecomp>> &p_decomps) {
+	Vector<Ref<GDScriptDecomp>> ret;
+	_for_each_candidate(p_buffer, p_decomps, true, [&](const Ref<GDScriptDecomp> &p_decomp, const GDScriptDecomp::ScriptState *p_state, bool p_passed) {
+		if (p_passed) {
+			ret.push_back(p_decomp);
+		}
+	});
+	return ret;
+}
+
+Vector<Ref<GDScriptDecomp>> BytecodeTester::test_candidates(const Vector<uint8_t> &p_buffer, const Vector<Ref<GDScriptDecomp>> &p_decomps, bool print_verbosely) {
+	Vector<Ref<GDScriptDecomp>> passed;
+	// when printing verbosely, run the full test on every candidate so the log says why each one failed
+	_for_each_candidate(p_buffer, p_decomps, !print_verbosely, [&](const Ref<GDScriptDecomp> &p_decomp, const GDScriptDecomp::ScriptState *p_state, bool p_passed) {
+		if (!p_passed) {
+			return;
+		}
+		GDScriptDecomp::BytecodeTestResult result;
+		if (p_state) {
+			result = p_decomp->test_script_state(*p_state, print_verbosely);
+		} else {
+			// let it report why the buffer is corrupt
+			result = p_decomp->test_bytecode(p_buffer, print_verbosely);
+		}
+		if (result != GDScriptDecomp::BYTECODE_TEST_FAIL && result != GDScriptDecomp::BYTECODE_TEST_CORRUPT) {
+			passed.push_back(p_decomp);
+		}
+	});
+	return passed;
+}
+
+// Tests every file against the candidates on the worker threads. Each chunk of work has its own instances of the
+// candidate revisions, since testing sets their error messages; a candidate that fails a file is dropped from `alive`
+// for every chunk, and the chunks stop taking files once nothing is left.
+struct CandidateTestData {
+	static constexpr int MAX_CANDIDATES = 64;
+
+	const Vector<BytecodeFile> *files = nullptr;
+	Vector<Vector<Ref<GDScriptDecomp>>> chunk_decomps;
+	std::atomic<uint64_t> alive = 0;
+	std::atomic<int> next_file = 0;
+	std::atomic<bool> any_tested = false;
+
+	void test_chunk(uint32_t p_chunk, void *p_userdata) {
+		const Vector<Ref<GDScriptDecomp>> &decomps = chunk_decomps[p_chunk];
+		Vector<Ref<GDScriptDecomp>> candidates;
+		while (true) {
+			uint64_t tested = alive.load(std::memory_order_acquire);
+			if (tested == 0) {
 				break;
 			}
+			int i = next_file.fetch_add(1, std::memory_order_relaxed);
+			if (i >= files->size()) {
+				break;
+			}
+			const BytecodeFile &file = (*files)[i];
+			if (file.buffer.is_empty()) {
+				continue;
+			}
+			candidates.clear();
+			for (int c = 0; c < decomps.size(); c++) {
+				if (tested & (uint64_t(1) << c)) {
+					candidates.push_back(decomps[c]);
+				}
+			}
+			any_tested.store(true, std::memory_order_relaxed);
+			uint64_t failed = tested;
+			for (const Ref<GDScriptDecomp> &decomp : BytecodeTester::test_candidates(file.buffer, candidates)) {
+				failed &= ~(uint64_t(1) << decomps.find(decomp));
+			}
+			if (failed) {
+				alive.fetch_and(~failed, std::memory_order_acq_rel);
+			}
 		}
-		if (!failed) {
-			passed.append(decomp);
+	}
+};
+
+// The candidates in `p_decomps` whose bit is set in `p_alive`, in the order `test_candidates` returns them, grouped by
+// variant version.
+static Vector<Ref<GDScriptDecomp>> _get_alive_decomps(const Vector<Ref<GDScriptDecomp>> &p_decomps, uint64_t p_alive) {
+	Vector<Ref<GDScriptDecomp>> passed;
+	uint64_t done = 0;
+	for (int i = 0; i < p_decomps.size(); i++) {
+		int variant_ver_major = p_decomps[i]->get_variant_ver_major();
+		for (int j = i; j < p_decomps.size(); j++) {
+			uint64_t bit = uint64_t(1) << j;
+			if (!(done & bit) && p_decomps[j]->get_variant_ver_major() == variant_ver_major) {
+				done |= bit;
+				if (p_alive & bit) {
+					passed.push_back(p_decomps[j]);
+				}
+			}
 		}
 	}
 	return passed;
 }
 
-Vector<Ref<GDScriptDecomp>> BytecodeTester::get_possible_decomps(Vector<String> bytecode_files, bool include_dev, bool print_verbosely) {
-	int bytecode_version = get_bytecode_version(bytecode_files);
+// Testing sets the candidates' error messages, so every test runs on its own instances rather than the caller's.
+static Vector<Ref<GDScriptDecomp>> _clone_decomps(const Vector<Ref<GDScriptDecomp>> &p_decomps) {
+	Vector<Ref<GDScriptDecomp>> decomps;
+	for (const Ref<GDScriptDecomp> &decomp : p_decomps) {
+		decomps.push_back(GDScriptDecomp::create_decomp_for_commit(decomp->get_bytecode_rev()));
+	}
+	return decomps;
+}
+
+static Vector<Ref<GDScriptDecomp>> _test_possibles(const Vector<BytecodeFile> &p_files, const Vector<Ref<GDScriptDecomp>> &p_decomps, bool print_verbosely) {
+	int chunk_count = MIN(WorkerThreadPool::get_singleton()->get_thread_count(), p_files.size());
+	// when printing verbosely the log has to be in file order
+	if (print_verbosely || chunk_count < 2 || p_decomps.size() > CandidateTestData::MAX_CANDIDATES) {
+		Vector<Ref<GDScriptDecomp>> decomps = _clone_decomps(p_decomps);
+		Vector<Ref<GDScriptDecomp>> passed = decomps;
+		for (const BytecodeFile &file : p_files) {
+			if (passed.is_empty()) {
+				break;
+			}
+			if (file.buffer.is_empty()) {
+				continue;
+			}
+			int prev_count = passed.size();
+			passed = BytecodeTester::test_candidates(file.buffer, passed, print_verbosely);
+			if (print_verbosely && passed.size() < prev_count) {
+				print_line("\t Test failed on file " + file.path);
+			}
+		}
+		// the caller gets back its own instances, in the order `test_candidates` left them
+		Vector<Ref<GDScriptDecomp>> ret;
+		for (const Ref<GDScriptDecomp> &decomp : passed) {
+			ret.push_back(p_decomps[decomps.find(decomp)]);
+		}
+		return ret;
+	}
+
+	// A candidate passes if it passes every file, so testing the files in any order, on any thread, gives the same
+	// candidates as testing them one after another.
+	CandidateTestData data;
+	data.files = &p_files;
+	data.alive = p_decomps.size() == CandidateTestData::MAX_CANDIDATES ? ~uint64_t(0) : (uint64_t(1) << p_decomps.size()) - 1;
+	data.chunk_decomps.resize(chunk_count);
+	for (int i = 0; i < chunk_count; i++) {
+		data.chunk_decomps.write[i] = _clone_decomps(p_decomps);
+	}
+	WorkerThreadPool::GroupID group_id = WorkerThreadPool::get_singleton()->add_template_group_task(
+			&data,
+			&CandidateTestData::test_chunk,
+			(void *)nullptr,
+			chunk_count, -1, true, SNAME("BytecodeTester::get_possible_decomps"));
+	WorkerThreadPool::get_singleton()->wait_for_group_task_completion(group_id);
+
+	if (!data.any_tested.load(std::memory_order_relaxed)) {
+		return p_decomps;
+	}
+	return _get_alive_decomps(p_decomps, data.alive.load(std::memory_order_acquire));
+}
+
+// Tests each of `indices` against the candidates that haven't been tested on it yet, for `BytecodeTestCache`. Like
+// `CandidateTestData`, a candidate that fails a file is dropped from `alive` for every chunk, and each chunk has its
+// own instances of the candidates; what was tested on each file, and what passed, is kept so it can be cached.
+struct FileTestData {
+	const Vector<BytecodeFile> *files = nullptr;
+	Vector<int> indices;
+	Vector<uint64_t> untested; // the candidates that each of `indices` still has to be tested against
+	Vector<Vector<Ref<GDScriptDecomp>>> chunk_decomps;
+	uint64_t *tested = nullptr;
+	uint64_t *passed = nullptr;
+	std::atomic<uint64_t> alive = 0;
+	std::atomic<int> next_index = 0;
+
+	void test_chunk(uint32_t p_chunk, void *p_userdata) {
+		const Vector<Ref<GDScriptDecomp>> &decomps = chunk_decomps[p_chunk];
+		Vector<Ref<GDScriptDecomp>> candidates;
+		while (true) {
+			uint64_t alive_now = alive.load(std::memory_order_acquire);
+			if (alive_now == 0) {
+				break;
+			}
+			int i = next_index.fetch_add(1, std::memory_order_relaxed);
+			if (i >= indices.size()) {
+				break;
+			}
+			uint64_t to_test = alive_now & untested[i];
+			if (to_test == 0) {
+				continue;
+			}
+			candidates.clear();
+			for (int c = 0; c < decomps.size(); c++) {
+				if (to_test & (uint64_t(1) << c)) {
+					candidates.push_back(decomps[c]);
+				}
+			}
+			uint64_t passed_now = 0;
+			for (const Ref<GDScriptDecomp> &decomp : BytecodeTester::test_candidates((*files)[indices[i]].buffer, candidates)) {
+				passed_now |= uint64_t(1) << decomps.find(decomp);
+			}
+			tested[i] = to_test;
+			passed[i] = passed_now;
+			if (to_test & ~passed_now) {
+				alive.fetch_and(~(to_test & ~passed_now), std::memory_order_acq_rel);
+			}
+		}
+	}
+};
+
+// Looks each file up in `BytecodeTestCache`, and only tests it against the candidates it hasn't been tested on before;
+// what gets tested is added to the cache. A file that has never been seen costs the same as it does without the cache.
+static Vector<Ref<GDScriptDecomp>> _test_possibles_cached(const Vector<BytecodeFile> &p_files, const Vector<Ref<GDScriptDecomp>> &p_decomps) {
+	uint64_t all = p_decomps.size() == CandidateTestData::MAX_CANDIDATES ? ~uint64_t(0) : (uint64_t(1) << p_decomps.size()) - 1;
+	uint64_t alive = all;
+	bool any_tested = false;
+	FileTestData data;
+	data.files = &p_files;
+	Vector<uint64_t> hashes;
+	hashes.resize(p_files.size());
+	Vector<uint32_t> tested_revs;
+	Vector<uint32_t> passed_revs;
+	for (int i = 0; i < p_files.size(); i++) {
+		const BytecodeFile &file = p_files[i];
+		if (file.buffer.is_empty()) {
+			continue;
+		}
+		any_tested = true;
+		hashes.write[i] = BytecodeTestCache::hash_buffer(file.buffer);
+		uint64_t untested = all;
+		if (BytecodeTestCache::get_results(file.buffer, hashes[i], tested_revs, passed_revs)) {
+			for (int c = 0; c < p_decomps.size(); c++) {
+				uint32_t rev = p_decomps[c]->get_bytecode_rev();
+				if (tested_revs.has(rev)) {
+					untested &= ~(uint64_t(1) << c);
+					if (!passed_revs.has(rev)) {
+						alive &= ~(uint64_t(1) << c);
+					}
+				}
+			}
+		}
+		if (untested) {
+			data.indices.push_back(i);
+			data.untested.push_back(untested);
+		}
+	}
+	if (!any_tested) {
+		return p_decomps;
+	}
+	// if the cached results already ruled everything out, testing the other files can't bring anything back
+	if (alive == 0 || data.indices.is_empty()) {
+		return _get_alive_decomps(p_decomps, alive);
+	}
+
+	Vector<uint64_t> tested;
+	Vector<uint64_t> passed;
+	tested.resize(data.indices.size());
+	passed.resize(data.indices.size());
+	tested.fill(0);
+	passed.fill(0);
+	data.tested = tested.ptrw();
+	data.passed = passed.ptrw();
+	data.alive = alive;
+	int chunk_count = MIN(WorkerThreadPool::get_singleton()->get_thread_count(), data.indices.size());
+	chunk_count = MAX(chunk_count, 1);
+	data.chunk_decomps.resize(chunk_count);
+	for (int i = 0; i < chunk_count; i++) {
+		data.chunk_decomps.write[i] = _clone_decomps(p_decomps);
+	}
+	if (chunk_count < 2) {
+		data.test_chunk(0, nullptr);
+	} else {
+		WorkerThreadPool::GroupID group_id = WorkerThreadPool::get_singleton()->add_template_group_task(
+				&data,
+				&FileTestData::test_chunk,
+				(void *)nullptr,
+				chunk_count, -1, true, SNAME("BytecodeTester::get_possible_decomps_cached"));
+		WorkerThreadPool::get_singleton()->wait_for_group_task_completion(group_id);
+	}
+
+	for (int i = 0; i < data.indices.size(); i++) {
+		if (tested[i] == 0) {
+			continue;
+		}
+		tested_revs.clear();
+		passed_revs.clear();
+		for (int c = 0; c < p_decomps.size(); c++) {
+			uint64_t bit = uint64_t(1) << c;
+			if (tested[i] & bit) {
+				tested_revs.push_back(p_decomps[c]->get_bytecode_rev());
+				if (passed[i] & bit) {
+					passed_revs.push_back(p_decomps[c]->get_bytecode_rev());
+				}
+			}
+		}
+		const BytecodeFile &file = p_files[data.indices[i]];
+		BytecodeTestCache::add_results(file.buffer, hashes[data.indices[i]], tested_revs, passed_revs);
+	}
+	return _get_alive_decomps(p_decomps, data.alive.load(std::memory_order_acquire));
+}
+
+static Vector<Ref<GDScriptDecomp>> _get_possibles_from_set(const Vector<BytecodeFile> &p_files, const Vector<Ref<GDScriptDecomp>> &p_decomps, bool print_verbosely) {
+	// when printing verbosely, every file has to actually be tested so that the log says why each candidate failed
+	if (print_verbosely || p_decomps.is_empty() || p_decomps.size() > CandidateTestData::MAX_CANDIDATES || !BytecodeTestCache::is_enabled()) {
+		return _test_possibles(p_files, p_decomps, print_verbosely);
+	}
+	return _test_possibles_cached(p_files, p_decomps);
+}
+
+static Vector<Ref<GDScriptDecomp>> _get_possible_decomps(const Vector<BytecodeFile> &p_files, bool p_include_dev, bool print_verbosely) {
+	int bytecode_version = _get_bytecode_version(p_files);
 	ERR_FAIL_COND_V_MSG(bytecode_version == -1, {}, "Inconsistent bytecode versions across files!!!");
 	ERR_FAIL_COND_V_MSG(bytecode_version <= 0, {}, "Could not read bytecode version from files.");
-	auto decomps = get_decomps_for_bytecode_ver(bytecode_version, include_dev);
-	return get_possibles_from_set(bytecode_files, decomps, print_verbosely);
+	auto decomps = get_decomps_for_bytecode_ver(bytecode_version, p_include_dev);
+	return _get_possibles_from_set(p_files, decomps, print_verbosely);
+}
+
+Vector<Ref<GDScriptDecomp>> BytecodeTester::get_possible_decomps(Vector<String> bytecode_files, bool include_dev, bool print_verbosely) {
+	return _get_possible_decomps(_load_bytecode_files(bytecode_files), include_dev, print_verbosely);
 }
 
 Vector<Ref<GDScriptDecomp>> BytecodeTester::filter_decomps(const Vector<Ref<GDScriptDecomp>> &decomp_versions, int ver_major_hint, int ver_minor_hint) {
@@ -543,20 +1048,22 @@ Vector<Ref<GDScriptDecomp>> BytecodeTester::filter_decomps(const Vector<Ref<GDSc
 	} else if (ver_major_hint > 0 && ver_minor_hint >= 0) {
 		for (int i = 0; i < decomp_versions.size(); i++) {
 			if (decomp_versions[i]->get_engine_ver_major() == ver_major_hint) {
-				bool good = false;
-				if (decomp_versions[i]->get_max_engine_version() != "") {
-					Ref<GodotVer> min_ver = GodotVer::parse(decomp_versions[i]->get_engine_version());
-					Ref<GodotVer> max_ver = GodotVer::parse(decomp_versions[i]->get_max_engine_version());
-					if (max_ver->get_minor() >= ver_minor_hint && min_ver->get_minor() <= ver_minor_hint) {
-						good = true;
-					}
+				int min_minor;
+				int max_minor;
+				int idx = get_decomp_version_index(decomp_versions[i]->get_bytecode_rev());
+				if (idx != -1) {
+					// `::decomp_versions` is the generated table, not the parameter
+					const GDScriptDecompVersion &v = ::decomp_versions[idx];
+					min_minor = v.min_number.minor;
+					max_minor = v.max_number.is_empty() ? min_minor : v.max_number.minor;
 				} else {
-					Ref<GodotVer> ver = memnew(GodotVer(decomp_versions[i]->get_engine_version()));
-					if (ver->get_minor() == ver_minor_hint) {
-						good = true;
+					min_minor = GodotVer::parse(decomp_versions[i]->get_engine_version())->get_minor();
+					max_minor = min_minor;
+					if (decomp_versions[i]->get_max_engine_version() != "") {
+						max_minor = GodotVer::parse(decomp_versions[i]->get_max_engine_version())->get_minor();
 					}
 				}
-				if (good) {
+				if (max_minor >= ver_minor_hint && min_minor <= ver_minor_hint) {
 					candidates.push_back(decomp_versions[i]);
 				}
 			}
@@ -13,5 +13,10 @@ class BytecodeTester {
 public:
 	static uint64_t test_files(const Vector<String> &p_paths, int ver_major_hint = -1, int ver_minor_hint = -1, bool print_verbosely = false);
 	static Vector<Ref<GDScriptDecomp>> filter_decomps(const Vector<Ref<GDScriptDecomp>> &decomps, int ver_major_hint, int ver_minor_hint);
+	// Returns the decomps in `p_decomps` (which must share a bytecode version) that the generated discriminators can't rule out for `p_buffer`.
+	static Vector<Ref<GDScriptDecomp>> narrow_candidates(const Vector<uint8_t> &p_buffer, const Vector<Ref<GDScriptDecomp>> &p_decomps);
+	// Returns the decomps in `p_decomps` that pass `test_bytecode` on `p_buffer`.
+	// The buffer is parsed once, checked against every candidate's discriminators, and only the survivors get the full test.
+	static Vector<Ref<GDScriptDecomp>> test_candidates(const Vector<uint8_t> &p_buffer, const Vector<Ref<GDScriptDecomp>> &p_decomps, bool print_verbosely = false);
 	static Vector<Ref<GDScriptDecomp>> get_possible_decomps(Vector<String> bytecode_files, bool include_dev = false, bool print_verbosely = false);
 };
\ No newline at end of file
@@ -6,6 +6,253 @@
 
 #include "bytecode/bytecode_versions.h"
 
+#include "bytecode/bytecode_77af6ca.h"
+#include "bytecode/bytecode_f3f05dc.h"
+#include "bytecode/bytecode_506df14.h"
+#include "bytecode/bytecode_a7aad78.h"
+#include "bytecode/bytecode_5565f55.h"
+#include "bytecode/bytecode_6694c11.h"
+#include "bytecode/bytecode_a60f242.h"
+#include "bytecode/bytecode_c00427a.h"
+#include "bytecode/bytecode_620ec47.h"
+#include "bytecode/bytecode_7f7d97f.h"
+#include "bytecode/bytecode_514a3fb.h"
+#include "bytecode/bytecode_1a36141.h"
+#include "bytecode/bytecode_1ca61a3.h"
+#include "bytecode/bytecode_d6b31da.h"
+#include "bytecode/bytecode_8aab9a0.h"
+#include "bytecode/bytecode_a3f1ee5.h"
+#include "bytecode/bytecode_8e35d93.h"
+#include "bytecode/bytecode_3ea6d9f.h"
+#include "bytecode/bytecode_a56d6ff.h"
+#include "bytecode/bytecode_ff1e7cf.h"
+#include "bytecode/bytecode_054a2ac.h"
+#include "bytecode/bytecode_91ca725.h"
+#include "bytecode/bytecode_216a8aa.h"
+#include "bytecode/bytecode_d28da86.h"
+#include "bytecode/bytecode_c6120e7.h"
+#include "bytecode/bytecode_015d36d.h"
+#include "bytecode/bytecode_5e938f0.h"
+#include "bytecode/bytecode_c24c739.h"
+#include "bytecode/bytecode_f8a7c46.h"
+#include "bytecode/bytecode_62273e5.h"
+#include "bytecode/bytecode_8b912d1.h"
+#include "bytecode/bytecode_23381a5.h"
+#include "bytecode/bytecode_513c026.h"
+#include "bytecode/bytecode_4ee82a2.h"
+#include "bytecode/bytecode_1add52b.h"
+#include "bytecode/bytecode_ed80f45.h"
+#include "bytecode/bytecode_85585c7.h"
+#include "bytecode/bytecode_7124599.h"
+#include "bytecode/bytecode_23441ec.h"
+#include "bytecode/bytecode_6174585.h"
+#include "bytecode/bytecode_64872ca.h"
+#include "bytecode/bytecode_7d2d144.h"
+#include "bytecode/bytecode_30c1229.h"
+#include "bytecode/bytecode_48f1d02.h"
+#include "bytecode/bytecode_65d48d6.h"
+#include "bytecode/bytecode_be46be7.h"
+#include "bytecode/bytecode_97f34a1.h"
+#include "bytecode/bytecode_2185c01.h"
+#include "bytecode/bytecode_e82dc40.h"
+#include "bytecode/bytecode_8cab401.h"
+#include "bytecode/bytecode_703004f.h"
+#include "bytecode/bytecode_31ce3c5.h"
+#include "bytecode/bytecode_8c1731b.h"
+#include "bytecode/bytecode_0b806ee.h"
+
+const GDScriptDecompVersion decomp_versions[] = {
+	{ 0xfffffff, "--- Please select bytecode version ---", 0, false, "", "", 0, {}, {} },
+	{ 0x77af6ca, "4.3.0-stable (77af6ca / 2024-02-09 / Bytecode version: 100) - initial version", 100, false, "4.3.0-stable", "", 0x0, { 4, 3, 0, 5, 0 }, { 0, 0, 0, 0, 0 } },
+	{ 0xf3f05dc, "	4.0-dev2 (f3f05dc / 2020-02-13 / Bytecode version: 13) - Removed `SYNC`, `SLAVE` tokens.", 13, true, "4.0-dev2", "", 0x506df14, { 4, 0, 0, 0, 2 }, { 0, 0, 0, 0, 0 } },
+	{ 0x506df14, "	4.0-dev1 (506df14 / 2020-02-12 / Bytecode version: 13) - Removed `decimals` function.", 13, true, "4.0-dev1", "", 0x5565f55, { 4, 0, 0, 0, 1 }, { 0, 0, 0, 0, 0 } },
+	{ 0xa7aad78, "3.5.0-stable (a7aad78 / 2020-10-07 / Bytecode version: 13) - Added `deep_equal` function.", 13, false, "3.5.0-stable", "3.6.0-stable", 0x5565f55, { 3, 5, 0, 5, 0 }, { 3, 6, 0, 5, 0 } },
+	{ 0x5565f55, "3.2.0-stable (5565f55 / 2019-08-26 / Bytecode version: 13) - Added `ord` function.", 13, false, "3.2.0-stable", "3.4.5-stable", 0x6694c11, { 3, 2, 0, 5, 0 }, { 3, 4, 5, 5, 0 } },
+	{ 0x6694c11, "	3.2-dev5 (6694c11 / 2019-07-20 / Bytecode version: 13) - Added `lerp_angle` function.", 13, true, "3.2-dev5", "", 0xa60f242, { 3, 2, 0, 0, 5 }, { 0, 0, 0, 0, 0 } },
+	{ 0xa60f242, "	3.2-dev4 (a60f242 / 2019-07-19 / Bytecode version: 13) - Added `posmod` function.", 13, true, "3.2-dev4", "", 0xc00427a, { 3, 2, 0, 0, 4 }, { 0, 0, 0, 0, 0 } },
+	{ 0xc00427a, "	3.2-dev3 (c00427a / 2019-06-01 / Bytecode version: 13) - Added `move_toward` function.", 13, true, "3.2-dev3", "", 0x620ec47, { 3, 2, 0, 0, 3 }, { 0, 0, 0, 0, 0 } },
+	{ 0x620ec47, "	3.2-dev2 (620ec47 / 2019-05-01 / Bytecode version: 13) - Added `step_decimals` function.", 13, true, "3.2-dev2", "", 0x7f7d97f, { 3, 2, 0, 0, 2 }, { 0, 0, 0, 0, 0 } },
+	{ 0x7f7d97f, "	3.2-dev1 (7f7d97f / 2019-04-29 / Bytecode version: 13) - Added `is_equal_approx`, `is_zero_approx` functions.", 13, true, "3.2-dev1", "", 0x514a3fb, { 3, 2, 0, 0, 1 }, { 0, 0, 0, 0, 0 } },
+	{ 0x514a3fb, "3.1.1-stable (514a3fb / 2019-03-19 / Bytecode version: 13) - Added `smoothstep` function, changed argument count for `var2bytes`, `bytes2var` functions.", 13, false, "3.1.1-stable", "3.1.2-stable", 0x1a36141, { 3, 1, 1, 5, 0 }, { 3, 1, 2, 5, 0 } },
+	{ 0x1a36141, "3.1.0-stable (1a36141 / 2019-02-20 / Bytecode version: 13) - Removed `DO`, `CASE`, `SWITCH` tokens.", 13, false, "3.1.0-stable", "", 0x1ca61a3, { 3, 1, 0, 5, 0 }, { 0, 0, 0, 0, 0 } },
+	{ 0x1ca61a3, "3.1-beta1 (1ca61a3 / 2018-10-31 / Bytecode version: 13) - Added `push_error`, `push_warning` functions.", 13, false, "3.1-beta1", "3.1-beta5", 0xd6b31da, { 3, 1, 0, 2, 1 }, { 3, 1, 0, 2, 5 } },
+	{ 0xd6b31da, "	3.1-dev7 (d6b31da / 2018-09-15 / Bytecode version: 13) - Added `PUPPET` token, renamed token `SLAVESYNC` to `PUPPETSYNC`.", 13, true, "3.1-dev7", "", 0x8aab9a0, { 3, 1, 0, 0, 7 }, { 0, 0, 0, 0, 0 } },
+	{ 0x8aab9a0, "	3.1-dev6 (8aab9a0 / 2018-07-20 / Bytecode version: 13) - Added `AS`, `VOID`, `FORWARD_ARROW` tokens.", 13, true, "3.1-dev6", "", 0xa3f1ee5, { 3, 1, 0, 0, 6 }, { 0, 0, 0, 0, 0 } },
+	{ 0xa3f1ee5, "	3.1-dev5 (a3f1ee5 / 2018-07-15 / Bytecode version: 13) - Added `CLASS_NAME` token.", 13, true, "3.1-dev5", "", 0x8e35d93, { 3, 1, 0, 0, 5 }, { 0, 0, 0, 0, 0 } },
+	{ 0x8e35d93, "	3.1-dev4 (8e35d93 / 2018-05-29 / Bytecode version: 12) - Added `REMOTESYNC`, `MASTERSYNC`, `SLAVESYNC` tokens.", 12, true, "3.1-dev4", "", 0x3ea6d9f, { 3, 1, 0, 0, 4 }, { 0, 0, 0, 0, 0 } },
+	{ 0x3ea6d9f, "	3.1-dev3 (3ea6d9f / 2018-05-28 / Bytecode version: 12) - Added `print_debug` function.", 12, true, "3.1-dev3", "", 0xa56d6ff, { 3, 1, 0, 0, 3 }, { 0, 0, 0, 0, 0 } },
+	{ 0xa56d6ff, "	3.1-dev2 (a56d6ff / 2018-05-17 / Bytecode version: 12) - Added `get_stack` function.", 12, true, "3.1-dev2", "", 0xff1e7cf, { 3, 1, 0, 0, 2 }, { 0, 0, 0, 0, 0 } },
+	{ 0xff1e7cf, "	3.1-dev1 (ff1e7cf / 2018-05-07 / Bytecode version: 12) - Added `is_instance_valid` function.", 12, true, "3.1-dev1", "", 0x054a2ac, { 3, 1, 0, 0, 1 }, { 0, 0, 0, 0, 0 } },
+	{ 0x054a2ac, "3.0.0-stable (054a2ac / 2017-11-20 / Bytecode version: 12) - Added `polar2cartesian`, `cartesian2polar` functions.", 12, false, "3.0.0-stable", "3.0.6-stable", 0x91ca725, { 3, 0, 0, 5, 0 }, { 3, 0, 6, 5, 0 } },
+	{ 0x91ca725, "	3.0-dev14 (91ca725 / 2017-11-12 / Bytecode version: 12) - Added `CONST_TAU` token.", 12, true, "3.0-dev14", "", 0x216a8aa, { 3, 0, 0, 0, 14 }, { 0, 0, 0, 0, 0 } },
+	{ 0x216a8aa, "	3.0-dev13 (216a8aa / 2017-10-13 / Bytecode version: 12) - Added `wrapi`, `wrapf` functions.", 12, true, "3.0-dev13", "", 0xd28da86, { 3, 0, 0, 0, 13 }, { 0, 0, 0, 0, 0 } },
+	{ 0xd28da86, "	3.0-dev12 (d28da86 / 2017-08-18 / Bytecode version: 12) - Added `inverse_lerp`, `range_lerp` functions.", 12, true, "3.0-dev12", "", 0xc6120e7, { 3, 0, 0, 0, 12 }, { 0, 0, 0, 0, 0 } },
+	{ 0xc6120e7, "	3.0-dev11 (c6120e7 / 2017-08-07 / Bytecode version: 12) - Added `len` function.", 12, true, "3.0-dev11", "", 0x015d36d, { 3, 0, 0, 0, 11 }, { 0, 0, 0, 0, 0 } },
+	{ 0x015d36d, "	3.0-dev10 (015d36d / 2017-05-27 / Bytecode version: 12) - Added `IS` token.", 12, true, "3.0-dev10", "", 0x5e938f0, { 3, 0, 0, 0, 10 }, { 0, 0, 0, 0, 0 } },
+	{ 0x5e938f0, "	3.0-dev9 (5e938f0 / 2017-02-28 / Bytecode version: 12) - Added `CONST_INF`, `CONST_NAN` tokens.", 12, true, "3.0-dev9", "", 0xc24c739, { 3, 0, 0, 0, 9 }, { 0, 0, 0, 0, 0 } },
+	{ 0xc24c739, "	3.0-dev8 (c24c739 / 2017-01-20 / Bytecode version: 12) - Added `WILDCARD` token.", 12, true, "3.0-dev8", "", 0xf8a7c46, { 3, 0, 0, 0, 8 }, { 0, 0, 0, 0, 0 } },
+	{ 0xf8a7c46, "	3.0-dev7 (f8a7c46 / 2017-01-11 / Bytecode version: 12) - Added `MATCH` token.", 12, true, "3.0-dev7", "", 0x62273e5, { 3, 0, 0, 0, 7 }, { 0, 0, 0, 0, 0 } },
+	{ 0x62273e5, "	3.0-dev6 (62273e5 / 2017-01-08 / Bytecode version: 12) - Added `validate_json`, `parse_json`, `to_json` functions.", 12, true, "3.0-dev6", "", 0x8b912d1, { 3, 0, 0, 0, 6 }, { 0, 0, 0, 0, 0 } },
+	{ 0x8b912d1, "	3.0-dev5 (8b912d1 / 2017-01-08 / Bytecode version: 11) - Added `DOLLAR` token.", 11, true, "3.0-dev5", "", 0x23381a5, { 3, 0, 0, 0, 5 }, { 0, 0, 0, 0, 0 } },
+	{ 0x23381a5, "	3.0-dev4 (23381a5 / 2016-12-17 / Bytecode version: 11) - Added `ColorN` function.", 11, true, "3.0-dev4", "", 0x513c026, { 3, 0, 0, 0, 4 }, { 0, 0, 0, 0, 0 } },
+	{ 0x513c026, "	3.0-dev3 (513c026 / 2016-10-03 / Bytecode version: 11) - Added `char` function.", 11, true, "3.0-dev3", "", 0x4ee82a2, { 3, 0, 0, 0, 3 }, { 0, 0, 0, 0, 0 } },
+	{ 0x4ee82a2, "	3.0-dev2 (4ee82a2 / 2016-08-27 / Bytecode version: 11) - Added `ENUM` token.", 11, true, "3.0-dev2", "", 0x1add52b, { 3, 0, 0, 0, 2 }, { 0, 0, 0, 0, 0 } },
+	{ 0x1add52b, "	3.0-dev1 (1add52b / 2016-08-19 / Bytecode version: 11) - Added `REMOTE`, `SYNC`, `MASTER`, `SLAVE` tokens.", 11, true, "3.0-dev1", "", 0x7124599, { 3, 0, 0, 0, 1 }, { 0, 0, 0, 0, 0 } },
+	{ 0xed80f45, "2.1.3-stable (ed80f45 / 2017-04-06 / Bytecode version: 10) - Added `ENUM` token.", 10, false, "2.1.3-stable", "2.1.6-stable", 0x85585c7, { 2, 1, 3, 5, 0 }, { 2, 1, 6, 5, 0 } },
+	{ 0x85585c7, "2.1.2-stable (85585c7 / 2017-01-12 / Bytecode version: 10) - Added `ColorN` function.", 10, false, "2.1.2-stable", "", 0x7124599, { 2, 1, 2, 5, 0 }, { 0, 0, 0, 0, 0 } },
+	{ 0x7124599, "2.1.0-stable (7124599 / 2016-06-18 / Bytecode version: 10) - Added `type_exists` function.", 10, false, "2.1.0-stable", "2.1.1-stable", 0x23441ec, { 2, 1, 0, 5, 0 }, { 2, 1, 1, 5, 0 } },
+	{ 0x23441ec, "2.0.0-stable (23441ec / 2016-01-02 / Bytecode version: 10) - Added `var2bytes`, `bytes2var` functions.", 10, false, "2.0.0-stable", "2.0.4-stable", 0x6174585, { 2, 0, 0, 5, 0 }, { 2, 0, 4, 5, 0 } },
+	{ 0x6174585, "	2.0-dev5 (6174585 / 2016-01-02 / Bytecode version: 9) - Added `CONST_PI` token.", 9, true, "2.0-dev5", "", 0x64872ca, { 2, 0, 0, 0, 5 }, { 0, 0, 0, 0, 0 } },
+	{ 0x64872ca, "	2.0-dev4 (64872ca / 2015-12-31 / Bytecode version: 8) - Added `Color8` function.", 8, true, "2.0-dev4", "", 0x7d2d144, { 2, 0, 0, 0, 4 }, { 0, 0, 0, 0, 0 } },
+	{ 0x7d2d144, "	2.0-dev3 (7d2d144 / 2015-12-29 / Bytecode version: 7) - Added `BREAKPOINT` token.", 7, true, "2.0-dev3", "", 0x30c1229, { 2, 0, 0, 0, 3 }, { 0, 0, 0, 0, 0 } },
+	{ 0x30c1229, "	2.0-dev2 (30c1229 / 2015-12-28 / Bytecode version: 6) - Added `ONREADY` token.", 6, true, "2.0-dev2", "", 0x48f1d02, { 2, 0, 0, 0, 2 }, { 0, 0, 0, 0, 0 } },
+	{ 0x48f1d02, "	2.0-dev1 (48f1d02 / 2015-06-24 / Bytecode version: 5) - Added `SIGNAL` token.", 5, true, "2.0-dev1", "", 0x65d48d6, { 2, 0, 0, 0, 1 }, { 0, 0, 0, 0, 0 } },
+	{ 0x65d48d6, "1.1.0-stable (65d48d6 / 2015-05-09 / Bytecode version: 4) - Added `prints` function.", 4, false, "1.1.0-stable", "", 0xbe46be7, { 1, 1, 0, 5, 0 }, { 0, 0, 0, 0, 0 } },
+	{ 0xbe46be7, "	1.1-dev3 (be46be7 / 2015-04-18 / Bytecode version: 3) - Renamed function get_inst to instance_from_id.", 3, true, "1.1-dev3", "", 0x97f34a1, { 1, 1, 0, 0, 3 }, { 0, 0, 0, 0, 0 } },
+	{ 0x97f34a1, "	1.1-dev2 (97f34a1 / 2015-03-25 / Bytecode version: 3) - Added `seed`, `get_inst` functions.", 3, true, "1.1-dev2", "", 0x2185c01, { 1, 1, 0, 0, 2 }, { 0, 0, 0, 0, 0 } },
+	{ 0x2185c01, "	1.1-dev1 (2185c01 / 2015-02-15 / Bytecode version: 3) - Added `var2str`, `str2var` functions.", 3, true, "1.1-dev1", "", 0xe82dc40, { 1, 1, 0, 0, 1 }, { 0, 0, 0, 0, 0 } },
+	{ 0xe82dc40, "1.0.0-stable (e82dc40 / 2014-10-27 / Bytecode version: 3) - Added `SETGET` token.", 3, false, "1.0.0-stable", "", 0x8cab401, { 1, 0, 0, 5, 0 }, { 0, 0, 0, 0, 0 } },
+	{ 0x8cab401, "	1.0-dev5 (8cab401 / 2014-09-15 / Bytecode version: 2) - Added `YIELD` token.", 2, true, "1.0-dev5", "", 0x703004f, { 1, 0, 0, 0, 5 }, { 0, 0, 0, 0, 0 } },
+	{ 0x703004f, "	1.0-dev4 (703004f / 2014-06-16 / Bytecode version: 2) - Added `hash` function.", 2, true, "1.0-dev4", "", 0x31ce3c5, { 1, 0, 0, 0, 4 }, { 0, 0, 0, 0, 0 } },
+	{ 0x31ce3c5, "	1.0-dev3 (31ce3c5 / 2014-03-13 / Bytecode version: 2) - Added `funcref` function.", 2, true, "1.0-dev3", "", 0x8c1731b, { 1, 0, 0, 0, 3 }, { 0, 0, 0, 0, 0 } },
+	{ 0x8c1731b, "	1.0-dev2 (8c1731b / 2014-02-15 / Bytecode version: 2) - Added `load` function.", 2, true, "1.0-dev2", "", 0x0b806ee, { 1, 0, 0, 0, 2 }, { 0, 0, 0, 0, 0 } },
+	{ 0x0b806ee, "	1.0-dev1 (0b806ee / 2014-02-09 / Bytecode version: 1) - initial version", 1, true, "1.0-dev1", "", 0x0, { 1, 0, 0, 0, 1 }, { 0, 0, 0, 0, 0 } },
+	{ 0x0000000, "-NULL-", 0, false, "", "", 0, {}, {} },
+};
+
+const int num_decomp_versions = sizeof(decomp_versions) / sizeof(GDScriptDecompVersion);
+
+const char *const bytecode_table_hash = "f9e547846192c1faac89a95bb730a1634d09dd252bf746867e7b5c7b5ff1b0fb";
+
+// One instance of every revision in `decomp_versions`, created when the classes are registered.
+static Ref<GDScriptDecomp> shared_decomps[num_decomp_versions];
+
+// [start, end) rows of `decomp_versions` for each bytecode version
+static const int decomp_version_ranges[][2] = {
+	{ 0, 0 },
+	{ 54, 55 }, // 1
+	{ 50, 54 }, // 2
+	{ 46, 50 }, // 3
+	{ 45, 46 }, // 4
+	{ 44, 45 }, // 5
+	{ 43, 44 }, // 6
+	{ 42, 43 }, // 7
+	{ 41, 42 }, // 8
+	{ 40, 41 }, // 9
+	{ 36, 40 }, // 10
+	{ 31, 36 }, // 11
+	{ 17, 31 }, // 12
+	{ 2, 17 }, // 13
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 0, 0 },
+	{ 1, 2 }, // 100
+};
+
+static const int num_decomp_version_ranges = sizeof(decomp_version_ranges) / sizeof(decomp_version_ranges[0]);
+
+// rows of `decomp_versions` for the non-dev revisions, sorted by `min_number`
+static const int decomp_version_intervals[] = {
+	49, // 1.0.0-stable
+	45, // 1.1.0-stable
+	39, // 2.0.0-stable - 2.0.4-stable
+	38, // 2.1.0-stable - 2.1.1-stable
+	37, // 2.1.2-stable
+	36, // 2.1.3-stable - 2.1.6-stable
+	21, // 3.0.0-stable - 3.0.6-stable
+	13, // 3.1-beta1 - 3.1-beta5
+	12, // 3.1.0-stable
+	11, // 3.1.1-stable - 3.1.2-stable
+	5, // 3.2.0-stable - 3.4.5-stable
+	4, // 3.5.0-stable - 3.6.0-stable
+	1, // 4.3.0-stable
+};
+
+static const int num_decomp_version_intervals = sizeof(decomp_version_intervals) / sizeof(decomp_version_intervals[0]);
+
 void register_decomp_versions() {
 	ClassDB::register_class<GDScriptDecomp_77af6ca>();
 	ClassDB::register_class<GDScriptDecomp_f3f05dc>();
@@ -62,6 +309,85 @@ void register_decomp_versions() {
 	ClassDB::register_class<GDScriptDecomp_8c1731b>();
 	ClassDB::register_class<GDScriptDecomp_0b806ee>();
 
+	for (int i = 0; i < num_decomp_versions; i++) {
+		shared_decomps[i] = Ref<GDScriptDecomp>(create_decomp_for_commit(decomp_versions[i].commit));
+	}
+}
+
+void unregister_decomp_versions() {
+	for (int i = 0; i < num_decomp_versions; i++) {
+		shared_decomps[i].unref();
+	}
+}
+
+int get_decomp_version_index(uint64_t p_commit_hash) {
+	switch (p_commit_hash) {
+		case 0x77af6ca: return 1;
+		case 0xf3f05dc: return 2;
+		case 0x506df14: return 3;
+		case 0xa7aad78: return 4;
+		case 0x5565f55: return 5;
+		case 0x6694c11: return 6;
+		case 0xa60f242: return 7;
+		case 0xc00427a: return 8;
+		case 0x620ec47: return 9;
+		case 0x7f7d97f: return 10;
+		case 0x514a3fb: return 11;
+		case 0x1a36141: return 12;
+		case 0x1ca61a3: return 13;
+		case 0xd6b31da: return 14;
+		case 0x8aab9a0: return 15;
+		case 0xa3f1ee5: return 16;
+		case 0x8e35d93: return 17;
+		case 0x3ea6d9f: return 18;
+		case 0xa56d6ff: return 19;
+		case 0xff1e7cf: return 20;
+		case 0x054a2ac: return 21;
+		case 0x91ca725: return 22;
+		case 0x216a8aa: return 23;
+		case 0xd28da86: return 24;
+		case 0xc6120e7: return 25;
+		case 0x015d36d: return 26;
+		case 0x5e938f0: return 27;
+		case 0xc24c739: return 28;
+		case 0xf8a7c46: return 29;
+		case 0x62273e5: return 30;
+		case 0x8b912d1: return 31;
+		case 0x23381a5: return 32;
+		case 0x513c026: return 33;
+		case 0x4ee82a2: return 34;
+		case 0x1add52b: return 35;
+		case 0xed80f45: return 36;
+		case 0x85585c7: return 37;
+		case 0x7124599: return 38;
+		case 0x23441ec: return 39;
+		case 0x6174585: return 40;
+		case 0x64872ca: return 41;
+		case 0x7d2d144: return 42;
+		case 0x30c1229: return 43;
+		case 0x48f1d02: return 44;
+		case 0x65d48d6: return 45;
+		case 0xbe46be7: return 46;
+		case 0x97f34a1: return 47;
+		case 0x2185c01: return 48;
+		case 0xe82dc40: return 49;
+		case 0x8cab401: return 50;
+		case 0x703004f: return 51;
+		case 0x31ce3c5: return 52;
+		case 0x8c1731b: return 53;
+		case 0x0b806ee: return 54;
+
+		default:
+			return -1;
+	}
+}
+
+Ref<GDScriptDecomp> get_shared_decomp_for_commit(uint64_t p_commit_hash) {
+	int idx = get_decomp_version_index(p_commit_hash);
+	if (idx == -1) {
+		return Ref<GDScriptDecomp>();
+	}
+	return shared_decomps[idx];
 }
 
 GDScriptDecomp *create_decomp_for_commit(uint64_t p_commit_hash) {
@@ -128,8 +454,11 @@ GDScriptDecomp *create_decomp_for_commit(uint64_t p_commit_hash) {
 
 Vector<Ref<GDScriptDecomp>> get_decomps_for_bytecode_ver(int bytecode_version, bool include_dev) {
 	Vector<Ref<GDScriptDecomp>> decomps;
-	for (int i = 0; i < num_decomp_versions; i++) {
-		if (decomp_versions[i].bytecode_version == bytecode_version && (include_dev || !decomp_versions[i].is_dev)) {
+	if (bytecode_version < 0 || bytecode_version >= num_decomp_version_ranges) {
+		return decomps;
+	}
+	for (int i = decomp_version_ranges[bytecode_version][0]; i < decomp_version_ranges[bytecode_version][1]; i++) {
+		if (include_dev || !decomp_versions[i].is_dev) {
 			decomps.push_back(Ref<GDScriptDecomp>(create_decomp_for_commit(decomp_versions[i].commit)));
 		}
 	}
@@ -153,3 +482,73 @@ Vector<GDScriptDecompVersion> get_decomp_versions(bool include_dev, int ver_majo
 	}
 	return versions;
 }
+
+int GDScriptDecompVersionNumber::cmp(const GDScriptDecompVersionNumber &p_b) const {
+	if (major != p_b.major) {
+		return major > p_b.major ? 1 : -1;
+	}
+	if (minor != p_b.minor) {
+		return minor > p_b.minor ? 1 : -1;
+	}
+	if (patch != p_b.patch) {
+		return patch > p_b.patch ? 1 : -1;
+	}
+	if (prerelease != p_b.prerelease) {
+		return prerelease > p_b.prerelease ? 1 : -1;
+	}
+	if (prerelease_num != p_b.prerelease_num) {
+		return prerelease_num > p_b.prerelease_num ? 1 : -1;
+	}
+	return 0;
+}
+
+GDScriptDecompVersionNumber GDScriptDecompVersionNumber::from_godot_ver(const Ref<GodotVer> &p_ver) {
+	GDScriptDecompVersionNumber number = { p_ver->get_major(), p_ver->get_minor(), p_ver->get_patch(), PRERELEASE_NONE, 0 };
+	String prerelease = p_ver->get_prerelease();
+	if (prerelease.is_empty()) {
+		return number;
+	}
+	if (prerelease.contains("dev")) {
+		number.prerelease = PRERELEASE_DEV;
+	} else if (prerelease.contains("alpha")) {
+		number.prerelease = PRERELEASE_ALPHA;
+	} else if (prerelease.contains("beta")) {
+		number.prerelease = PRERELEASE_BETA;
+	} else if (prerelease.contains("rc")) {
+		number.prerelease = PRERELEASE_RC;
+	} else {
+		number.prerelease = PRERELEASE_OTHER;
+	}
+	// the first run of digits, like `GodotVer::cmp`
+	bool found_digit = false;
+	for (int i = 0; i < prerelease.length(); i++) {
+		if (is_digit(prerelease[i])) {
+			found_digit = true;
+			number.prerelease_num = number.prerelease_num * 10 + (prerelease[i] - '0');
+		} else if (found_digit) {
+			break;
+		}
+	}
+	return number;
+}
+
+int find_decomp_version_index(const GDScriptDecompVersionNumber &p_ver) {
+	int lo = 0;
+	int hi = num_decomp_version_intervals;
+	while (lo < hi) {
+		int mid = (lo + hi) / 2;
+		if (decomp_versions[decomp_version_intervals[mid]].min_number.cmp(p_ver) <= 0) {
+			lo = mid + 1;
+		} else {
+			hi = mid;
+		}
+	}
+	if (lo == 0) {
+		return -1;
+	}
+	int row = decomp_version_intervals[lo - 1];
+	if (decomp_versions[row].min_number.major != p_ver.major) {
+		return -1;
+	}
+	return row;
+}
@@ -1,4 +1,12 @@
+import argparse
+import contextlib
+import difflib
+import hashlib
+import io
 import os
+import re
+import sys
+import tempfile
 from pathlib import Path
 import json
 
@@ -103,6 +111,7 @@ builtin_func_arg_elements = [
     ("deep_equal", (2, 2)),
     ("get_inst", (1, 1)),
 ]
+builtin_func_args = dict(builtin_func_arg_elements)
 
 greater_than_3_1_versions = [
     0xF3F05DC,
@@ -120,8 +129,13 @@ greater_than_3_1_versions = [
 
 class BytecodeClass:
     def __init__(self):
-        self.func_names = []
-        self.tk_names = []
+        self._func_names: list[str] | None = []
+        self._tk_names: list[str] | None = []
+        # set by `read_bytecode_json` for revisions stored as a delta against their parent, see `apply_names_delta`
+        self._parent_class: "BytecodeClass | None" = None
+        self._tk_names_delta: list = []
+        self._func_names_delta: list = []
+        self._tables_digest = ""
         self.bytecode_version = 0
         self.bytecode_rev = ""
         self.bytecode_rev_num = 0
@@ -141,6 +155,33 @@ class BytecodeClass:
         self.engine_version = ""
         self.max_engine_version = ""
 
+    def _materialize(self) -> None:
+        # the parent is materialized (and checked) first, so a chain of deltas is only walked once
+        parent = self._parent_class
+        self._tk_names = apply_names_delta(parent.tk_names, self._tk_names_delta)
+        self._func_names = apply_names_delta(parent.func_names, self._func_names_delta)
+        check_tables_digest(self)
+
+    @property
+    def tk_names(self) -> list[str]:
+        if self._tk_names is None:
+            self._materialize()
+        return self._tk_names
+
+    @tk_names.setter
+    def tk_names(self, value: list[str]) -> None:
+        self._tk_names = value
+
+    @property
+    def func_names(self) -> list[str]:
+        if self._func_names is None:
+            self._materialize()
+        return self._func_names
+
+    @func_names.setter
+    def func_names(self, value: list[str]) -> None:
+        self._func_names = value
+
     @property
     def file_stem(self):
         return "bytecode_" + self.bytecode_rev
@@ -176,6 +217,12 @@ def remove_comments(line: str) -> str:
 # 	{ "is_instance_valid", Pair<int, int>(1, 1) },
 # };
 # static constexpr int num_funcs = sizeof(funcs) / sizeof(Pair<String, Pair<int, int>>);
+#
+# static constexpr int funcs_sorted[] = {
+# 	62, // Color8
+# 	16, // abs
+# 	[etc...]
+# };
 # ```
 # We use a Pair here because we need to store the number of arguments for each function
 # we get this by matching the function name with the builtin_func_arg_elements list
@@ -202,51 +249,163 @@ def remove_comments(line: str) -> str:
 # 	return funcs[p_func].second;
 # }
 # ```
-# 5.5) the `get_function_index` function, which is laid out like this:
+# 5.5) the `get_function_index` function, which does a binary search over `funcs_sorted`
+# (the indices of `funcs` sorted by name), and is laid out like this:
 # ```cpp
 # int <class_name>::get_function_index(const String &p_func) const {
-#   for (int i = 0; i < num_funcs; i++) {
-#     if (funcs[i].first == p_func) {
-#       return i;
+#   int lo = 0;
+#   int hi = num_funcs;
+#   while (lo < hi) {
+#     int mid = (lo + hi) / 2;
+#     const String &name = funcs[funcs_sorted[mid]].first;
+#     if (name == p_func) {
+#       return funcs_sorted[mid];
+#     }
+#     if (name < p_func) {
+#       lo = mid + 1;
+#     } else {
+#       hi = mid;
 #     }
+#   }
 #   return -1;
 # }
 # ```
-# 6) the `get_global_token` function, which is laid out like this:
+# 6) the token translation tables, built from the Token enum above and the GlobalToken enum in `bytecode_base.h`:
+# ```cpp
+# static constexpr GDScriptDecomp::GlobalToken local_to_global[] = {
+# 	GDScriptDecomp::GlobalToken::G_TK_EMPTY, // TK_EMPTY
+# 	GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER, // TK_IDENTIFIER
+# 	[..etc, one entry for every local token before TK_MAX]
+# };
+#
+# static constexpr int global_to_local[] = {
+# 	TK_EMPTY, // G_TK_EMPTY
+# 	TK_IDENTIFIER, // G_TK_IDENTIFIER
+# 	-1, // G_TK_<not in this revision>
+# 	[..etc, one entry for every global token up to and including G_TK_MAX]
+# };
+# ```
+# 7) the `get_global_token` function, which is laid out like this:
 # ```cpp
 # GDScriptDecomp::GlobalToken <class_name>::get_global_token(int p_token) const {
-# 	if (p_token < 0 || p_token >= TK_MAX) {
+# 	p_token = p_token & TOKEN_MASK;
+# 	if (p_token >= TK_MAX) {
 # 		return GDScriptDecomp::GlobalToken::G_TK_MAX;
 # 	}
-# 	switch(Token(p_token)) {
-# 		case TK_EOF: return GDScriptDecomp::GlobalToken::G_TK_EOF;
-# 		case TK_IDENTIFIER: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
-# 		case TK_CONSTANT: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
-# 		[..etc]
-# 		case TK_MAX: return GDScriptDecomp::GlobalToken::G_TK_MAX;
-# 	}
-# 	return GDScriptDecomp::GlobalToken::G_TK_MAX;
+# 	return local_to_global[p_token];
 # }
 # ```
-# 7) the `get_local_token_val` function, which is laid out like this:
+# 8) the `get_local_token_val` function, which is laid out like this:
 # ```cpp
 # int <class_name>::get_local_token_val(GDScriptDecomp::GlobalToken p_token) const {
-#   switch(p_token) {
-#     case GDScriptDecomp::GlobalToken::G_TK_EOF: return (int) TK_EOF;
-#     case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return (int) TK_IDENTIFIER;
-#     case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return (int) TK_CONSTANT;
-#     [..etc]
-#     case GDScriptDecomp::GlobalToken::G_TK_MAX: return (int) TK_MAX;
-#     default: return (int) TK_MAX;
-#   }
-#   return (int) TK_MAX;
+# 	if ((unsigned int)p_token > GDScriptDecomp::GlobalToken::G_TK_MAX) {
+# 		return -1;
+# 	}
+# 	return global_to_local[p_token];
 # }
 # ```
+# `get_function_name`, `get_function_index`, `get_global_token` and `get_local_token_val` all start with
+# `GDRE_INSTRUMENT_LOOKUP(bytecode_rev, LOOKUP_...);`, which counts the call in a `gdre_instrumentation=yes` build
+# and expands to nothing otherwise; see `bytecode_instrumentation.h`.
 # That's it. We're done.
 
 
+class GeneratedOutputs:
+    """Collects the generated files in memory so that only the ones whose content changed are written to disk."""
+
+    def __init__(self) -> None:
+        self.files: dict[Path, str] = {}
+        self.removed: list[Path] = []
+
+    @contextlib.contextmanager
+    def open(self, path: Path):
+        buf = io.StringIO()
+        yield buf
+        self.files[Path(path)] = buf.getvalue()
+
+    def remove(self, path: Path) -> None:
+        self.removed.append(Path(path))
+
+    def stale_files(self) -> list[Path]:
+        """Returns the outputs whose on-disk content differs from the rendered content."""
+        return [path for path, content in self.files.items() if read_text_or_none(path) != content]
+
+    def stale_removals(self) -> list[Path]:
+        return [path for path in self.removed if path.exists()]
+
+    def commit(self) -> tuple[list[Path], list[Path]]:
+        """Writes the changed files and deletes the removed ones; returns the paths written and the paths deleted."""
+        changed = self.stale_files()
+        for path in changed:
+            write_atomic(path, self.files[path])
+        removed = self.stale_removals()
+        for path in removed:
+            path.unlink()
+        return changed, removed
+
+
+def read_text_or_none(path: Path):
+    try:
+        # newline="" so that the comparison sees exactly what write_atomic would write
+        with open(path, "r", newline="") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def write_atomic(path: Path, content: str) -> None:
+    # write to a temporary file in the same directory and rename it over the target,
+    # so an interrupted run never leaves a half-written source file behind
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix="." + path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", newline="") as f:
+            f.write(content)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def sha256_of(data) -> str:
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+outputs = GeneratedOutputs()
+
+
+def read_global_tokens(path: Path) -> list[str]:
+    """Returns the names of the `GDScriptDecomp::GlobalToken` enum values, in order, from `bytecode_base.h`."""
+    with open(path, "r") as f:
+        code = f.read()
+    enum_body = code[code.index("enum GlobalToken {") : code.index("G_TK_MAX,")]
+    return re.findall(r"\b(G_TK_\w+),", enum_body) + ["G_TK_MAX"]
+
+
+def get_function_entries(bytecode_class: BytecodeClass) -> list[tuple[str, tuple]]:
+    """Returns the (name, (min_args, max_args)) entries of the `funcs` table, in bytecode order."""
+    funcs = []
+    for func_name in bytecode_class.func_names:
+        if func_name == "var2bytes" or func_name == "bytes2var":
+            if bytecode_class.bytecode_rev_num in greater_than_3_1_versions:
+                funcs.append((func_name, (1, 2)))
+            else:
+                funcs.append((func_name, (1, 1)))
+        elif func_name in builtin_func_args:
+            funcs.append((func_name, builtin_func_args[func_name]))
+    return funcs
+
+
+def get_sorted_function_indices(funcs: list[tuple[str, tuple]]) -> list[int]:
+    # Function names are ASCII, so Python's ordering matches `String::operator<`
+    return sorted(range(len(funcs)), key=lambda i: funcs[i][0])
+
+
 NO_BUILTIN_FUNCTION_BODY = """
 String {0}::get_function_name(int p_func) const {{
+    GDRE_INSTRUMENT_LOOKUP(bytecode_rev, LOOKUP_GET_FUNCTION_NAME);
     return "";
 }}
 int {0}::get_function_count() const {{
@@ -256,12 +415,13 @@ Pair<int, int> {0}::get_function_arg_count(int p_func) const {{
     return Pair<int, int>(-1, -1);
 }}
 int {0}::get_function_index(const String &p_func) const {{
+    GDRE_INSTRUMENT_LOOKUP(bytecode_rev, LOOKUP_GET_FUNCTION_INDEX);
     return -1;
 }}
 """
 
 
-def generate_class_cpp(dir: Path, bytecode_class: BytecodeClass) -> None:
+def generate_class_cpp(dir: Path, bytecode_class: BytecodeClass, global_tokens: list[str]) -> None:
     file_stem = bytecode_class.file_stem
     class_name = bytecode_class.class_name
     func_names = bytecode_class.func_names
@@ -272,42 +432,33 @@ def generate_class_cpp(dir: Path, bytecode_class: BytecodeClass) -> None:
     engine_ver_major = bytecode_class.engine_ver_major
     variant_ver_major = bytecode_class.variant_ver_major
     new_dir = dir
-    # ensure the directory exists
-    if not new_dir.exists():
-        new_dir.mkdir()
     new_file_cpp = new_dir / (file_stem + ".cpp")
-    with open(new_file_cpp, "w") as f:
+    with outputs.open(new_file_cpp) as f:
         f.write(PRELUDE)
         f.write(CLANG_FORMAT_OFF)
         # 1) the header declarations:
         f.write('#include "' + file_stem + '.h"\n')
+        f.write('#include "bytecode/bytecode_instrumentation.h"\n')
+        funcs = get_function_entries(bytecode_class)
+        if len(funcs) != 0:
+            f.write('#include "bytecode/bytecode_table.h"\n')
         f.write("\n")
 
-        # 2) the builtin function declarations:
-        if len(func_names) != 0:
-            f.write("static const Pair<String, Pair<int, int>> funcs[] = {\n")
-            for func_name in func_names:
-                if func_name == "var2bytes" or func_name == "bytes2var":
-                    if bytecode_rev_num in greater_than_3_1_versions:
-                        f.write('\t{ "' + func_name + '", Pair<int, int>(1, 2) },\n')
-                    else:
-                        f.write('\t{ "' + func_name + '", Pair<int, int>(1, 1) },\n')
-                else:
-                    for builtin_func_arg_element in builtin_func_arg_elements:
-                        if builtin_func_arg_element[0] == func_name:
-                            f.write(
-                                '\t{ "'
-                                + func_name
-                                + '", Pair<int, int>('
-                                + str(builtin_func_arg_element[1][0])
-                                + ", "
-                                + str(builtin_func_arg_element[1][1])
-                                + ") },\n"
-                            )
-                            break
+        # 2) the builtin function declarations, as plain data so that nothing has to run before `main`:
+        if len(funcs) != 0:
+            f.write("static constexpr GDScriptDecompFunction funcs[] = {\n")
+            for func_name, (min_args, max_args) in funcs:
+                f.write('\t{ "' + func_name + '", ' + str(min_args) + ", " + str(max_args) + " },\n")
+            f.write("};\n")
+            f.write("\n")
+            f.write("static constexpr int num_funcs = sizeof(funcs) / sizeof(funcs[0]);\n")
+            f.write("\n")
+            # 2.5) the indices of `funcs` sorted by name, used by `get_function_index` for a binary search
+            f.write("static constexpr int funcs_sorted[] = {\n")
+            for idx in get_sorted_function_indices(funcs):
+                f.write("\t" + str(idx) + ", // " + funcs[idx][0] + "\n")
             f.write("};\n")
             f.write("\n")
-            f.write("static constexpr int num_funcs = sizeof(funcs) / sizeof(Pair<String, Pair<int, int>>);\n")
         # 3) the Token enum declarations:
         f.write("enum Token {\n")
         for tk_name in tk_names:
@@ -325,10 +476,11 @@ def generate_class_cpp(dir: Path, bytecode_class: BytecodeClass) -> None:
         else:
             # 4) the `get_function_name` function:
             f.write("String " + class_name + "::get_function_name(int p_func) const {\n")
+            f.write("\tGDRE_INSTRUMENT_LOOKUP(bytecode_rev, LOOKUP_GET_FUNCTION_NAME);\n")
             f.write("\tif (p_func < 0 || p_func >= num_funcs) {\n")
             f.write('\t\treturn "";\n')
             f.write("\t}\n")
-            f.write("\treturn funcs[p_func].first;\n")
+            f.write("\treturn funcs[p_func].name;\n")
             f.write("}\n")
             f.write("\n")
 
@@ -342,49 +494,76 @@ def generate_class_cpp(dir: Path, bytecode_class: BytecodeClass) -> None:
             f.write("\tif (p_func < 0 || p_func >= num_funcs) {\n")
             f.write("\t\treturn Pair<int, int>(-1, -1);\n")
             f.write("\t}\n")
-            f.write("\treturn funcs[p_func].second;\n")
+            f.write("\treturn Pair<int, int>(funcs[p_func].min_args, funcs[p_func].max_args);\n")
             f.write("}\n")
             f.write("\n")
 
             f.write("\n")
             # 5.5) the `get_function_index` function:
             f.write("int " + class_name + "::get_function_index(const String &p_func) const {\n")
-            f.write("\tfor (int i = 0; i < num_funcs; i++) {\n")
-            f.write("\t\tif (funcs[i].first == p_func) {\n")
-            f.write("\t\t\treturn i;\n")
+            f.write("\tGDRE_INSTRUMENT_LOOKUP(bytecode_rev, LOOKUP_GET_FUNCTION_INDEX);\n")
+            f.write("\tint lo = 0;\n")
+            f.write("\tint hi = num_funcs;\n")
+            f.write("\twhile (lo < hi) {\n")
+            f.write("\t\tint mid = (lo + hi) / 2;\n")
+            f.write("\t\tconst char *name = funcs[funcs_sorted[mid]].name;\n")
+            f.write("\t\tif (p_func == name) {\n")
+            f.write("\t\t\treturn funcs_sorted[mid];\n")
+            f.write("\t\t}\n")
+            f.write("\t\tif (p_func < name) {\n")
+            f.write("\t\t\thi = mid;\n")
+            f.write("\t\t} else {\n")
+            f.write("\t\t\tlo = mid + 1;\n")
             f.write("\t\t}\n")
             f.write("\t}\n")
             f.write("\treturn -1;\n")
             f.write("}\n")
             f.write("\n")
 
-        # 6) the `get_global_token` function:
+        # 6) the token translation tables:
+        f.write("static constexpr GDScriptDecomp::GlobalToken local_to_global[] = {\n")
+        for tk_name in tk_names:
+            if tk_name == "TK_MAX":
+                break
+            f.write("\tGDScriptDecomp::GlobalToken::G_" + tk_name + ", // " + tk_name + "\n")
+        f.write("};\n")
+        f.write("static_assert(sizeof(local_to_global) / sizeof(local_to_global[0]) == TK_MAX);\n")
+        f.write("\n")
+        f.write("static constexpr int global_to_local[] = {\n")
+        for g_tk_name in global_tokens:
+            tk_name = g_tk_name[2:]
+            if tk_name in tk_names:
+                f.write("\t" + tk_name + ", // " + g_tk_name + "\n")
+            else:
+                f.write("\t-1, // " + g_tk_name + "\n")
+        f.write("};\n")
+        f.write(
+            "static_assert(sizeof(global_to_local) / sizeof(global_to_local[0]) == GDScriptDecomp::GlobalToken::G_TK_MAX + 1);\n"
+        )
+        f.write("\n")
+
+        # 7) the `get_global_token` function:
         f.write("GDScriptDecomp::GlobalToken " + class_name + "::get_global_token(int p_token) const {\n")
+        f.write("\tGDRE_INSTRUMENT_LOOKUP(bytecode_rev, LOOKUP_GET_GLOBAL_TOKEN);\n")
         f.write("\tp_token = p_token & TOKEN_MASK;\n")
-        f.write("\tif (p_token < 0 || p_token >= TK_MAX) {\n")
+        f.write("\tif (p_token >= TK_MAX) {\n")
         f.write("\t\treturn GDScriptDecomp::GlobalToken::G_TK_MAX;\n")
         f.write("\t}\n")
-        f.write("\tswitch(Token(p_token)) {\n")
-        for tk_name in tk_names:
-            f.write("\t\tcase " + tk_name + ": return GDScriptDecomp::GlobalToken::G_" + tk_name + ";\n")
-        f.write("\t\tdefault: return GDScriptDecomp::GlobalToken::G_TK_MAX;\n")
-        f.write("\t}\n")
-        f.write("\treturn GDScriptDecomp::GlobalToken::G_TK_MAX;\n")
+        f.write("\treturn local_to_global[p_token];\n")
         f.write("}\n")
         f.write("\n")
 
-        # 7) the `get_local_token_val` function:
+        # 8) the `get_local_token_val` function:
         f.write("int " + class_name + "::get_local_token_val(GDScriptDecomp::GlobalToken p_token) const {\n")
-        f.write("\tswitch(p_token) {\n")
-        for tk_name in tk_names:
-            f.write("\t\tcase GDScriptDecomp::GlobalToken::G_" + tk_name + ": return (int) " + tk_name + ";\n")
-        f.write("\t\tdefault: return -1;\n")
+        f.write("\tGDRE_INSTRUMENT_LOOKUP(bytecode_rev, LOOKUP_GET_LOCAL_TOKEN_VAL);\n")
+        f.write("\tif ((unsigned int)p_token > GDScriptDecomp::GlobalToken::G_TK_MAX) {\n")
+        f.write("\t\treturn -1;\n")
         f.write("\t}\n")
-        f.write("\treturn -1;\n")
+        f.write("\treturn global_to_local[p_token];\n")
         f.write("}\n")
         f.write("\n")
 
-        # 8) the `test_bytecode` function:
+        # 9) the `test_bytecode` function:
         # f.write("GDScriptDecomp::BYTECODE_TEST_RESULT " + class_name + "::test_bytecode(Vector<uint8_t> buffer) {\n")
         # f.write("\treturn GDScriptDecomp::test_bytecode(buffer);\n")
         # f.write("}\n")
@@ -444,13 +623,10 @@ def generate_class_header(dir: Path, bytecode_class: BytecodeClass) -> None:
     engine_ver_major = bytecode_class.engine_ver_major
     variant_ver_major = bytecode_class.variant_ver_major
     new_dir = dir
-    # ensure the directory exists
-    if not new_dir.exists():
-        new_dir.mkdir()
     new_file_h = new_dir / (file_stem + ".h")
     new_added_tokens = ["GlobalToken::G_" + tk_name for tk_name in bytecode_class.added_tokens]
     new_removed_tokens = ["GlobalToken::G_" + tk_name for tk_name in bytecode_class.removed_tokens]
-    with open(new_file_h, "w") as f:
+    with outputs.open(new_file_h) as f:
         f.write(PRELUDE)
         f.write(CLANG_FORMAT_OFF)
         f.write("#pragma once\n")
@@ -524,39 +700,144 @@ def generate_class_header(dir: Path, bytecode_class: BytecodeClass) -> None:
         f.write("\n")
 
 
-def write_bytecode_json(dir: Path, bytecode_classes: list[BytecodeClass]) -> None:
-    bytecode_json = []
-    for bytecode_class in bytecode_classes:
-        bytecode_json.append(
-            {
-                "bytecode_rev": bytecode_class.bytecode_rev,
-                "bytecode_version": bytecode_class.bytecode_version,
-                "date": bytecode_class.date,
-                "engine_version": bytecode_class.engine_version,
-                "max_engine_version": bytecode_class.max_engine_version,
-                "engine_ver_major": bytecode_class.engine_ver_major,
-                "variant_ver_major": bytecode_class.variant_ver_major,
-                "parent": bytecode_class.parent,
-                "is_dev": bytecode_class.is_dev,
-                "added_tokens": bytecode_class.added_tokens,
-                "removed_tokens": bytecode_class.removed_tokens,
-                "added_functions": bytecode_class.added_functions,
-                "removed_functions": bytecode_class.removed_functions,
-                "renamed_functions": bytecode_class.renamed_functions,
-                "arg_count_changed": bytecode_class.arg_count_changed,
-                "tokens_renamed": bytecode_class.tokens_renamed,
-                "func_names": bytecode_class.func_names,
-                "tk_names": bytecode_class.tk_names,
-            }
+# `misc/bytecode_versions.json` stores the full `tk_names` and `func_names` only for revisions without a parent.
+# The others have `tk_names_delta` and `func_names_delta`, edit scripts against their parent's lists:
+# a positive number copies that many names from the parent, a negative number skips that many,
+# and a list of names inserts them. `tables_digest` is `get_tables_digest` of the full lists, so that every
+# rebuilt table is checked against the data it was encoded from.
+def encode_names_delta(base: list[str], names: list[str]) -> list:
+    delta = []
+    for tag, i1, i2, j1, j2 in difflib.SequenceMatcher(None, base, names, autojunk=False).get_opcodes():
+        if tag == "equal":
+            delta.append(i2 - i1)
+            continue
+        if i2 > i1:
+            delta.append(i1 - i2)
+        if j2 > j1:
+            delta.append(names[j1:j2])
+    return delta
+
+
+def apply_names_delta(base: list[str], delta: list) -> list[str]:
+    names = []
+    pos = 0
+    for op in delta:
+        if isinstance(op, list):
+            names.extend(op)
+        elif op > 0:
+            names.extend(base[pos : pos + op])
+            pos += op
+        else:
+            pos -= op
+    if pos != len(base):
+        raise Exception("Names delta doesn't cover its parent's " + str(len(base)) + " names")
+    return names
+
+
+def get_tables_digest(tk_names: list[str], func_names: list[str]) -> str:
+    h = hashlib.sha256()
+    h.update("\n".join(tk_names).encode("utf-8"))
+    h.update(b"\0")
+    h.update("\n".join(func_names).encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def check_tables_digest(bytecode_class: BytecodeClass) -> None:
+    if not bytecode_class._tables_digest:
+        return
+    digest = get_tables_digest(bytecode_class.tk_names, bytecode_class.func_names)
+    if digest != bytecode_class._tables_digest:
+        raise Exception(
+            "Tables of " + bytecode_class.bytecode_rev + " don't match their digest (" + digest + " != " + bytecode_class._tables_digest + ")"
         )
-    with open(our_dir / "bytecode_versions.json", "w") as f:
-        f.write(json.dumps(bytecode_json, indent=4))
 
 
-def read_bytecode_json(path: Path) -> list[BytecodeClass]:
+def write_bytecode_json(path: Path, bytecode_classes: list[BytecodeClass]) -> None:
+    by_rev = {bytecode_class.bytecode_rev: bytecode_class for bytecode_class in bytecode_classes}
     bytecode_json = []
-    with open(path, "r") as f:
-        bytecode_json = json.loads(f.read())
+    for bytecode_class in bytecode_classes:
+        entry = {
+            "bytecode_rev": bytecode_class.bytecode_rev,
+            "bytecode_version": bytecode_class.bytecode_version,
+            "date": bytecode_class.date,
+            "engine_version": bytecode_class.engine_version,
+            "max_engine_version": bytecode_class.max_engine_version,
+            "engine_ver_major": bytecode_class.engine_ver_major,
+            "variant_ver_major": bytecode_class.variant_ver_major,
+            "parent": bytecode_class.parent,
+            "is_dev": bytecode_class.is_dev,
+            "added_tokens": bytecode_class.added_tokens,
+            "removed_tokens": bytecode_class.removed_tokens,
+            "added_functions": bytecode_class.added_functions,
+            "removed_functions": bytecode_class.removed_functions,
+            "renamed_functions": bytecode_class.renamed_functions,
+            "arg_count_changed": bytecode_class.arg_count_changed,
+            "tokens_renamed": bytecode_class.tokens_renamed,
+            "tables_digest": get_tables_digest(bytecode_class.tk_names, bytecode_class.func_names),
+        }
+        parent = by_rev.get(bytecode_class.parent)
+        if parent is None:
+            entry["func_names"] = bytecode_class.func_names
+            entry["tk_names"] = bytecode_class.tk_names
+        else:
+            entry["func_names_delta"] = encode_names_delta(parent.func_names, bytecode_class.func_names)
+            entry["tk_names_delta"] = encode_names_delta(parent.tk_names, bytecode_class.tk_names)
+        bytecode_json.append(entry)
+    write_atomic(path, json.dumps(bytecode_json, indent=4) + "\n")
+
+
+# Bump this when the cache's layout changes.
+JSON_CACHE_VERSION = 2
+
+
+def _get_json_cache_path(path: Path) -> Path:
+    return path.parent / ("." + path.name + ".cache")
+
+
+def load_bytecode_json_entries(path: Path, use_cache: bool = True) -> list[dict]:
+    """Returns the parsed entries of a `bytecode_versions.json`.
+
+    They're cached next to it, keyed by the file's mtime and size, and by its hash if those changed; a cache that's
+    missing, stale or unreadable is just rebuilt."""
+    if not use_cache:
+        with open(path, "r") as f:
+            return json.load(f)
+    cache_path = _get_json_cache_path(path)
+    stat = path.stat()
+    # a list rather than a tuple, since that's what it reads back as
+    key = [JSON_CACHE_VERSION, stat.st_mtime_ns, stat.st_size]
+    cached = None
+    try:
+        # JSON rather than pickle, so that a tampered cache can't run code; it's still only trusted if the key matches
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached["key"] == key:
+            return cached["entries"]
+    except (OSError, ValueError, KeyError, TypeError):
+        cached = None
+    if not isinstance(cached, dict):
+        cached = None
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    if cached is not None and cached.get("version") == JSON_CACHE_VERSION and cached.get("sha256") == digest:
+        # touched, but not changed
+        entries = cached["entries"]
+    else:
+        entries = json.loads(data)
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name + ".", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"version": JSON_CACHE_VERSION, "key": key, "sha256": digest, "entries": entries}, f, separators=(",", ":"))
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        # a read-only checkout just doesn't get a cache
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+    return entries
+
+
+def read_bytecode_json(path: Path, use_cache: bool = True) -> list[BytecodeClass]:
+    bytecode_json = load_bytecode_json_entries(path, use_cache)
     bytecode_classes = []
     for bytecode in bytecode_json:
         bytecode_class = BytecodeClass()
@@ -568,8 +849,16 @@ def read_bytecode_json(path: Path) -> list[BytecodeClass]:
         bytecode_class.engine_ver_major = bytecode["engine_ver_major"]
         bytecode_class.variant_ver_major = bytecode["variant_ver_major"]
         bytecode_class.parent = bytecode["parent"]
-        bytecode_class.func_names = bytecode["func_names"]
-        bytecode_class.tk_names = bytecode["tk_names"]
+        if "tk_names" in bytecode:
+            bytecode_class.func_names = bytecode["func_names"]
+            bytecode_class.tk_names = bytecode["tk_names"]
+        else:
+            # rebuilt on first use, once every revision has been read
+            bytecode_class.func_names = None
+            bytecode_class.tk_names = None
+            bytecode_class._func_names_delta = bytecode["func_names_delta"]
+            bytecode_class._tk_names_delta = bytecode["tk_names_delta"]
+        bytecode_class._tables_digest = bytecode.get("tables_digest", "")
         bytecode_class.added_tokens = bytecode["added_tokens"]
         bytecode_class.removed_tokens = bytecode["removed_tokens"]
         bytecode_class.added_functions = bytecode["added_functions"]
@@ -579,9 +868,30 @@ def read_bytecode_json(path: Path) -> list[BytecodeClass]:
         bytecode_class.tokens_renamed = bytecode["tokens_renamed"]
         bytecode_class.is_dev = bytecode["is_dev"]
         bytecode_classes.append(bytecode_class)
+    by_rev = {bytecode_class.bytecode_rev: bytecode_class for bytecode_class in bytecode_classes}
+    for bytecode_class in bytecode_classes:
+        if bytecode_class._tk_names is None:
+            if bytecode_class.parent not in by_rev:
+                raise Exception(bytecode_class.bytecode_rev + " is stored as a delta, but its parent isn't in " + str(path))
+            bytecode_class._parent_class = by_rev[bytecode_class.parent]
     return bytecode_classes
 
 
+def check_bytecode_json(bytecode_classes: list[BytecodeClass]) -> None:
+    """Rebuilds every table, checks it against its digest, and checks that encoding it again gives back the same table."""
+    by_rev = {bytecode_class.bytecode_rev: bytecode_class for bytecode_class in bytecode_classes}
+    for bytecode_class in bytecode_classes:
+        tk_names = bytecode_class.tk_names
+        func_names = bytecode_class.func_names
+        check_tables_digest(bytecode_class)
+        parent = by_rev.get(bytecode_class.parent)
+        if parent is None:
+            continue
+        for base, names in ((parent.tk_names, tk_names), (parent.func_names, func_names)):
+            if apply_names_delta(base, encode_names_delta(base, names)) != names:
+                raise Exception("Names delta of " + bytecode_class.bytecode_rev + " doesn't round-trip")
+
+
 def generate_bytecode_description_string(bytecode_class: BytecodeClass) -> str:
     # examples:
     # f3f05dc would have the description: "removed `SYNC` and `SLAVE` tokens"
@@ -669,28 +979,71 @@ BYTECODE_CLASSDB_REGISTER = "//_BYTECODE_CLASSDB_REGISTER_"
 BYTECODE_CASE_STATEMENTS = "//_BYTECODE_CASE_STATEMENTS_"
 BYTECODE_HEADERS = "//_BYTECODE_HEADERS_"
 BYTECODE_DECOMP_VERSIONS = "//_BYTECODE_DECOMP_VERSIONS_"
+BYTECODE_VERSION_RANGES = "//_BYTECODE_VERSION_RANGES_"
+BYTECODE_VERSION_INDEX_CASES = "//_BYTECODE_VERSION_INDEX_CASES_"
+BYTECODE_VERSION_INTERVALS = "//_BYTECODE_VERSION_INTERVALS_"
+BYTECODE_TABLE_HASH = "//_BYTECODE_TABLE_HASH_"
 PRELUDE_REPLACE = "//_PRELUDE_"
 
 
-def generate_bytecode_version_header(dir: Path, bytecode_classes: list[BytecodeClass]) -> None:
-    new_dir = dir
-    # get misc/bytecode_versions.h.inc
-    code = ""
-    with open(our_dir / "misc" / "bytecode_versions.h.inc", "r") as f:
-        code = f.read()
-    # ensure the directory exists
-    if not new_dir.exists():
-        new_dir.mkdir()
-    new_file_h = new_dir / ("bytecode_versions.h")
-    code = code.replace(PRELUDE_REPLACE, PRELUDE)
-    header_str = ""
-    for bytecode_class in bytecode_classes:
-        header_str += f'#include "bytecode/{bytecode_class.file_stem}.h"\n'
+# `GodotVer::non_strict_regex_str`
+GODOT_VER_REGEX = re.compile(
+    r"^[vV]?(?P<major>0|[1-9]\d*)(?:\.(?P<minor>0|[1-9]\d*))?(?:\.(?P<patch>0|[1-9]\d*))?"
+    r"(?:[\.-](?P<prerelease>(?:dev|alpha|beta|rc)\d*))?(?:[\.+-](?P<buildmetadata>(?:[\w\-_\+\.]*)))?$"
+)
+# `GDScriptDecompVersionNumber::Prerelease`, no prerelease is `len(PRERELEASE_KINDS) + 1`
+PRERELEASE_KINDS = ["dev", "alpha", "beta", "rc"]
+
+
+def parse_version_number(ver: str) -> tuple[int, int, int, int, int]:
+    """Parses a version the way `GodotVer::parse` does, into the fields of a `GDScriptDecompVersionNumber`."""
+    if not ver:
+        return (0, 0, 0, 0, 0)
+    match = GODOT_VER_REGEX.match(ver)
+    if not match:
+        raise Exception("Invalid engine version: " + ver)
+    prerelease = match.group("prerelease")
+    kind = len(PRERELEASE_KINDS) + 1
+    num = 0
+    if prerelease:
+        kind = next(i for i, name in enumerate(PRERELEASE_KINDS) if prerelease.startswith(name))
+        digits = prerelease[len(PRERELEASE_KINDS[kind]) :]
+        num = int(digits) if digits else 0
+    return (int(match.group("major")), int(match.group("minor") or 0), int(match.group("patch") or 0), kind, num)
+
+
+def get_version_intervals(bytecode_classes: list[BytecodeClass]) -> list[int]:
+    """Returns the rows of `decomp_versions` for the non-dev revisions, sorted by their minimum version.
+
+    `find_decomp_version_index` binary searches these, which only gives the same answer as walking the revisions
+    of a major version from oldest to newest if they're already in that order and none of them overlap."""
+    rows = []
+    for row, bytecode_class in enumerate(bytecode_classes, start=1):
+        if not bytecode_class.is_dev:
+            rows.append((parse_version_number(bytecode_class.engine_version), row))
+    rows.sort()
+    for (min_ver, row), (next_min_ver, next_row) in zip(rows, rows[1:]):
+        if min_ver[0] != next_min_ver[0]:
+            continue
+        if row <= next_row:
+            raise Exception(f"Revision on row {row} comes before the older revision on row {next_row} in the JSON file")
+        max_ver = min_ver
+        if bytecode_classes[row - 1].max_engine_version:
+            max_ver = parse_version_number(bytecode_classes[row - 1].max_engine_version)
+        if max_ver >= next_min_ver:
+            raise Exception(f"Version range of the revision on row {row} overlaps the one on row {next_row}")
+    return [row for _, row in rows]
 
-    code = code.replace(BYTECODE_HEADERS, header_str)
-    version_section = '\t{ 0xfffffff, "--- Please select bytecode version ---", 0, false },\n'
+
+def format_version_number(ver: str) -> str:
+    return "{ " + ", ".join(str(field) for field in parse_version_number(ver)) + " }"
+
+
+def get_decomp_versions_section(bytecode_classes: list[BytecodeClass]) -> str:
+    """Returns the rows of `decomp_versions`."""
+    version_section = '\t{ 0xfffffff, "--- Please select bytecode version ---", 0, false, "", "", 0, {}, {} },\n'
     # "4.3.0 release (77af6ca / 2024-02-09 / Bytecode version: 100) - initial version"
-    ver_format = '\t{{ 0x{commit}, "{name}", {bytecode_version}, {is_dev}, "{ver}", "{max_ver}", 0x{parent} }},\n'
+    ver_format = '\t{{ 0x{commit}, "{name}", {bytecode_version}, {is_dev}, "{ver}", "{max_ver}", 0x{parent}, {ver_number}, {max_ver_number} }},\n'
     name_format = "{ver} ({commit} / {date} / Bytecode version: {bytecode_version}) - {description}"
     for bytecode_class in bytecode_classes:
         name_tab = "\t" if bytecode_class.is_dev else ""
@@ -711,26 +1064,49 @@ def generate_bytecode_version_header(dir: Path, bytecode_classes: list[BytecodeC
             ver=bytecode_class.engine_version,
             max_ver=bytecode_class.max_engine_version if bytecode_class.max_engine_version else "",
             parent=bytecode_class.parent if bytecode_class.parent else 0,
+            ver_number=format_version_number(bytecode_class.engine_version),
+            max_ver_number=format_version_number(bytecode_class.max_engine_version),
         )
         version_section += line
-    version_section += '\t{ 0x0000000, "-NULL-", 0, false },\n'
-    code = code.replace(BYTECODE_DECOMP_VERSIONS, version_section)
-    with open(new_file_h, "w") as f:
+    version_section += '\t{ 0x0000000, "-NULL-", 0, false, "", "", 0, {}, {} },\n'
+    return version_section
+
+
+def generate_bytecode_version_header(dir: Path) -> None:
+    # The public header only declares the registry, so that editing one revision doesn't rebuild everything that includes it.
+    # The revision classes are only included by `bytecode_versions.cpp`, see `get_class_headers_section`.
+    new_dir = dir
+    # get misc/bytecode_versions.h.inc
+    code = ""
+    with open(our_dir / "misc" / "bytecode_versions.h.inc", "r") as f:
+        code = f.read()
+    new_file_h = new_dir / ("bytecode_versions.h")
+    code = code.replace(PRELUDE_REPLACE, PRELUDE)
+    with outputs.open(new_file_h) as f:
         f.write(code)
 
 
-def generate_bytecode_versions_cpp(dir: Path, bytecode_classes: list[BytecodeClass]) -> None:
+def get_class_headers_section(bytecode_classes: list[BytecodeClass], table_mode: bool) -> str:
+    if table_mode:
+        return f'#include "bytecode/{TABLE_CLASSES_FILE}"\n'
+    header_str = ""
+    for bytecode_class in bytecode_classes:
+        header_str += f'#include "bytecode/{bytecode_class.file_stem}.h"\n'
+    return header_str
+
+
+def generate_bytecode_versions_cpp(
+    dir: Path, bytecode_classes: list[BytecodeClass], table_hash: str, table_mode: bool = False
+) -> None:
     new_dir = dir
-    # ensure the directory exists
     code = ""
     with open(our_dir / "misc" / "bytecode_versions.cpp.inc", "r") as f:
         code = f.read()
     if not code:
         raise Exception("Failed to read bytecode_versions.cpp.inc")
-    if not new_dir.exists():
-        new_dir.mkdir()
     new_file_cpp = new_dir / ("bytecode_versions.cpp")
     code = code.replace(PRELUDE_REPLACE, PRELUDE)
+    code = code.replace(BYTECODE_HEADERS, get_class_headers_section(bytecode_classes, table_mode).rstrip("\n"))
     bytecode_classdb_register = ""
     for bytecode_class in bytecode_classes:
         bytecode_classdb_register += "\tClassDB::register_class<" + bytecode_class.class_name + ">();\n"
@@ -741,22 +1117,701 @@ def generate_bytecode_versions_cpp(dir: Path, bytecode_classes: list[BytecodeCla
             "\t\tcase 0x" + bytecode_class.bytecode_rev + ": return memnew(" + bytecode_class.class_name + ");\n"
         )
     code = code.replace(BYTECODE_CASE_STATEMENTS, bytecode_case_statements)
+    code = code.replace(BYTECODE_DECOMP_VERSIONS, get_decomp_versions_section(bytecode_classes).rstrip("\n"))
 
-    with open(new_file_cpp, "w") as f:
+    # rows of `decomp_versions`; row 0 is the "Please select" placeholder
+    index_cases = ""
+    ranges: dict[int, list[int]] = {}
+    for row, bytecode_class in enumerate(bytecode_classes, start=1):
+        index_cases += "\t\tcase 0x" + bytecode_class.bytecode_rev + ": return " + str(row) + ";\n"
+        version_range = ranges.setdefault(bytecode_class.bytecode_version, [row, row])
+        if version_range[1] != row:
+            raise Exception("Revisions with bytecode version " + str(bytecode_class.bytecode_version) + " aren't contiguous")
+        version_range[1] = row + 1
+    code = code.replace(BYTECODE_VERSION_INDEX_CASES, index_cases)
+    version_ranges = ""
+    for version in range(max(ranges) + 1):
+        start, end = ranges.get(version, [0, 0])
+        version_ranges += "\t{ " + str(start) + ", " + str(end) + " }," + (" // " + str(version) if version in ranges else "") + "\n"
+    code = code.replace(BYTECODE_VERSION_RANGES, version_ranges.rstrip("\n"))
+    version_intervals = ""
+    for row in get_version_intervals(bytecode_classes):
+        bytecode_class = bytecode_classes[row - 1]
+        version_intervals += "\t" + str(row) + ", // " + bytecode_class.engine_version
+        if bytecode_class.max_engine_version:
+            version_intervals += " - " + bytecode_class.max_engine_version
+        version_intervals += "\n"
+    code = code.replace(BYTECODE_VERSION_INTERVALS, version_intervals.rstrip("\n"))
+    code = code.replace(BYTECODE_TABLE_HASH, table_hash)
+
+    with outputs.open(new_file_cpp) as f:
         f.write(code)
 
 
-bytecode_classes = []
+# tests/test_bytecode_generated.h contains the function tables of every revision straight from the JSON file,
+# and checks the generated lookups against them, like this:
+# ```cpp
+# static const char *const funcs_<bytecode_rev>[] = {
+# 	"sin",
+# 	[etc...]
+# };
+#
+# static const RevisionFunctions revision_functions[] = {
+# 	{ 0x<bytecode_rev>, funcs_<bytecode_rev>, <num_funcs> },
+# 	[etc...]
+# 	{ 0, nullptr, 0 },
+# };
+# ```
+TOKEN_TRANSLATION_TESTS = """TEST_CASE("[GDSDecomp][Bytecode] Token translation tables match the legacy switch statements for every revision") {
+	for (int i = 0; revision_tokens[i].revision != 0; i++) {
+		const RevisionTokens &rev = revision_tokens[i];
+		String sub_case_name = vformat("Testing token translation for revision %07x", rev.revision);
+		SUBCASE(sub_case_name.utf8().get_data()) {
+			auto decomp = GDScriptDecomp::create_decomp_for_commit(rev.revision);
+			REQUIRE(decomp.is_valid());
+			// the upper bits hold identifier/constant/function indices, so make sure they're masked off
+			for (int token = 0; token <= (int)GDScriptDecomp::TOKEN_MASK; token++) {
+				CHECK(decomp->get_global_token(token) == rev.get_global_token(token));
+				CHECK(decomp->get_global_token(token | (1234 << GDScriptDecomp::TOKEN_BITS)) == rev.get_global_token(token | (1234 << GDScriptDecomp::TOKEN_BITS)));
+			}
+			for (int token = 0; token <= GDScriptDecomp::GlobalToken::G_TK_MAX; token++) {
+				auto g_token = GDScriptDecomp::GlobalToken(token);
+				CHECK(decomp->get_local_token_val(g_token) == rev.get_local_token_val(g_token));
+			}
+		}
+	}
+}
+
+// Run with `--test --test-case="*Benchmark*" --no-skip`
+TEST_CASE("[GDSDecomp][Bytecode][Benchmark] Token translation tables vs. legacy switch statements" * doctest::skip()) {
+	const int num_tokens = 4 * 1024 * 1024;
+	Vector<int> local_tokens;
+	Vector<GDScriptDecomp::GlobalToken> global_tokens;
+	local_tokens.resize(num_tokens);
+	global_tokens.resize(num_tokens);
+	RandomPCG rng(0x5eed);
+	for (int i = 0; i < num_tokens; i++) {
+		local_tokens.write[i] = rng.rand() & ((1 << (GDScriptDecomp::TOKEN_BITS + 4)) - 1);
+		global_tokens.write[i] = GDScriptDecomp::GlobalToken(rng.rand() % (GDScriptDecomp::GlobalToken::G_TK_MAX + 1));
+	}
+	const int *local_ptr = local_tokens.ptr();
+	const GDScriptDecomp::GlobalToken *global_ptr = global_tokens.ptr();
+	for (int i = 0; revision_tokens[i].revision != 0; i++) {
+		const RevisionTokens &rev = revision_tokens[i];
+		auto decomp = GDScriptDecomp::create_decomp_for_commit(rev.revision);
+		REQUIRE(decomp.is_valid());
+		uint64_t checksum_old = 0;
+		uint64_t checksum_new = 0;
+
+		uint64_t start = OS::get_singleton()->get_ticks_usec();
+		for (int j = 0; j < num_tokens; j++) {
+			checksum_old += rev.get_global_token(local_ptr[j]) + rev.get_local_token_val(global_ptr[j]);
+		}
+		uint64_t old_usec = OS::get_singleton()->get_ticks_usec() - start;
+
+		start = OS::get_singleton()->get_ticks_usec();
+		for (int j = 0; j < num_tokens; j++) {
+			checksum_new += decomp->get_global_token(local_ptr[j]) + decomp->get_local_token_val(global_ptr[j]);
+		}
+		uint64_t new_usec = OS::get_singleton()->get_ticks_usec() - start;
+
+		CHECK(checksum_old == checksum_new);
+		print_line(vformat("%07x: %d tokens each way, switch: %d usec, tables: %d usec (%.2fx)", rev.revision, num_tokens, old_usec, new_usec, new_usec > 0 ? (double)old_usec / new_usec : 0.0));
+	}
+}
+"""
+
+
+def generate_bytecode_test_header(dir: Path, bytecode_classes: list[BytecodeClass]) -> None:
+    new_dir = dir
+    new_file_h = new_dir / "test_bytecode_generated.h"
+    all_function_names = []
+    for bytecode_class in bytecode_classes:
+        for func_name in bytecode_class.func_names:
+            if func_name not in all_function_names:
+                all_function_names.append(func_name)
+    with outputs.open(new_file_h) as f:
+        f.write(PRELUDE)
+        f.write(CLANG_FORMAT_OFF)
+        f.write("#pragma once\n")
+        f.write("\n")
+        f.write('#include "../bytecode/bytecode_base.h"\n')
+        f.write('#include "tests/test_macros.h"\n')
+        f.write("\n")
+        f.write('#include "core/math/random_pcg.h"\n')
+        f.write('#include "core/os/os.h"\n')
+        f.write("\n")
+        f.write("namespace TestBytecodeGenerated {\n")
+        f.write("\n")
+        f.write("struct RevisionFunctions {\n")
+        f.write("\tuint64_t revision;\n")
+        f.write("\tconst char *const *funcs;\n")
+        f.write("\tint func_count;\n")
+        f.write("};\n")
+        f.write("\n")
+        for bytecode_class in bytecode_classes:
+            funcs = get_function_entries(bytecode_class)
+            if len(funcs) == 0:
+                continue
+            f.write("static const char *const funcs_" + bytecode_class.bytecode_rev + "[] = {\n")
+            for func_name, _ in funcs:
+                f.write('\t"' + func_name + '",\n')
+            f.write("};\n")
+            f.write("\n")
+        f.write("static const RevisionFunctions revision_functions[] = {\n")
+        for bytecode_class in bytecode_classes:
+            funcs = get_function_entries(bytecode_class)
+            if len(funcs) == 0:
+                f.write("\t{ 0x" + bytecode_class.bytecode_rev + ", nullptr, 0 },\n")
+            else:
+                f.write(
+                    "\t{ 0x"
+                    + bytecode_class.bytecode_rev
+                    + ", funcs_"
+                    + bytecode_class.bytecode_rev
+                    + ", "
+                    + str(len(funcs))
+                    + " },\n"
+                )
+        f.write("\t{ 0, nullptr, 0 },\n")
+        f.write("};\n")
+        f.write("\n")
+        f.write("// Every function name in any revision, so that we also look up names that a revision doesn't have.\n")
+        f.write("static const char *const all_function_names[] = {\n")
+        for func_name in all_function_names:
+            f.write('\t"' + func_name + '",\n')
+        f.write('\t"",\n')
+        f.write('\t"not_a_builtin_function",\n')
+        f.write("};\n")
+        f.write("\n")
+        f.write("// The linear scan that `get_function_index` used to do.\n")
+        f.write("inline int linear_function_index(const RevisionFunctions &p_rev, const String &p_func) {\n")
+        f.write("\tfor (int i = 0; i < p_rev.func_count; i++) {\n")
+        f.write("\t\tif (p_func == p_rev.funcs[i]) {\n")
+        f.write("\t\t\treturn i;\n")
+        f.write("\t\t}\n")
+        f.write("\t}\n")
+        f.write("\treturn -1;\n")
+        f.write("}\n")
+        f.write("\n")
+        f.write('TEST_CASE("[GDSDecomp][Bytecode] get_function_index matches a linear scan for every revision") {\n')
+        f.write("\tfor (int i = 0; revision_functions[i].revision != 0; i++) {\n")
+        f.write("\t\tconst RevisionFunctions &rev = revision_functions[i];\n")
+        f.write('\t\tString sub_case_name = vformat("Testing function lookup for revision %07x", rev.revision);\n')
+        f.write("\t\tSUBCASE(sub_case_name.utf8().get_data()) {\n")
+        f.write("\t\t\tauto decomp = GDScriptDecomp::create_decomp_for_commit(rev.revision);\n")
+        f.write("\t\t\tREQUIRE(decomp.is_valid());\n")
+        f.write("\t\t\tCHECK(decomp->get_function_count() == rev.func_count);\n")
+        f.write("\t\t\tfor (int j = 0; j < rev.func_count; j++) {\n")
+        f.write("\t\t\t\tCHECK(decomp->get_function_name(j) == rev.funcs[j]);\n")
+        f.write("\t\t\t}\n")
+        f.write("\t\t\tfor (const char *func_name : all_function_names) {\n")
+        f.write("\t\t\t\tCHECK(decomp->get_function_index(func_name) == linear_function_index(rev, func_name));\n")
+        f.write("\t\t\t}\n")
+        f.write("\t\t}\n")
+        f.write("\t}\n")
+        f.write("}\n")
+        f.write("\n")
+        # The `switch` statements that `get_global_token` and `get_local_token_val` used to be generated as,
+        # kept here to check the translation tables against them and to benchmark the two.
+        for bytecode_class in bytecode_classes:
+            rev = bytecode_class.bytecode_rev
+            f.write("inline GDScriptDecomp::GlobalToken legacy_get_global_token_" + rev + "(int p_token) {\n")
+            f.write("\tp_token = p_token & GDScriptDecomp::TOKEN_MASK;\n")
+            f.write("\tswitch(p_token) {\n")
+            for i, tk_name in enumerate(bytecode_class.tk_names):
+                if tk_name == "TK_MAX":
+                    break
+                f.write("\t\tcase " + str(i) + ": return GDScriptDecomp::GlobalToken::G_" + tk_name + ";\n")
+            f.write("\t\tdefault: return GDScriptDecomp::GlobalToken::G_TK_MAX;\n")
+            f.write("\t}\n")
+            f.write("}\n")
+            f.write("\n")
+            f.write("inline int legacy_get_local_token_val_" + rev + "(GDScriptDecomp::GlobalToken p_token) {\n")
+            f.write("\tswitch(p_token) {\n")
+            for i, tk_name in enumerate(bytecode_class.tk_names):
+                f.write("\t\tcase GDScriptDecomp::GlobalToken::G_" + tk_name + ": return " + str(i) + ";\n")
+            f.write("\t\tdefault: return -1;\n")
+            f.write("\t}\n")
+            f.write("}\n")
+            f.write("\n")
+        f.write("struct RevisionTokens {\n")
+        f.write("\tuint64_t revision;\n")
+        f.write("\tGDScriptDecomp::GlobalToken (*get_global_token)(int);\n")
+        f.write("\tint (*get_local_token_val)(GDScriptDecomp::GlobalToken);\n")
+        f.write("};\n")
+        f.write("\n")
+        f.write("static const RevisionTokens revision_tokens[] = {\n")
+        for bytecode_class in bytecode_classes:
+            rev = bytecode_class.bytecode_rev
+            f.write(
+                "\t{ 0x"
+                + rev
+                + ", legacy_get_global_token_"
+                + rev
+                + ", legacy_get_local_token_val_"
+                + rev
+                + " },\n"
+            )
+        f.write("\t{ 0, nullptr, nullptr },\n")
+        f.write("};\n")
+        f.write("\n")
+        f.write(TOKEN_TRANSLATION_TESTS)
+        f.write("\n")
+        f.write("} //namespace TestBytecodeGenerated\n")
+
+
+# In table mode (`--table`), instead of a class per revision, every revision's tables go into one read-only
+# array of `GDScriptDecompRevision`s in `bytecode_table_data.cpp`, which the table-driven `GDScriptDecompTable`
+# (see `bytecode_table.h`) reads from. `bytecode_table_classes.h` then declares a thin subclass per revision, so that
+# `GDScriptDecomp_<bytecode_rev>` keeps existing for ClassDB and for code that uses the classes directly:
+# ```cpp
+# static const GDScriptDecompFunction funcs_<bytecode_rev>[] = {
+# 	{ "sin", 1, 1 },
+# 	[etc...]
+# };
+# static const uint8_t funcs_sorted_<bytecode_rev>[] = { 62, 16, [etc...] };
+# static const uint8_t local_to_global_<bytecode_rev>[] = { GDScriptDecomp::G_TK_EMPTY, [etc...] };
+# static const int8_t global_to_local_<bytecode_rev>[] = { 0, 1, -1, [etc...] };
+# [etc...]
+#
+# const GDScriptDecompRevision gdscript_decomp_revisions[] = {
+# 	{ 0x<bytecode_rev>, <bytecode_version>, [etc...] },
+# };
+# ```
+TABLE_DATA_FILE = "bytecode_table_data.cpp"
+TABLE_CLASSES_FILE = "bytecode_table_classes.h"
+
+
+def _c_array_or_null(name: str, values: list) -> str:
+    return name if len(values) > 0 else "nullptr"
+
+
+def generate_table_data_cpp(dir: Path, bytecode_classes: list[BytecodeClass], global_tokens: list[str]) -> None:
+    new_dir = dir
+    new_file_cpp = new_dir / TABLE_DATA_FILE
+    with outputs.open(new_file_cpp) as f:
+        f.write(PRELUDE)
+        f.write(CLANG_FORMAT_OFF)
+        f.write('#include "bytecode/' + TABLE_CLASSES_FILE + '"\n')
+        f.write("\n")
+        f.write("static_assert(GDScriptDecomp::GlobalToken::G_TK_MAX <= UINT8_MAX);\n")
+        f.write("\n")
+        for bytecode_class in bytecode_classes:
+            rev = bytecode_class.bytecode_rev
+            tk_names = bytecode_class.tk_names
+            if len(tk_names) > 127:
+                raise Exception("Too many tokens in " + rev + " for an int8_t global_to_local table")
+            funcs = get_function_entries(bytecode_class)
+            f.write("// " + rev + "\n")
+            if len(funcs) > 0:
+                f.write("static const GDScriptDecompFunction funcs_" + rev + "[] = {\n")
+                for func_name, (min_args, max_args) in funcs:
+                    f.write('\t{ "' + func_name + '", ' + str(min_args) + ", " + str(max_args) + " },\n")
+                f.write("};\n")
+                f.write(
+                    "static const uint8_t funcs_sorted_"
+                    + rev
+                    + "[] = { "
+                    + ", ".join(str(idx) for idx in get_sorted_function_indices(funcs))
+                    + " };\n"
+                )
+            local_to_global = ["GDScriptDecomp::GlobalToken::G_" + tk_name for tk_name in tk_names if tk_name != "TK_MAX"]
+            f.write("static const uint8_t local_to_global_" + rev + "[] = { " + ", ".join(local_to_global) + " };\n")
+            global_to_local = [
+                str(tk_names.index(g_tk_name[2:])) if g_tk_name[2:] in tk_names else "-1" for g_tk_name in global_tokens
+            ]
+            f.write(
+                "static const int8_t global_to_local_"
+                + rev
+                + "[GDScriptDecomp::GlobalToken::G_TK_MAX + 1] = { "
+                + ", ".join(global_to_local)
+                + " };\n"
+            )
+            for list_name, tokens in (
+                ("added_tokens", bytecode_class.added_tokens),
+                ("removed_tokens", bytecode_class.removed_tokens),
+            ):
+                if len(tokens) > 0:
+                    f.write(
+                        "static const uint8_t "
+                        + list_name
+                        + "_"
+                        + rev
+                        + "[] = { "
+                        + ", ".join("GDScriptDecomp::GlobalToken::G_" + tk_name for tk_name in tokens)
+                        + " };\n"
+                    )
+            for list_name, names in (
+                ("added_functions", bytecode_class.added_functions),
+                ("removed_functions", bytecode_class.removed_functions),
+                ("arg_count_changed", bytecode_class.arg_count_changed),
+            ):
+                if len(names) > 0:
+                    f.write(
+                        "static const char *const "
+                        + list_name
+                        + "_"
+                        + rev
+                        + '[] = { "'
+                        + '", "'.join(names)
+                        + '" };\n'
+                    )
+            f.write("\n")
+
+        f.write("const GDScriptDecompRevision gdscript_decomp_revisions[] = {\n")
+        for bytecode_class in bytecode_classes:
+            rev = bytecode_class.bytecode_rev
+            funcs = get_function_entries(bytecode_class)
+            fields = [
+                "0x" + rev,
+                str(bytecode_class.bytecode_version),
+                str(bytecode_class.engine_ver_major),
+                str(bytecode_class.variant_ver_major),
+                "0x" + bytecode_class.parent if bytecode_class.parent else "0",
+                '"' + bytecode_class.engine_version + '"',
+                '"' + bytecode_class.max_engine_version + '"',
+                str(bytecode_class.tk_names.index("TK_MAX")),
+                "local_to_global_" + rev,
+                "global_to_local_" + rev,
+                str(len(funcs)),
+                _c_array_or_null("funcs_" + rev, funcs),
+                _c_array_or_null("funcs_sorted_" + rev, funcs),
+            ]
+            for list_name, values in (
+                ("added_tokens", bytecode_class.added_tokens),
+                ("removed_tokens", bytecode_class.removed_tokens),
+                ("added_functions", bytecode_class.added_functions),
+                ("removed_functions", bytecode_class.removed_functions),
+                ("arg_count_changed", bytecode_class.arg_count_changed),
+            ):
+                fields.append(str(len(values)))
+                fields.append(_c_array_or_null(list_name + "_" + rev, values))
+            f.write("\t{ " + ", ".join(fields) + " },\n")
+        f.write("};\n")
+        f.write("\n")
+        f.write(
+            "const int gdscript_decomp_revision_count = sizeof(gdscript_decomp_revisions) / sizeof(GDScriptDecompRevision);\n"
+        )
+
+
+def generate_table_classes_header(dir: Path, bytecode_classes: list[BytecodeClass]) -> None:
+    new_dir = dir
+    new_file_h = new_dir / TABLE_CLASSES_FILE
+    with outputs.open(new_file_h) as f:
+        f.write(PRELUDE)
+        f.write(CLANG_FORMAT_OFF)
+        f.write("#pragma once\n")
+        f.write("\n")
+        f.write('#include "bytecode/bytecode_table.h"\n')
+        f.write("\n")
+        f.write("extern const GDScriptDecompRevision gdscript_decomp_revisions[];\n")
+        f.write("extern const int gdscript_decomp_revision_count;\n")
+        f.write("\n")
+        for idx, bytecode_class in enumerate(bytecode_classes):
+            class_name = bytecode_class.class_name
+            f.write("class " + class_name + " : public GDScriptDecompTable {\n")
+            f.write("\tGDCLASS(" + class_name + ", GDScriptDecompTable);\n")
+            f.write("protected:\n")
+            f.write("\tstatic void _bind_methods(){};\n")
+            f.write("public:\n")
+            f.write("\t" + class_name + "() : GDScriptDecompTable(&gdscript_decomp_revisions[" + str(idx) + "]) {}\n")
+            f.write("};\n")
+            f.write("\n")
+
+
+# The discriminators are generated like this:
+# ```cpp
+# // bytecode version <bytecode_version>
+# static const GDScriptArityRange arities_<bytecode_rev>[] = { { <min_args>, <max_args> }, [etc...] };
+# [etc...]
+# static const GDScriptDiscriminatorCandidate candidates_<bytecode_version>[] = {
+# 	{ 0x<bytecode_rev>, <call_signature>, { <valid_tokens bits 0-63>, [etc...] }, <func_count>, arities_<bytecode_rev> }, // <engine_version>
+# 	[etc...]
+# };
+# static const GDScriptCallSignature call_signatures_<bytecode_version>[] = {
+# 	{ <builtin_func>, <period>, [etc...] },
+# };
+#
+# const GDScriptRevisionDiscriminators gdscript_revision_discriminators[] = {
+# 	{ <bytecode_version>, <candidate_count>, candidates_<bytecode_version>, <call_signature_count>, call_signatures_<bytecode_version> },
+# };
+# ```
+DISCRIMINATORS_FILE = "bytecode_discriminators.cpp"
+GDSCRIPT_2_0_VERSION = 100
+
+CALL_SIGNATURE_TOKENS = [
+    "TK_BUILT_IN_FUNC",
+    "TK_PERIOD",
+    "TK_PR_FUNCTION",
+    "TK_PARENTHESIS_OPEN",
+    "TK_PARENTHESIS_CLOSE",
+    "TK_BRACKET_OPEN",
+    "TK_BRACKET_CLOSE",
+    "TK_CURLY_BRACKET_OPEN",
+    "TK_CURLY_BRACKET_CLOSE",
+    "TK_COMMA",
+    "TK_INDENT",
+    "TK_DEDENT",
+    "TK_NEWLINE",
+    "TK_CURSOR",
+]
+
+
+def get_rejected_local_tokens(bytecode_class: BytecodeClass) -> set[int]:
+    """Returns the local token IDs below 256 that `_test_bytecode` fails on no matter where they appear."""
+    tk_names = bytecode_class.tk_names
+    rejected = {"TK_MAX", "TK_CURSOR"}
+    if bytecode_class.bytecode_version < GDSCRIPT_2_0_VERSION:
+        rejected.add("TK_ERROR")
+    # anything past the end of the token list translates to G_TK_MAX
+    return {i for i in range(256) if i >= len(tk_names) or tk_names[i] in rejected}
+
+
+def get_valid_token_words(bytecode_class: BytecodeClass) -> list[int]:
+    """Returns the complement of `get_rejected_local_tokens` as four 64-bit words, bit `t` of word `t / 64` for token `t`."""
+    rejected = get_rejected_local_tokens(bytecode_class)
+    words = [0, 0, 0, 0]
+    for token in range(256):
+        if token not in rejected:
+            words[token // 64] |= 1 << (token % 64)
+    return words
+
+
+def generate_discriminators_cpp(dir: Path, bytecode_classes: list[BytecodeClass]) -> None:
+    groups: dict[int, list[BytecodeClass]] = {}
+    for bytecode_class in bytecode_classes:
+        groups.setdefault(bytecode_class.bytecode_version, []).append(bytecode_class)
+    groups = {version: group for version, group in sorted(groups.items()) if len(group) > 1}
+
+    signature_counts: dict[int, int] = {}
+    new_file_cpp = dir / DISCRIMINATORS_FILE
+    with outputs.open(new_file_cpp) as f:
+        f.write(PRELUDE)
+        f.write(CLANG_FORMAT_OFF)
+        f.write('#include "bytecode/bytecode_discriminators.h"\n')
+        f.write("\n")
+        for version, group in groups.items():
+            if len(group) > 32:
+                raise Exception("Too many revisions with bytecode version " + str(version) + " for a uint32_t mask")
+            f.write("// bytecode version " + str(version) + "\n")
+
+            signatures: list[tuple] = []
+            candidate_signatures = []
+            for bytecode_class in group:
+                signature = tuple(
+                    bytecode_class.tk_names.index(tk_name) if tk_name in bytecode_class.tk_names else -1
+                    for tk_name in CALL_SIGNATURE_TOKENS
+                )
+                if signature not in signatures:
+                    signatures.append(signature)
+                candidate_signatures.append(signatures.index(signature))
+            signature_counts[version] = len(signatures)
+
+            for bytecode_class in group:
+                funcs = get_function_entries(bytecode_class)
+                if len(funcs) > 0:
+                    f.write(
+                        "static const GDScriptArityRange arities_"
+                        + bytecode_class.bytecode_rev
+                        + "[] = { "
+                        + ", ".join("{ " + str(min_args) + ", " + str(max_args) + " }" for _, (min_args, max_args) in funcs)
+                        + " };\n"
+                    )
+            f.write("static const GDScriptDiscriminatorCandidate candidates_" + str(version) + "[] = {\n")
+            for bytecode_class, signature_idx in zip(group, candidate_signatures):
+                func_count = len(get_function_entries(bytecode_class))
+                f.write(
+                    "\t{ 0x"
+                    + bytecode_class.bytecode_rev
+                    + ", "
+                    + str(signature_idx)
+                    + ", { "
+                    + ", ".join(format(word, "#018x") for word in get_valid_token_words(bytecode_class))
+                    + " }, "
+                    + str(func_count)
+                    + ", "
+                    + _c_array_or_null("arities_" + bytecode_class.bytecode_rev, [None] * func_count)
+                    + " }, // "
+                    + bytecode_class.engine_version
+                    + "\n"
+                )
+            f.write("};\n")
+            f.write("static const GDScriptCallSignature call_signatures_" + str(version) + "[] = {\n")
+            for signature in signatures:
+                f.write("\t{ " + ", ".join(str(tk) for tk in signature) + " },\n")
+            f.write("};\n")
+            f.write("\n")
+
+        f.write("const GDScriptRevisionDiscriminators gdscript_revision_discriminators[] = {\n")
+        for version, group in groups.items():
+            v = str(version)
+            f.write(
+                "\t{ "
+                + ", ".join([v, str(len(group)), "candidates_" + v, str(signature_counts[version]), "call_signatures_" + v])
+                + " },\n"
+            )
+        f.write("};\n")
+        f.write("\n")
+        f.write(
+            "const int gdscript_revision_discriminators_count = sizeof(gdscript_revision_discriminators) / sizeof(GDScriptRevisionDiscriminators);\n"
+        )
+        f.write("\n")
+        f.write("const GDScriptRevisionDiscriminators *get_revision_discriminators(int p_bytecode_version) {\n")
+        f.write("\tfor (int i = 0; i < gdscript_revision_discriminators_count; i++) {\n")
+        f.write("\t\tif (gdscript_revision_discriminators[i].bytecode_version == p_bytecode_version) {\n")
+        f.write("\t\t\treturn &gdscript_revision_discriminators[i];\n")
+        f.write("\t\t}\n")
+        f.write("\t}\n")
+        f.write("\treturn nullptr;\n")
+        f.write("}\n")
+
+
+def remove_stale_outputs(dir: Path, bytecode_classes: list[BytecodeClass], table_mode: bool) -> None:
+    # SCsub compiles everything in bytecode/, so the outputs of the other mode have to go
+    if table_mode:
+        stale = [dir / (c.file_stem + ext) for c in bytecode_classes for ext in (".cpp", ".h")]
+    else:
+        stale = [dir / TABLE_DATA_FILE, dir / TABLE_CLASSES_FILE]
+    for path in stale:
+        outputs.remove(path)
+
 
 # First, we need to get the bytecode directory
 our_dir = Path(os.path.dirname(os.path.realpath(__file__)))
-json_path = our_dir / "misc" / "bytecode_versions.json"
-bytecode_dir = our_dir / "bytecode"
 
-bytecode_classes = read_bytecode_json(json_path)
-for bytecode_class in bytecode_classes:
-    generate_class_cpp(bytecode_dir, bytecode_class)
-    generate_class_header(bytecode_dir, bytecode_class)
+# Records the hash of every input and output of the last run, so that a run with nothing to do
+# can stop before reading the json or rendering anything. Not committed (see .gitignore).
+MANIFEST_PATH = our_dir / "misc" / ".bytecode_generator_manifest.json"
+
+
+def hash_inputs(input_paths: list[Path], table_mode: bool) -> str:
+    h = hashlib.sha256()
+    h.update(b"table" if table_mode else b"class")
+    for path in input_paths:
+        h.update(str(path.relative_to(our_dir)).encode("utf-8"))
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def read_manifest() -> dict:
+    try:
+        with open(MANIFEST_PATH, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def manifest_is_current(manifest: dict, inputs_hash: str) -> bool:
+    if manifest.get("inputs") != inputs_hash:
+        return False
+    # the outputs are committed and might have been edited or deleted by hand since the last run
+    for rel_path, output_hash in manifest.get("outputs", {}).items():
+        content = read_text_or_none(our_dir / rel_path)
+        if content is None or sha256_of(content) != output_hash:
+            return False
+    return not any((our_dir / rel_path).exists() for rel_path in manifest.get("removed", []))
+
+
+def write_manifest(inputs_hash: str) -> None:
+    manifest = {
+        "inputs": inputs_hash,
+        "outputs": {
+            str(path.relative_to(our_dir)): sha256_of(content) for path, content in sorted(outputs.files.items())
+        },
+        "removed": [str(path.relative_to(our_dir)) for path in sorted(outputs.removed)],
+    }
+    write_atomic(MANIFEST_PATH, json.dumps(manifest, indent=1, sort_keys=True) + "\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generates the GDScriptDecomp sources from misc/bytecode_versions.json")
+    parser.add_argument(
+        "--table",
+        action="store_true",
+        help="generate one read-only table of every revision for GDScriptDecompTable instead of a class per revision",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="don't write anything; exit with status 1 if any generated file is out of date",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="render every file even if the manifest says nothing changed",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="parse misc/bytecode_versions.json instead of using (and updating) its cache",
+    )
+    parser.add_argument(
+        "--write-json",
+        action="store_true",
+        help="rewrite misc/bytecode_versions.json, storing each revision as a delta against its parent",
+    )
+    args = parser.parse_args()
+
+    json_path = our_dir / "misc" / "bytecode_versions.json"
+    bytecode_dir = our_dir / "bytecode"
+    tests_dir = our_dir / "tests"
+    input_paths = [
+        Path(os.path.realpath(__file__)),
+        json_path,
+        our_dir / "misc" / "bytecode_versions.h.inc",
+        our_dir / "misc" / "bytecode_versions.cpp.inc",
+        bytecode_dir / "bytecode_base.h",
+    ]
+
+    if args.write_json:
+        write_bytecode_json(json_path, read_bytecode_json(json_path, not args.no_cache))
+        print(f"updated: {json_path.relative_to(our_dir)}")
+    if args.check:
+        # every rebuilt table has to match the digest it was stored with, whether or not the outputs need rendering
+        check_bytecode_json(read_bytecode_json(json_path, not args.no_cache))
+
+    inputs_hash = hash_inputs(input_paths, args.table)
+    if not args.force and manifest_is_current(read_manifest(), inputs_hash):
+        print("Generated files are up to date.")
+        return
+
+    bytecode_classes = read_bytecode_json(json_path, not args.no_cache)
+    global_tokens = read_global_tokens(bytecode_dir / "bytecode_base.h")
+    if args.table:
+        generate_table_data_cpp(bytecode_dir, bytecode_classes, global_tokens)
+        generate_table_classes_header(bytecode_dir, bytecode_classes)
+    else:
+        for bytecode_class in bytecode_classes:
+            generate_class_cpp(bytecode_dir, bytecode_class, global_tokens)
+            generate_class_header(bytecode_dir, bytecode_class)
+    remove_stale_outputs(bytecode_dir, bytecode_classes, args.table)
+
+    generate_bytecode_version_header(bytecode_dir)
+    generate_bytecode_versions_cpp(bytecode_dir, bytecode_classes, sha256_of(json_path.read_bytes()), args.table)
+    generate_discriminators_cpp(bytecode_dir, bytecode_classes)
+    generate_bytecode_test_header(tests_dir, bytecode_classes)
+
+    if args.check:
+        stale = outputs.stale_files()
+        removals = outputs.stale_removals()
+        for path in stale:
+            print(f"out of date: {path.relative_to(our_dir)}")
+        for path in removals:
+            print(f"should be removed: {path.relative_to(our_dir)}")
+        if stale or removals:
+            sys.exit(1)
+        print("Generated files are up to date.")
+        return
+
+    written, removed = outputs.commit()
+    for path in written:
+        print(f"updated: {path.relative_to(our_dir)}")
+    for path in removed:
+        print(f"removed: {path.relative_to(our_dir)}")
+    print(f"{len(written)} of {len(outputs.files)} generated files written, {len(removed)} removed.")
+    write_manifest(inputs_hash)
+
 
-generate_bytecode_version_header(bytecode_dir, bytecode_classes)
-generate_bytecode_versions_cpp(bytecode_dir, bytecode_classes)
+if __name__ == "__main__":
+    main()
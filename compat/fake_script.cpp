@@ -305,6 +305,10 @@ Error FakeGDScript::load_source_code(const String &p_path) {
 	return reload();
 }
 
+String FakeGDScript::get_error_message() const {
+	return decomp.is_valid() ? decomp->get_error_message() : String();
+}
+
 // FakeEmbeddedScript
 
 bool FakeEmbeddedScript::_get(const StringName &p_name, Variant &r_ret) const {
@@ -116,6 +116,8 @@ public:
 
 	String get_script_path() const;
 	Error load_source_code(const String &p_path);
+	// Why the last `load_source_code` failed to decompile (or compile) the script, if it did
+	String get_error_message() const;
 };
 
 class FakeEmbeddedScript : public Script {
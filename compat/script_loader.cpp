@@ -57,7 +57,7 @@ ResourceInfo ResourceFormatGDScriptLoader::get_resource_info(const String &p_pat
 	String extension = p_path.get_extension().to_lower();
 	auto rev = GDRESettings::get_singleton()->get_bytecode_revision();
 	if (rev) {
-		auto decomp = GDScriptDecomp::create_decomp_for_commit(rev);
+		auto decomp = GDScriptDecomp::get_shared_decomp_for_commit(rev);
 		if (decomp.is_valid()) {
 			Ref<GodotVer> ver = decomp->get_godot_ver();
 			if (ver.is_valid() && ver->is_valid_semver()) {
@@ -30,6 +30,18 @@ def monkey_patch_sort_module_list():
     methods.sort_module_list = sort_module_list
 
 
+def get_opts(platform):
+    from SCons.Variables import BoolVariable
+
+    return [
+        BoolVariable(
+            "gdre_instrumentation",
+            "Count (and optionally time) the token and function lookups of every bytecode revision",
+            False,
+        ),
+    ]
+
+
 def configure(env):
     if not env.editor_build:
         monkey_patch_sort_module_list()
@@ -38,6 +50,7 @@ def configure(env):
 def get_doc_classes():
     return [
         "GDScriptDecomp",
+        "GDScriptDecompTable",
         "GDScriptDecomp_0b806ee",
         "GDScriptDecomp_8c1731b",
         "GDScriptDecomp_31ce3c5",
@@ -43,6 +43,7 @@
 #endif
 
 #include "core/crypto/crypto_core.h"
+#include "core/io/compression.h"
 
 #ifndef TOOLS_ENABLED
 #include "core/object/message_queue.h"
@@ -147,18 +148,46 @@ static int _get_pad(int p_alignment, int p_n) {
 	return pad;
 }
 
-static Ref<ImageTexture> generate_icon(int p_index) {
-	Ref<Image> img = memnew(Image);
+Ref<Texture2D> GodotREEditor::get_gdre_icon(const String &p_name) {
+	if (icons.has(p_name)) {
+		return icons[p_name];
+	}
+	int idx = -1;
+	for (int i = 0; i < gdre_icons_count; i++) {
+		if (p_name == gdre_icons_names[i]) {
+			idx = i;
+			break;
+		}
+	}
+	ERR_FAIL_COND_V_MSG(idx == -1, Ref<Texture2D>(), "No such icon: " + p_name);
 
+	Ref<Image> img = memnew(Image);
 #ifdef MODULE_SVG_ENABLED
+	// The icons are only decompressed and rasterized when they're first used.
+	const uint8_t *sources = gdre_icons_data;
+	if (gdre_icons_compressed) {
+		if (icon_sources.is_empty()) {
+			icon_sources.resize(gdre_icons_uncompressed_size);
+			int size = Compression::decompress(icon_sources.ptrw(), gdre_icons_uncompressed_size, gdre_icons_data, gdre_icons_data_size, Compression::MODE_DEFLATE);
+			if (size != gdre_icons_uncompressed_size) {
+				icon_sources.clear();
+				ERR_FAIL_V_MSG(Ref<Texture2D>(), "Failed to decompress the icons");
+			}
+		}
+		sources = icon_sources.ptr();
+	}
 	// Upsample icon generation only if the scale isn't an integer multiplier.
 	// Generating upsampled icons is slower, and the benefit is hardly visible
 	// with integer scales.
 	ImageLoaderSVG img_loader;
-	img_loader.create_image_from_string(img, gdre_icons_sources[p_index], 1.0, false, false);
+	String source = String::utf8((const char *)sources + gdre_icons_sources[idx][0], gdre_icons_sources[idx][1]);
+	img_loader.create_image_from_string(img, source, 1.0, false, false);
 #endif
 
-	return ImageTexture::create_from_image(img);
+	Ref<Texture2D> icon = ImageTexture::create_from_image(img);
+	icons[p_name] = icon;
+	ne_parent->add_theme_icon_override(p_name, icon);
+	return icon;
 }
 
 #ifdef TOOLS_ENABLED
@@ -186,13 +215,6 @@ void init_icons() {
 void GodotREEditor::init_gui(Control *p_control, HBoxContainer *p_menu, bool p_long_menu) {
 	//Init dialogs
 
-	// Convert the generated icon sources to a dictionary for easier access.
-	// Unlike the editor icons, there is no central repository of icons in the Theme resource itself to keep it tidy.
-	for (int i = 0; i < gdre_icons_count; i++) {
-		icons[gdre_icons_names[i]] = generate_icon(i);
-		ne_parent->add_theme_icon_override(gdre_icons_names[i], icons[gdre_icons_names[i]]);
-	}
-
 	ovd = memnew(OverwriteDialog);
 	p_control->add_child(ovd);
 
@@ -299,7 +321,7 @@ void GodotREEditor::init_gui(Control *p_control, HBoxContainer *p_menu, bool p_l
 		TextureRect *about_icon = memnew(TextureRect);
 		about_hbc->add_child(about_icon);
 		about_icon->set_stretch_mode(TextureRect::STRETCH_KEEP_ASPECT_CENTERED);
-		about_icon->set_texture(icons["RELogoBig"]);
+		about_icon->set_texture(get_gdre_icon("RELogoBig"));
 
 		Label *about_label = memnew(Label);
 		about_hbc->add_child(about_label);
@@ -326,79 +348,79 @@ void GodotREEditor::init_gui(Control *p_control, HBoxContainer *p_menu, bool p_l
 		p_menu->set_anchor(Side::SIDE_TOP, 0);
 		menu_button = memnew(MenuButton);
 		menu_button->set_text(RTR("RE Tools"));
-		menu_button->set_button_icon(icons["RELogo"]);
+		menu_button->set_button_icon(get_gdre_icon("RELogo"));
 		menu_popup = menu_button->get_popup();
-		menu_popup->add_icon_item(icons["RELogo"], RTR("Recover project..."), MENU_EXT_PCK);
+		menu_popup->add_icon_item(get_gdre_icon("RELogo"), RTR("Recover project..."), MENU_EXT_PCK);
 		menu_popup->add_separator();
-		menu_popup->add_icon_item(icons["RELogo"], RTR("Set encryption key..."), MENU_KEY);
+		menu_popup->add_icon_item(get_gdre_icon("RELogo"), RTR("Set encryption key..."), MENU_KEY);
 		menu_popup->add_separator();
-		menu_popup->add_icon_item(icons["RELogo"], RTR("About Godot RE Tools"), MENU_ABOUT_RE);
-		menu_popup->add_icon_item(icons["RELogo"], RTR("Report a bug..."), MENU_REPORT_ISSUE);
+		menu_popup->add_icon_item(get_gdre_icon("RELogo"), RTR("About Godot RE Tools"), MENU_ABOUT_RE);
+		menu_popup->add_icon_item(get_gdre_icon("RELogo"), RTR("Report a bug..."), MENU_REPORT_ISSUE);
 
-		menu_popup->add_icon_item(icons["RELogo"], RTR("Quit"), MENU_EXIT_RE);
+		menu_popup->add_icon_item(get_gdre_icon("RELogo"), RTR("Quit"), MENU_EXIT_RE);
 		menu_popup->connect("id_pressed", callable_mp(this, &GodotREEditor::menu_option_pressed));
 		menu_button->set_anchor(Side::SIDE_TOP, 0);
 		p_menu->add_child(menu_button);
 
 		menu_button = memnew(MenuButton);
 		menu_button->set_text(RTR("PCK"));
-		menu_button->set_button_icon(icons["REPack"]);
+		menu_button->set_button_icon(get_gdre_icon("REPack"));
 		menu_popup = menu_button->get_popup();
-		menu_popup->add_icon_item(icons["REPack"], RTR("Create PCK archive from folder..."), MENU_CREATE_PCK);
+		menu_popup->add_icon_item(get_gdre_icon("REPack"), RTR("Create PCK archive from folder..."), MENU_CREATE_PCK);
 		menu_button->set_anchor(Side::SIDE_TOP, 0);
 		menu_popup->connect("id_pressed", callable_mp(this, &GodotREEditor::menu_option_pressed));
 		p_menu->add_child(menu_button);
 
 		menu_button = memnew(MenuButton);
 		menu_button->set_text(RTR("GDScript"));
-		menu_button->set_button_icon(icons["REScript"]);
+		menu_button->set_button_icon(get_gdre_icon("REScript"));
 		menu_popup = menu_button->get_popup();
-		menu_popup->add_icon_item(icons["REScript"], RTR("Decompile .GDC/.GDE script files..."), MENU_DECOMP_GDS);
-		menu_popup->add_icon_item(icons["REScript"], RTR("Compile .GD script files..."), MENU_COMP_GDS);
+		menu_popup->add_icon_item(get_gdre_icon("REScript"), RTR("Decompile .GDC/.GDE script files..."), MENU_DECOMP_GDS);
+		menu_popup->add_icon_item(get_gdre_icon("REScript"), RTR("Compile .GD script files..."), MENU_COMP_GDS);
 		menu_button->set_anchor(Side::SIDE_TOP, 0);
 		menu_popup->connect("id_pressed", callable_mp(this, &GodotREEditor::menu_option_pressed));
 		p_menu->add_child(menu_button);
 
 		menu_button = memnew(MenuButton);
 		menu_button->set_text(RTR("Resources"));
-		menu_button->set_button_icon(icons["REResBT"]);
+		menu_button->set_button_icon(get_gdre_icon("REResBT"));
 		menu_popup = menu_button->get_popup();
-		menu_popup->add_icon_item(icons["REResBT"], RTR("Convert binary resources to text..."), MENU_CONV_TO_TXT);
-		menu_popup->add_icon_item(icons["REResTB"], RTR("Convert text resources to binary..."), MENU_CONV_TO_BIN);
+		menu_popup->add_icon_item(get_gdre_icon("REResBT"), RTR("Convert binary resources to text..."), MENU_CONV_TO_TXT);
+		menu_popup->add_icon_item(get_gdre_icon("REResTB"), RTR("Convert text resources to binary..."), MENU_CONV_TO_BIN);
 		menu_popup->add_separator();
-		menu_popup->add_icon_item(icons["REResOther"], RTR("Convert stream textures to PNG..."), MENU_STEX_TO_PNG);
-		menu_popup->add_icon_item(icons["REResOther"], RTR("Convert OGG Samples to OGG..."), MENU_OSTR_TO_OGG);
-		menu_popup->add_icon_item(icons["REResOther"], RTR("Convert WAV Samples to WAV..."), MENU_SMPL_TO_WAV);
+		menu_popup->add_icon_item(get_gdre_icon("REResOther"), RTR("Convert stream textures to PNG..."), MENU_STEX_TO_PNG);
+		menu_popup->add_icon_item(get_gdre_icon("REResOther"), RTR("Convert OGG Samples to OGG..."), MENU_OSTR_TO_OGG);
+		menu_popup->add_icon_item(get_gdre_icon("REResOther"), RTR("Convert WAV Samples to WAV..."), MENU_SMPL_TO_WAV);
 		menu_popup->connect("id_pressed", callable_mp(this, &GodotREEditor::menu_option_pressed));
 		menu_button->set_anchor(Side::SIDE_TOP, 0);
 		p_menu->add_child(menu_button);
 	} else {
 		menu_button = memnew(MenuButton);
 		menu_button->set_text(RTR("RE Tools"));
-		menu_button->set_button_icon(icons["RELogo"]);
+		menu_button->set_button_icon(get_gdre_icon("RELogo"));
 		menu_popup = menu_button->get_popup();
 
-		menu_popup->add_icon_item(icons["RELogo"], RTR("Recover project..."), MENU_EXT_PCK);
+		menu_popup->add_icon_item(get_gdre_icon("RELogo"), RTR("Recover project..."), MENU_EXT_PCK);
 		menu_popup->add_separator();
-		menu_popup->add_icon_item(icons["RELogo"], RTR("Set encryption key..."), MENU_KEY);
+		menu_popup->add_icon_item(get_gdre_icon("RELogo"), RTR("Set encryption key..."), MENU_KEY);
 		menu_popup->add_separator();
-		menu_popup->add_icon_item(icons["RELogo"], RTR("About Godot RE Tools"), MENU_ABOUT_RE);
-		menu_popup->add_icon_item(icons["RELogo"], RTR("Report a bug..."), MENU_REPORT_ISSUE);
+		menu_popup->add_icon_item(get_gdre_icon("RELogo"), RTR("About Godot RE Tools"), MENU_ABOUT_RE);
+		menu_popup->add_icon_item(get_gdre_icon("RELogo"), RTR("Report a bug..."), MENU_REPORT_ISSUE);
 		menu_popup->add_separator();
 
-		menu_popup->add_icon_item(icons["REPack"], RTR("Create PCK archive from folder..."), MENU_CREATE_PCK);
+		menu_popup->add_icon_item(get_gdre_icon("REPack"), RTR("Create PCK archive from folder..."), MENU_CREATE_PCK);
 		menu_popup->add_separator();
 
-		menu_popup->add_icon_item(icons["REScript"], RTR("Decompile .GDC/.GDE script files..."), MENU_DECOMP_GDS);
-		menu_popup->add_icon_item(icons["REScript"], RTR("Compile .GD script files..."), MENU_COMP_GDS);
+		menu_popup->add_icon_item(get_gdre_icon("REScript"), RTR("Decompile .GDC/.GDE script files..."), MENU_DECOMP_GDS);
+		menu_popup->add_icon_item(get_gdre_icon("REScript"), RTR("Compile .GD script files..."), MENU_COMP_GDS);
 		menu_popup->set_item_disabled(menu_popup->get_item_index(MENU_COMP_GDS), true); //TEMP RE-ENABLE WHEN IMPLEMENTED
 		menu_popup->add_separator();
-		menu_popup->add_icon_item(icons["REResBT"], RTR("Convert binary resources to text..."), MENU_CONV_TO_TXT);
-		menu_popup->add_icon_item(icons["REResTB"], RTR("Convert text resources to binary..."), MENU_CONV_TO_BIN);
+		menu_popup->add_icon_item(get_gdre_icon("REResBT"), RTR("Convert binary resources to text..."), MENU_CONV_TO_TXT);
+		menu_popup->add_icon_item(get_gdre_icon("REResTB"), RTR("Convert text resources to binary..."), MENU_CONV_TO_BIN);
 		menu_popup->add_separator();
-		menu_popup->add_icon_item(icons["REResOther"], RTR("Convert stream textures to PNG..."), MENU_STEX_TO_PNG);
-		menu_popup->add_icon_item(icons["REResOther"], RTR("Convert OGG Samples to OGG..."), MENU_OSTR_TO_OGG);
-		menu_popup->add_icon_item(icons["REResOther"], RTR("Convert WAV Samples to WAV..."), MENU_SMPL_TO_WAV);
+		menu_popup->add_icon_item(get_gdre_icon("REResOther"), RTR("Convert stream textures to PNG..."), MENU_STEX_TO_PNG);
+		menu_popup->add_icon_item(get_gdre_icon("REResOther"), RTR("Convert OGG Samples to OGG..."), MENU_OSTR_TO_OGG);
+		menu_popup->add_icon_item(get_gdre_icon("REResOther"), RTR("Convert WAV Samples to WAV..."), MENU_SMPL_TO_WAV);
 		menu_popup->connect("id_pressed", callable_mp(this, &GodotREEditor::menu_option_pressed));
 		menu_button->set_anchor(Side::SIDE_TOP, 0);
 		p_menu->add_child(menu_button);
@@ -776,15 +798,15 @@ void GodotREEditor::_pck_select_request(const Vector<String> &p_paths) {
 		bool md5_error = !file->is_checksum_validated();
 		bool is_malformed = file->is_malformed();
 		if (p_check_md5 && md5_error) {
-			icon = icons["REFileBroken"];
+			icon = get_gdre_icon("REFileBroken");
 			error_string += "MD5 mismatch";
 		} else if (is_malformed) {
-			icon = icons["REFileBroken"];
+			icon = get_gdre_icon("REFileBroken");
 			error_string += String(error_string.length() > 0 ? ", " : "") + "Malformed_path";
 		} else if (!p_check_md5) {
-			icon = icons["REFile"];
+			icon = get_gdre_icon("REFile");
 		} else {
-			icon = icons["REFileOk"];
+			icon = get_gdre_icon("REFileOk");
 		}
 		if (files.size() > 50000 && i % 10000 == 0) {
 			print_line("Loading file " + itos(i) + " of " + itos(files.size()));
@@ -86,7 +86,10 @@ private:
 	ProgressDialog *pdialog_singleton = nullptr;
 
 	Control *ne_parent;
+	// Icons are generated the first time `get_gdre_icon` asks for them.
+	// Unlike the editor icons, there is no central repository of icons in the Theme resource itself to keep it tidy.
 	Dictionary icons;
+	Vector<uint8_t> icon_sources;
 
 	OverwriteDialog *ovd;
 	ResultDialog *rdl;
@@ -122,6 +125,8 @@ private:
 	AcceptDialog *about_dialog;
 	CheckBox *about_dialog_checkbox;
 
+	Ref<Texture2D> get_gdre_icon(const String &p_name);
+
 	void _toggle_about_dialog_on_start(bool p_enabled);
 
 	void _decompile_files();
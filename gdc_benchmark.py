@@ -0,0 +1,101 @@
+"""Benchmarks bytecode detection and decompilation on generated corpora, and writes the results as JSON.
+
+For every revision and corpus size, `gdc_corpus.py` writes a corpus and a Godot build with this module and its tests
+runs the "Generated corpus detection and decompilation" test case on it in a fresh process, so that the peak RSS
+belongs to that revision alone:
+
+    python3 gdc_benchmark.py GODOT_BINARY [--revision REV]... [--tokens N[,N...]] [--files N] [--seed N] [-o FILE]
+
+The output has one record per revision and size with the `BytecodeTester` detection time, `decompile_buffer`
+throughput in MB/s and tokens/s, and peak memory; the seed and sizes are recorded so that runs can be compared.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from gdc_corpus import load_corpus_revisions, select_revisions, write_corpus
+
+TEST_CASE = "*Generated corpus detection and decompilation*"
+
+
+def run_benchmark(godot: str, corpus_dir: Path, timeout: float) -> tuple[list[dict], int]:
+    """Runs the test case on `corpus_dir`; returns its records and the peak RSS of the process in KiB."""
+    output = corpus_dir / "results.json"
+    env = dict(os.environ, GDRE_BENCHMARK_CORPUS=str(corpus_dir), GDRE_BENCHMARK_OUTPUT=str(output))
+    cmd = [godot, "--headless", "--test", "--test-case=" + TEST_CASE, "--no-skip"]
+    log = corpus_dir / "godot.log"
+    with open(log, "wb") as log_file:
+        proc = subprocess.Popen(cmd, env=env, stdout=log_file, stderr=subprocess.STDOUT)
+        deadline = time.monotonic() + timeout
+        # `os.wait4` instead of `proc.wait`, for the child's own resource usage
+        while True:
+            pid, status, usage = os.wait4(proc.pid, os.WNOHANG)
+            if pid != 0:
+                break
+            if time.monotonic() > deadline:
+                proc.kill()
+                os.wait4(proc.pid, 0)
+                raise RuntimeError("Benchmark timed out on " + str(corpus_dir))
+            time.sleep(0.05)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    if proc.returncode != 0 or not output.exists():
+        raise RuntimeError("Benchmark failed on %s:\n%s" % (corpus_dir, log.read_text("utf-8", "replace")[-2000:]))
+    with open(output) as f:
+        records = json.load(f)
+    # ru_maxrss is in KiB on Linux, and in bytes on macOS
+    peak_rss = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+    return records, peak_rss
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("godot", help="Godot binary built with this module and tests=yes")
+    parser.add_argument("--revision", action="append", default=[], help="bytecode revision (default: all non-dev)")
+    parser.add_argument("--tokens", default="1000,20000", help="comma-separated tokens per script, one corpus each")
+    parser.add_argument("--files", type=int, default=32, help="scripts per corpus")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--include-dev", action="store_true", help="also benchmark development revisions")
+    parser.add_argument("--timeout", type=float, default=600, help="seconds to allow each run")
+    parser.add_argument("-o", "--output", help="file to write the results to (default: stdout)")
+    args = parser.parse_args()
+
+    revisions = select_revisions(load_corpus_revisions(), args.revision, args.include_dev)
+    sizes = [int(size) for size in args.tokens.split(",")]
+    results = []
+    with tempfile.TemporaryDirectory(prefix="gdc_benchmark_") as tmp:
+        for size in sizes:
+            for revision in revisions:
+                corpus_dir = Path(tmp) / ("%s_%d" % (revision.rev, size))
+                write_corpus([revision], corpus_dir, args.files, size, args.seed)
+                records, peak_rss = run_benchmark(args.godot, corpus_dir, args.timeout)
+                for record in records:
+                    record["tokens_per_file"] = size
+                    record["peak_rss_kib"] = peak_rss
+                    results.append(record)
+                print("%s, %d tokens/script: done" % (revision.rev, size), file=sys.stderr)
+
+    report = {
+        "seed": args.seed,
+        "files_per_corpus": args.files,
+        "tokens_per_file": sizes,
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "results": results,
+    }
+    text = json.dumps(report, indent=1) + "\n"
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+"""Writes seeded, synthetic `.gdc` files for any bytecode revision in `misc/bytecode_versions.json`.
+
+The scripts only use the revision's own tokens and built-in functions, with argument counts that `test_bytecode`
+accepts, so every file is one that the revision's tokenizer could have written:
+
+    python3 gdc_corpus.py [--revision REV]... [--files N] [--tokens N] [--seed N] [--include-dev] OUT_DIR
+
+Each revision gets a directory of `.gdc` files, and `OUT_DIR/manifest.json` lists them with their sizes and token counts.
+The same arguments always give the same files.
+"""
+
+import argparse
+import json
+import os
+import random
+import struct
+from pathlib import Path
+
+from bytecode_generator import GDSCRIPT_2_0_VERSION, BytecodeClass, get_function_entries, our_dir, read_bytecode_json
+
+TOKEN_BYTE_MASK = 0x80
+TOKEN_BITS = 8
+TOKEN_MASK = (1 << TOKEN_BITS) - 1
+# `Variant::INT` and `Variant::STRING` have the same IDs in Godot 2.x, 3.x and 4.x
+VARIANT_INT = 2
+VARIANT_STRING = 4
+# GDScript 2.0 columns count a tab as this many columns
+TAB_SIZE = 4
+MAX_VARARGS = 3
+
+BINARY_OPERATORS = ("TK_OP_ADD", "TK_OP_SUB", "TK_OP_MUL", "TK_OP_LESS", "TK_OP_GREATER", "TK_OP_EQUAL")
+IDENTIFIER_NAMES = ("speed", "count", "value", "target", "offset", "result", "delta", "scale", "index", "total")
+
+
+class CorpusRevision:
+    """The tokens and built-in functions of a `BytecodeClass`, by name."""
+
+    __slots__ = ("rev", "bytecode_version", "is_dev", "tokens", "functions")
+
+    def __init__(self, bytecode_class: BytecodeClass):
+        self.rev = bytecode_class.bytecode_rev
+        self.bytecode_version = bytecode_class.bytecode_version
+        self.is_dev = bytecode_class.is_dev
+        self.tokens = {name: i for i, name in enumerate(bytecode_class.tk_names)}
+        self.functions = [
+            (func_id, min_args, MAX_VARARGS if max_args == "INT_MAX" else max_args)
+            for func_id, (_, (min_args, max_args)) in enumerate(get_function_entries(bytecode_class))
+        ]
+
+    @property
+    def is_gdscript_2_0(self) -> bool:
+        return self.bytecode_version >= GDSCRIPT_2_0_VERSION
+
+
+class ScriptWriter:
+    """Collects tokens, identifiers and constants like `GDScriptDecomp::compile_code_string`, and encodes them."""
+
+    def __init__(self, revision: CorpusRevision):
+        self.revision = revision
+        self.identifiers: dict[str, int] = {}
+        self.constants: dict[object, int] = {}
+        self.tokens: list[int] = []
+        # (token index, line, column) of the first token on each line
+        self.line_starts: list[tuple[int, int, int]] = []
+        self.token_lines: list[int] = []
+        self.line = 1
+        self.indent = 0
+        self.line_start_pending = True
+
+    def token(self, name: str, value: int = 0) -> None:
+        if self.line_start_pending:
+            self.line_starts.append((len(self.tokens), self.line, 1 + self.indent * TAB_SIZE))
+            self.line_start_pending = False
+        self.tokens.append(self.revision.tokens[name] | (value << TOKEN_BITS))
+        self.token_lines.append(self.line)
+
+    def identifier(self, name: str) -> None:
+        self.token("TK_IDENTIFIER", self.identifiers.setdefault(name, len(self.identifiers)))
+
+    def constant(self, value) -> None:
+        self.token("TK_CONSTANT", self.constants.setdefault(value, len(self.constants)))
+
+    def newline(self, indent: int) -> None:
+        if self.revision.is_gdscript_2_0:
+            self.token("TK_NEWLINE")
+            while self.indent < indent:
+                self.token("TK_INDENT")
+                self.indent += 1
+            while self.indent > indent:
+                self.token("TK_DEDENT")
+                self.indent -= 1
+        else:
+            self.token("TK_NEWLINE", indent)
+            self.indent = indent
+        self.line += 1
+        self.line_start_pending = True
+
+    def _encode_constant(self, value) -> bytes:
+        if isinstance(value, int):
+            return struct.pack("<Ii", VARIANT_INT, value)
+        data = value.encode("utf-8")
+        return struct.pack("<II", VARIANT_STRING, len(data)) + data + b"\0" * (-len(data) % 4)
+
+    def build(self) -> bytes:
+        self.token("TK_EOF")
+        constants = b"".join(self._encode_constant(value) for value in self.constants)
+        if self.revision.is_gdscript_2_0:
+            return self._build_v2(constants)
+        return self._build_v1(constants)
+
+    def _build_v1(self, constants: bytes) -> bytes:
+        out = bytearray(b"GDSC")
+        out += struct.pack("<5I", self.revision.bytecode_version, len(self.identifiers), len(self.constants), len(self.line_starts), len(self.tokens))
+        for name in self.identifiers:
+            data = name.encode("utf-8") + b"\0"
+            data += b"\0" * (-len(data) % 4)
+            out += struct.pack("<I", len(data)) + bytes(b ^ 0xB6 for b in data)
+        out += constants
+        for token_index, line, _ in self.line_starts:
+            out += struct.pack("<II", token_index, line)
+        for token in self.tokens:
+            if token & ~TOKEN_MASK:
+                out += struct.pack("<I", token | TOKEN_BYTE_MASK)
+            else:
+                out.append(token)
+        return bytes(out)
+
+    def _build_v2(self, constants: bytes) -> bytes:
+        contents = bytearray(struct.pack("<5I", len(self.identifiers), len(self.constants), len(self.line_starts), 0, len(self.tokens)))
+        for name in self.identifiers:
+            contents += struct.pack("<I", len(name))
+            for char in name:
+                contents += bytes(b ^ 0xB6 for b in struct.pack("<I", ord(char)))
+        contents += constants
+        for token_index, line, _ in self.line_starts:
+            contents += struct.pack("<II", token_index, line)
+        for token_index, _, column in self.line_starts:
+            contents += struct.pack("<II", token_index, column)
+        for token, line in zip(self.tokens, self.token_lines):
+            if token & ~TOKEN_MASK:
+                contents += struct.pack("<II", token | TOKEN_BYTE_MASK, line)
+            else:
+                contents += struct.pack("<BI", token, line)
+        # a decompressed size of 0 means the contents aren't compressed
+        return b"GDSC" + struct.pack("<II", self.revision.bytecode_version, 0) + bytes(contents)
+
+
+class ScriptGenerator:
+    """Writes random but well-formed scripts: member variables, then functions with assignments, ifs and returns."""
+
+    def __init__(self, revision: CorpusRevision, rng: random.Random):
+        self.revision = revision
+        self.rng = rng
+
+    def _term(self, w: ScriptWriter, names: list[str], depth: int) -> None:
+        roll = self.rng.random()
+        if roll < 0.25 and self.revision.functions and depth < 2:
+            func_id, min_args, max_args = self.rng.choice(self.revision.functions)
+            w.token("TK_BUILT_IN_FUNC", func_id)
+            w.token("TK_PARENTHESIS_OPEN")
+            for i in range(self.rng.randint(min_args, max_args)):
+                if i > 0:
+                    w.token("TK_COMMA")
+                self._expression(w, names, depth + 1)
+            w.token("TK_PARENTHESIS_CLOSE")
+        elif roll < 0.35 and depth < 2:
+            w.token("TK_PARENTHESIS_OPEN")
+            self._expression(w, names, depth + 1)
+            w.token("TK_PARENTHESIS_CLOSE")
+        elif roll < 0.65:
+            w.identifier(self.rng.choice(names))
+        elif roll < 0.9:
+            w.constant(self.rng.randint(-1000, 1000))
+        else:
+            w.constant("str_%d" % self.rng.randint(0, 99))
+
+    def _expression(self, w: ScriptWriter, names: list[str], depth: int = 0) -> None:
+        self._term(w, names, depth)
+        for _ in range(self.rng.randint(0, 2)):
+            w.token(self.rng.choice(BINARY_OPERATORS))
+            self._term(w, names, depth)
+
+    def _statement(self, w: ScriptWriter, names: list[str], indent: int) -> None:
+        roll = self.rng.random()
+        if roll < 0.4:
+            name = "%s_%d" % (self.rng.choice(IDENTIFIER_NAMES), len(names))
+            w.token("TK_PR_VAR")
+            w.identifier(name)
+            w.token("TK_OP_ASSIGN")
+            self._expression(w, names)
+            names.append(name)
+            w.newline(indent)
+        elif roll < 0.7:
+            w.identifier(self.rng.choice(names))
+            w.token("TK_OP_ASSIGN")
+            self._expression(w, names)
+            w.newline(indent)
+        else:
+            w.token("TK_CF_IF")
+            self._expression(w, names)
+            w.token("TK_COLON")
+            w.newline(indent + 1)
+            w.token("TK_CF_PASS")
+            w.newline(indent)
+
+    def generate(self, target_tokens: int) -> ScriptWriter:
+        w = ScriptWriter(self.revision)
+        w.token("TK_PR_EXTENDS")
+        w.identifier("Node")
+        w.newline(0)
+        members = []
+        for i in range(self.rng.randint(1, 4)):
+            members.append("member_%d" % i)
+            w.token("TK_PR_VAR")
+            w.identifier(members[-1])
+            w.token("TK_OP_ASSIGN")
+            w.constant(self.rng.randint(0, 100))
+            w.newline(0)
+        func_count = 0
+        while len(w.tokens) < target_tokens:
+            w.token("TK_PR_FUNCTION")
+            w.identifier("func_%d" % func_count)
+            w.token("TK_PARENTHESIS_OPEN")
+            params = ["arg_a", "arg_b"]
+            w.identifier(params[0])
+            w.token("TK_COMMA")
+            w.identifier(params[1])
+            w.token("TK_PARENTHESIS_CLOSE")
+            w.token("TK_COLON")
+            w.newline(1)
+            names = members + params
+            for _ in range(self.rng.randint(2, 12)):
+                self._statement(w, names, 1)
+            w.token("TK_CF_RETURN")
+            self._expression(w, names)
+            w.newline(0)
+            func_count += 1
+        return w
+
+
+def load_corpus_revisions(path: Path = our_dir / "misc" / "bytecode_versions.json") -> list[CorpusRevision]:
+    return [CorpusRevision(bytecode_class) for bytecode_class in read_bytecode_json(path)]
+
+
+def write_corpus(revisions: list[CorpusRevision], out_dir: Path, files: int, target_tokens: int, seed: int) -> dict:
+    """Writes `files` scripts of about `target_tokens` tokens for each revision, and returns the manifest."""
+    manifest = {"seed": seed, "files_per_revision": files, "tokens_per_file": target_tokens, "revisions": []}
+    for revision in revisions:
+        # one stream per revision, so adding or removing revisions doesn't change the others' files
+        rng = random.Random("%d:%s:%d" % (seed, revision.rev, target_tokens))
+        rev_dir = out_dir / revision.rev
+        rev_dir.mkdir(parents=True, exist_ok=True)
+        entry = {"revision": revision.rev, "bytecode_version": revision.bytecode_version, "files": []}
+        for i in range(files):
+            writer = ScriptGenerator(revision, rng).generate(target_tokens)
+            data = writer.build()
+            path = rev_dir / ("script_%04d.gdc" % i)
+            path.write_bytes(data)
+            entry["files"].append({"path": os.path.relpath(path, out_dir), "size": len(data), "tokens": len(writer.tokens)})
+        manifest["revisions"].append(entry)
+    with open(out_dir / "manifest.json", "w") as f:
+        json.dump(manifest, f, indent=1)
+        f.write("\n")
+    return manifest
+
+
+def select_revisions(revisions: list[CorpusRevision], names: list[str], include_dev: bool) -> list[CorpusRevision]:
+    if names:
+        by_rev = {revision.rev: revision for revision in revisions}
+        missing = [name for name in names if name not in by_rev]
+        if missing:
+            raise SystemExit("Unknown revision(s): " + ", ".join(missing))
+        return [by_rev[name] for name in names]
+    return [revision for revision in revisions if include_dev or not revision.is_dev]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("out_dir", help="directory to write the corpus to")
+    parser.add_argument("--revision", action="append", default=[], help="bytecode revision, e.g. 5565f55 (default: all)")
+    parser.add_argument("--files", type=int, default=16, help="scripts per revision")
+    parser.add_argument("--tokens", type=int, default=2000, help="approximate tokens per script")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--include-dev", action="store_true", help="also write development revisions")
+    args = parser.parse_args()
+
+    revisions = select_revisions(load_corpus_revisions(), args.revision, args.include_dev)
+    manifest = write_corpus(revisions, Path(args.out_dir), args.files, args.tokens, args.seed)
+    total = sum(f["size"] for entry in manifest["revisions"] for f in entry["files"])
+    print("Wrote %d revisions, %d bytes to %s" % (len(revisions), total, args.out_dir))
+
+
+if __name__ == "__main__":
+    main()
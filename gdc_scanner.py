@@ -0,0 +1,465 @@
+"""Finds the bytecode revisions that could have compiled a set of `.gdc` files, without starting Godot.
+
+It runs the same checks as `GDScriptDecomp::test_bytecode` against the tables in `misc/bytecode_versions.json`,
+and writes one JSON object per line: one per file, then one per bytecode version with the revisions that
+passed every file of that version.
+
+    python3 gdc_scanner.py [-j JOBS] [--include-dev] [--benchmark] PATH...
+
+Directories are searched for `.gdc` files. GDScript 2.0 scripts are usually zstd-compressed, so reading them
+needs either the `zstandard` package or Python 3.14's `compression.zstd`.
+"""
+
+import argparse
+import concurrent.futures
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from pathlib import Path
+
+from bytecode_generator import GDSCRIPT_2_0_VERSION, BytecodeClass, get_function_entries, our_dir, read_bytecode_json
+
+try:
+    from compression import zstd as _zstd
+
+    def _zstd_decompress(data: bytes, size: int) -> bytes:
+        return _zstd.decompress(data)
+
+except ImportError:
+    try:
+        import zstandard as _zstd
+
+        def _zstd_decompress(data: bytes, size: int) -> bytes:
+            return _zstd.ZstdDecompressor().decompress(data, max_output_size=size)
+
+    except ImportError:
+        _zstd_decompress = None
+
+TOKEN_BYTE_MASK = 0x80
+TOKEN_BITS = 8
+TOKEN_MASK = (1 << TOKEN_BITS) - 1
+INT_MAX = 2**31 - 1
+
+# The tokens `test_bytecode` looks at, by the name of their `GDScriptDecomp::GlobalToken`
+WHITESPACE_TOKENS = {"G_TK_INDENT", "G_TK_DEDENT", "G_TK_NEWLINE", "G_TK_CURSOR"}
+BRACKET_OPEN_TOKENS = {"G_TK_BRACKET_OPEN", "G_TK_CURLY_BRACKET_OPEN", "G_TK_PARENTHESIS_OPEN"}
+BRACKET_CLOSE_TOKENS = {"G_TK_BRACKET_CLOSE", "G_TK_CURLY_BRACKET_CLOSE", "G_TK_PARENTHESIS_CLOSE"}
+
+
+class ScanError(Exception):
+    pass
+
+
+class Revision:
+    """The parts of a `BytecodeClass` that `test_bytecode` depends on."""
+
+    __slots__ = ("rev", "bytecode_version", "is_dev", "variant_ver_major", "local_to_global", "arities")
+
+    def __init__(self, bytecode_class: BytecodeClass):
+        self.rev = bytecode_class.bytecode_rev
+        self.bytecode_version = bytecode_class.bytecode_version
+        self.is_dev = bytecode_class.is_dev
+        self.variant_ver_major = bytecode_class.variant_ver_major
+        # anything past the end translates to G_TK_MAX, like `get_global_token`
+        names = ["G_" + name for name in bytecode_class.tk_names]
+        self.local_to_global = tuple(names + ["G_TK_MAX"] * (TOKEN_MASK + 1 - len(names)))
+        self.arities = tuple(
+            (min_args, INT_MAX if max_args == "INT_MAX" else max_args)
+            for _, (min_args, max_args) in get_function_entries(bytecode_class)
+        )
+
+
+def load_revisions(path: Path = our_dir / "misc" / "bytecode_versions.json") -> dict[int, list[Revision]]:
+    """Returns the revisions for each bytecode version, in the same order as `decomp_versions`."""
+    revisions: dict[int, list[Revision]] = {}
+    for bytecode_class in read_bytecode_json(path):
+        revisions.setdefault(bytecode_class.bytecode_version, []).append(Revision(bytecode_class))
+    return revisions
+
+
+# `VariantDecoderCompat::decode_variant_compat`, for the types that can be script constants.
+# Sizes of the fixed-size types in floats (`r`) or 32-bit ints (`i`), by type ID for each `variant_ver_major`.
+_FIXED_SIZE_TYPES_V3 = {5: "2r", 6: "4r", 7: "3r", 8: "6r", 9: "4r", 10: "4r", 11: "6r", 12: "9r", 13: "12r", 14: "4i"}
+_FIXED_SIZE_TYPES = {
+    2: _FIXED_SIZE_TYPES_V3,
+    3: _FIXED_SIZE_TYPES_V3,
+    4: {
+        5: "2r", 6: "2i", 7: "4r", 8: "4i", 9: "3r", 10: "3i", 11: "6r", 12: "4r", 13: "4i",
+        14: "4r", 15: "4r", 16: "6r", 17: "9r", 18: "12r", 19: "16r", 20: "4i",
+    },
+}
+_STRING_TYPES = {2: {4}, 3: {4}, 4: {4, 21}}
+_NODE_PATH_TYPE = {2: 16, 3: 15, 4: 22}
+_ENCODE_FLAG_64 = 1 << 16
+
+
+def _skip_string(buf: memoryview, offset: int) -> int:
+    if offset + 4 > len(buf):
+        raise ScanError("Invalid string length")
+    (length,) = struct.unpack_from("<I", buf, offset)
+    offset += 4 + length + (-length % 4)
+    if offset > len(buf):
+        raise ScanError("Invalid string length")
+    return offset
+
+
+def skip_variant(buf: memoryview, offset: int, variant_ver_major: int) -> int:
+    """Returns the offset just past the encoded variant at `offset`."""
+    ver = min(max(variant_ver_major, 2), 4)
+    if offset + 4 > len(buf):
+        raise ScanError("Invalid constant")
+    (header,) = struct.unpack_from("<I", buf, offset)
+    offset += 4
+    variant_type = header & 0xFF
+    wide = header & _ENCODE_FLAG_64
+    if variant_type == 0:  # NIL
+        size = 0
+    elif variant_type == 1:  # BOOL
+        size = 4
+    elif variant_type in (2, 3):  # INT, FLOAT
+        size = 8 if wide else 4
+    elif variant_type in _STRING_TYPES[ver]:
+        return _skip_string(buf, offset)
+    elif variant_type == _NODE_PATH_TYPE[ver]:
+        if offset + 12 > len(buf):
+            raise ScanError("Invalid constant")
+        name_count, subname_count, flags = struct.unpack_from("<III", buf, offset)
+        if not name_count & 0x80000000:
+            raise ScanError("Old-style NodePath constants are not supported")
+        offset += 12
+        total = (name_count & 0x7FFFFFFF) + subname_count + (1 if flags & 2 else 0)
+        for _ in range(total):
+            offset = _skip_string(buf, offset)
+        return offset
+    elif variant_type in _FIXED_SIZE_TYPES[ver]:
+        layout = _FIXED_SIZE_TYPES[ver][variant_type]
+        count = int(layout[:-1])
+        size = count * (8 if layout[-1] == "r" and wide and ver == 4 else 4)
+    else:
+        raise ScanError("Unsupported constant type " + str(variant_type))
+    offset += size
+    if offset > len(buf):
+        raise ScanError("Invalid constant")
+    return offset
+
+
+def read_bytecode_version(buf: memoryview) -> int:
+    if len(buf) < 24 or buf[:4] != b"GDSC":
+        raise ScanError("Invalid GDScript tokenizer buffer")
+    return struct.unpack_from("<I", buf, 4)[0]
+
+
+def read_tokens(buf: memoryview, variant_ver_major: int) -> list[int]:
+    """Returns the tokens of a `.gdc` file, like `GDScriptDecomp::get_script_state`.
+
+    Identifiers and constants are only skipped over; nothing is copied until the token section."""
+    version = read_bytecode_version(buf)
+    if version > GDSCRIPT_2_0_VERSION:
+        raise ScanError("Binary GDScript is too recent")
+    if version >= GDSCRIPT_2_0_VERSION:
+        (decompressed_size,) = struct.unpack_from("<I", buf, 8)
+        if decompressed_size == 0:
+            contents = buf[12:]
+        else:
+            if _zstd_decompress is None:
+                raise ScanError("Reading compressed GDScript 2.0 scripts needs zstd support")
+            contents = memoryview(_zstd_decompress(bytes(buf[12:]), decompressed_size))
+            if len(contents) != decompressed_size:
+                raise ScanError("Error decompressing GDScript tokenizer buffer")
+        identifier_count, constant_count, line_count, _, token_count = struct.unpack_from("<5I", contents, 0)
+        return _read_sections_v2(contents, variant_ver_major, identifier_count, constant_count, line_count, token_count)
+    identifier_count, constant_count, line_count, token_count = struct.unpack_from("<4I", buf, 8)
+    return _read_sections_v1(buf, variant_ver_major, identifier_count, constant_count, line_count, token_count)
+
+
+def _read_sections_v1(buf, variant_ver_major, identifier_count, constant_count, line_count, token_count) -> list[int]:
+    offset = 24
+    for _ in range(identifier_count):
+        if offset + 4 > len(buf):
+            raise ScanError("Invalid identifier length")
+        (length,) = struct.unpack_from("<I", buf, offset)
+        offset += 4 + length
+        if offset > len(buf):
+            raise ScanError("Invalid identifier length")
+    for _ in range(constant_count):
+        offset = skip_variant(buf, offset, variant_ver_major)
+    offset += line_count * 8
+    if offset > len(buf):
+        raise ScanError("Invalid line count")
+    tokens = []
+    end = len(buf)
+    for _ in range(token_count):
+        if offset >= end:
+            raise ScanError("Invalid token length")
+        first = buf[offset]
+        if first & TOKEN_BYTE_MASK:
+            if offset + 4 > end:
+                raise ScanError("Invalid token length")
+            tokens.append(struct.unpack_from("<I", buf, offset)[0] & ~TOKEN_BYTE_MASK)
+            offset += 4
+        else:
+            tokens.append(first)
+            offset += 1
+    return tokens
+
+
+def _read_sections_v2(buf, variant_ver_major, identifier_count, constant_count, line_count, token_count) -> list[int]:
+    offset = 20
+    for _ in range(identifier_count):
+        if offset + 4 > len(buf):
+            raise ScanError("Invalid identifier length")
+        (length,) = struct.unpack_from("<I", buf, offset)
+        offset += 4 + length * 4
+        if offset > len(buf):
+            raise ScanError("Invalid identifier length")
+    for _ in range(constant_count):
+        offset = skip_variant(buf, offset, variant_ver_major)
+    # token lines, then token columns
+    offset += line_count * 16
+    if offset > len(buf):
+        raise ScanError("Invalid token line count")
+    tokens = []
+    end = len(buf)
+    for _ in range(token_count):
+        if offset >= end:
+            raise ScanError("Invalid token length")
+        first = buf[offset]
+        if first & TOKEN_BYTE_MASK:
+            if offset + 8 > end:
+                raise ScanError("Invalid token length")
+            tokens.append(struct.unpack_from("<I", buf, offset)[0] & ~TOKEN_BYTE_MASK)
+            offset += 8
+        else:
+            if offset + 5 > end:
+                raise ScanError("Invalid token length")
+            tokens.append(first)
+            offset += 5
+    if offset != end:
+        raise ScanError("Invalid token length")
+    return tokens
+
+
+def _count_call_args(pos: int, tokens: list[int], globals_: list[str]) -> int:
+    """`GDScriptDecomp::get_func_arg_count_and_params`."""
+    n = len(tokens)
+    if pos + 2 >= n or globals_[pos + 1] != "G_TK_PARENTHESIS_OPEN":
+        return -1
+    depth = 0
+    args = 0
+    has_tokens = False
+    t = None
+    p = pos + 2
+    while p < n:
+        t = globals_[p]
+        if t in BRACKET_OPEN_TOKENS:
+            depth += 1
+        elif t in BRACKET_CLOSE_TOKENS:
+            depth -= 1
+        elif t == "G_TK_COMMA" and depth == 0:
+            args += 1
+        if depth == -1:
+            if has_tokens:
+                args += 1
+            break
+        if t not in WHITESPACE_TOKENS:
+            has_tokens = True
+        p += 1
+    if p == n or t != "G_TK_PARENTHESIS_CLOSE":
+        return -1
+    return args
+
+
+def _check_structure(version: int, tokens: list[int], globals_: list[str]):
+    """The checks of `GDScriptDecomp::_test_script_state` that only depend on how local tokens map to global ones.
+
+    Returns None if the script fails them, otherwise the built-in calls as (func_id, arg_count), with -1 for preload."""
+    gd2 = version >= GDSCRIPT_2_0_VERSION
+    n = len(tokens)
+    calls = []
+    for i, curr in enumerate(globals_):
+        prev = globals_[i - 1] if i > 0 else None
+        if curr == "G_TK_PR_FUNCTION":
+            if gd2 and prev == "G_TK_PERIOD":
+                continue
+            if i + 2 >= n:
+                return None
+            if globals_[i + 2] != "G_TK_PARENTHESIS_OPEN" and (not gd2 or globals_[i + 1] != "G_TK_PARENTHESIS_OPEN"):
+                return None
+        elif curr == "G_TK_CF_PASS":
+            if not gd2:
+                if i + 1 >= n or globals_[i + 1] not in ("G_TK_NEWLINE", "G_TK_SEMICOLON", "G_TK_EOF"):
+                    return None
+        elif curr == "G_TK_PR_STATIC":
+            if gd2 and prev == "G_TK_PERIOD":
+                continue
+            if i + 1 >= n:
+                return None
+            if globals_[i + 1] != "G_TK_PR_FUNCTION" and (not gd2 or globals_[i + 1] != "G_TK_PR_VAR"):
+                return None
+        elif curr == "G_TK_PR_ENUM":
+            if gd2 and prev == "G_TK_PERIOD":
+                continue
+            if i + 1 >= n or globals_[i + 1] not in ("G_TK_IDENTIFIER", "G_TK_CURLY_BRACKET_OPEN"):
+                return None
+        elif curr in ("G_TK_BUILT_IN_FUNC", "G_TK_PR_PRELOAD"):
+            # `is_token_builtin_func`
+            if prev == "G_TK_PERIOD" or prev == "G_TK_PR_FUNCTION":
+                continue
+            if i + 1 >= n or globals_[i + 1] != "G_TK_PARENTHESIS_OPEN":
+                continue
+            if i + 2 >= n:
+                return None
+            is_preload = curr == "G_TK_PR_PRELOAD"
+            arg_count = _count_call_args(i, tokens, globals_) if is_preload or not gd2 else None
+            calls.append((-1 if is_preload else tokens[i] >> TOKEN_BITS, arg_count))
+        elif curr == "G_TK_ERROR":
+            if not gd2:
+                return None
+        elif curr in ("G_TK_CURSOR", "G_TK_MAX"):
+            return None
+        elif curr == "G_TK_EOF":
+            if i != n - 1:
+                return None
+    return calls
+
+
+def test_revisions(version: int, tokens: list[int], revisions: list[Revision]) -> list[str]:
+    """Returns the revisions that `test_bytecode` doesn't reject for this script."""
+    passed = []
+    # revisions that map local tokens the same way only differ in their built-in functions
+    structure_cache: dict[tuple, object] = {}
+    for revision in revisions:
+        mapping = revision.local_to_global
+        if mapping not in structure_cache:
+            globals_ = [mapping[token & TOKEN_MASK] for token in tokens]
+            structure_cache[mapping] = _check_structure(version, tokens, globals_)
+        calls = structure_cache[mapping]
+        if calls is None:
+            continue
+        ok = True
+        for func_id, arg_count in calls:
+            if func_id == -1:
+                min_args, max_args = 1, 1
+            elif func_id >= len(revision.arities):
+                ok = False
+                break
+            else:
+                min_args, max_args = revision.arities[func_id]
+            if arg_count is not None and not min_args <= arg_count <= max_args:
+                ok = False
+                break
+        if ok:
+            passed.append(revision.rev)
+    return passed
+
+
+_revisions: dict[int, list[Revision]] = {}
+_include_dev = False
+
+
+def _init_worker(include_dev: bool) -> None:
+    global _revisions, _include_dev
+    _revisions = load_revisions()
+    _include_dev = include_dev
+
+
+def scan_file(path: str) -> dict:
+    """Returns the result for one file, as it's written to the output."""
+    result: dict = {"path": path}
+    candidates = []
+    error = None
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ScanError("Empty file")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                buf = memoryview(mapped)
+                try:
+                    version = read_bytecode_version(buf)
+                    revisions = [r for r in _revisions.get(version, []) if _include_dev or not r.is_dev]
+                    # parsing only depends on how constants are encoded, which doesn't change much between revisions
+                    by_variant: dict[int, list[Revision]] = {}
+                    for revision in revisions:
+                        by_variant.setdefault(revision.variant_ver_major, []).append(revision)
+                    for variant_ver_major, group in by_variant.items():
+                        try:
+                            tokens = read_tokens(buf, variant_ver_major)
+                        except (ScanError, struct.error) as e:
+                            error = str(e)
+                            continue
+                        candidates += test_revisions(version, tokens, group)
+                finally:
+                    buf.release()
+    except (OSError, ScanError, struct.error) as e:
+        result["error"] = str(e)
+        return result
+    result["bytecode_version"] = version
+    # keep the order of `decomp_versions`
+    result["candidates"] = [r.rev for r in revisions if r.rev in candidates]
+    if error and not candidates:
+        result["error"] = error
+    return result
+
+
+def find_scripts(paths: list[str]) -> list[str]:
+    scripts = []
+    for path in paths:
+        if os.path.isdir(path):
+            scripts.extend(sorted(str(p) for p in Path(path).rglob("*.gdc")))
+        else:
+            scripts.append(path)
+    return scripts
+
+
+def scan(paths: list[str], jobs: int, include_dev: bool, out=sys.stdout):
+    """Writes a JSON line for each file, then one for each bytecode version. Returns the number of files scanned."""
+    scripts = find_scripts(paths)
+    set_candidates: dict[int, list[str]] = {}
+    file_counts: dict[int, int] = {}
+
+    def emit(result: dict) -> None:
+        out.write(json.dumps(result) + "\n")
+        if "candidates" in result:
+            version = result["bytecode_version"]
+            file_counts[version] = file_counts.get(version, 0) + 1
+            if version not in set_candidates:
+                set_candidates[version] = result["candidates"]
+            else:
+                set_candidates[version] = [c for c in set_candidates[version] if c in result["candidates"]]
+
+    if jobs == 1:
+        _init_worker(include_dev)
+        for script in scripts:
+            emit(scan_file(script))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(jobs, initializer=_init_worker, initargs=(include_dev,)) as executor:
+            for result in executor.map(scan_file, scripts, chunksize=32):
+                emit(result)
+
+    for version in sorted(set_candidates):
+        summary = {"bytecode_version": version, "files": file_counts[version], "candidates": set_candidates[version]}
+        out.write(json.dumps(summary) + "\n")
+    return len(scripts)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="+", help=".gdc files, or directories to search for them")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--include-dev", action="store_true", help="also test development revisions")
+    parser.add_argument("--benchmark", action="store_true", help="print files/sec to stderr when done")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    count = scan(args.paths, max(args.jobs, 1), args.include_dev)
+    elapsed = time.perf_counter() - start
+    if args.benchmark:
+        rate = count / elapsed if elapsed > 0 else 0.0
+        print(f"{count} files in {elapsed:.2f}s ({rate:.1f} files/sec)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
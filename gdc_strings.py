@@ -0,0 +1,329 @@
+"""Pulls the string constants, and optionally the identifiers, out of GDScript 2.0 `.gdc` files without starting Godot.
+
+It decodes the token buffers the same way as `GDScriptDecomp::get_ids_consts_tokens_v2`, using the token table of
+one revision in `misc/bytecode_versions.json` (`77af6ca`, 4.3.0-stable, by default), and writes one JSON object per
+line for each distinct string, with every file it appears in and the line it first appears on there:
+
+    python3 gdc_strings.py [-j JOBS] [--identifiers] [--revision REV] PATH...
+
+    {"string": "res://player.tscn", "kinds": ["string"], "files": [{"path": "a.gdc", "line": 3, "count": 1}]}
+
+Directories are searched for `.gdc` files. Files that can't be read get a `{"path": ..., "error": ...}` line first.
+Compressed scripts need either the `zstandard` package or Python 3.14's `compression.zstd`.
+"""
+
+import argparse
+import concurrent.futures
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+
+from gdc_scanner import (
+    _NODE_PATH_TYPE,
+    _STRING_TYPES,
+    TOKEN_BITS,
+    TOKEN_BYTE_MASK,
+    TOKEN_MASK,
+    ScanError,
+    find_scripts,
+    read_bytecode_version,
+    skip_variant,
+)
+from version_catalog import RevisionRecord, VersionCatalog
+
+try:
+    from compression.zstd import ZstdDecompressor as _ZstdDecompressor
+except ImportError:
+    try:
+        from zstandard import ZstdDecompressor as _ZstandardDecompressor
+
+        def _ZstdDecompressor():
+            return _ZstandardDecompressor().decompressobj()
+
+    except ImportError:
+        _ZstdDecompressor = None
+
+DEFAULT_REVISION = "77af6ca"
+# compressed input is fed to the decompressor this many bytes at a time
+DECOMPRESS_CHUNK_SIZE = 1 << 20
+# `get_ids_consts_tokens_v2` XORs every byte of an identifier's UTF-32 characters with this
+_IDENTIFIER_XOR_TABLE = bytes(i ^ 0xB6 for i in range(256))
+_STRING_NAME_TYPE = 21
+
+
+class TokenTable:
+    """The token IDs of a revision that refer to the identifier or constant tables."""
+
+    __slots__ = ("rev", "bytecode_version", "variant_ver_major", "annotation", "identifier", "constant", "error")
+
+    def __init__(self, record: RevisionRecord):
+        self.rev = record.rev
+        self.bytecode_version = record.bytecode_version
+        self.variant_ver_major = record.variant_ver_major
+        ids = {name: i for i, name in enumerate(record.tokens)}
+        try:
+            self.annotation = ids["TK_ANNOTATION"]
+            self.identifier = ids["TK_IDENTIFIER"]
+            self.constant = ids["TK_CONSTANT"]
+            self.error = ids["TK_ERROR"]
+        except KeyError as e:
+            raise ScanError(f"Revision {record.rev} has no {e.args[0]} token") from None
+
+
+def load_token_table(rev: str = DEFAULT_REVISION) -> TokenTable:
+    record = VersionCatalog.load().resolve(rev)
+    if record.engine_ver_major < 4:
+        raise ScanError(f"Revision {record.rev} is not a GDScript 2.0 revision")
+    return TokenTable(record)
+
+
+def decompress_contents(buf: memoryview) -> memoryview:
+    """The contents of a GDScript 2.0 buffer after its 12-byte header, decompressing them if needed.
+
+    The compressed data is read straight from `buf` in chunks, and decompressed into a single preallocated buffer."""
+    (decompressed_size,) = struct.unpack_from("<I", buf, 8)
+    if decompressed_size == 0:
+        return buf[12:]
+    if _ZstdDecompressor is None:
+        raise ScanError("Reading compressed GDScript 2.0 scripts needs zstd support")
+    decompressor = _ZstdDecompressor()
+    out = bytearray(decompressed_size)
+    pos = 0
+    for start in range(12, len(buf), DECOMPRESS_CHUNK_SIZE):
+        data = decompressor.decompress(buf[start : start + DECOMPRESS_CHUNK_SIZE])
+        if pos + len(data) > decompressed_size:
+            raise ScanError("Error decompressing GDScript tokenizer buffer")
+        out[pos : pos + len(data)] = data
+        pos += len(data)
+    if pos != decompressed_size:
+        raise ScanError("Error decompressing GDScript tokenizer buffer")
+    return memoryview(out)
+
+
+def _read_string(buf: memoryview, offset: int) -> tuple[str, int]:
+    if offset + 4 > len(buf):
+        raise ScanError("Invalid string length")
+    (length,) = struct.unpack_from("<I", buf, offset)
+    offset += 4
+    if offset + length > len(buf):
+        raise ScanError("Invalid string length")
+    # `str` decodes the slice in place
+    value = str(buf[offset : offset + length], "utf-8", "replace")
+    return value, offset + length + (-length % 4)
+
+
+def read_constant(buf: memoryview, offset: int, variant_ver_major: int) -> tuple[str | None, str | None, int]:
+    """Returns (kind, value, next offset) for the encoded variant at `offset`; kind and value are None for non-strings."""
+    ver = min(max(variant_ver_major, 2), 4)
+    if offset + 4 > len(buf):
+        raise ScanError("Invalid constant")
+    variant_type = buf[offset]
+    if variant_type in _STRING_TYPES[ver]:
+        value, next_offset = _read_string(buf, offset + 4)
+        return "string_name" if ver == 4 and variant_type == _STRING_NAME_TYPE else "string", value, next_offset
+    if variant_type == _NODE_PATH_TYPE[ver]:
+        if offset + 16 > len(buf):
+            raise ScanError("Invalid constant")
+        name_count, subname_count, flags = struct.unpack_from("<III", buf, offset + 4)
+        if not name_count & 0x80000000:
+            raise ScanError("Old-style NodePath constants are not supported")
+        next_offset = offset + 16
+        parts = []
+        for _ in range((name_count & 0x7FFFFFFF) + subname_count + (1 if flags & 2 else 0)):
+            part, next_offset = _read_string(buf, next_offset)
+            parts.append(part)
+        name_count &= 0x7FFFFFFF
+        value = ("/" if flags & 1 else "") + "/".join(parts[:name_count])
+        if len(parts) > name_count:
+            value += ":" + ":".join(parts[name_count:])
+        return "node_path", value, next_offset
+    return None, None, skip_variant(buf, offset, variant_ver_major)
+
+
+def read_strings(buf: memoryview, table: TokenTable, include_identifiers: bool) -> list[list]:
+    """Returns [string, kind, line, count] for each distinct string of a `.gdc` file, in order of first use.
+
+    Constants that no token refers to are listed last, with a line of 0."""
+    version = read_bytecode_version(buf)
+    if version != table.bytecode_version:
+        raise ScanError(f"Bytecode version {version} doesn't match revision {table.rev} ({table.bytecode_version})")
+    contents = decompress_contents(buf)
+    if len(contents) < 20:
+        raise ScanError("Invalid GDScript tokenizer buffer")
+    identifier_count, constant_count, line_count, _, token_count = struct.unpack_from("<5I", contents, 0)
+    end = len(contents)
+    offset = 20
+
+    identifiers = []
+    for _ in range(identifier_count):
+        if offset + 4 > end:
+            raise ScanError("Invalid identifier length")
+        (length,) = struct.unpack_from("<I", contents, offset)
+        offset += 4
+        if offset + length * 4 > end:
+            raise ScanError("Invalid identifier length")
+        if include_identifiers:
+            raw = contents[offset : offset + length * 4].tobytes().translate(_IDENTIFIER_XOR_TABLE)
+            identifiers.append(raw.decode("utf-32-le", "replace"))
+        offset += length * 4
+
+    constants = []
+    for _ in range(constant_count):
+        kind, value, offset = read_constant(contents, offset, table.variant_ver_major)
+        constants.append((kind, value))
+
+    if offset + line_count * 16 > end:
+        raise ScanError("Invalid token line count")
+    # token index -> line; the columns follow, but aren't needed
+    lines = dict(struct.iter_unpack("<II", contents[offset : offset + line_count * 8]))
+    offset += line_count * 16
+
+    found: dict[str, list] = {}
+    used_constants = set()
+    line = 1
+    for i in range(token_count):
+        if offset >= end:
+            raise ScanError("Invalid token length")
+        if contents[offset] & TOKEN_BYTE_MASK:
+            if offset + 8 > end:
+                raise ScanError("Invalid token length")
+            token = struct.unpack_from("<I", contents, offset)[0] & ~TOKEN_BYTE_MASK
+            offset += 8
+        else:
+            if offset + 5 > end:
+                raise ScanError("Invalid token length")
+            token = contents[offset]
+            offset += 5
+        token_line = lines.get(i, 0)
+        if token_line:
+            line = token_line
+        token_type = token & TOKEN_MASK
+        index = token >> TOKEN_BITS
+        if token_type == table.constant or token_type == table.error:
+            if index >= len(constants):
+                raise ScanError("Invalid constant index")
+            used_constants.add(index)
+            kind, value = constants[index]
+            if kind is None:
+                continue
+            if token_type == table.error:
+                kind = "error"
+        elif include_identifiers and (token_type == table.identifier or token_type == table.annotation):
+            if index >= len(identifiers):
+                raise ScanError("Invalid identifier index")
+            kind = "annotation" if token_type == table.annotation else "identifier"
+            value = identifiers[index]
+        else:
+            continue
+        entry = found.get(value)
+        if entry is None:
+            found[value] = [value, kind, line, 1]
+        else:
+            entry[3] += 1
+    if offset != end:
+        raise ScanError("Invalid token length")
+
+    for index, (kind, value) in enumerate(constants):
+        if kind is not None and index not in used_constants and value not in found:
+            found[value] = [value, kind, 0, 1]
+    if include_identifiers:
+        for value in identifiers:
+            if value not in found:
+                found[value] = [value, "identifier", 0, 1]
+    return list(found.values())
+
+
+_table: TokenTable | None = None
+_include_identifiers = False
+
+
+def _init_worker(rev: str, include_identifiers: bool) -> None:
+    global _table, _include_identifiers
+    _table = load_token_table(rev)
+    _include_identifiers = include_identifiers
+
+
+def extract_file(path: str) -> dict:
+    """Returns `{"path": ..., "strings": [...]}` for one file, or `{"path": ..., "error": ...}`."""
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ScanError("Empty file")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                buf = memoryview(mapped)
+                # handled before the map is closed, so the traceback doesn't keep views of it alive
+                try:
+                    result = {"path": path, "strings": read_strings(buf, _table, _include_identifiers)}
+                except (ScanError, struct.error) as e:
+                    result = {"path": path, "error": str(e)}
+                buf.release()
+    except (OSError, ScanError) as e:
+        return {"path": path, "error": str(e)}
+    return result
+
+
+def extract(paths: list[str], jobs: int, rev: str, include_identifiers: bool, out=sys.stdout) -> int:
+    """Writes a JSON line for each file that couldn't be read, then one for each distinct string.
+
+    Returns the number of files read."""
+    scripts = find_scripts(paths)
+    # string -> (kinds, files), in order of first appearance
+    merged: dict[str, tuple[list[str], list[dict]]] = {}
+
+    def merge(result: dict) -> None:
+        if "error" in result:
+            out.write(json.dumps(result) + "\n")
+            return
+        for value, kind, line, count in result["strings"]:
+            entry = merged.get(value)
+            if entry is None:
+                entry = merged[value] = ([], [])
+            if kind not in entry[0]:
+                entry[0].append(kind)
+            entry[1].append({"path": result["path"], "line": line, "count": count})
+
+    if jobs == 1:
+        _init_worker(rev, include_identifiers)
+        for script in scripts:
+            merge(extract_file(script))
+    else:
+        # load the table here first, so a bad revision is reported once instead of by every worker
+        load_token_table(rev)
+        initargs = (rev, include_identifiers)
+        with concurrent.futures.ProcessPoolExecutor(jobs, initializer=_init_worker, initargs=initargs) as executor:
+            for result in executor.map(extract_file, scripts, chunksize=32):
+                merge(result)
+
+    for value, (kinds, files) in merged.items():
+        out.write(json.dumps({"string": value, "kinds": kinds, "files": files}) + "\n")
+    return len(scripts)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="+", help=".gdc files, or directories to search for them")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--identifiers", action="store_true", help="also list identifiers and annotations")
+    parser.add_argument(
+        "--revision", default=DEFAULT_REVISION, help=f"revision whose token table to use (default {DEFAULT_REVISION})"
+    )
+    parser.add_argument("--benchmark", action="store_true", help="print files/sec to stderr when done")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        count = extract(args.paths, max(args.jobs, 1), args.revision, args.identifiers)
+    except (KeyError, ScanError) as e:
+        print(e.args[0], file=sys.stderr)
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+    if args.benchmark:
+        rate = count / elapsed if elapsed > 0 else 0.0
+        print(f"{count} files in {elapsed:.2f}s ({rate:.1f} files/sec)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
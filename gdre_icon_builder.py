@@ -5,33 +5,61 @@ All such functions are invoked in a subprocess on Windows to prevent build flaki
 """
 
 import os
+import re
+import zlib
 from io import StringIO
 
 
-# See also `editor/icons/editor_icons_builders.py`.
-def make_gdre_icons_action(target, source, env):
+XML_COMMENT_RE = re.compile(rb"<!--.*?-->", re.DOTALL)
+XML_DECLARATION_RE = re.compile(rb"<\?xml.*?\?>", re.DOTALL)
+BETWEEN_TAGS_RE = re.compile(rb">\s+<")
+WHITESPACE_RE = re.compile(rb"\s+")
 
-    dst = str(target[0])
-    svg_icons = source
 
-    icons_string = StringIO()
+def minify_svg(data: bytes) -> bytes:
+    """Strips comments, the XML declaration and insignificant whitespace from an SVG."""
+    data = XML_COMMENT_RE.sub(b"", data)
+    data = XML_DECLARATION_RE.sub(b"", data)
+    data = BETWEEN_TAGS_RE.sub(b"><", data)
+    data = WHITESPACE_RE.sub(b" ", data)
+    return data.strip()
 
-    for f in svg_icons:
 
-        fname = str(f)
+def pack_icons(paths: list[str]) -> tuple[bytes, list[tuple[int, int]]]:
+    """Concatenates the minified icons into one blob.
 
-        icons_string.write('\t"')
+    Returns the blob and the (offset, length) of each icon in it; icons with the same content share their data."""
+    blob = bytearray()
+    offsets: dict[bytes, int] = {}
+    entries = []
+    for path in paths:
+        with open(path, "rb") as svgf:
+            svg = minify_svg(svgf.read())
+        if svg not in offsets:
+            offsets[svg] = len(blob)
+            blob += svg
+        entries.append((offsets[svg], len(svg)))
+    return bytes(blob), entries
 
-        with open(fname, "rb") as svgf:
-            b = svgf.read(1)
-            while len(b) == 1:
-                icons_string.write("\\" + str(hex(ord(b)))[1:])
-                b = svgf.read(1)
 
-        icons_string.write('"')
-        if fname != svg_icons[-1]:
-            icons_string.write(",")
-        icons_string.write("\n")
+def write_byte_array(s: StringIO, name: str, data: bytes) -> None:
+    s.write("static const unsigned char {}[] = {{\n".format(name))
+    for i in range(0, len(data), 32):
+        s.write("\t" + ",".join(str(b) for b in data[i : i + 32]) + ",\n")
+    s.write("};\n")
+
+
+# See also `editor/icons/editor_icons_builders.py`.
+def make_gdre_icons_action(target, source, env):
+
+    dst = str(target[0])
+    svg_icons = [str(f) for f in source]
+    compress = env.get("gdre_compress_icons", True)
+
+    data, entries = pack_icons(svg_icons)
+    uncompressed_size = len(data)
+    if compress:
+        data = zlib.compress(data, zlib.Z_BEST_COMPRESSION)
 
     s = StringIO()
     s.write("/* THIS FILE IS GENERATED DO NOT EDIT */\n\n")
@@ -40,15 +68,20 @@ def make_gdre_icons_action(target, source, env):
     s.write("#define _GDRE_ICONS_H\n")
     s.write("static const int gdre_icons_count = {};\n\n".format(len(svg_icons)))
     s.write("#ifdef MODULE_SVG_ENABLED\n")
-    s.write("static const char *gdre_icons_sources[] = {\n")
-    s.write(icons_string.getvalue())
+    s.write("// The minified SVG sources of all the icons, compressed with `Compression::MODE_DEFLATE` if `gdre_icons_compressed`.\n")
+    s.write("static const bool gdre_icons_compressed = {};\n".format("true" if compress else "false"))
+    s.write("static const int gdre_icons_data_size = {};\n".format(len(data)))
+    s.write("static const int gdre_icons_uncompressed_size = {};\n".format(uncompressed_size))
+    write_byte_array(s, "gdre_icons_data", data)
+    s.write("\n// The offset and length of each icon in the uncompressed data.\n")
+    s.write("static const int gdre_icons_sources[][2] = {\n")
+    for offset, length in entries:
+        s.write("\t{{ {}, {} }},\n".format(offset, length))
     s.write("};\n")
     s.write("#endif // MODULE_SVG_ENABLED\n\n")
     s.write("static const char *gdre_icons_names[] = {\n")
 
-    for f in svg_icons:
-
-        fname = str(f)
+    for fname in svg_icons:
 
         # Trim the `.svg` extension from the string.
         icon_name = os.path.basename(fname)[:-4]
@@ -67,4 +100,3 @@ def make_gdre_icons_action(target, source, env):
         f.write(s.getvalue())
 
     s.close()
-    icons_string.close()
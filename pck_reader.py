@@ -0,0 +1,568 @@
+"""Lists, verifies and extracts Godot packs without starting Godot.
+
+It reads the same layouts as `GDREPackedSource::try_open_pack`: standalone `.pck` files (format versions 0 to 2),
+and packs embedded in executables, either in a `pck` section (ELF or PE) or appended to the end. The pack is
+memory-mapped, and its directory is only parsed when the file list is first needed:
+
+    python3 pck_reader.py list PACK...
+    python3 pck_reader.py verify [-j JOBS] PACK...
+    python3 pck_reader.py extract [-j JOBS] [--no-verify] [--include PATH]... PACK OUTPUT_DIR
+    python3 pck_reader.py self-test
+
+Extraction writes straight from the mapping, in pack offset order, across a process pool; each file's MD5 is
+computed while it is written. Files in encrypted packs or encrypted files can be listed, but not read.
+"""
+
+import argparse
+import concurrent.futures
+import hashlib
+import json
+import mmap
+import os
+import posixpath
+import struct
+import sys
+import tempfile
+from dataclasses import dataclass
+
+PACK_HEADER_MAGIC = 0x43504447  # "GDPC"
+CURRENT_PACK_FORMAT_VERSION = 2
+
+# pack_flags
+PACK_DIR_ENCRYPTED = 1 << 0
+PACK_REL_FILEBASE = 1 << 1
+# file flags
+PACK_FILE_ENCRYPTED = 1 << 0
+PACK_FILE_REMOVAL = 1 << 1
+
+EMPTY_MD5 = bytes(16)
+# how much of a file is hashed and written at a time
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+class PackError(Exception):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class PackEntry:
+    path: str
+    # absolute offset in the pack file
+    offset: int
+    size: int
+    md5: bytes
+    flags: int
+
+    @property
+    def encrypted(self) -> bool:
+        return bool(self.flags & PACK_FILE_ENCRYPTED)
+
+    @property
+    def has_md5(self) -> bool:
+        return self.md5 != EMPTY_MD5
+
+
+def _u32(buf, offset: int) -> int:
+    return struct.unpack_from("<I", buf, offset)[0]
+
+
+def _u64(buf, offset: int) -> int:
+    return struct.unpack_from("<Q", buf, offset)[0]
+
+
+def _elf_pck_section_offset(buf) -> int:
+    if len(buf) < 0x40 or _u32(buf, 0) != 0x464C457F:  # 0x7F + "ELF"
+        return 0
+    bits = buf[4] * 32
+    if bits == 32:
+        section_header_size = 40
+        section_table_pos = _u32(buf, 0x20)
+        num_sections, string_section_idx = struct.unpack_from("<HH", buf, 0x30)
+    else:
+        section_header_size = 64
+        section_table_pos = _u64(buf, 0x28)
+        num_sections, string_section_idx = struct.unpack_from("<HH", buf, 0x3C)
+    string_header = section_table_pos + string_section_idx * section_header_size
+    if bits == 32:
+        string_data_pos, string_data_size = struct.unpack_from("<II", buf, string_header + 0x10)
+    else:
+        string_data_pos, string_data_size = struct.unpack_from("<QQ", buf, string_header + 0x18)
+    strings = bytes(buf[string_data_pos : string_data_pos + string_data_size])
+    for i in range(num_sections):
+        section_header_pos = section_table_pos + i * section_header_size
+        name_offset = _u32(buf, section_header_pos)
+        end = strings.find(b"\0", name_offset)
+        if strings[name_offset:end] == b"pck":
+            if bits == 32:
+                return _u32(buf, section_header_pos + 0x10)
+            return _u64(buf, section_header_pos + 0x18)
+    return 0
+
+
+def _pe_pck_section_offset(buf) -> int:
+    if len(buf) < 0x40:
+        return 0
+    pe_pos = _u32(buf, 0x3C)
+    if pe_pos + 24 > len(buf) or _u32(buf, pe_pos) != 0x00004550:  # "PE\0\0"
+        return 0
+    header_pos = pe_pos + 4
+    num_sections = struct.unpack_from("<H", buf, header_pos + 2)[0]
+    opt_header_size = struct.unpack_from("<H", buf, header_pos + 16)[0]
+    section_table_pos = header_pos + 20 + opt_header_size
+    for i in range(num_sections):
+        section_header_pos = section_table_pos + i * 40
+        if bytes(buf[section_header_pos : section_header_pos + 8]).rstrip(b"\0") == b"pck":
+            return _u32(buf, section_header_pos + 20)
+    return 0
+
+
+def find_pack_start(buf, path: str) -> tuple[int, bool]:
+    """Returns the offset of the pack header and whether the pack is embedded in an executable."""
+    if len(buf) >= 4 and _u32(buf, 0) == PACK_HEADER_MAGIC:
+        return 0, False
+    try:
+        pck_off = _pe_pck_section_offset(buf) if path.lower().endswith(".exe") else _elf_pck_section_offset(buf)
+    except struct.error:
+        pck_off = 0
+    if pck_off:
+        # in case the PCK start and the section have a different alignment
+        for i in range(8):
+            if pck_off + i + 4 <= len(buf) and _u32(buf, pck_off + i) == PACK_HEADER_MAGIC:
+                return pck_off + i, True
+    # a self-contained executable: the pack is followed by its size and the magic
+    if len(buf) >= 16 and _u32(buf, len(buf) - 4) == PACK_HEADER_MAGIC:
+        pack_size = _u64(buf, len(buf) - 12)
+        start = len(buf) - 12 - pack_size
+        if 0 <= start <= len(buf) - 4 and _u32(buf, start) == PACK_HEADER_MAGIC:
+            return start, True
+    raise PackError("No pack header found in " + path)
+
+
+class PackFile:
+    """A memory-mapped pack. The header is read when it's opened, and the file list when it's first used."""
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = os.fspath(path)
+        self._file = open(self.path, "rb")
+        try:
+            if os.fstat(self._file.fileno()).st_size == 0:
+                raise PackError("Empty file: " + self.path)
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            self._file.close()
+            raise
+        self._buf = memoryview(self._mmap)
+        self._entries: tuple[PackEntry, ...] | None = None
+        self._index: dict[str, PackEntry] | None = None
+        try:
+            self._read_header()
+        except BaseException:
+            self.close()
+            raise
+
+    def _read_header(self) -> None:
+        buf = self._buf
+        try:
+            self.pack_start, self.is_exe = find_pack_start(buf, self.path)
+            pos = self.pack_start + 4
+            self.format_version, self.ver_major, self.ver_minor, self.ver_rev = struct.unpack_from("<4I", buf, pos)
+            pos += 16
+            if self.format_version > CURRENT_PACK_FORMAT_VERSION:
+                raise PackError("Pack version unsupported: %d." % self.format_version)
+            self.pack_flags = 0
+            self.file_base = 0
+            if self.format_version == 2:
+                self.pack_flags = _u32(buf, pos)
+                self.file_base = _u64(buf, pos + 4)
+                pos += 12
+            if self.pack_flags & PACK_REL_FILEBASE:
+                self.file_base += self.pack_start
+            # reserved
+            pos += 16 * 4
+            self.file_count = _u32(buf, pos)
+            self._directory_pos = pos + 4
+        except struct.error as e:
+            raise PackError("Truncated pack header in %s: %s" % (self.path, e))
+
+    @property
+    def dir_encrypted(self) -> bool:
+        return bool(self.pack_flags & PACK_DIR_ENCRYPTED)
+
+    @property
+    def version_string(self) -> str:
+        return "%d.%d.%d" % (self.ver_major, self.ver_minor, self.ver_rev)
+
+    def _parse_directory(self) -> tuple[PackEntry, ...]:
+        if self.dir_encrypted:
+            raise PackError("The directory of %s is encrypted" % self.path)
+        buf = self._buf
+        pos = self._directory_pos
+        entries: dict[str, PackEntry] = {}
+        try:
+            for _ in range(self.file_count):
+                path_length = _u32(buf, pos)
+                pos += 4
+                raw_path = bytes(buf[pos : pos + path_length])
+                pos += path_length
+                # the path is padded with NULs
+                path = raw_path.split(b"\0", 1)[0].decode("utf-8", "replace")
+                offset, size = struct.unpack_from("<QQ", buf, pos)
+                md5 = bytes(buf[pos + 16 : pos + 32])
+                pos += 32
+                flags = 0
+                if self.format_version == 2:
+                    flags = _u32(buf, pos)
+                    pos += 4
+                if flags & PACK_FILE_REMOVAL:
+                    entries.pop(path, None)
+                else:
+                    entries[path] = PackEntry(path, self.file_base + offset, size, md5, flags)
+        except struct.error as e:
+            raise PackError("Truncated pack directory in %s: %s" % (self.path, e))
+        return tuple(entries.values())
+
+    @property
+    def entries(self) -> tuple[PackEntry, ...]:
+        """The files in the pack, in directory order."""
+        if self._entries is None:
+            self._entries = self._parse_directory()
+        return self._entries
+
+    @property
+    def index(self) -> dict[str, PackEntry]:
+        if self._index is None:
+            self._index = {entry.path: entry for entry in self.entries}
+        return self._index
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self.index
+
+    def get(self, path: str) -> PackEntry | None:
+        return self.index.get(path)
+
+    def data(self, entry: PackEntry | str) -> memoryview:
+        """The file's bytes as a slice of the mapping; it's only valid until the pack is closed."""
+        if isinstance(entry, str):
+            entry = self.index[entry]
+        if entry.offset + entry.size > len(self._buf):
+            raise PackError("%s runs past the end of %s" % (entry.path, self.path))
+        return self._buf[entry.offset : entry.offset + entry.size]
+
+    def check_md5(self, entry: PackEntry | str) -> bool | None:
+        """Whether the file matches its MD5, or None if it has no MD5 or is encrypted."""
+        if isinstance(entry, str):
+            entry = self.index[entry]
+        if entry.encrypted or not entry.has_md5:
+            return None
+        data = self.data(entry)
+        try:
+            return _hash_and_write(data, None) == entry.md5
+        finally:
+            data.release()
+
+    def close(self) -> None:
+        self._buf.release()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "PackFile":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _hash_and_write(data: memoryview, out) -> bytes:
+    md5 = hashlib.md5()
+    for start in range(0, len(data), STREAM_CHUNK_SIZE):
+        chunk = data[start : start + STREAM_CHUNK_SIZE]
+        md5.update(chunk)
+        if out is not None:
+            out.write(chunk)
+        chunk.release()
+    return md5.digest()
+
+
+def output_path(output_dir: str, path: str) -> str | None:
+    """Where `path` is extracted to, or None if it would end up outside `output_dir`."""
+    rel = path[len("res://") :] if path.startswith("res://") else path
+    rel = posixpath.normpath(rel.replace("\\", "/")).lstrip("/")
+    if rel in ("", ".") or rel == ".." or rel.startswith("../"):
+        return None
+    return os.path.join(output_dir, *rel.split("/"))
+
+
+_pack: PackFile | None = None
+
+
+def _init_worker(pack_path: str) -> None:
+    global _pack
+    _pack = PackFile(pack_path)
+
+
+def _process_batch(batch: list[tuple[PackEntry, str | None]], verify: bool) -> list[dict]:
+    """Hashes, and writes if a destination is given, a run of files; returns one result per file."""
+    results = []
+    for entry, dest in batch:
+        result: dict = {"path": entry.path, "size": entry.size}
+        try:
+            if entry.encrypted:
+                raise PackError("encrypted")
+            data = _pack.data(entry)
+            try:
+                if dest is None:
+                    digest = _hash_and_write(data, None)
+                else:
+                    os.makedirs(os.path.dirname(dest), exist_ok=True)
+                    with open(dest, "wb") as out:
+                        digest = _hash_and_write(data, out)
+            finally:
+                data.release()
+            if verify:
+                result["md5"] = ("ok" if digest == entry.md5 else "mismatch") if entry.has_md5 else "skipped"
+        except (OSError, PackError) as e:
+            result["error"] = str(e)
+        results.append(result)
+    return results
+
+
+def _batches(items: list, batch_bytes: int):
+    batch = []
+    size = 0
+    for item in items:
+        batch.append(item)
+        size += item[0].size
+        if size >= batch_bytes:
+            yield batch
+            batch = []
+            size = 0
+    if batch:
+        yield batch
+
+
+def process_pack(
+    pack_path: str, output_dir: str | None = None, paths=None, jobs: int = 1, verify: bool = True
+) -> list[dict]:
+    """Verifies and/or extracts the files of a pack; `paths` limits it to those files.
+
+    Returns one result per file, in directory order, with "md5" set to "ok", "mismatch" or "skipped" if `verify`,
+    and "error" set if the file couldn't be read or written.
+    """
+    global _pack
+    with PackFile(pack_path) as pack:
+        entries = pack.entries if paths is None else [pack.index[path] for path in paths if path in pack.index]
+        work = []
+        results: dict[str, dict] = {}
+        for entry in entries:
+            dest = None
+            if output_dir is not None:
+                dest = output_path(output_dir, entry.path)
+                if dest is None:
+                    results[entry.path] = {"path": entry.path, "size": entry.size, "error": "unsafe path"}
+                    continue
+            work.append((entry, dest))
+        # one pass over the pack: each batch is a contiguous run of it
+        work.sort(key=lambda item: item[0].offset)
+        total = sum(entry.size for entry, _ in work)
+        batch_bytes = max(total // (max(jobs, 1) * 8), STREAM_CHUNK_SIZE)
+        batches = list(_batches(work, batch_bytes))
+        if jobs <= 1 or len(batches) <= 1:
+            _pack = pack
+            try:
+                for batch in batches:
+                    for result in _process_batch(batch, verify):
+                        results[result["path"]] = result
+            finally:
+                _pack = None
+        else:
+            with concurrent.futures.ProcessPoolExecutor(jobs, initializer=_init_worker, initargs=(pack_path,)) as executor:
+                for batch_results in executor.map(_process_batch, batches, [verify] * len(batches)):
+                    for result in batch_results:
+                        results[result["path"]] = result
+        return [results[entry.path] for entry in entries if entry.path in results]
+
+
+def _entry_to_json(entry: PackEntry) -> dict:
+    return {
+        "path": entry.path,
+        "offset": entry.offset,
+        "size": entry.size,
+        "md5": entry.md5.hex(),
+        "encrypted": entry.encrypted,
+    }
+
+
+def _build_pack(files, format_version: int = CURRENT_PACK_FORMAT_VERSION, prefix: bytes = b"") -> bytes:
+    """Builds a pack from (path, data, flags, md5) tuples, for `self_test`; an md5 of None is the data's real one.
+
+    Version 2 packs use a file base relative to the pack, like the engine writes; older ones use offsets from the
+    start of the file, which is `prefix` followed by the pack."""
+    directory_size = 0
+    for path, _, _, _ in files:
+        encoded = path.encode("utf-8")
+        directory_size += 4 + (len(encoded) + 3) // 4 * 4 + 32 + (4 if format_version == 2 else 0)
+    header_size = 4 + 16 + (12 if format_version == 2 else 0) + 16 * 4 + 4
+    data_start = header_size + directory_size
+    header = struct.pack("<5I", PACK_HEADER_MAGIC, format_version, 4, 3, 0)
+    if format_version == 2:
+        header += struct.pack("<IQ", PACK_REL_FILEBASE, data_start)
+    header += bytes(16 * 4) + struct.pack("<I", len(files))
+    directory = b""
+    data = b""
+    for path, content, flags, md5 in files:
+        encoded = path.encode("utf-8")
+        padded = encoded + bytes((len(encoded) + 3) // 4 * 4 - len(encoded))
+        offset = len(data) if format_version == 2 else len(prefix) + data_start + len(data)
+        md5 = hashlib.md5(content).digest() if md5 is None else md5
+        directory += struct.pack("<I", len(padded)) + padded + struct.pack("<QQ", offset, len(content)) + md5
+        if format_version == 2:
+            directory += struct.pack("<I", flags)
+        data += content
+    return header + directory + data
+
+
+def self_test() -> bool:
+    """Checks the reader against packs built by `_build_pack`; returns whether everything passed."""
+    failures = []
+
+    def check(condition: bool, message: str) -> None:
+        if not condition:
+            failures.append(message)
+
+    def check_entries(pack: PackFile, expected: dict[str, bytes], name: str) -> None:
+        check([entry.path for entry in pack.entries] == list(expected), name + ": file list")
+        for path, content in expected.items():
+            entry = pack.get(path)
+            if entry is None:
+                continue
+            check(entry.size == len(content), name + ": size of " + path)
+            check(entry.md5 == hashlib.md5(content).digest(), name + ": md5 of " + path)
+            data = pack.data(entry)
+            check(bytes(data) == content, name + ": offset of " + path)
+            data.release()
+            check(pack.check_md5(entry) is True, name + ": check_md5 of " + path)
+
+    files = {"res://project.binary": b"config", "res://scripts/main.gdc": bytes(range(256)) * 3, "res://empty": b""}
+    with tempfile.TemporaryDirectory() as tmp:
+        # version 1: absolute offsets
+        pack_path = os.path.join(tmp, "v1.pck")
+        with open(pack_path, "wb") as f:
+            f.write(_build_pack([(path, data, 0, None) for path, data in files.items()], 1))
+        with PackFile(pack_path) as pack:
+            check(pack.format_version == 1 and not pack.is_exe and pack.pack_start == 0, "v1: header")
+            check_entries(pack, files, "v1")
+
+        # version 2: offsets from a relative file base, and a later removal entry
+        pack_path = os.path.join(tmp, "v2.pck")
+        with open(pack_path, "wb") as f:
+            removed = ("res://removed.gd", b"gone", 0, None)
+            removal = ("res://removed.gd", b"", PACK_FILE_REMOVAL, EMPTY_MD5)
+            f.write(_build_pack([removed] + [(path, data, 0, None) for path, data in files.items()] + [removal], 2))
+        with PackFile(pack_path) as pack:
+            check(pack.format_version == 2 and pack.pack_flags & PACK_REL_FILEBASE, "v2: header")
+            check("res://removed.gd" not in pack, "v2: removal entry")
+            check_entries(pack, files, "v2")
+
+        # appended to an executable: the pack, then its size and the magic
+        pack_path = os.path.join(tmp, "game.x86_64")
+        prefix = b"not really an executable" * 10
+        pack_data = _build_pack([(path, data, 0, None) for path, data in files.items()], 2, prefix)
+        with open(pack_path, "wb") as f:
+            f.write(prefix + pack_data + struct.pack("<QI", len(pack_data), PACK_HEADER_MAGIC))
+        with PackFile(pack_path) as pack:
+            check(pack.is_exe and pack.pack_start == len(prefix), "exe: pack start")
+            check_entries(pack, files, "exe")
+
+        # extracting: bad checksums are reported, and paths that leave the output directory are refused
+        pack_path = os.path.join(tmp, "unsafe.pck")
+        with open(pack_path, "wb") as f:
+            bad_md5 = hashlib.md5(b"something else").digest()
+            f.write(
+                _build_pack(
+                    [
+                        ("res://ok.txt", b"ok", 0, None),
+                        ("res://bad.txt", b"bad", 0, bad_md5),
+                        ("res://../escaped.txt", b"escaped", 0, None),
+                        ("res://a/../../escaped2.txt", b"escaped", 0, None),
+                    ]
+                )
+            )
+        out_dir = os.path.join(tmp, "out")
+        results = {result["path"]: result for result in process_pack(pack_path, out_dir)}
+        check(results["res://ok.txt"].get("md5") == "ok", "extract: good md5")
+        check(results["res://bad.txt"].get("md5") == "mismatch", "extract: bad md5")
+        for path in ("res://../escaped.txt", "res://a/../../escaped2.txt"):
+            check(results[path].get("error") == "unsafe path", "extract: unsafe path " + path)
+        check(not os.path.exists(os.path.join(tmp, "escaped.txt")), "extract: wrote outside the output directory")
+        check(not os.path.exists(os.path.join(tmp, "escaped2.txt")), "extract: wrote outside the output directory")
+        with open(os.path.join(out_dir, "ok.txt"), "rb") as f:
+            check(f.read() == b"ok", "extract: contents")
+
+    for message in failures:
+        print("FAILED: " + message, file=sys.stderr)
+    print("%d checks failed" % len(failures) if failures else "All checks passed", file=sys.stderr)
+    return not failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    list_parser = commands.add_parser("list", help="print the header and files of each pack as JSON")
+    list_parser.add_argument("packs", nargs="+")
+    verify_parser = commands.add_parser("verify", help="check the MD5 of every file")
+    verify_parser.add_argument("packs", nargs="+")
+    extract_parser = commands.add_parser("extract", help="extract the files of a pack")
+    extract_parser.add_argument("pack")
+    extract_parser.add_argument("output_dir")
+    extract_parser.add_argument("--include", action="append", help="res:// path of a file to extract (can be repeated)")
+    extract_parser.add_argument("--no-verify", action="store_true", help="don't check the MD5s")
+    commands.add_parser("self-test", help="check the reader against packs it builds itself")
+    for sub in (verify_parser, extract_parser):
+        sub.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="worker processes")
+    args = parser.parse_args()
+
+    if args.command == "self-test":
+        sys.exit(0 if self_test() else 1)
+    failed = False
+    try:
+        if args.command == "list":
+            for pack_path in args.packs:
+                with PackFile(pack_path) as pack:
+                    info = {
+                        "pack": pack_path,
+                        "format_version": pack.format_version,
+                        "engine_version": pack.version_string,
+                        "embedded": pack.is_exe,
+                        "dir_encrypted": pack.dir_encrypted,
+                        "file_count": pack.file_count,
+                    }
+                    if not pack.dir_encrypted:
+                        info["files"] = [_entry_to_json(entry) for entry in pack.entries]
+                print(json.dumps(info, indent=1))
+        elif args.command == "verify":
+            for pack_path in args.packs:
+                results = process_pack(pack_path, jobs=args.jobs)
+                bad = [r for r in results if r.get("md5") == "mismatch" or "error" in r]
+                for result in bad:
+                    print(json.dumps(dict(result, pack=pack_path)))
+                checked = sum(1 for r in results if r.get("md5") == "ok")
+                print("%s: %d verified, %d failed, %d files" % (pack_path, checked, len(bad), len(results)), file=sys.stderr)
+                failed = failed or bool(bad)
+        else:
+            results = process_pack(args.pack, args.output_dir, args.include, args.jobs, not args.no_verify)
+            for result in results:
+                if result.get("md5") == "mismatch" or "error" in result:
+                    print(json.dumps(result))
+                    failed = True
+            print("Extracted %d files to %s" % (sum(1 for r in results if "error" not in r), args.output_dir), file=sys.stderr)
+    except (OSError, PackError) as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@
 #include "editor/editor_node.h"
 #endif
 
+#include "bytecode/bytecode_table.h"
 #include "bytecode/bytecode_versions.h"
 #include "compat/oggstr_loader_compat.h"
 #include "compat/resource_compat_binary.h"
@@ -231,6 +232,7 @@ void initialize_gdsdecomp_module(ModuleInitializationLevel p_level) {
 	init_ver_regex();
 
 	ClassDB::register_abstract_class<GDScriptDecomp>();
+	ClassDB::register_abstract_class<GDScriptDecompTable>();
 	register_decomp_versions();
 
 	ClassDB::register_class<FileAccessGDRE>();
@@ -300,6 +302,7 @@ void uninitialize_gdsdecomp_module(ModuleInitializationLevel p_level) {
 	uninitialize_etcpak_decompress_module(p_level);
 	deinit_exporters();
 	deinit_loaders();
+	unregister_decomp_versions();
 	if (gdre_singleton) {
 		memdelete(gdre_singleton);
 		gdre_singleton = nullptr;
@@ -229,15 +229,17 @@ func dump_files(output_dir:String, files: PackedStringArray, ignore_checksum_err
 	var pckdump = PckDumper.new()
 	# var start_time = Time.get_ticks_msec()
 	pckdump.set_multi_thread(not disable_multi_threading)
-	err = pckdump.check_md5_all_files()
-	if err != OK:
-		if (err != ERR_SKIP and not ignore_checksum_errors):
+	# verify the checksums while extracting, rather than reading the whole pack twice
+	pckdump.set_check_md5_on_extract(true)
+	pckdump.set_skip_failed_md5(ignore_checksum_errors)
+	err = pckdump.pck_dump_to_dir(output_dir, files)
+	if err == ERR_BUG:
+		if (not ignore_checksum_errors):
 			print("MD5 checksum failed, not proceeding...")
 			return err
-		elif (ignore_checksum_errors):
-			print("MD5 checksum failed, but --ignore_checksum_errors specified, proceeding anyway...")
-	err = pckdump.pck_dump_to_dir(output_dir, files)
-	if err != OK:
+		print("MD5 checksum failed, but --ignore_checksum_errors specified, proceeding anyway...")
+		err = OK
+	elif err != OK:
 		print("error dumping to dir")
 	# var end_time = Time.get_ticks_msec()
 	# var secs_taken = (end_time - start_time) / 1000
@@ -280,7 +282,13 @@ var RECOVER_OPTS_NOTES = """Recover/Extract Options:
 --scripts-only              Only extract/recover scripts
 --include=<GLOB>            Include files matching the glob pattern (can be repeated)
 --exclude=<GLOB>            Exclude files matching the glob pattern (can be repeated)
---ignore-checksum-errors    Ignore MD5 checksum errors when extracting/recovering
+--ignore-checksum-errors    Ignore MD5 checksum errors when extracting/recovering. Checksums are verified
+							while extracting: without this, files that fail are deleted and recovery stops
+							after extraction; with it, they're kept
+--no-bytecode-cache         Test every script when detecting the bytecode revision, instead of reusing
+							the results for scripts that were tested before
+--async-log                 Write the log in batches from a background thread instead of line by line
+							(errors and warnings are still written straight away)
 """
 # todo: handle --key option
 var COMPILE_OPTS_NOTES = """Decompile/Compile Options:
@@ -290,6 +298,11 @@ var COMPILE_OPTS_NOTES = """Decompile/Compile Options:
 										  - If not specified, compiled files will be output to the same location 
 										  (e.g. '<PROJ_DIR>/main.gd' -> '<PROJ_DIR>/main.gdc')
 """
+var PROFILING_OPTS_NOTES = """Profiling Options (builds made with 'gdre_instrumentation=yes' only):
+--dump-lookup-counts=<FILE>             After the command finishes, write the token and function lookup counts
+										  of each bytecode revision to <FILE> as JSON
+--time-lookups                          Also time the lookups (slower)
+"""
 func print_usage():
 	print("Godot Reverse Engineering Tools")
 	print("")
@@ -302,6 +315,7 @@ func print_usage():
 	print(RECOVER_OPTS_NOTES)
 	print(GLOB_NOTES)
 	print(COMPILE_OPTS_NOTES)
+	print(PROFILING_OPTS_NOTES)
 
 
 # TODO: remove this hack
@@ -656,6 +670,7 @@ func handle_cli(args: PackedStringArray) -> bool:
 	var includes: PackedStringArray = []
 	var prepop: PackedStringArray = []
 	var set_setting: bool = false
+	var lookup_counts_file: String = ""
 	if (args.size() == 0):
 		return false
 	var any_commands = false
@@ -704,6 +719,10 @@ func handle_cli(args: PackedStringArray) -> bool:
 			translation_only = true
 		elif arg.begins_with("--disable-multithreading"):
 			disable_multi_threading = true
+		elif arg.begins_with("--async-log"):
+			GDRESettings.set_async_logging(true)
+		elif arg.begins_with("--no-bytecode-cache"):
+			GDRESettings.set_bytecode_test_cache_enabled(false)
 		elif arg.begins_with("--enable-experimental-plugin-downloading"):
 			GDRESettings.set_setting_download_plugins(true)
 			set_setting = true
@@ -725,6 +744,10 @@ func handle_cli(args: PackedStringArray) -> bool:
 			excludes.append(get_arg_value(arg))
 		elif arg.begins_with("--include"):
 			includes.append(get_arg_value(arg))
+		elif arg.begins_with("--dump-lookup-counts"):
+			lookup_counts_file = get_arg_value(arg).simplify_path()
+		elif arg.begins_with("--time-lookups"):
+			GDScriptDecomp.set_lookup_timing_enabled(true)
 		elif arg.begins_with("--plcache"):
 			main_cmds["plcache"] = true
 			prepop.append(get_arg_value(arg))
@@ -767,4 +790,18 @@ func handle_cli(args: PackedStringArray) -> bool:
 	else:
 		print_usage()
 		print("ERROR: invalid option! Must specify one of " + ", ".join(MAIN_COMMANDS))
+	if lookup_counts_file != "":
+		dump_lookup_counts(lookup_counts_file)
 	return true
+
+func dump_lookup_counts(file: String):
+	if not GDScriptDecomp.is_lookup_instrumentation_enabled():
+		print("WARNING: this build doesn't count lookups, rebuild with 'gdre_instrumentation=yes'")
+	file = get_cli_abs_path(file)
+	var f = FileAccess.open(file, FileAccess.WRITE)
+	if f == null:
+		print("Error: failed to open " + file + " for writing")
+		return
+	f.store_string(GDScriptDecomp.get_lookup_counts_json())
+	f.close()
+	print("Lookup counts written to " + file)
@@ -0,0 +1,56 @@
+"""Measures how long a Godot RE Tools build takes to start and quit headless.
+
+Static initialisation runs before `main`, so the only way to see it is to time whole runs of the binary.
+Give two binaries to compare a build before and after a change:
+
+    python3 startup_benchmark.py [-n RUNS] [--args ARGS] BINARY [BINARY...]
+
+Each binary is run once to warm the disk cache, then `RUNS` times with `--headless` and `ARGS`
+(`--quit` by default). The mean, median and minimum wall-clock times are printed per binary.
+"""
+
+import argparse
+import shlex
+import statistics
+import subprocess
+import sys
+import time
+
+
+def time_runs(binary: str, args: list[str], runs: int) -> list[float]:
+    cmd = [binary, "--headless"] + args
+    subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        times.append(time.perf_counter() - start)
+        if result.returncode != 0:
+            print(f"{binary} exited with {result.returncode}", file=sys.stderr)
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("binaries", nargs="+", help="Godot binaries with the module built in")
+    parser.add_argument("-n", "--runs", type=int, default=20, help="timed runs per binary")
+    parser.add_argument("--args", default="--quit", help="arguments passed after `--headless`")
+    args = parser.parse_args()
+
+    extra = shlex.split(args.args)
+    baseline = None
+    for binary in args.binaries:
+        times = time_runs(binary, extra, max(args.runs, 1))
+        mean = statistics.mean(times)
+        line = "{}: mean {:.1f} ms, median {:.1f} ms, min {:.1f} ms".format(
+            binary, mean * 1000, statistics.median(times) * 1000, min(times) * 1000
+        )
+        if baseline is None:
+            baseline = mean
+        else:
+            line += " ({:+.1f}% vs. {})".format((mean / baseline - 1) * 100, args.binaries[0])
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,16 @@
 #define TEST_BYTECODE_H
 
 #include "../bytecode/bytecode_base.h"
+#include "../bytecode/bytecode_discriminators.h"
+#include "../bytecode/bytecode_remap.h"
+#include "../bytecode/bytecode_test_cache.h"
+#include "../bytecode/bytecode_tester.h"
+#include "../bytecode/bytecode_versions.h"
 #include "test_common.h"
 #include "tests/test_macros.h"
 
+#include <core/io/json.h>
+#include <core/os/os.h>
 #include <core/version_generated.gen.h>
 #include <modules/gdscript/gdscript_tokenizer_buffer.h>
 #include <utility/common.h>
@@ -240,6 +247,587 @@ TEST_CASE("[GDSDecomp][Bytecode] Compiling Helper Scripts") {
 	}
 }
 
+TEST_CASE("[GDSDecomp][Bytecode] Registry lookups match a scan of decomp_versions") {
+	for (int i = 0; i < num_decomp_versions; i++) {
+		uint64_t commit = decomp_versions[i].commit;
+		if (commit == 0xfffffff || commit == 0) {
+			continue;
+		}
+		CHECK(get_decomp_version_index(commit) == i);
+		auto shared = get_shared_decomp_for_commit(commit);
+		REQUIRE(shared.is_valid());
+		CHECK(shared == get_shared_decomp_for_commit(commit));
+		CHECK((uint64_t)shared->get_bytecode_rev() == commit);
+	}
+	CHECK(get_decomp_version_index(0x1234567) == -1);
+	CHECK(get_shared_decomp_for_commit(0x1234567).is_null());
+
+	for (int bytecode_version = 0; bytecode_version <= GDScriptDecomp::LATEST_GDSCRIPT_VERSION + 1; bytecode_version++) {
+		for (bool include_dev : { false, true }) {
+			Vector<uint64_t> expected;
+			for (int i = 0; i < num_decomp_versions; i++) {
+				// the placeholder rows have bytecode version 0, but no decomp
+				if (decomp_versions[i].commit == 0xfffffff || decomp_versions[i].commit == 0) {
+					continue;
+				}
+				if (decomp_versions[i].bytecode_version == bytecode_version && (include_dev || !decomp_versions[i].is_dev)) {
+					expected.push_back(decomp_versions[i].commit);
+				}
+			}
+			auto decomps = get_decomps_for_bytecode_ver(bytecode_version, include_dev);
+			REQUIRE(decomps.size() == expected.size());
+			for (int i = 0; i < decomps.size(); i++) {
+				CHECK((uint64_t)decomps[i]->get_bytecode_rev() == expected[i]);
+				// safe to test with, unlike the shared instances
+				CHECK(decomps[i] != get_shared_decomp_for_commit(expected[i]));
+			}
+		}
+	}
+}
+
+// `GDScriptDecomp::create_decomp_for_version` as it was before `find_decomp_version_index`, returning the commit
+static uint64_t legacy_decomp_commit_for_version(const String &p_ver, bool p_force) {
+	Ref<GodotVer> ver = GodotVer::parse(p_ver);
+	bool include_dev = ver->get_prerelease().contains("dev");
+	auto versions = get_decomp_versions(include_dev, ver->get_major());
+	versions.reverse();
+	if (include_dev) {
+		String tag = ver->as_tag();
+		for (auto &v : versions) {
+			if (v.min_version == tag || (v.has_max_version() && v.max_version == tag)) {
+				return v.commit;
+			}
+		}
+		return 0;
+	}
+	if (p_force && ver->get_major() == 4 && ver->get_minor() < 3 && (ver->get_minor() != 0 || !ver->is_prerelease())) {
+		return legacy_decomp_commit_for_version("4.3.0", false);
+	}
+	Ref<GodotVer> prev_ver = nullptr;
+	uint64_t prev_ver_commit = 0;
+	for (auto &curr_version : versions) {
+		Ref<GodotVer> min_ver = curr_version.get_min_version();
+		if (ver->eq(min_ver)) {
+			return curr_version.commit;
+		}
+		if (ver->gt(min_ver) && curr_version.has_max_version() && ver->lte(curr_version.get_max_version())) {
+			return curr_version.commit;
+		}
+		if (prev_ver_commit > 0 && ver->lt(min_ver) && ver->gte(prev_ver) && ver->get_major() == prev_ver->get_major()) {
+			return prev_ver_commit;
+		}
+		prev_ver = min_ver;
+		prev_ver_commit = curr_version.commit;
+	}
+	if (prev_ver.is_valid() && ver->get_major() == prev_ver->get_major() && ver->gte(prev_ver)) {
+		return prev_ver_commit;
+	}
+	return 0;
+}
+
+// every tag in the Godot repository, plus a few versions between them
+static const char *const godot_version_tags[] = {
+	"1.0-dev1",
+	"1.0-dev5",
+	"1.0-stable",
+	"1.0.1",
+	"1.1-dev2",
+	"1.1-beta1",
+	"1.1-rc1",
+	"1.1-stable",
+	"2.0-dev3",
+	"2.0-beta1",
+	"2.0-stable",
+	"2.0.1-stable",
+	"2.0.2-stable",
+	"2.0.3-stable",
+	"2.0.4-stable",
+	"2.0.4.1-stable",
+	"2.1-beta1",
+	"2.1-stable",
+	"2.1.1-stable",
+	"2.1.2-stable",
+	"2.1.3-stable",
+	"2.1.4-stable",
+	"2.1.5-stable",
+	"2.1.6-stable",
+	"2.2",
+	"3.0-dev5",
+	"3.0-dev14",
+	"3.0-alpha1",
+	"3.0-beta2",
+	"3.0-rc3",
+	"3.0-stable",
+	"3.0.1-stable",
+	"3.0.2-stable",
+	"3.0.3-stable",
+	"3.0.4-stable",
+	"3.0.5-stable",
+	"3.0.6-stable",
+	"3.0.7",
+	"3.1-dev1",
+	"3.1-dev7",
+	"3.1-alpha5",
+	"3.1-beta",
+	"3.1-beta1",
+	"3.1-beta3",
+	"3.1-beta5",
+	"3.1-beta6",
+	"3.1-rc1",
+	"3.1-rc3",
+	"3.1-stable",
+	"3.1.1-stable",
+	"3.1.2-stable",
+	"3.1.3",
+	"3.2-dev1",
+	"3.2-dev5",
+	"3.2-beta1",
+	"3.2-rc4",
+	"3.2-stable",
+	"3.2.1-stable",
+	"3.2.2-stable",
+	"3.2.3-stable",
+	"3.3-stable",
+	"3.3.1-stable",
+	"3.3.2-stable",
+	"3.3.3-stable",
+	"3.3.4-stable",
+	"3.4-stable",
+	"3.4.1-stable",
+	"3.4.2-stable",
+	"3.4.3-stable",
+	"3.4.4-stable",
+	"3.4.5-stable",
+	"3.4.6",
+	"3.5-beta1",
+	"3.5-rc1",
+	"3.5-stable",
+	"3.5.1-stable",
+	"3.5.2-stable",
+	"3.5.3-stable",
+	"3.6-beta1",
+	"3.6-rc1",
+	"3.6-stable",
+	"3.6.1",
+	"3.7",
+	"4.0-dev1",
+	"4.0-dev2",
+	"4.0-alpha1",
+	"4.0-beta1",
+	"4.0-rc1",
+	"4.0-stable",
+	"4.0.1-stable",
+	"4.0.2-stable",
+	"4.0.3-stable",
+	"4.0.4-stable",
+	"4.1-stable",
+	"4.1.1-stable",
+	"4.1.2-stable",
+	"4.1.3-stable",
+	"4.1.4-stable",
+	"4.2-stable",
+	"4.2.1-stable",
+	"4.2.2-stable",
+	"4.3-dev1",
+	"4.3-beta1",
+	"4.3-rc1",
+	"4.3-stable",
+	"4.3.0",
+	"v4.3.stable.official",
+	"4.4-beta1",
+	"4.4-stable",
+	"4.4.1-stable",
+	"4.5-stable",
+	"10.0",
+	"10.0-dev1",
+};
+
+TEST_CASE("[GDSDecomp][Bytecode] Version lookups match the legacy search for every tagged version") {
+	Vector<String> versions;
+	for (const char *tag : godot_version_tags) {
+		versions.push_back(tag);
+	}
+	for (int i = 0; i < num_decomp_versions; i++) {
+		if (decomp_versions[i].min_version[0] != '\0') {
+			versions.push_back(decomp_versions[i].min_version);
+		}
+		if (decomp_versions[i].has_max_version()) {
+			versions.push_back(decomp_versions[i].max_version);
+		}
+	}
+
+	for (const String &ver : versions) {
+		for (bool force : { false, true }) {
+			uint64_t expected = legacy_decomp_commit_for_version(ver, force);
+			ERR_PRINT_OFF;
+			auto decomp = GDScriptDecomp::create_decomp_for_version(ver, force);
+			ERR_PRINT_ON;
+			uint64_t result = decomp.is_valid() ? (uint64_t)decomp->get_bytecode_rev() : 0;
+			CHECK_MESSAGE(result == expected, (ver + (force ? " (forced)" : "")).utf8().get_data());
+		}
+	}
+
+	// the pre-parsed numbers compare the same way `GodotVer` does
+	for (const String &a : versions) {
+		Ref<GodotVer> a_ver = GodotVer::parse(a);
+		GDScriptDecompVersionNumber a_number = GDScriptDecompVersionNumber::from_godot_ver(a_ver);
+		for (const String &b : versions) {
+			Ref<GodotVer> b_ver = GodotVer::parse(b);
+			int expected = a_ver->cmp(b_ver);
+			int result = a_number.cmp(GDScriptDecompVersionNumber::from_godot_ver(b_ver));
+			CHECK_MESSAGE((result > 0) - (result < 0) == (expected > 0) - (expected < 0), (a + " <=> " + b).utf8().get_data());
+		}
+	}
+	for (int i = 0; i < num_decomp_versions; i++) {
+		if (decomp_versions[i].min_version[0] != '\0') {
+			CHECK(decomp_versions[i].min_number.cmp(GDScriptDecompVersionNumber::from_godot_ver(decomp_versions[i].get_min_version())) == 0);
+		}
+		if (decomp_versions[i].has_max_version()) {
+			CHECK(decomp_versions[i].max_number.cmp(GDScriptDecompVersionNumber::from_godot_ver(decomp_versions[i].get_max_version())) == 0);
+		}
+	}
+}
+
+TEST_CASE("[GDSDecomp][Bytecode] Generated discriminators match the revisions they were generated from") {
+	for (int i = 0; i < gdscript_revision_discriminators_count; i++) {
+		const GDScriptRevisionDiscriminators &disc = gdscript_revision_discriminators[i];
+		CHECK(get_revision_discriminators(disc.bytecode_version) == &disc);
+		for (int c = 0; c < disc.candidate_count; c++) {
+			const GDScriptDiscriminatorCandidate &candidate = disc.candidates[c];
+			String sub_case_name = vformat("Testing discriminators for revision %07x", candidate.bytecode_rev);
+			SUBCASE(sub_case_name.utf8().get_data()) {
+				auto decomp = GDScriptDecomp::create_decomp_for_commit(candidate.bytecode_rev);
+				REQUIRE(decomp.is_valid());
+				CHECK(decomp->get_bytecode_version() == disc.bytecode_version);
+				CHECK(decomp->get_function_count() == candidate.func_count);
+
+				for (int token = 0; token <= (int)GDScriptDecomp::TOKEN_MASK; token++) {
+					auto g_token = decomp->get_global_token(token);
+					bool rejected = g_token == GDScriptDecomp::G_TK_MAX || g_token == GDScriptDecomp::G_TK_CURSOR || (g_token == GDScriptDecomp::G_TK_ERROR && disc.bytecode_version < GDScriptDecomp::GDSCRIPT_2_0_VERSION);
+					bool valid = candidate.valid_tokens[token / 64] & (uint64_t(1) << (token % 64));
+					CHECK(valid == !rejected);
+				}
+				for (int f = 0; f < candidate.func_count; f++) {
+					CHECK(decomp->get_function_arg_count(f) == Pair<int, int>(candidate.arities[f].min_args, candidate.arities[f].max_args));
+				}
+
+				const GDScriptCallSignature &sig = disc.call_signatures[candidate.call_signature];
+				CHECK(sig.builtin_func == decomp->get_local_token_val(GDScriptDecomp::G_TK_BUILT_IN_FUNC));
+				CHECK(sig.period == decomp->get_local_token_val(GDScriptDecomp::G_TK_PERIOD));
+				CHECK(sig.pr_function == decomp->get_local_token_val(GDScriptDecomp::G_TK_PR_FUNCTION));
+				CHECK(sig.parenthesis_open == decomp->get_local_token_val(GDScriptDecomp::G_TK_PARENTHESIS_OPEN));
+				CHECK(sig.parenthesis_close == decomp->get_local_token_val(GDScriptDecomp::G_TK_PARENTHESIS_CLOSE));
+				CHECK(sig.bracket_open == decomp->get_local_token_val(GDScriptDecomp::G_TK_BRACKET_OPEN));
+				CHECK(sig.bracket_close == decomp->get_local_token_val(GDScriptDecomp::G_TK_BRACKET_CLOSE));
+				CHECK(sig.curly_bracket_open == decomp->get_local_token_val(GDScriptDecomp::G_TK_CURLY_BRACKET_OPEN));
+				CHECK(sig.curly_bracket_close == decomp->get_local_token_val(GDScriptDecomp::G_TK_CURLY_BRACKET_CLOSE));
+				CHECK(sig.comma == decomp->get_local_token_val(GDScriptDecomp::G_TK_COMMA));
+				CHECK(sig.indent == decomp->get_local_token_val(GDScriptDecomp::G_TK_INDENT));
+				CHECK(sig.dedent == decomp->get_local_token_val(GDScriptDecomp::G_TK_DEDENT));
+				CHECK(sig.newline == decomp->get_local_token_val(GDScriptDecomp::G_TK_NEWLINE));
+				CHECK(sig.cursor == decomp->get_local_token_val(GDScriptDecomp::G_TK_CURSOR));
+			}
+		}
+	}
+}
+
+TEST_CASE("[GDSDecomp][Bytecode] Narrowing and testing candidates agrees with testing them one at a time") {
+	for (int i = 0; tests[i].script != nullptr; i++) {
+		auto &script_to_revision = tests[i];
+		String sub_case_name = vformat("Testing narrowing for script %s, revision %07x", String(script_to_revision.script), script_to_revision.revision);
+		SUBCASE(sub_case_name.utf8().get_data()) {
+			auto helper_script_path = get_gdsdecomp_path().path_join("helpers").path_join(script_to_revision.script) + ".gd";
+			auto helper_script_text = FileAccess::get_file_as_string(helper_script_path);
+			REQUIRE(helper_script_text != "");
+			auto decomp = GDScriptDecomp::create_decomp_for_commit(script_to_revision.revision);
+			REQUIRE(decomp.is_valid());
+			auto bytecode = decomp->compile_code_string(helper_script_text);
+			REQUIRE(bytecode.size() > 0);
+
+			auto candidates = get_decomps_for_bytecode_ver(decomp->get_bytecode_version(), true);
+			auto narrowed = BytecodeTester::narrow_candidates(bytecode, candidates);
+			bool found = false;
+			for (const auto &candidate : narrowed) {
+				found = found || candidate->get_bytecode_rev() == script_to_revision.revision;
+			}
+			CHECK(found);
+			for (const auto &candidate : candidates) {
+				if (!narrowed.has(candidate)) {
+					CHECK(candidate->test_bytecode(bytecode, false) == GDScriptDecomp::BYTECODE_TEST_FAIL);
+				}
+			}
+
+			// testing them all from one parse has to give the same answer as testing them one at a time
+			auto passed = BytecodeTester::test_candidates(bytecode, candidates);
+			for (const auto &candidate : candidates) {
+				bool expected = candidate->test_bytecode(bytecode, false) == GDScriptDecomp::BYTECODE_TEST_UNKNOWN;
+				CHECK(passed.has(candidate) == expected);
+			}
+		}
+	}
+}
+
+static Vector<int> get_revs(const Vector<Ref<GDScriptDecomp>> &p_decomps) {
+	Vector<int> revs;
+	for (const Ref<GDScriptDecomp> &decomp : p_decomps) {
+		revs.push_back(decomp->get_bytecode_rev());
+	}
+	return revs;
+}
+
+// Compiles every helper script that compiles for `p_decomp`'s revision and writes them to the temp dir, so that
+// there's a set of more than one file to test.
+static void write_helper_file_set(const Ref<GDScriptDecomp> &p_decomp, Vector<String> &r_paths, Vector<Vector<uint8_t>> &r_buffers) {
+	String dir = get_tmp_path().path_join(vformat("file_set_%07x", p_decomp->get_bytecode_rev()));
+	REQUIRE(gdre::ensure_dir(dir) == OK);
+	for (int j = 0; tests[j].script != nullptr; j++) {
+		auto helper_script_path = get_gdsdecomp_path().path_join("helpers").path_join(tests[j].script) + ".gd";
+		auto bytecode = p_decomp->compile_code_string(FileAccess::get_file_as_string(helper_script_path));
+		if (bytecode.is_empty()) {
+			continue;
+		}
+		String path = dir.path_join(vformat("%d.gdc", j));
+		Ref<FileAccess> fa = FileAccess::open(path, FileAccess::WRITE);
+		REQUIRE(fa.is_valid());
+		fa->store_buffer(bytecode);
+		fa.unref();
+		r_paths.push_back(path);
+		r_buffers.push_back(bytecode);
+	}
+	REQUIRE(r_paths.size() > 0);
+}
+
+TEST_CASE("[GDSDecomp][Bytecode] Testing a set of files in parallel agrees with testing them one after another") {
+	for (int i = 0; tests[i].script != nullptr; i++) {
+		auto &script_to_revision = tests[i];
+		String sub_case_name = vformat("Testing file set for script %s, revision %07x", String(script_to_revision.script), script_to_revision.revision);
+		SUBCASE(sub_case_name.utf8().get_data()) {
+			auto decomp = GDScriptDecomp::create_decomp_for_commit(script_to_revision.revision);
+			REQUIRE(decomp.is_valid());
+			Vector<String> paths;
+			Vector<Vector<uint8_t>> buffers;
+			write_helper_file_set(decomp, paths, buffers);
+
+			for (bool include_dev : { false, true }) {
+				auto expected = get_decomps_for_bytecode_ver(decomp->get_bytecode_version(), include_dev);
+				for (const auto &buffer : buffers) {
+					if (expected.is_empty()) {
+						break;
+					}
+					expected = BytecodeTester::test_candidates(buffer, expected);
+				}
+				// every call creates its own instances, so compare the revisions
+				auto possible = BytecodeTester::get_possible_decomps(paths, include_dev);
+				CHECK(get_revs(possible) == get_revs(expected));
+			}
+		}
+	}
+}
+
+TEST_CASE("[GDSDecomp][Bytecode] Cached detection results agree with testing every file") {
+	bool was_enabled = BytecodeTestCache::is_enabled();
+	// keep the user's own cache out of this
+	String cache_path = get_tmp_path().path_join("bytecode_test_cache.bin");
+	gdre::ensure_dir(get_tmp_path());
+	BytecodeTestCache::set_cache_path(cache_path);
+	for (int i = 0; tests[i].script != nullptr; i++) {
+		auto &script_to_revision = tests[i];
+		String sub_case_name = vformat("Testing cached file set for script %s, revision %07x", String(script_to_revision.script), script_to_revision.revision);
+		SUBCASE(sub_case_name.utf8().get_data()) {
+			auto decomp = GDScriptDecomp::create_decomp_for_commit(script_to_revision.revision);
+			REQUIRE(decomp.is_valid());
+			Vector<String> paths;
+			Vector<Vector<uint8_t>> buffers;
+			write_helper_file_set(decomp, paths, buffers);
+
+			BytecodeTestCache::set_enabled(true);
+			BytecodeTestCache::clear();
+			for (bool include_dev : { false, true }) {
+				BytecodeTestCache::set_enabled(false);
+				auto expected = BytecodeTester::get_possible_decomps(paths, include_dev);
+				BytecodeTestCache::set_enabled(true);
+				// the first time only tests what the cache doesn't have yet (just the dev revisions, the second time round), the second reads it
+				CHECK(get_revs(BytecodeTester::get_possible_decomps(paths, include_dev)) == get_revs(expected));
+				CHECK(BytecodeTestCache::get_size() > 0);
+				CHECK(BytecodeTestCache::get_size() <= buffers.size());
+				CHECK(get_revs(BytecodeTester::get_possible_decomps(paths, include_dev)) == get_revs(expected));
+			}
+
+			// evicting results only means testing those files again
+			BytecodeTestCache::set_max_entries(1);
+			CHECK(BytecodeTestCache::get_size() <= 1);
+			auto expected = get_decomps_for_bytecode_ver(decomp->get_bytecode_version(), false);
+			for (const auto &buffer : buffers) {
+				expected = BytecodeTester::test_candidates(buffer, expected);
+			}
+			CHECK(get_revs(BytecodeTester::get_possible_decomps(paths, false)) == get_revs(expected));
+			BytecodeTestCache::set_max_entries(BytecodeTestCache::DEFAULT_MAX_ENTRIES);
+
+			// and the results survive being saved and loaded again
+			int size = BytecodeTestCache::get_size();
+			CHECK(BytecodeTestCache::save() == OK);
+			BytecodeTestCache::set_cache_path(cache_path);
+			CHECK(BytecodeTestCache::get_size() == size);
+			CHECK(get_revs(BytecodeTester::get_possible_decomps(paths, false)) == get_revs(expected));
+		}
+	}
+	// drops what this left in memory, so that nothing gets saved over the user's cache
+	BytecodeTestCache::set_cache_path("");
+	BytecodeTestCache::set_enabled(was_enabled);
+}
+
+TEST_CASE("[GDSDecomp][Bytecode] Remapping tokens between revisions keeps their meaning") {
+	for (int i = 0; tests[i].script != nullptr; i++) {
+		auto &script_to_revision = tests[i];
+		String sub_case_name = vformat("Testing remapping for script %s, revision %07x", String(script_to_revision.script), script_to_revision.revision);
+		SUBCASE(sub_case_name.utf8().get_data()) {
+			auto helper_script_path = get_gdsdecomp_path().path_join("helpers").path_join(script_to_revision.script) + ".gd";
+			auto helper_script_text = FileAccess::get_file_as_string(helper_script_path);
+			REQUIRE(helper_script_text != "");
+			auto decomp = GDScriptDecomp::create_decomp_for_commit(script_to_revision.revision);
+			REQUIRE(decomp.is_valid());
+			auto bytecode = decomp->compile_code_string(helper_script_text);
+			REQUIRE(bytecode.size() > 0);
+			GDScriptDecomp::ScriptState state;
+			REQUIRE(decomp->get_script_state(bytecode, state) == OK);
+
+			for (int row = 1; row < num_decomp_versions - 1; row++) {
+				auto target = GDScriptDecomp::get_shared_decomp_for_commit(decomp_versions[row].commit);
+				REQUIRE(target.is_valid());
+				GDScriptRevisionRemap remap;
+				REQUIRE(remap.init(decomp, target) == OK);
+				Vector<uint32_t> remapped;
+				Vector<GDScriptRevisionRemap::Unmapped> unmapped;
+				Error err = remap.remap_tokens(state.tokens, remapped, unmapped);
+				CHECK((err == OK) == unmapped.is_empty());
+				REQUIRE(remapped.size() == state.tokens.size());
+
+				int next_unmapped = 0;
+				for (int t = 0; t < state.tokens.size(); t++) {
+					if (next_unmapped < unmapped.size() && unmapped[next_unmapped].position == t) {
+						CHECK(remapped[t] == state.tokens[t]);
+						next_unmapped++;
+						continue;
+					}
+					auto global = decomp->get_global_token(state.tokens[t]);
+					CHECK_MESSAGE(target->get_global_token(remapped[t]) == global, vformat("Token %d changed when remapping to %07x", t, decomp_versions[row].commit));
+					if (global == GDScriptDecomp::G_TK_BUILT_IN_FUNC) {
+						CHECK(target->get_function_name(remapped[t] >> GDScriptDecomp::TOKEN_BITS) == decomp->get_function_name(state.tokens[t] >> GDScriptDecomp::TOKEN_BITS));
+					}
+				}
+				CHECK(next_unmapped == unmapped.size());
+
+				// a buffer that mapped completely has to map back to the original
+				if (err == OK) {
+					GDScriptRevisionRemap back;
+					REQUIRE(back.init(target, decomp) == OK);
+					Vector<uint32_t> round_trip;
+					CHECK(back.remap_tokens(remapped, round_trip, unmapped) == OK);
+					CHECK(round_trip == state.tokens);
+				}
+			}
+		}
+	}
+}
+
+TEST_CASE("[GDSDecomp][Bytecode] Lookup counters count each revision's lookups") {
+	GDScriptDecomp::reset_lookup_counts();
+	auto decomp = GDScriptDecomp::create_decomp_for_commit(0x5565f55);
+	REQUIRE(decomp.is_valid());
+	for (int i = 0; i < 10; i++) {
+		decomp->get_global_token(i);
+	}
+	decomp->get_local_token_val(GDScriptDecomp::G_TK_IDENTIFIER);
+	decomp->get_function_index("sin");
+	decomp->get_function_name(0);
+
+	Dictionary counts = GDScriptDecomp::get_lookup_counts();
+	CHECK(bool(counts["enabled"]) == GDScriptDecomp::is_lookup_instrumentation_enabled());
+	Dictionary revisions = counts["revisions"];
+	if (!GDScriptDecomp::is_lookup_instrumentation_enabled()) {
+		CHECK(revisions.is_empty());
+		return;
+	}
+	REQUIRE(revisions.has("5565f55"));
+	Dictionary lookups = revisions["5565f55"];
+	CHECK(uint64_t(Dictionary(lookups["get_global_token"])["calls"]) >= 10);
+	CHECK(uint64_t(Dictionary(lookups["get_local_token_val"])["calls"]) >= 1);
+	CHECK(uint64_t(Dictionary(lookups["get_function_index"])["calls"]) >= 1);
+	CHECK(uint64_t(Dictionary(lookups["get_function_name"])["calls"]) >= 1);
+
+	GDScriptDecomp::reset_lookup_counts();
+	revisions = Dictionary(GDScriptDecomp::get_lookup_counts())["revisions"];
+	CHECK(Dictionary(revisions["5565f55"]).is_empty());
+}
+
+// Needs a corpus written by `gdc_corpus.py`; `gdc_benchmark.py` runs this for each revision and corpus size.
+// Run with `GDRE_BENCHMARK_CORPUS=<dir> [GDRE_BENCHMARK_OUTPUT=<file>] --test --test-case="*Generated corpus*" --no-skip`
+TEST_CASE("[GDSDecomp][Bytecode][Benchmark] Generated corpus detection and decompilation" * doctest::skip()) {
+	String corpus_dir = OS::get_singleton()->get_environment("GDRE_BENCHMARK_CORPUS");
+	REQUIRE_MESSAGE(!corpus_dir.is_empty(), "Set GDRE_BENCHMARK_CORPUS to a directory written by gdc_corpus.py");
+	Dictionary manifest = JSON::parse_string(FileAccess::get_file_as_string(corpus_dir.path_join("manifest.json")));
+	REQUIRE(manifest.has("revisions"));
+
+	Array results;
+	Array revisions = manifest["revisions"];
+	for (int i = 0; i < revisions.size(); i++) {
+		Dictionary entry = revisions[i];
+		uint64_t revision = String(entry["revision"]).hex_to_int();
+		Array files = entry["files"];
+		Vector<String> paths;
+		Vector<Vector<uint8_t>> buffers;
+		int64_t total_bytes = 0;
+		int64_t total_tokens = 0;
+		for (int j = 0; j < files.size(); j++) {
+			Dictionary file = files[j];
+			paths.push_back(corpus_dir.path_join(file["path"]));
+			buffers.push_back(FileAccess::get_file_as_bytes(paths[j]));
+			REQUIRE(buffers[j].size() > 0);
+			total_bytes += buffers[j].size();
+			total_tokens += int64_t(file["tokens"]);
+		}
+
+		uint64_t start = OS::get_singleton()->get_ticks_usec();
+		uint64_t detected = BytecodeTester::test_files(paths);
+		uint64_t detection_usec = OS::get_singleton()->get_ticks_usec() - start;
+
+		auto decomp = GDScriptDecomp::create_decomp_for_commit(revision);
+		REQUIRE(decomp.is_valid());
+		int failed = 0;
+		start = OS::get_singleton()->get_ticks_usec();
+		for (const auto &buffer : buffers) {
+			failed += decomp->decompile_buffer(buffer) != OK;
+		}
+		uint64_t decompile_usec = MAX(OS::get_singleton()->get_ticks_usec() - start, (uint64_t)1);
+		CHECK_MESSAGE(failed == 0, vformat("%07x: %d of %d scripts failed to decompile", revision, failed, buffers.size()));
+
+		Dictionary result;
+		result["revision"] = entry["revision"];
+		result["bytecode_version"] = entry["bytecode_version"];
+		result["files"] = buffers.size();
+		result["bytes"] = total_bytes;
+		result["tokens"] = total_tokens;
+		result["detected"] = detected == 0 ? String() : String::num_uint64(detected, 16).lpad(7, "0");
+		result["detection_usec"] = detection_usec;
+		result["decompile_usec"] = decompile_usec;
+		result["decompile_failures"] = failed;
+		result["decompile_mb_per_sec"] = double(total_bytes) / decompile_usec;
+		result["decompile_tokens_per_sec"] = double(total_tokens) * 1000000.0 / decompile_usec;
+		result["static_memory_peak"] = OS::get_singleton()->get_static_memory_peak_usage();
+		results.push_back(result);
+	}
+
+	String json = JSON::stringify(results, "", false);
+	String output_path = OS::get_singleton()->get_environment("GDRE_BENCHMARK_OUTPUT");
+	if (output_path.is_empty()) {
+		print_line(json);
+	} else {
+		Ref<FileAccess> f = FileAccess::open(output_path, FileAccess::WRITE);
+		REQUIRE(f.is_valid());
+		f->store_string(json);
+	}
+}
+
 TEST_CASE("[GDSDecomp][Bytecode][GDScript2.0] Compiling GDScript Tests") {
 	auto cwd = GDRESettings::get_singleton()->get_cwd();
 	String gdscript_tests_path = GDRESettings::get_singleton()->get_cwd().path_join("modules/gdscript/tests/scripts");
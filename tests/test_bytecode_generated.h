@@ -0,0 +1,14561 @@
+// This file is automatically generated by `bytecode_generator.py`
+// Do not edit this file directly, as it will be overwritten.
+// Instead, edit `bytecode_generator.py` and run it to generate this file.
+
+// clang-format off
+#pragma once
+
+#include "../bytecode/bytecode_base.h"
+#include "tests/test_macros.h"
+
+#include "core/math/random_pcg.h"
+#include "core/os/os.h"
+
+namespace TestBytecodeGenerated {
+
+struct RevisionFunctions {
+	uint64_t revision;
+	const char *const *funcs;
+	int func_count;
+};
+
+static const char *const funcs_f3f05dc[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"posmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"is_equal_approx",
+	"is_zero_approx",
+	"ease",
+	"step_decimals",
+	"stepify",
+	"lerp",
+	"lerp_angle",
+	"inverse_lerp",
+	"range_lerp",
+	"smoothstep",
+	"move_toward",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"polar2cartesian",
+	"cartesian2polar",
+	"wrapi",
+	"wrapf",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"ord",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"print_debug",
+	"push_error",
+	"push_warning",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"get_stack",
+	"instance_from_id",
+	"len",
+	"is_instance_valid",
+};
+
+static const char *const funcs_506df14[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"posmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"is_equal_approx",
+	"is_zero_approx",
+	"ease",
+	"step_decimals",
+	"stepify",
+	"lerp",
+	"lerp_angle",
+	"inverse_lerp",
+	"range_lerp",
+	"smoothstep",
+	"move_toward",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"polar2cartesian",
+	"cartesian2polar",
+	"wrapi",
+	"wrapf",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"ord",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"print_debug",
+	"push_error",
+	"push_warning",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"get_stack",
+	"instance_from_id",
+	"len",
+	"is_instance_valid",
+};
+
+static const char *const funcs_a7aad78[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"posmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"is_equal_approx",
+	"is_zero_approx",
+	"ease",
+	"decimals",
+	"step_decimals",
+	"stepify",
+	"lerp",
+	"lerp_angle",
+	"inverse_lerp",
+	"range_lerp",
+	"smoothstep",
+	"move_toward",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"polar2cartesian",
+	"cartesian2polar",
+	"wrapi",
+	"wrapf",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"ord",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"print_debug",
+	"push_error",
+	"push_warning",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"get_stack",
+	"instance_from_id",
+	"len",
+	"is_instance_valid",
+	"deep_equal",
+};
+
+static const char *const funcs_5565f55[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"posmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"is_equal_approx",
+	"is_zero_approx",
+	"ease",
+	"decimals",
+	"step_decimals",
+	"stepify",
+	"lerp",
+	"lerp_angle",
+	"inverse_lerp",
+	"range_lerp",
+	"smoothstep",
+	"move_toward",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"polar2cartesian",
+	"cartesian2polar",
+	"wrapi",
+	"wrapf",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"ord",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"print_debug",
+	"push_error",
+	"push_warning",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"get_stack",
+	"instance_from_id",
+	"len",
+	"is_instance_valid",
+};
+
+static const char *const funcs_6694c11[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"posmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"is_equal_approx",
+	"is_zero_approx",
+	"ease",
+	"decimals",
+	"step_decimals",
+	"stepify",
+	"lerp",
+	"lerp_angle",
+	"inverse_lerp",
+	"range_lerp",
+	"smoothstep",
+	"move_toward",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"polar2cartesian",
+	"cartesian2polar",
+	"wrapi",
+	"wrapf",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"print_debug",
+	"push_error",
+	"push_warning",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"get_stack",
+	"instance_from_id",
+	"len",
+	"is_instance_valid",
+};
+
+static const char *const funcs_a60f242[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"posmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"is_equal_approx",
+	"is_zero_approx",
+	"ease",
+	"decimals",
+	"step_decimals",
+	"stepify",
+	"lerp",
+	"inverse_lerp",
+	"range_lerp",
+	"smoothstep",
+	"move_toward",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"polar2cartesian",
+	"cartesian2polar",
+	"wrapi",
+	"wrapf",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"print_debug",
+	"push_error",
+	"push_warning",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"get_stack",
+	"instance_from_id",
+	"len",
+	"is_instance_valid",
+};
+
+static const char *const funcs_c00427a[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"is_equal_approx",
+	"is_zero_approx",
+	"ease",
+	"decimals",
+	"step_decimals",
+	"stepify",
+	"lerp",
+	"inverse_lerp",
+	"range_lerp",
+	"smoothstep",
+	"move_toward",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"polar2cartesian",
+	"cartesian2polar",
+	"wrapi",
+	"wrapf",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"print_debug",
+	"push_error",
+	"push_warning",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"get_stack",
+	"instance_from_id",
+	"len",
+	"is_instance_valid",
+};
+
+static const char *const funcs_620ec47[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"is_equal_approx",
+	"is_zero_approx",
+	"ease",
+	"decimals",
+	"step_decimals",
+	"stepify",
+	"lerp",
+	"inverse_lerp",
+	"range_lerp",
+	"smoothstep",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"polar2cartesian",
+	"cartesian2polar",
+	"wrapi",
+	"wrapf",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"print_debug",
+	"push_error",
+	"push_warning",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"get_stack",
+	"instance_from_id",
+	"len",
+	"is_instance_valid",
+};
+
+static const char *const funcs_7f7d97f[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"is_equal_approx",
+	"is_zero_approx",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"inverse_lerp",
+	"range_lerp",
+	"smoothstep",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"polar2cartesian",
+	"cartesian2polar",
+	"wrapi",
+	"wrapf",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"print_debug",
+	"push_error",
+	"push_warning",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"get_stack",
+	"instance_from_id",
+	"len",
+	"is_instance_valid",
+};
+
+static const char *const funcs_514a3fb[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"inverse_lerp",
+	"range_lerp",
+	"smoothstep",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"polar2cartesian",
+	"cartesian2polar",
+	"wrapi",
+	"wrapf",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"print_debug",
+	"push_error",
+	"push_warning",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"get_stack",
+	"instance_from_id",
+	"len",
+	"is_instance_valid",
+};
+
+static const char *const funcs_1a36141[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"inverse_lerp",
+	"range_lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"polar2cartesian",
+	"cartesian2polar",
+	"wrapi",
+	"wrapf",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"print_debug",
+	"push_error",
+	"push_warning",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"get_stack",
+	"instance_from_id",
+	"len",
+	"is_instance_valid",
+};
+
+static const char *const funcs_1ca61a3[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"inverse_lerp",
+	"range_lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"polar2cartesian",
+	"cartesian2polar",
+	"wrapi",
+	"wrapf",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"print_debug",
+	"push_error",
+	"push_warning",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"get_stack",
+	"instance_from_id",
+	"len",
+	"is_instance_valid",
+};
+
+static const char *const funcs_d6b31da[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"inverse_lerp",
+	"range_lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"polar2cartesian",
+	"cartesian2polar",
+	"wrapi",
+	"wrapf",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"print_debug",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"get_stack",
+	"instance_from_id",
+	"len",
+	"is_instance_valid",
+};
+
+static const char *const funcs_8aab9a0[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"inverse_lerp",
+	"range_lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"polar2cartesian",
+	"cartesian2polar",
+	"wrapi",
+	"wrapf",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"print_debug",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"get_stack",
+	"instance_from_id",
+	"len",
+	"is_instance_valid",
+};
+
+static const char *const funcs_a3f1ee5[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"inverse_lerp",
+	"range_lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"polar2cartesian",
+	"cartesian2polar",
+	"wrapi",
+	"wrapf",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"print_debug",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"get_stack",
+	"instance_from_id",
+	"len",
+	"is_instance_valid",
+};
+
+static const char *const funcs_8e35d93[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"inverse_lerp",
+	"range_lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"polar2cartesian",
+	"cartesian2polar",
+	"wrapi",
+	"wrapf",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"print_debug",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"get_stack",
+	"instance_from_id",
+	"len",
+	"is_instance_valid",
+};
+
+static const char *const funcs_3ea6d9f[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"inverse_lerp",
+	"range_lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"polar2cartesian",
+	"cartesian2polar",
+	"wrapi",
+	"wrapf",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"print_debug",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"get_stack",
+	"instance_from_id",
+	"len",
+	"is_instance_valid",
+};
+
+static const char *const funcs_a56d6ff[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"inverse_lerp",
+	"range_lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"polar2cartesian",
+	"cartesian2polar",
+	"wrapi",
+	"wrapf",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"get_stack",
+	"instance_from_id",
+	"len",
+	"is_instance_valid",
+};
+
+static const char *const funcs_ff1e7cf[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"inverse_lerp",
+	"range_lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"polar2cartesian",
+	"cartesian2polar",
+	"wrapi",
+	"wrapf",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"instance_from_id",
+	"len",
+	"is_instance_valid",
+};
+
+static const char *const funcs_054a2ac[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"inverse_lerp",
+	"range_lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"polar2cartesian",
+	"cartesian2polar",
+	"wrapi",
+	"wrapf",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"instance_from_id",
+	"len",
+};
+
+static const char *const funcs_91ca725[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"inverse_lerp",
+	"range_lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"wrapi",
+	"wrapf",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"instance_from_id",
+	"len",
+};
+
+static const char *const funcs_216a8aa[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"inverse_lerp",
+	"range_lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"wrapi",
+	"wrapf",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"instance_from_id",
+	"len",
+};
+
+static const char *const funcs_d28da86[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"inverse_lerp",
+	"range_lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"instance_from_id",
+	"len",
+};
+
+static const char *const funcs_c6120e7[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"instance_from_id",
+	"len",
+};
+
+static const char *const funcs_015d36d[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"instance_from_id",
+};
+
+static const char *const funcs_5e938f0[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"instance_from_id",
+};
+
+static const char *const funcs_c24c739[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"instance_from_id",
+};
+
+static const char *const funcs_f8a7c46[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"instance_from_id",
+};
+
+static const char *const funcs_62273e5[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"instance_from_id",
+};
+
+static const char *const funcs_8b912d1[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"instance_from_id",
+};
+
+static const char *const funcs_23381a5[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"instance_from_id",
+};
+
+static const char *const funcs_513c026[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"hash",
+	"Color8",
+	"print_stack",
+	"instance_from_id",
+};
+
+static const char *const funcs_4ee82a2[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"hash",
+	"Color8",
+	"print_stack",
+	"instance_from_id",
+};
+
+static const char *const funcs_1add52b[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"hash",
+	"Color8",
+	"print_stack",
+	"instance_from_id",
+};
+
+static const char *const funcs_ed80f45[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"instance_from_id",
+};
+
+static const char *const funcs_85585c7[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"instance_from_id",
+};
+
+static const char *const funcs_7124599[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"hash",
+	"Color8",
+	"print_stack",
+	"instance_from_id",
+};
+
+static const char *const funcs_23441ec[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"hash",
+	"Color8",
+	"print_stack",
+	"instance_from_id",
+};
+
+static const char *const funcs_6174585[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"hash",
+	"Color8",
+	"print_stack",
+	"instance_from_id",
+};
+
+static const char *const funcs_64872ca[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"hash",
+	"Color8",
+	"print_stack",
+	"instance_from_id",
+};
+
+static const char *const funcs_7d2d144[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"hash",
+	"print_stack",
+	"instance_from_id",
+};
+
+static const char *const funcs_30c1229[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"hash",
+	"print_stack",
+	"instance_from_id",
+};
+
+static const char *const funcs_48f1d02[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"hash",
+	"print_stack",
+	"instance_from_id",
+};
+
+static const char *const funcs_65d48d6[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"hash",
+	"print_stack",
+	"instance_from_id",
+};
+
+static const char *const funcs_be46be7[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"str",
+	"print",
+	"printt",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"hash",
+	"print_stack",
+	"instance_from_id",
+};
+
+static const char *const funcs_97f34a1[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"str",
+	"print",
+	"printt",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"hash",
+	"print_stack",
+	"get_inst",
+};
+
+static const char *const funcs_2185c01[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"str",
+	"print",
+	"printt",
+	"printerr",
+	"printraw",
+	"var2str",
+	"str2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"hash",
+	"print_stack",
+};
+
+static const char *const funcs_e82dc40[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"str",
+	"print",
+	"printt",
+	"printerr",
+	"printraw",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"hash",
+	"print_stack",
+};
+
+static const char *const funcs_8cab401[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"str",
+	"print",
+	"printt",
+	"printerr",
+	"printraw",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"hash",
+	"print_stack",
+};
+
+static const char *const funcs_703004f[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"str",
+	"print",
+	"printt",
+	"printerr",
+	"printraw",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"hash",
+	"print_stack",
+};
+
+static const char *const funcs_31ce3c5[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"str",
+	"print",
+	"printt",
+	"printerr",
+	"printraw",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"print_stack",
+};
+
+static const char *const funcs_8c1731b[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"convert",
+	"typeof",
+	"str",
+	"print",
+	"printt",
+	"printerr",
+	"printraw",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"print_stack",
+};
+
+static const char *const funcs_0b806ee[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"ease",
+	"decimals",
+	"stepify",
+	"lerp",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"convert",
+	"typeof",
+	"str",
+	"print",
+	"printt",
+	"printerr",
+	"printraw",
+	"range",
+	"inst2dict",
+	"dict2inst",
+	"print_stack",
+};
+
+static const RevisionFunctions revision_functions[] = {
+	{ 0x77af6ca, nullptr, 0 },
+	{ 0xf3f05dc, funcs_f3f05dc, 89 },
+	{ 0x506df14, funcs_506df14, 89 },
+	{ 0xa7aad78, funcs_a7aad78, 91 },
+	{ 0x5565f55, funcs_5565f55, 90 },
+	{ 0x6694c11, funcs_6694c11, 89 },
+	{ 0xa60f242, funcs_a60f242, 88 },
+	{ 0xc00427a, funcs_c00427a, 87 },
+	{ 0x620ec47, funcs_620ec47, 86 },
+	{ 0x7f7d97f, funcs_7f7d97f, 85 },
+	{ 0x514a3fb, funcs_514a3fb, 83 },
+	{ 0x1a36141, funcs_1a36141, 82 },
+	{ 0x1ca61a3, funcs_1ca61a3, 82 },
+	{ 0xd6b31da, funcs_d6b31da, 80 },
+	{ 0x8aab9a0, funcs_8aab9a0, 80 },
+	{ 0xa3f1ee5, funcs_a3f1ee5, 80 },
+	{ 0x8e35d93, funcs_8e35d93, 80 },
+	{ 0x3ea6d9f, funcs_3ea6d9f, 80 },
+	{ 0xa56d6ff, funcs_a56d6ff, 79 },
+	{ 0xff1e7cf, funcs_ff1e7cf, 78 },
+	{ 0x054a2ac, funcs_054a2ac, 77 },
+	{ 0x91ca725, funcs_91ca725, 75 },
+	{ 0x216a8aa, funcs_216a8aa, 75 },
+	{ 0xd28da86, funcs_d28da86, 73 },
+	{ 0xc6120e7, funcs_c6120e7, 71 },
+	{ 0x015d36d, funcs_015d36d, 70 },
+	{ 0x5e938f0, funcs_5e938f0, 70 },
+	{ 0xc24c739, funcs_c24c739, 70 },
+	{ 0xf8a7c46, funcs_f8a7c46, 70 },
+	{ 0x62273e5, funcs_62273e5, 70 },
+	{ 0x8b912d1, funcs_8b912d1, 67 },
+	{ 0x23381a5, funcs_23381a5, 67 },
+	{ 0x513c026, funcs_513c026, 66 },
+	{ 0x4ee82a2, funcs_4ee82a2, 65 },
+	{ 0x1add52b, funcs_1add52b, 65 },
+	{ 0xed80f45, funcs_ed80f45, 66 },
+	{ 0x85585c7, funcs_85585c7, 66 },
+	{ 0x7124599, funcs_7124599, 65 },
+	{ 0x23441ec, funcs_23441ec, 64 },
+	{ 0x6174585, funcs_6174585, 62 },
+	{ 0x64872ca, funcs_64872ca, 62 },
+	{ 0x7d2d144, funcs_7d2d144, 61 },
+	{ 0x30c1229, funcs_30c1229, 61 },
+	{ 0x48f1d02, funcs_48f1d02, 61 },
+	{ 0x65d48d6, funcs_65d48d6, 61 },
+	{ 0xbe46be7, funcs_be46be7, 60 },
+	{ 0x97f34a1, funcs_97f34a1, 60 },
+	{ 0x2185c01, funcs_2185c01, 58 },
+	{ 0xe82dc40, funcs_e82dc40, 56 },
+	{ 0x8cab401, funcs_8cab401, 56 },
+	{ 0x703004f, funcs_703004f, 56 },
+	{ 0x31ce3c5, funcs_31ce3c5, 55 },
+	{ 0x8c1731b, funcs_8c1731b, 54 },
+	{ 0x0b806ee, funcs_0b806ee, 53 },
+	{ 0, nullptr, 0 },
+};
+
+// Every function name in any revision, so that we also look up names that a revision doesn't have.
+static const char *const all_function_names[] = {
+	"sin",
+	"cos",
+	"tan",
+	"sinh",
+	"cosh",
+	"tanh",
+	"asin",
+	"acos",
+	"atan",
+	"atan2",
+	"sqrt",
+	"fmod",
+	"fposmod",
+	"posmod",
+	"floor",
+	"ceil",
+	"round",
+	"abs",
+	"sign",
+	"pow",
+	"log",
+	"exp",
+	"is_nan",
+	"is_inf",
+	"is_equal_approx",
+	"is_zero_approx",
+	"ease",
+	"step_decimals",
+	"stepify",
+	"lerp",
+	"lerp_angle",
+	"inverse_lerp",
+	"range_lerp",
+	"smoothstep",
+	"move_toward",
+	"dectime",
+	"randomize",
+	"randi",
+	"randf",
+	"rand_range",
+	"seed",
+	"rand_seed",
+	"deg2rad",
+	"rad2deg",
+	"linear2db",
+	"db2linear",
+	"polar2cartesian",
+	"cartesian2polar",
+	"wrapi",
+	"wrapf",
+	"max",
+	"min",
+	"clamp",
+	"nearest_po2",
+	"weakref",
+	"funcref",
+	"convert",
+	"typeof",
+	"type_exists",
+	"char",
+	"ord",
+	"str",
+	"print",
+	"printt",
+	"prints",
+	"printerr",
+	"printraw",
+	"print_debug",
+	"push_error",
+	"push_warning",
+	"var2str",
+	"str2var",
+	"var2bytes",
+	"bytes2var",
+	"range",
+	"load",
+	"inst2dict",
+	"dict2inst",
+	"validate_json",
+	"parse_json",
+	"to_json",
+	"hash",
+	"Color8",
+	"ColorN",
+	"print_stack",
+	"get_stack",
+	"instance_from_id",
+	"len",
+	"is_instance_valid",
+	"decimals",
+	"deep_equal",
+	"get_inst",
+	"",
+	"not_a_builtin_function",
+};
+
+// The linear scan that `get_function_index` used to do.
+inline int linear_function_index(const RevisionFunctions &p_rev, const String &p_func) {
+	for (int i = 0; i < p_rev.func_count; i++) {
+		if (p_func == p_rev.funcs[i]) {
+			return i;
+		}
+	}
+	return -1;
+}
+
+TEST_CASE("[GDSDecomp][Bytecode] get_function_index matches a linear scan for every revision") {
+	for (int i = 0; revision_functions[i].revision != 0; i++) {
+		const RevisionFunctions &rev = revision_functions[i];
+		String sub_case_name = vformat("Testing function lookup for revision %07x", rev.revision);
+		SUBCASE(sub_case_name.utf8().get_data()) {
+			auto decomp = GDScriptDecomp::create_decomp_for_commit(rev.revision);
+			REQUIRE(decomp.is_valid());
+			CHECK(decomp->get_function_count() == rev.func_count);
+			for (int j = 0; j < rev.func_count; j++) {
+				CHECK(decomp->get_function_name(j) == rev.funcs[j]);
+			}
+			for (const char *func_name : all_function_names) {
+				CHECK(decomp->get_function_index(func_name) == linear_function_index(rev, func_name));
+			}
+		}
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_77af6ca(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_ANNOTATION;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_AMPERSAND_AMPERSAND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_PIPE_PIPE;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_BANG;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_STAR_STAR;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_STAR_STAR_EQUAL;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_CF_WHEN;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_AS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_AWAIT;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_IS;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_NAMESPACE;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_SUPER;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_TRAIT;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PR_VOID;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_PERIOD_PERIOD;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_UNDERSCORE;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_INDENT;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_DEDENT;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 91: return GDScriptDecomp::GlobalToken::G_TK_CONST_TAU;
+		case 92: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 93: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 94: return GDScriptDecomp::GlobalToken::G_TK_VCS_CONFLICT_MARKER;
+		case 95: return GDScriptDecomp::GlobalToken::G_TK_BACKTICK;
+		case 96: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 97: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 98: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_77af6ca(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_ANNOTATION: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_AMPERSAND_AMPERSAND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_PIPE_PIPE: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_BANG: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_STAR_STAR: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_STAR_STAR_EQUAL: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHEN: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_AS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_AWAIT: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_IS: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_NAMESPACE: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SUPER: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TRAIT: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VOID: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD_PERIOD: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_UNDERSCORE: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_INDENT: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_DEDENT: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_TAU: return 91;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 92;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 93;
+		case GDScriptDecomp::GlobalToken::G_TK_VCS_CONFLICT_MARKER: return 94;
+		case GDScriptDecomp::GlobalToken::G_TK_BACKTICK: return 95;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 96;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 97;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 98;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 99;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_f3f05dc(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_IS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_AS;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_VOID;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_PUPPET;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_PR_PUPPETSYNC;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_CONST_TAU;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 91: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 92: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 93: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 94: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 95: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_f3f05dc(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_IS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_AS: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VOID: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PUPPET: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PUPPETSYNC: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_TAU: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 91;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 92;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 93;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 94;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 95;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 96;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_506df14(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_IS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_AS;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_VOID;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_PR_PUPPET;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_PR_PUPPETSYNC;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 91: return GDScriptDecomp::GlobalToken::G_TK_CONST_TAU;
+		case 92: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 93: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 94: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 95: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 96: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 97: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_506df14(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_IS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_AS: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VOID: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PUPPET: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PUPPETSYNC: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_TAU: return 91;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 92;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 93;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 94;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 95;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 96;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 97;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 98;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_a7aad78(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_IS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_AS;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_VOID;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_PR_PUPPET;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_PR_PUPPETSYNC;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 91: return GDScriptDecomp::GlobalToken::G_TK_CONST_TAU;
+		case 92: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 93: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 94: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 95: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 96: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 97: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_a7aad78(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_IS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_AS: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VOID: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PUPPET: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PUPPETSYNC: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_TAU: return 91;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 92;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 93;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 94;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 95;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 96;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 97;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 98;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_5565f55(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_IS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_AS;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_VOID;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_PR_PUPPET;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_PR_PUPPETSYNC;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 91: return GDScriptDecomp::GlobalToken::G_TK_CONST_TAU;
+		case 92: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 93: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 94: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 95: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 96: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 97: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_5565f55(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_IS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_AS: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VOID: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PUPPET: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PUPPETSYNC: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_TAU: return 91;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 92;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 93;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 94;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 95;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 96;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 97;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 98;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_6694c11(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_IS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_AS;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_VOID;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_PR_PUPPET;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_PR_PUPPETSYNC;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 91: return GDScriptDecomp::GlobalToken::G_TK_CONST_TAU;
+		case 92: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 93: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 94: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 95: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 96: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 97: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_6694c11(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_IS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_AS: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VOID: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PUPPET: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PUPPETSYNC: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_TAU: return 91;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 92;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 93;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 94;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 95;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 96;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 97;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 98;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_a60f242(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_IS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_AS;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_VOID;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_PR_PUPPET;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_PR_PUPPETSYNC;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 91: return GDScriptDecomp::GlobalToken::G_TK_CONST_TAU;
+		case 92: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 93: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 94: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 95: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 96: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 97: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_a60f242(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_IS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_AS: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VOID: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PUPPET: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PUPPETSYNC: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_TAU: return 91;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 92;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 93;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 94;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 95;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 96;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 97;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 98;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_c00427a(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_IS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_AS;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_VOID;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_PR_PUPPET;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_PR_PUPPETSYNC;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 91: return GDScriptDecomp::GlobalToken::G_TK_CONST_TAU;
+		case 92: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 93: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 94: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 95: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 96: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 97: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_c00427a(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_IS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_AS: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VOID: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PUPPET: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PUPPETSYNC: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_TAU: return 91;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 92;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 93;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 94;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 95;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 96;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 97;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 98;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_620ec47(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_IS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_AS;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_VOID;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_PR_PUPPET;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_PR_PUPPETSYNC;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 91: return GDScriptDecomp::GlobalToken::G_TK_CONST_TAU;
+		case 92: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 93: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 94: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 95: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 96: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 97: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_620ec47(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_IS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_AS: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VOID: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PUPPET: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PUPPETSYNC: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_TAU: return 91;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 92;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 93;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 94;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 95;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 96;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 97;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 98;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_7f7d97f(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_IS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_AS;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_VOID;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_PR_PUPPET;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_PR_PUPPETSYNC;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 91: return GDScriptDecomp::GlobalToken::G_TK_CONST_TAU;
+		case 92: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 93: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 94: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 95: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 96: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 97: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_7f7d97f(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_IS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_AS: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VOID: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PUPPET: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PUPPETSYNC: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_TAU: return 91;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 92;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 93;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 94;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 95;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 96;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 97;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 98;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_514a3fb(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_IS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_AS;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_VOID;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_PR_PUPPET;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_PR_PUPPETSYNC;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 91: return GDScriptDecomp::GlobalToken::G_TK_CONST_TAU;
+		case 92: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 93: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 94: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 95: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 96: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 97: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_514a3fb(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_IS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_AS: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VOID: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PUPPET: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PUPPETSYNC: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_TAU: return 91;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 92;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 93;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 94;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 95;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 96;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 97;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 98;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_1a36141(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_IS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_AS;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_VOID;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_PR_PUPPET;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_PR_PUPPETSYNC;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 91: return GDScriptDecomp::GlobalToken::G_TK_CONST_TAU;
+		case 92: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 93: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 94: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 95: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 96: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 97: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_1a36141(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_IS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_AS: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VOID: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PUPPET: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PUPPETSYNC: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_TAU: return 91;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 92;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 93;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 94;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 95;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 96;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 97;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 98;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_1ca61a3(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_IS;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_AS;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_VOID;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_PR_PUPPET;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_PR_PUPPETSYNC;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 91: return GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW;
+		case 92: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 93: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 94: return GDScriptDecomp::GlobalToken::G_TK_CONST_TAU;
+		case 95: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 96: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 97: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 98: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 99: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 100: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_1ca61a3(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_IS: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_AS: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VOID: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PUPPET: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PUPPETSYNC: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW: return 91;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 92;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 93;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_TAU: return 94;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 95;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 96;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 97;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 98;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 99;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 100;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 101;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_d6b31da(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_IS;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_AS;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_VOID;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_PR_PUPPET;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_PR_PUPPETSYNC;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 91: return GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW;
+		case 92: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 93: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 94: return GDScriptDecomp::GlobalToken::G_TK_CONST_TAU;
+		case 95: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 96: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 97: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 98: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 99: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 100: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_d6b31da(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_IS: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_AS: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VOID: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PUPPET: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PUPPETSYNC: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW: return 91;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 92;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 93;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_TAU: return 94;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 95;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 96;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 97;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 98;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 99;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 100;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 101;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_8aab9a0(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_IS;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_AS;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_VOID;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVESYNC;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW;
+		case 91: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 92: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 93: return GDScriptDecomp::GlobalToken::G_TK_CONST_TAU;
+		case 94: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 95: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 96: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 97: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 98: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 99: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_8aab9a0(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_IS: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_AS: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VOID: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVESYNC: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_FORWARD_ARROW: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 91;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 92;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_TAU: return 93;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 94;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 95;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 96;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 97;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 98;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 99;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 100;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_a3f1ee5(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_IS;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVESYNC;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_CONST_TAU;
+		case 91: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 92: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 93: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 94: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 95: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 96: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_a3f1ee5(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS_NAME: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_IS: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVESYNC: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_TAU: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 91;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 92;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 93;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 94;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 95;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 96;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 97;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_8e35d93(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_IS;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVESYNC;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_CONST_TAU;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 91: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 92: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 93: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 94: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 95: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_8e35d93(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_IS: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTESYNC: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTERSYNC: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVESYNC: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_TAU: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 91;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 92;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 93;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 94;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 95;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 96;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_3ea6d9f(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_IS;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_CONST_TAU;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 91: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 92: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_3ea6d9f(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_IS: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_TAU: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 91;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 92;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 93;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_a56d6ff(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_IS;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_CONST_TAU;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 91: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 92: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_a56d6ff(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_IS: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_TAU: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 91;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 92;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 93;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_ff1e7cf(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_IS;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_CONST_TAU;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 91: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 92: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_ff1e7cf(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_IS: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_TAU: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 91;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 92;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 93;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_054a2ac(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_IS;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_CONST_TAU;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 91: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 92: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_054a2ac(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_IS: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_TAU: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 91;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 92;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 93;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_91ca725(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_IS;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_CONST_TAU;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 91: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 92: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_91ca725(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_IS: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_TAU: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 91;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 92;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 93;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_216a8aa(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_IS;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 91: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_216a8aa(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_IS: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 91;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 92;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_d28da86(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_IS;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 91: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_d28da86(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_IS: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 91;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 92;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_c6120e7(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_IS;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 91: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_c6120e7(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_IS: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 91;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 92;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_015d36d(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_IS;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 91: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_015d36d(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_IS: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 91;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 92;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_5e938f0(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_CONST_INF;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_CONST_NAN;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 89: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 90: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_5e938f0(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_INF: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_NAN: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 89;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 90;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 91;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_c24c739(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_WILDCARD;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 88: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_c24c739(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_WILDCARD: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 88;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 89;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_f8a7c46(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_CF_MATCH;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 87: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_f8a7c46(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_MATCH: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 87;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 88;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_62273e5(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_62273e5(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 87;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_8b912d1(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_DOLLAR;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 86: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_8b912d1(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_DOLLAR: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 86;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 87;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_23381a5(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_23381a5(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 86;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_513c026(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_513c026(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 86;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_4ee82a2(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 85: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_4ee82a2(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 85;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 86;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_1add52b(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PR_SYNC;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PR_MASTER;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 82: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 83: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 84: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_1add52b(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_REMOTE: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SYNC: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_MASTER: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SLAVE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 82;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 83;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 84;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 85;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_ed80f45(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_ENUM;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 81: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_ed80f45(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ENUM: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 81;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 82;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_85585c7(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_85585c7(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 81;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_7124599(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_7124599(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 81;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_23441ec(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_23441ec(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 81;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_6174585(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_CONST_PI;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 80: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_6174585(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_CONST_PI: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 80;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 81;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_64872ca(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_64872ca(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 80;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_7d2d144(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 79: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_7d2d144(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_BREAKPOINT: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 79;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 80;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_30c1229(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 78: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_30c1229(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ONREADY: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 78;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 79;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_48f1d02(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 77: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_48f1d02(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SIGNAL: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 77;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 78;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_65d48d6(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_65d48d6(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 77;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_be46be7(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_be46be7(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 77;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_97f34a1(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_97f34a1(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 77;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_2185c01(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		case 76: return GDScriptDecomp::GlobalToken::G_TK_CURSOR;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_2185c01(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_CURSOR: return 76;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 77;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_e82dc40(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_SETGET;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 75: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_e82dc40(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_SETGET: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 75;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 76;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_8cab401(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_PR_YIELD;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 74: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_8cab401(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_YIELD: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 74;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 75;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_703004f(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_703004f(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 74;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_31ce3c5(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_31ce3c5(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 74;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_8c1731b(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_8c1731b(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 74;
+		default: return -1;
+	}
+}
+
+inline GDScriptDecomp::GlobalToken legacy_get_global_token_0b806ee(int p_token) {
+	p_token = p_token & GDScriptDecomp::TOKEN_MASK;
+	switch(p_token) {
+		case 0: return GDScriptDecomp::GlobalToken::G_TK_EMPTY;
+		case 1: return GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER;
+		case 2: return GDScriptDecomp::GlobalToken::G_TK_CONSTANT;
+		case 3: return GDScriptDecomp::GlobalToken::G_TK_SELF;
+		case 4: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE;
+		case 5: return GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC;
+		case 6: return GDScriptDecomp::GlobalToken::G_TK_OP_IN;
+		case 7: return GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL;
+		case 8: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL;
+		case 9: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS;
+		case 10: return GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL;
+		case 11: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER;
+		case 12: return GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL;
+		case 13: return GDScriptDecomp::GlobalToken::G_TK_OP_AND;
+		case 14: return GDScriptDecomp::GlobalToken::G_TK_OP_OR;
+		case 15: return GDScriptDecomp::GlobalToken::G_TK_OP_NOT;
+		case 16: return GDScriptDecomp::GlobalToken::G_TK_OP_ADD;
+		case 17: return GDScriptDecomp::GlobalToken::G_TK_OP_SUB;
+		case 18: return GDScriptDecomp::GlobalToken::G_TK_OP_MUL;
+		case 19: return GDScriptDecomp::GlobalToken::G_TK_OP_DIV;
+		case 20: return GDScriptDecomp::GlobalToken::G_TK_OP_MOD;
+		case 21: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT;
+		case 22: return GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT;
+		case 23: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN;
+		case 24: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD;
+		case 25: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB;
+		case 26: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL;
+		case 27: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV;
+		case 28: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD;
+		case 29: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT;
+		case 30: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT;
+		case 31: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND;
+		case 32: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR;
+		case 33: return GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR;
+		case 34: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND;
+		case 35: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR;
+		case 36: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR;
+		case 37: return GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT;
+		case 38: return GDScriptDecomp::GlobalToken::G_TK_CF_IF;
+		case 39: return GDScriptDecomp::GlobalToken::G_TK_CF_ELIF;
+		case 40: return GDScriptDecomp::GlobalToken::G_TK_CF_ELSE;
+		case 41: return GDScriptDecomp::GlobalToken::G_TK_CF_FOR;
+		case 42: return GDScriptDecomp::GlobalToken::G_TK_CF_DO;
+		case 43: return GDScriptDecomp::GlobalToken::G_TK_CF_WHILE;
+		case 44: return GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH;
+		case 45: return GDScriptDecomp::GlobalToken::G_TK_CF_CASE;
+		case 46: return GDScriptDecomp::GlobalToken::G_TK_CF_BREAK;
+		case 47: return GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE;
+		case 48: return GDScriptDecomp::GlobalToken::G_TK_CF_PASS;
+		case 49: return GDScriptDecomp::GlobalToken::G_TK_CF_RETURN;
+		case 50: return GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION;
+		case 51: return GDScriptDecomp::GlobalToken::G_TK_PR_CLASS;
+		case 52: return GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS;
+		case 53: return GDScriptDecomp::GlobalToken::G_TK_PR_TOOL;
+		case 54: return GDScriptDecomp::GlobalToken::G_TK_PR_STATIC;
+		case 55: return GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT;
+		case 56: return GDScriptDecomp::GlobalToken::G_TK_PR_CONST;
+		case 57: return GDScriptDecomp::GlobalToken::G_TK_PR_VAR;
+		case 58: return GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD;
+		case 59: return GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT;
+		case 60: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN;
+		case 61: return GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE;
+		case 62: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN;
+		case 63: return GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE;
+		case 64: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN;
+		case 65: return GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE;
+		case 66: return GDScriptDecomp::GlobalToken::G_TK_COMMA;
+		case 67: return GDScriptDecomp::GlobalToken::G_TK_SEMICOLON;
+		case 68: return GDScriptDecomp::GlobalToken::G_TK_PERIOD;
+		case 69: return GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK;
+		case 70: return GDScriptDecomp::GlobalToken::G_TK_COLON;
+		case 71: return GDScriptDecomp::GlobalToken::G_TK_NEWLINE;
+		case 72: return GDScriptDecomp::GlobalToken::G_TK_ERROR;
+		case 73: return GDScriptDecomp::GlobalToken::G_TK_EOF;
+		default: return GDScriptDecomp::GlobalToken::G_TK_MAX;
+	}
+}
+
+inline int legacy_get_local_token_val_0b806ee(GDScriptDecomp::GlobalToken p_token) {
+	switch(p_token) {
+		case GDScriptDecomp::GlobalToken::G_TK_EMPTY: return 0;
+		case GDScriptDecomp::GlobalToken::G_TK_IDENTIFIER: return 1;
+		case GDScriptDecomp::GlobalToken::G_TK_CONSTANT: return 2;
+		case GDScriptDecomp::GlobalToken::G_TK_SELF: return 3;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_TYPE: return 4;
+		case GDScriptDecomp::GlobalToken::G_TK_BUILT_IN_FUNC: return 5;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_IN: return 6;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_EQUAL: return 7;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT_EQUAL: return 8;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS: return 9;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_LESS_EQUAL: return 10;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER: return 11;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_GREATER_EQUAL: return 12;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_AND: return 13;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_OR: return 14;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_NOT: return 15;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ADD: return 16;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SUB: return 17;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MUL: return 18;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_DIV: return 19;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_MOD: return 20;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_LEFT: return 21;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_SHIFT_RIGHT: return 22;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN: return 23;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_ADD: return 24;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SUB: return 25;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MUL: return 26;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_DIV: return 27;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_MOD: return 28;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_LEFT: return 29;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_SHIFT_RIGHT: return 30;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_AND: return 31;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_OR: return 32;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_ASSIGN_BIT_XOR: return 33;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_AND: return 34;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_OR: return 35;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_XOR: return 36;
+		case GDScriptDecomp::GlobalToken::G_TK_OP_BIT_INVERT: return 37;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_IF: return 38;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELIF: return 39;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_ELSE: return 40;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_FOR: return 41;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_DO: return 42;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_WHILE: return 43;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_SWITCH: return 44;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CASE: return 45;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_BREAK: return 46;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_CONTINUE: return 47;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_PASS: return 48;
+		case GDScriptDecomp::GlobalToken::G_TK_CF_RETURN: return 49;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_FUNCTION: return 50;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CLASS: return 51;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXTENDS: return 52;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_TOOL: return 53;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_STATIC: return 54;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_EXPORT: return 55;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_CONST: return 56;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_VAR: return 57;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_PRELOAD: return 58;
+		case GDScriptDecomp::GlobalToken::G_TK_PR_ASSERT: return 59;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_OPEN: return 60;
+		case GDScriptDecomp::GlobalToken::G_TK_BRACKET_CLOSE: return 61;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_OPEN: return 62;
+		case GDScriptDecomp::GlobalToken::G_TK_CURLY_BRACKET_CLOSE: return 63;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_OPEN: return 64;
+		case GDScriptDecomp::GlobalToken::G_TK_PARENTHESIS_CLOSE: return 65;
+		case GDScriptDecomp::GlobalToken::G_TK_COMMA: return 66;
+		case GDScriptDecomp::GlobalToken::G_TK_SEMICOLON: return 67;
+		case GDScriptDecomp::GlobalToken::G_TK_PERIOD: return 68;
+		case GDScriptDecomp::GlobalToken::G_TK_QUESTION_MARK: return 69;
+		case GDScriptDecomp::GlobalToken::G_TK_COLON: return 70;
+		case GDScriptDecomp::GlobalToken::G_TK_NEWLINE: return 71;
+		case GDScriptDecomp::GlobalToken::G_TK_ERROR: return 72;
+		case GDScriptDecomp::GlobalToken::G_TK_EOF: return 73;
+		case GDScriptDecomp::GlobalToken::G_TK_MAX: return 74;
+		default: return -1;
+	}
+}
+
+struct RevisionTokens {
+	uint64_t revision;
+	GDScriptDecomp::GlobalToken (*get_global_token)(int);
+	int (*get_local_token_val)(GDScriptDecomp::GlobalToken);
+};
+
+static const RevisionTokens revision_tokens[] = {
+	{ 0x77af6ca, legacy_get_global_token_77af6ca, legacy_get_local_token_val_77af6ca },
+	{ 0xf3f05dc, legacy_get_global_token_f3f05dc, legacy_get_local_token_val_f3f05dc },
+	{ 0x506df14, legacy_get_global_token_506df14, legacy_get_local_token_val_506df14 },
+	{ 0xa7aad78, legacy_get_global_token_a7aad78, legacy_get_local_token_val_a7aad78 },
+	{ 0x5565f55, legacy_get_global_token_5565f55, legacy_get_local_token_val_5565f55 },
+	{ 0x6694c11, legacy_get_global_token_6694c11, legacy_get_local_token_val_6694c11 },
+	{ 0xa60f242, legacy_get_global_token_a60f242, legacy_get_local_token_val_a60f242 },
+	{ 0xc00427a, legacy_get_global_token_c00427a, legacy_get_local_token_val_c00427a },
+	{ 0x620ec47, legacy_get_global_token_620ec47, legacy_get_local_token_val_620ec47 },
+	{ 0x7f7d97f, legacy_get_global_token_7f7d97f, legacy_get_local_token_val_7f7d97f },
+	{ 0x514a3fb, legacy_get_global_token_514a3fb, legacy_get_local_token_val_514a3fb },
+	{ 0x1a36141, legacy_get_global_token_1a36141, legacy_get_local_token_val_1a36141 },
+	{ 0x1ca61a3, legacy_get_global_token_1ca61a3, legacy_get_local_token_val_1ca61a3 },
+	{ 0xd6b31da, legacy_get_global_token_d6b31da, legacy_get_local_token_val_d6b31da },
+	{ 0x8aab9a0, legacy_get_global_token_8aab9a0, legacy_get_local_token_val_8aab9a0 },
+	{ 0xa3f1ee5, legacy_get_global_token_a3f1ee5, legacy_get_local_token_val_a3f1ee5 },
+	{ 0x8e35d93, legacy_get_global_token_8e35d93, legacy_get_local_token_val_8e35d93 },
+	{ 0x3ea6d9f, legacy_get_global_token_3ea6d9f, legacy_get_local_token_val_3ea6d9f },
+	{ 0xa56d6ff, legacy_get_global_token_a56d6ff, legacy_get_local_token_val_a56d6ff },
+	{ 0xff1e7cf, legacy_get_global_token_ff1e7cf, legacy_get_local_token_val_ff1e7cf },
+	{ 0x054a2ac, legacy_get_global_token_054a2ac, legacy_get_local_token_val_054a2ac },
+	{ 0x91ca725, legacy_get_global_token_91ca725, legacy_get_local_token_val_91ca725 },
+	{ 0x216a8aa, legacy_get_global_token_216a8aa, legacy_get_local_token_val_216a8aa },
+	{ 0xd28da86, legacy_get_global_token_d28da86, legacy_get_local_token_val_d28da86 },
+	{ 0xc6120e7, legacy_get_global_token_c6120e7, legacy_get_local_token_val_c6120e7 },
+	{ 0x015d36d, legacy_get_global_token_015d36d, legacy_get_local_token_val_015d36d },
+	{ 0x5e938f0, legacy_get_global_token_5e938f0, legacy_get_local_token_val_5e938f0 },
+	{ 0xc24c739, legacy_get_global_token_c24c739, legacy_get_local_token_val_c24c739 },
+	{ 0xf8a7c46, legacy_get_global_token_f8a7c46, legacy_get_local_token_val_f8a7c46 },
+	{ 0x62273e5, legacy_get_global_token_62273e5, legacy_get_local_token_val_62273e5 },
+	{ 0x8b912d1, legacy_get_global_token_8b912d1, legacy_get_local_token_val_8b912d1 },
+	{ 0x23381a5, legacy_get_global_token_23381a5, legacy_get_local_token_val_23381a5 },
+	{ 0x513c026, legacy_get_global_token_513c026, legacy_get_local_token_val_513c026 },
+	{ 0x4ee82a2, legacy_get_global_token_4ee82a2, legacy_get_local_token_val_4ee82a2 },
+	{ 0x1add52b, legacy_get_global_token_1add52b, legacy_get_local_token_val_1add52b },
+	{ 0xed80f45, legacy_get_global_token_ed80f45, legacy_get_local_token_val_ed80f45 },
+	{ 0x85585c7, legacy_get_global_token_85585c7, legacy_get_local_token_val_85585c7 },
+	{ 0x7124599, legacy_get_global_token_7124599, legacy_get_local_token_val_7124599 },
+	{ 0x23441ec, legacy_get_global_token_23441ec, legacy_get_local_token_val_23441ec },
+	{ 0x6174585, legacy_get_global_token_6174585, legacy_get_local_token_val_6174585 },
+	{ 0x64872ca, legacy_get_global_token_64872ca, legacy_get_local_token_val_64872ca },
+	{ 0x7d2d144, legacy_get_global_token_7d2d144, legacy_get_local_token_val_7d2d144 },
+	{ 0x30c1229, legacy_get_global_token_30c1229, legacy_get_local_token_val_30c1229 },
+	{ 0x48f1d02, legacy_get_global_token_48f1d02, legacy_get_local_token_val_48f1d02 },
+	{ 0x65d48d6, legacy_get_global_token_65d48d6, legacy_get_local_token_val_65d48d6 },
+	{ 0xbe46be7, legacy_get_global_token_be46be7, legacy_get_local_token_val_be46be7 },
+	{ 0x97f34a1, legacy_get_global_token_97f34a1, legacy_get_local_token_val_97f34a1 },
+	{ 0x2185c01, legacy_get_global_token_2185c01, legacy_get_local_token_val_2185c01 },
+	{ 0xe82dc40, legacy_get_global_token_e82dc40, legacy_get_local_token_val_e82dc40 },
+	{ 0x8cab401, legacy_get_global_token_8cab401, legacy_get_local_token_val_8cab401 },
+	{ 0x703004f, legacy_get_global_token_703004f, legacy_get_local_token_val_703004f },
+	{ 0x31ce3c5, legacy_get_global_token_31ce3c5, legacy_get_local_token_val_31ce3c5 },
+	{ 0x8c1731b, legacy_get_global_token_8c1731b, legacy_get_local_token_val_8c1731b },
+	{ 0x0b806ee, legacy_get_global_token_0b806ee, legacy_get_local_token_val_0b806ee },
+	{ 0, nullptr, nullptr },
+};
+
+TEST_CASE("[GDSDecomp][Bytecode] Token translation tables match the legacy switch statements for every revision") {
+	for (int i = 0; revision_tokens[i].revision != 0; i++) {
+		const RevisionTokens &rev = revision_tokens[i];
+		String sub_case_name = vformat("Testing token translation for revision %07x", rev.revision);
+		SUBCASE(sub_case_name.utf8().get_data()) {
+			auto decomp = GDScriptDecomp::create_decomp_for_commit(rev.revision);
+			REQUIRE(decomp.is_valid());
+			// the upper bits hold identifier/constant/function indices, so make sure they're masked off
+			for (int token = 0; token <= (int)GDScriptDecomp::TOKEN_MASK; token++) {
+				CHECK(decomp->get_global_token(token) == rev.get_global_token(token));
+				CHECK(decomp->get_global_token(token | (1234 << GDScriptDecomp::TOKEN_BITS)) == rev.get_global_token(token | (1234 << GDScriptDecomp::TOKEN_BITS)));
+			}
+			for (int token = 0; token <= GDScriptDecomp::GlobalToken::G_TK_MAX; token++) {
+				auto g_token = GDScriptDecomp::GlobalToken(token);
+				CHECK(decomp->get_local_token_val(g_token) == rev.get_local_token_val(g_token));
+			}
+		}
+	}
+}
+
+// Run with `--test --test-case="*Benchmark*" --no-skip`
+TEST_CASE("[GDSDecomp][Bytecode][Benchmark] Token translation tables vs. legacy switch statements" * doctest::skip()) {
+	const int num_tokens = 4 * 1024 * 1024;
+	Vector<int> local_tokens;
+	Vector<GDScriptDecomp::GlobalToken> global_tokens;
+	local_tokens.resize(num_tokens);
+	global_tokens.resize(num_tokens);
+	RandomPCG rng(0x5eed);
+	for (int i = 0; i < num_tokens; i++) {
+		local_tokens.write[i] = rng.rand() & ((1 << (GDScriptDecomp::TOKEN_BITS + 4)) - 1);
+		global_tokens.write[i] = GDScriptDecomp::GlobalToken(rng.rand() % (GDScriptDecomp::GlobalToken::G_TK_MAX + 1));
+	}
+	const int *local_ptr = local_tokens.ptr();
+	const GDScriptDecomp::GlobalToken *global_ptr = global_tokens.ptr();
+	for (int i = 0; revision_tokens[i].revision != 0; i++) {
+		const RevisionTokens &rev = revision_tokens[i];
+		auto decomp = GDScriptDecomp::create_decomp_for_commit(rev.revision);
+		REQUIRE(decomp.is_valid());
+		uint64_t checksum_old = 0;
+		uint64_t checksum_new = 0;
+
+		uint64_t start = OS::get_singleton()->get_ticks_usec();
+		for (int j = 0; j < num_tokens; j++) {
+			checksum_old += rev.get_global_token(local_ptr[j]) + rev.get_local_token_val(global_ptr[j]);
+		}
+		uint64_t old_usec = OS::get_singleton()->get_ticks_usec() - start;
+
+		start = OS::get_singleton()->get_ticks_usec();
+		for (int j = 0; j < num_tokens; j++) {
+			checksum_new += decomp->get_global_token(local_ptr[j]) + decomp->get_local_token_val(global_ptr[j]);
+		}
+		uint64_t new_usec = OS::get_singleton()->get_ticks_usec() - start;
+
+		CHECK(checksum_old == checksum_new);
+		print_line(vformat("%07x: %d tokens each way, switch: %d usec, tables: %d usec (%.2fx)", rev.revision, num_tokens, old_usec, new_usec, new_usec > 0 ? (double)old_usec / new_usec : 0.0));
+	}
+}
+
+} //namespace TestBytecodeGenerated
@@ -257,6 +257,12 @@ TEST_CASE("[GDSDecomp] uh oh") {
 	CHECK(dumper._check_md5_all_files(broken_files, checked_files, nullptr) == OK);
 	CHECK(broken_files.size() == 0);
 	CHECK(dumper.pck_dump_to_dir(output_dir, {}) == OK);
+	// extracting and verifying in one pass gives the same files and passes every checksum
+	dumper.set_check_md5_on_extract(true);
+	CHECK(dumper.pck_dump_to_dir(output_dir, {}) == OK);
+	for (const auto &file_info : settings->get_file_info_list()) {
+		CHECK_MESSAGE(file_info->is_checksum_validated(), "Checksum not validated for " + file_info->get_path());
+	}
 	HashMap<String, String> pck_files;
 	for (const auto &file : packed_files) {
 		String output_file_path = output_dir.path_join(file.trim_prefix("res://"));
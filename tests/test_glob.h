@@ -0,0 +1,75 @@
+#pragma once
+
+#include "test_common.h"
+#include "tests/test_macros.h"
+#include <utility/glob.h>
+
+namespace TestGlob {
+
+TEST_CASE("[GDSDecomp][Glob] Literal and extension patterns match the same names as the regex") {
+	Glob::clear_cache();
+	// the translated pattern is anchored at the end of the name, but not at the start
+	CHECK(Glob::fnmatch("res://scripts/player.gd", "*.gd"));
+	CHECK(Glob::fnmatch("res://scripts/player.gd", "player.gd"));
+	CHECK(Glob::fnmatch("res://scripts/player.gd", "res://scripts/player.gd"));
+	CHECK_FALSE(Glob::fnmatch("res://scripts/player.gdc", "*.gd"));
+	CHECK(Glob::fnmatch("res://addons/foo/plugin.cfg", "res://addons/foo/*"));
+	CHECK(Glob::fnmatch("res://x/res://addons/foo/plugin.cfg", "res://addons/foo/*"));
+	CHECK_FALSE(Glob::fnmatch("res://addons/foobar.cfg", "res://addons/foo/*"));
+	CHECK(Glob::fnmatch("res://a.b+c(d).gd", "*.b+c(d).gd"));
+	CHECK(Glob::fnmatch("anything", "*"));
+	CHECK(Glob::fnmatch("anything", "**"));
+	CHECK(Glob::fnmatch("res://dir/file.gd", "*"));
+	CHECK(Glob::fnmatch("res://dir/file.gd", "**"));
+	CHECK(Glob::fnmatch("anything", ""));
+	CHECK(Glob::fnmatch("res://scene.tscn", "*scene*"));
+	CHECK_FALSE(Glob::fnmatch("res://scene.tscn", "*scenes*"));
+	// these still go through the regex
+	CHECK(Glob::fnmatch("res://addons/foo/bar/plugin.gd", "res://addons/**/*.gd"));
+	CHECK(Glob::fnmatch("res://a1.gd", "res://a?.gd"));
+	CHECK(Glob::fnmatch("res://ab.gd", "res://a[bc].gd"));
+	CHECK_FALSE(Glob::fnmatch("res://ad.gd", "res://a[bc].gd"));
+	CHECK(Glob::fnmatch("res://line\n", "*.gd"));
+	// the cached patterns give the same results
+	CHECK(Glob::fnmatch("res://scripts/player.gd", "*.gd"));
+	CHECK_FALSE(Glob::fnmatch("res://scripts/player.gdc", "*.gd"));
+}
+
+TEST_CASE("[GDSDecomp][Glob] Matching a long list agrees with matching each name") {
+	Vector<String> names;
+	static const char *extensions[] = { "gd", "gdc", "tscn", "import", "png" };
+	for (int i = 0; i < 40000; i++) {
+		names.push_back(vformat("res://dir%d/sub%d/file%d.%s", i % 7, i % 13, i, extensions[i % 5]));
+	}
+	Vector<String> patterns = { "*.gdc", "res://dir3/*", "res://dir5/sub1?/*.png", "file123.tscn", "*sub12*" };
+	Vector<String> expected;
+	for (const String &name : names) {
+		for (const String &pattern : patterns) {
+			if (Glob::fnmatch(name, pattern)) {
+				expected.push_back(name);
+				break;
+			}
+		}
+	}
+	CHECK(expected.size() > 0);
+	CHECK(Glob::fnmatch_list(names, patterns) == expected);
+	// a bare wildcard matches every name, whatever else is in the list
+	CHECK(Glob::fnmatch_list(names, { "*" }) == names);
+	CHECK(Glob::fnmatch_list(names, { "**" }) == names);
+	CHECK(Glob::fnmatch_list(names, { "*.nothing", "*" }) == names);
+
+	Vector<String> dirs = { "res://dir1", "res://dir6", "res://nothere" };
+	Vector<String> expected_patterns;
+	for (const String &dir : dirs) {
+		for (const String &name : names) {
+			if (Glob::fnmatch(name, dir.path_join("*"))) {
+				expected_patterns.push_back(dir);
+				break;
+			}
+		}
+	}
+	CHECK(expected_patterns.size() == 2);
+	CHECK(Glob::dirs_in_names(names, dirs) == expected_patterns);
+}
+
+} // namespace TestGlob
@@ -4,6 +4,7 @@
 #include "gdre_settings.h"
 
 #include "core/io/dir_access.h"
+#include "core/os/os.h"
 
 bool inGuiMode() {
 	//check if we are in GUI mode
@@ -15,6 +16,8 @@ bool inGuiMode() {
 thread_local uint64_t thread_warning_count = 0;
 thread_local uint64_t thread_error_count = 0;
 thread_local bool previous_was_error = false;
+// set while this thread is draining, so that errors it raises (e.g. from the file) are only queued
+thread_local bool is_draining = false;
 
 std::atomic<uint64_t> GDRELogger::error_count = 0;
 std::atomic<uint64_t> GDRELogger::warning_count = 0;
@@ -58,11 +61,17 @@ void GDRELogger::logv(const char *p_format, va_list p_list, bool p_err) {
 			previous_was_error = false;
 		}
 
-		if (inGuiMode()) {
+		if (async && (file.is_valid() || inGuiMode())) {
+			_enqueue(buf, len, p_err);
+			// errors are written out right away, as they were before; a crash is logged as an error too
+			if (p_err && !is_draining) {
+				_drain();
+			}
+		} else if (inGuiMode()) {
 			// TODO: route this through GDRE Settings rather than GDRE Editor
 			GodotREEditor::get_singleton()->call_deferred(SNAME("emit_signal"), "write_log_message", String(buf));
 		}
-		if (file.is_valid()) {
+		if (file.is_valid() && !async) {
 			file->store_buffer((uint8_t *)buf, len);
 
 			if (p_err || _flush_stdout_on_print) {
@@ -84,6 +93,7 @@ void GDRELogger::logv(const char *p_format, va_list p_list, bool p_err) {
 }
 
 Error GDRELogger::open_file(const String &p_base_path) {
+	MutexLock drain_lock(drain_mutex);
 	if (file.is_valid()) {
 		return ERR_ALREADY_IN_USE;
 	}
@@ -121,7 +131,111 @@ void GDRELogger::stop_prebuffering() {
 	}
 }
 
+void GDRELogger::_enqueue(const char *p_buf, int p_len, bool p_err) {
+	uint32_t shard_idx = Thread::get_caller_id() % SHARD_COUNT;
+	Shard &shard = shards[shard_idx];
+	bool full;
+	{
+		MutexLock lock(shard.mutex);
+		// taken under the shard's lock, so the records of each shard are in sequence order
+		uint64_t seq = next_seq++;
+		uint32_t offset = shard.bytes.size();
+		shard.bytes.resize(offset + p_len);
+		memcpy(shard.bytes.ptr() + offset, p_buf, p_len);
+		shard.records.push_back({ seq, shard_idx, offset, (uint32_t)p_len, p_err });
+		full = shard.records.size() >= MAX_SHARD_RECORDS || shard.bytes.size() >= MAX_SHARD_BYTES;
+	}
+	if (full && !is_draining) {
+		_drain();
+	}
+}
+
+void GDRELogger::_drain() {
+	MutexLock lock(drain_mutex);
+	is_draining = true;
+	LocalVector<uint8_t> shard_bytes[SHARD_COUNT];
+	LocalVector<RecordInfo> records;
+	bool should_flush = _flush_stdout_on_print;
+	for (int i = 0; i < SHARD_COUNT; i++) {
+		MutexLock shard_lock(shards[i].mutex);
+		if (shards[i].records.is_empty()) {
+			continue;
+		}
+		shard_bytes[i] = shards[i].bytes;
+		for (const RecordInfo &record : shards[i].records) {
+			records.push_back(record);
+			should_flush = should_flush || record.err;
+		}
+		shards[i].bytes.clear();
+		shards[i].records.clear();
+	}
+	if (records.is_empty()) {
+		is_draining = false;
+		return;
+	}
+	records.sort_custom<RecordInfoOrder>();
+	LocalVector<uint8_t> out;
+	for (const RecordInfo &record : records) {
+		uint32_t offset = out.size();
+		out.resize(offset + record.length);
+		memcpy(out.ptr() + offset, shard_bytes[record.shard].ptr() + record.offset, record.length);
+	}
+	if (file.is_valid()) {
+		file->store_buffer(out.ptr(), out.size());
+		if (should_flush) {
+			file->flush();
+		}
+	}
+	if (inGuiMode()) {
+		// one signal for the whole batch instead of one per line
+		GodotREEditor::get_singleton()->call_deferred(SNAME("emit_signal"), "write_log_message", String::utf8((const char *)out.ptr(), out.size()));
+	}
+	is_draining = false;
+}
+
+void GDRELogger::_writer_thread_func(void *p_userdata) {
+	GDRELogger *logger = static_cast<GDRELogger *>(p_userdata);
+	while (!logger->writer_exit) {
+		OS::get_singleton()->delay_usec(WRITER_INTERVAL_USEC);
+		logger->_drain();
+	}
+	logger->_drain();
+}
+
+void GDRELogger::set_async(bool p_async) {
+	if (p_async == async) {
+		return;
+	}
+	if (p_async) {
+		writer_exit = false;
+		async = true;
+		writer_thread.start(_writer_thread_func, this);
+	} else {
+		writer_exit = true;
+		if (writer_thread.is_started()) {
+			writer_thread.wait_to_finish();
+		}
+		async = false;
+		// anything logged while the writer was exiting
+		_drain();
+	}
+}
+
+void GDRELogger::flush() {
+	if (async) {
+		_drain();
+	}
+	if (file.is_valid()) {
+		file->flush();
+	}
+}
+
 void GDRELogger::close_file() {
+	// the writer thread uses the file while holding this
+	MutexLock lock(drain_mutex);
+	if (async) {
+		_drain();
+	}
 	if (file.is_valid()) {
 		file->flush();
 		file = Ref<FileAccess>();
@@ -130,6 +244,7 @@ void GDRELogger::close_file() {
 }
 
 void GDRELogger::_disable() {
+	set_async(false);
 	disabled = true;
 }
 
@@ -146,5 +261,6 @@ GDRELogger::GDRELogger() {
 }
 
 GDRELogger::~GDRELogger() {
+	set_async(false);
 	close_file();
 }
\ No newline at end of file
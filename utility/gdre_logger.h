@@ -1,6 +1,8 @@
 #pragma once
 
 #include "core/io/logger.h"
+#include "core/os/thread.h"
+#include "core/templates/local_vector.h"
 
 class GDRELogger : public Logger {
 	Ref<FileAccess> file;
@@ -12,6 +14,40 @@ class GDRELogger : public Logger {
 	Mutex buffer_mutex;
 	Vector<String> buffer;
 
+	// Async mode: each thread appends its formatted messages to one of the shards, and the writer thread
+	// writes them all out in the order they were logged, with one write and one GUI notification per batch.
+	struct RecordInfo {
+		uint64_t seq;
+		uint32_t shard;
+		uint32_t offset;
+		uint32_t length;
+		bool err;
+	};
+	struct RecordInfoOrder {
+		_FORCE_INLINE_ bool operator()(const RecordInfo &a, const RecordInfo &b) const { return a.seq < b.seq; }
+	};
+	struct Shard {
+		Mutex mutex;
+		LocalVector<uint8_t> bytes;
+		LocalVector<RecordInfo> records;
+	};
+	static constexpr int SHARD_COUNT = 16;
+	// a thread that fills its shard drains the queue itself, so that a stalled writer can't grow it without bound
+	static constexpr uint32_t MAX_SHARD_RECORDS = 4096;
+	static constexpr uint32_t MAX_SHARD_BYTES = 1024 * 1024;
+	// about one frame
+	static constexpr uint64_t WRITER_INTERVAL_USEC = 16000;
+	Shard shards[SHARD_COUNT];
+	std::atomic<uint64_t> next_seq = 0;
+	std::atomic<bool> async = false;
+	std::atomic<bool> writer_exit = false;
+	Thread writer_thread;
+	Mutex drain_mutex;
+
+	static void _writer_thread_func(void *p_userdata);
+	void _enqueue(const char *p_buf, int p_len, bool p_err);
+	void _drain();
+
 public:
 	String get_path() { return base_path; }
 	GDRELogger();
@@ -21,6 +57,11 @@ public:
 	Error open_file(const String &p_base_path);
 	void close_file();
 	void _disable(); // only used for during cleanup, because we can't remove the logger
+	// Set this before logging starts; the error and warning counts are still updated as each message is logged.
+	void set_async(bool p_async);
+	bool is_async() const { return async; }
+	// Writes out everything queued so far
+	void flush();
 	virtual void logv(const char *p_format, va_list p_list, bool p_err) _PRINTF_FORMAT_ATTRIBUTE_2_0;
 	static uint64_t get_error_count();
 	static uint64_t get_thread_error_count();
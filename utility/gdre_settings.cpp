@@ -1,6 +1,7 @@
 #include "gdre_settings.h"
 
 #include "bytecode/bytecode_base.h"
+#include "bytecode/bytecode_test_cache.h"
 #include "bytecode/bytecode_tester.h"
 #include "compat/resource_compat_binary.h"
 #include "compat/resource_loader_compat.h"
@@ -243,6 +244,7 @@ GDRESettings::GDRESettings() {
 
 GDRESettings::~GDRESettings() {
 	AssetLibInfoGetter::save_cache();
+	BytecodeTestCache::save();
 	remove_current_pack();
 	memdelete(gdre_packeddata_singleton);
 	singleton = nullptr;
@@ -688,7 +690,7 @@ Error GDRESettings::detect_bytecode_revision() {
 		return guess_from_version(ERR_FILE_CANT_OPEN);
 	}
 	current_project->bytecode_revision = revision;
-	auto decomp = GDScriptDecomp::create_decomp_for_commit(revision);
+	auto decomp = GDScriptDecomp::get_shared_decomp_for_commit(revision);
 	ERR_FAIL_COND_V_MSG(decomp.is_null(), ERR_FILE_CANT_OPEN, "Cannot determine bytecode revision!");
 	auto check_if_same_minor_major = [&](Ref<GodotVer> version, Ref<GodotVer> max_ver) {
 		if (!(max_ver->get_major() == version->get_major() && max_ver->get_minor() == version->get_minor())) {
@@ -1427,6 +1429,22 @@ Error GDRESettings::close_log_file() {
 	return OK;
 }
 
+void GDRESettings::set_async_logging(bool p_async) {
+	logger->set_async(p_async);
+}
+
+bool GDRESettings::is_async_logging() const {
+	return logger->is_async();
+}
+
+void GDRESettings::set_bytecode_test_cache_enabled(bool p_enabled) {
+	BytecodeTestCache::set_enabled(p_enabled);
+}
+
+bool GDRESettings::is_bytecode_test_cache_enabled() const {
+	return BytecodeTestCache::is_enabled();
+}
+
 Array GDRESettings::get_import_files(bool copy) {
 	if (!copy) {
 		return import_files;
@@ -1834,6 +1852,10 @@ void GDRESettings::_bind_methods() {
 	ClassDB::bind_method(D_METHOD("get_log_file_path"), &GDRESettings::get_log_file_path);
 	ClassDB::bind_method(D_METHOD("is_fs_path", "p_path"), &GDRESettings::is_fs_path);
 	ClassDB::bind_method(D_METHOD("close_log_file"), &GDRESettings::close_log_file);
+	ClassDB::bind_method(D_METHOD("set_async_logging", "async"), &GDRESettings::set_async_logging);
+	ClassDB::bind_method(D_METHOD("is_async_logging"), &GDRESettings::is_async_logging);
+	ClassDB::bind_method(D_METHOD("set_bytecode_test_cache_enabled", "enabled"), &GDRESettings::set_bytecode_test_cache_enabled);
+	ClassDB::bind_method(D_METHOD("is_bytecode_test_cache_enabled"), &GDRESettings::is_bytecode_test_cache_enabled);
 	ClassDB::bind_method(D_METHOD("get_remaps", "include_imports"), &GDRESettings::get_remaps, DEFVAL(true));
 	ClassDB::bind_method(D_METHOD("has_any_remaps"), &GDRESettings::has_any_remaps);
 	ClassDB::bind_method(D_METHOD("has_remap", "src", "dst"), &GDRESettings::has_remap);
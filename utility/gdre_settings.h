@@ -201,6 +201,11 @@ public:
 	String get_log_file_path();
 	bool is_fs_path(const String &p_path) const;
 	Error close_log_file();
+	void set_async_logging(bool p_async);
+	bool is_async_logging() const;
+	// Whether bytecode revision detection reuses (and adds to) the results kept from earlier runs, see `BytecodeTestCache`.
+	void set_bytecode_test_cache_enabled(bool p_enabled);
+	bool is_bytecode_test_cache_enabled() const;
 	Dictionary get_remaps(bool include_imports = true) const;
 	bool has_any_remaps() const;
 	bool has_remap(const String &src, const String &dst) const;
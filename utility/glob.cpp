@@ -25,12 +25,48 @@
 
 #include "glob.h"
 #include "core/io/dir_access.h"
+#include "core/object/worker_thread_pool.h"
+#include "core/os/mutex.h"
 #include "core/os/os.h"
 #include "core/templates/hash_map.h"
+#include "core/templates/hash_set.h"
+#include "core/templates/lru.h"
 #include "modules/regex/regex.h"
 #include "utility/gdre_settings.h"
 
 #include <functional>
+
+// Patterns without '?' or '[' and with '*' only at the ends don't need the regex. `translate` anchors the pattern
+// at the end of the name but not at the start, so (for names without line breaks):
+// "L" and "*L" match names ending in L, and "L*" and "*L*" match names containing L; "*" and "**" match anything.
+struct CompiledGlob {
+	enum Kind {
+		ALL,
+		SUFFIX,
+		SUBSTRING,
+		REGEX,
+	};
+	Kind kind = REGEX;
+	String literal;
+	Ref<RegEx> regex;
+
+	// '$' also matches before a trailing newline, and '.' doesn't match one, so those names always use the regex
+	static bool needs_regex(const String &name) {
+		return name.contains_char('\n') || name.contains_char('\r');
+	}
+
+	bool match(const String &name) const {
+		if (kind == ALL) {
+			return true;
+		} else if (kind == SUFFIX && !needs_regex(name)) {
+			return name.ends_with(literal);
+		} else if (kind == SUBSTRING && !needs_regex(name)) {
+			return name.contains(literal);
+		}
+		return regex->search(name).is_valid();
+	}
+};
+
 namespace {
 
 // SPECIAL_CHARS
@@ -226,6 +262,159 @@ String expand_tilde(String path) {
 		return home;
 	}
 }
+
+constexpr int GLOB_CACHE_SIZE = 256;
+// Below this many names, matching on the calling thread is faster than starting a group task
+constexpr int PARALLEL_MATCH_MIN_NAMES = 16384;
+
+Mutex glob_cache_mutex;
+LRUCache<String, CompiledGlob> glob_cache(GLOB_CACHE_SIZE);
+
+CompiledGlob compile_glob(const String &pattern, const String &translated) {
+	CompiledGlob glob;
+	glob.regex = RegEx::create_from_string(translated);
+	if (pattern.contains_char('?') || pattern.contains_char('[')) {
+		return glob;
+	}
+	int start = 0;
+	int end = pattern.length();
+	while (start < end && pattern[start] == '*') {
+		start++;
+	}
+	bool trailing_star = false;
+	while (end > start && pattern[end - 1] == '*') {
+		end--;
+		trailing_star = true;
+	}
+	String literal = pattern.substr(start, end - start);
+	if (literal.contains_char('*')) {
+		return glob;
+	}
+	// `contains("")` is false, so a pattern that's nothing but stars can't be a substring match
+	if (literal.is_empty() && start > 0) {
+		glob.kind = CompiledGlob::ALL;
+		return glob;
+	}
+	glob.kind = trailing_star ? CompiledGlob::SUBSTRING : CompiledGlob::SUFFIX;
+	glob.literal = literal;
+	return glob;
+}
+
+// Matches names against several patterns at once: the suffixes are looked up by length in a hash set,
+// so a name costs one lookup per distinct suffix length rather than one search per pattern.
+class GlobMatcher {
+	HashMap<int, HashSet<String>> suffixes;
+	Vector<int> suffix_lengths;
+	Vector<String> substrings;
+	Vector<Ref<RegEx>> regexes;
+	Vector<Ref<RegEx>> all_regexes;
+	bool match_all = false;
+
+public:
+	GlobMatcher(const Vector<CompiledGlob> &globs) {
+		for (const CompiledGlob &glob : globs) {
+			all_regexes.push_back(glob.regex);
+			if (glob.kind == CompiledGlob::ALL || (glob.kind == CompiledGlob::SUBSTRING && glob.literal.is_empty())) {
+				match_all = true;
+			} else if (glob.kind == CompiledGlob::SUFFIX) {
+				int length = glob.literal.length();
+				if (!suffixes.has(length)) {
+					suffixes.insert(length, HashSet<String>());
+					suffix_lengths.push_back(length);
+				}
+				suffixes[length].insert(glob.literal);
+			} else if (glob.kind == CompiledGlob::SUBSTRING) {
+				substrings.push_back(glob.literal);
+			} else {
+				regexes.push_back(glob.regex);
+			}
+		}
+	}
+
+	bool match(const String &name) const {
+		if (match_all) {
+			return true;
+		}
+		if (CompiledGlob::needs_regex(name)) {
+			for (const Ref<RegEx> &re : all_regexes) {
+				if (re->search(name).is_valid()) {
+					return true;
+				}
+			}
+			return false;
+		}
+		int name_length = name.length();
+		for (int length : suffix_lengths) {
+			if (length <= name_length && suffixes[length].has(length == 0 ? String() : name.substr(name_length - length))) {
+				return true;
+			}
+		}
+		for (const String &substring : substrings) {
+			if (name.contains(substring)) {
+				return true;
+			}
+		}
+		for (const Ref<RegEx> &re : regexes) {
+			if (re->search(name).is_valid()) {
+				return true;
+			}
+		}
+		return false;
+	}
+};
+
+// Splits a long list of names into chunks matched on the worker pool. The results are per name (or per chunk and
+// pattern), so they are collected in the same order as matching on one thread.
+struct ChunkedMatch {
+	const Vector<String> *names = nullptr;
+	int64_t chunk_size = 0;
+	int64_t chunk_count = 0;
+	// one flag per name for `fnmatch_list`, or one per chunk and pattern for `pattern_match_list`
+	Vector<uint8_t> matched;
+	uint8_t *matched_ptr = nullptr;
+
+	ChunkedMatch(const Vector<String> &p_names) {
+		names = &p_names;
+		chunk_count = MAX(1, MIN(int64_t(WorkerThreadPool::get_singleton()->get_thread_count()) * 4, p_names.size() / 1024));
+		chunk_size = (p_names.size() + chunk_count - 1) / chunk_count;
+	}
+
+	static bool should_use(const Vector<String> &p_names) {
+		// don't start a group task from inside a worker, e.g. when an exporter filters a file list
+		return p_names.size() >= PARALLEL_MATCH_MIN_NAMES && WorkerThreadPool::get_singleton() &&
+				WorkerThreadPool::get_singleton()->get_thread_index() < 0;
+	}
+
+	void run(int64_t p_result_count, void (ChunkedMatch::*p_method)(uint32_t, const void *), const void *p_userdata, const StringName &p_description) {
+		matched.resize_zeroed(p_result_count);
+		matched_ptr = matched.ptrw();
+		WorkerThreadPool::GroupID group_task = WorkerThreadPool::get_singleton()->add_template_group_task(
+				this, p_method, p_userdata, chunk_count, -1, true, p_description);
+		WorkerThreadPool::get_singleton()->wait_for_group_task_completion(group_task);
+	}
+
+	void match_names(uint32_t p_chunk, const void *p_matcher) {
+		const GlobMatcher *matcher = static_cast<const GlobMatcher *>(p_matcher);
+		int64_t end = MIN(names->size(), (p_chunk + 1) * chunk_size);
+		for (int64_t i = p_chunk * chunk_size; i < end; i++) {
+			matched_ptr[i] = matcher->match(names->get(i));
+		}
+	}
+
+	void match_patterns(uint32_t p_chunk, const void *p_globs) {
+		const Vector<CompiledGlob> &globs = *static_cast<const Vector<CompiledGlob> *>(p_globs);
+		int64_t end = MIN(names->size(), (p_chunk + 1) * chunk_size);
+		uint8_t *chunk_matched = matched_ptr + p_chunk * globs.size();
+		for (int j = 0; j < globs.size(); j++) {
+			for (int64_t i = p_chunk * chunk_size; i < end; i++) {
+				if (globs[j].match(names->get(i))) {
+					chunk_matched[j] = 1;
+					break;
+				}
+			}
+		}
+	}
+};
 } //namespace
 
 Ref<RegEx> Glob::escapere = nullptr;
@@ -391,8 +580,27 @@ Vector<String> Glob::_glob(const String &inpath, bool recursive,
 	return result;
 }
 
+CompiledGlob Glob::_get_compiled(const String &pattern) {
+	{
+		MutexLock lock(glob_cache_mutex);
+		const CompiledGlob *cached = glob_cache.getptr(pattern);
+		if (cached) {
+			return *cached;
+		}
+	}
+	CompiledGlob glob = compile_glob(pattern, translate(pattern));
+	MutexLock lock(glob_cache_mutex);
+	glob_cache.insert(pattern, glob);
+	return glob;
+}
+
+void Glob::clear_cache() {
+	MutexLock lock(glob_cache_mutex);
+	glob_cache.clear();
+}
+
 bool Glob::fnmatch(const String &name, const String &pattern) {
-	return RegEx::create_from_string(translate(pattern))->search(name).is_valid();
+	return _get_compiled(pattern).match(name);
 }
 
 Vector<String> Glob::fnmatch_list(const Vector<String> &names, const Vector<String> &patterns) {
@@ -400,17 +608,24 @@ Vector<String> Glob::fnmatch_list(const Vector<String> &names, const Vector<Stri
 	if (patterns.is_empty() || names.is_empty()) {
 		return result;
 	}
-	Vector<Ref<RegEx>> regexes;
+	Vector<CompiledGlob> globs;
 	for (auto &pattern : patterns) {
-		auto re = RegEx::create_from_string(translate(pattern));
-		regexes.push_back(re);
+		globs.push_back(_get_compiled(pattern));
+	}
+	GlobMatcher matcher(globs);
+	if (ChunkedMatch::should_use(names)) {
+		ChunkedMatch chunked(names);
+		chunked.run(names.size(), &ChunkedMatch::match_names, &matcher, SNAME("Glob::fnmatch_list"));
+		for (int64_t i = 0; i < names.size(); i++) {
+			if (chunked.matched[i]) {
+				result.push_back(names[i]);
+			}
+		}
+		return result;
 	}
 	for (auto &n : names) {
-		for (auto &re : regexes) {
-			if (re->search(n).is_valid()) {
-				result.push_back(n);
-				break;
-			}
+		if (matcher.match(n)) {
+			result.push_back(n);
 		}
 	}
 	return result;
@@ -421,15 +636,26 @@ Vector<String> Glob::pattern_match_list(const Vector<String> &names, const Vecto
 	if (patterns.is_empty() || names.is_empty()) {
 		return result;
 	}
-	Vector<Ref<RegEx>> regexes;
+	Vector<CompiledGlob> globs;
 	for (auto &pattern : patterns) {
-		auto re = RegEx::create_from_string(translate(pattern));
-		regexes.push_back(re);
+		globs.push_back(_get_compiled(pattern));
+	}
+	if (ChunkedMatch::should_use(names)) {
+		ChunkedMatch chunked(names);
+		chunked.run(chunked.chunk_count * globs.size(), &ChunkedMatch::match_patterns, &globs, SNAME("Glob::pattern_match_list"));
+		for (int i = 0; i < globs.size(); i++) {
+			for (int64_t chunk = 0; chunk < chunked.chunk_count; chunk++) {
+				if (chunked.matched[chunk * globs.size() + i]) {
+					result.push_back(patterns[i]);
+					break;
+				}
+			}
+		}
+		return result;
 	}
-	for (int i = 0; i < regexes.size(); i++) {
-		auto &re = regexes[i];
+	for (int i = 0; i < globs.size(); i++) {
 		for (auto &n : names) {
-			if (re->search(n).is_valid()) {
+			if (globs[i].match(n)) {
 				result.push_back(patterns[i]);
 				break;
 			}
@@ -497,4 +723,5 @@ void Glob::_bind_methods() {
 	ClassDB::bind_static_method(get_class_static(), D_METHOD("pattern_match_list", "names", "patterns"), &Glob::pattern_match_list);
 	ClassDB::bind_static_method(get_class_static(), D_METHOD("names_in_dirs", "names", "dirs"), &Glob::names_in_dirs);
 	ClassDB::bind_static_method(get_class_static(), D_METHOD("dirs_in_names", "names", "dirs"), &Glob::dirs_in_names);
+	ClassDB::bind_static_method(get_class_static(), D_METHOD("clear_cache"), &Glob::clear_cache);
 }
@@ -29,6 +29,8 @@
 #include "core/templates/vector.h"
 #include "modules/regex/regex.h"
 
+struct CompiledGlob;
+
 class Glob : public Object {
 	GDCLASS(Glob, Object);
 
@@ -42,6 +44,8 @@ protected:
 	static constexpr const char *escape_pattern = R"([&~|])";
 
 	static String translate(const String &pattern);
+	// The compiled form of `pattern`, from a cache of the most recently used patterns
+	static CompiledGlob _get_compiled(const String &pattern);
 	static bool has_magic(const String &pathname);
 	static Vector<String> _glob(const String &inpath, bool recursive = false,
 			bool dironly = false, bool include_hidden = false);
@@ -84,4 +88,7 @@ public:
 	/// Returns a list of directories that are in any of the names
 	static Vector<String> dirs_in_names(const Vector<String> &names, const Vector<String> &dirs);
 
+	/// Empties the cache of compiled patterns
+	static void clear_cache();
+
 }; // namespace glob
@@ -3,6 +3,7 @@
 
 #include "bytecode/bytecode_base.h"
 #include "bytecode/bytecode_tester.h"
+#include "compat/fake_script.h"
 #include "compat/oggstr_loader_compat.h"
 #include "compat/resource_loader_compat.h"
 #include "core/error/error_list.h"
@@ -282,7 +283,9 @@ Error ImportExporter::_export_imports(const String &p_out_dir, const Vector<Stri
 			// we need to copy the addons to the output directory
 		}
 		if (to_decompile.size() > 0) {
-			decompile_scripts(output_dir, to_decompile);
+			if (_decompile_scripts(output_dir, to_decompile, pr) == ERR_PRINTER_ON_FIRE) {
+				return ERR_PRINTER_ON_FIRE;
+			}
 		}
 		if (has_non_compiled_scripts || to_decompile.size() > 0) {
 			// This only works if we decompile the scripts first
@@ -491,7 +494,31 @@ Error ImportExporter::_export_imports(const String &p_out_dir, const Vector<Stri
 	return OK;
 }
 
+void ImportExporter::_do_decompile_script(uint32_t i, ScriptDecompileToken *tokens) {
+	// Taken care of in the main thread
+	if (unlikely(cancelled)) {
+		return;
+	}
+	ScriptDecompileToken &token = tokens[i];
+	print_verbose("decompiling " + token.path);
+	// loaded directly rather than through ResourceFormatGDScriptLoader, which drops the script (and so the
+	// decompiler's error message) on failure; every script gets its own decomp instance
+	Ref<FakeGDScript> script;
+	script.instantiate();
+	token.err = script->load_source_code(token.path);
+	if (token.err == OK) {
+		token.text = script->get_source_code();
+	} else {
+		token.error_message = script->get_error_message();
+	}
+	last_completed++;
+}
+
 Error ImportExporter::decompile_scripts(const String &p_out_dir, const Vector<String> &to_decompile) {
+	return _decompile_scripts(p_out_dir, to_decompile, nullptr);
+}
+
+Error ImportExporter::_decompile_scripts(const String &p_out_dir, const Vector<String> &to_decompile, EditorProgressGDDC *pr) {
 	Ref<GDScriptDecomp> decomp;
 	// we have to remove remaps if they exist
 	bool has_remaps = get_settings()->has_any_remaps();
@@ -523,42 +550,90 @@ Error ImportExporter::decompile_scripts(const String &p_out_dir, const Vector<St
 	}
 
 	print_line("Script version " + decomp->get_engine_version() + " (rev 0x" + String::num_int64(decomp->get_bytecode_rev(), 16) + ") detected");
-	Error err;
-	ResourceFormatGDScriptLoader script_loader;
+	Vector<ScriptDecompileToken> tokens;
+	tokens.resize(code_files.size());
 	for (int i = 0; i < code_files.size(); i++) {
-		const String &f = code_files[i];
+		tokens.write[i].path = code_files[i];
+	}
+	// ***** Decompile scripts *****
+	// The scripts are only decompiled to memory here; they're written out below in order, on this thread.
+	int64_t num_tokens = tokens.size();
+	if (opt_multi_thread && num_tokens > 1) {
+		last_completed = -1;
+		cancelled = false;
+		print_line("Decompiling scripts in parallel...");
+		WorkerThreadPool::GroupID group_task = WorkerThreadPool::get_singleton()->add_template_group_task(
+				this,
+				&ImportExporter::_do_decompile_script,
+				tokens.ptrw(),
+				num_tokens, -1, true, SNAME("ImportExporter::decompile_scripts"));
+		if (pr) {
+			while (!WorkerThreadPool::get_singleton()->is_group_task_completed(group_task)) {
+				OS::get_singleton()->delay_usec(10000);
+				int i = last_completed;
+				if (i < 0) {
+					i = 0;
+				} else if (i >= num_tokens) {
+					i = num_tokens - 1;
+				}
+				bool cancel = pr->step(code_files[i], i, true);
+				if (cancel) {
+					cancelled = true;
+					WorkerThreadPool::get_singleton()->wait_for_group_task_completion(group_task);
+					return ERR_PRINTER_ON_FIRE;
+				}
+			}
+		}
+		// Always wait for completion; otherwise we leak memory.
+		WorkerThreadPool::get_singleton()->wait_for_group_task_completion(group_task);
+	} else {
+		cancelled = false;
+		uint64_t last_progress_upd = OS::get_singleton()->get_ticks_usec();
+		for (int i = 0; i < num_tokens; i++) {
+			if (pr) {
+				if (OS::get_singleton()->get_ticks_usec() - last_progress_upd > 10000) {
+					last_progress_upd = OS::get_singleton()->get_ticks_usec();
+					if (pr->step(code_files[i], i, false)) {
+						return ERR_PRINTER_ON_FIRE;
+					}
+				}
+			}
+			_do_decompile_script(i, tokens.ptrw());
+		}
+	}
+
+	Ref<DirAccess> da = DirAccess::open(p_out_dir);
+	for (int i = 0; i < num_tokens; i++) {
+		const ScriptDecompileToken &token = tokens[i];
+		const String &f = token.path;
 		String dest_file = f.replace(".gdc", ".gd").replace(".gde", ".gd");
-		Ref<DirAccess> da = DirAccess::open(p_out_dir);
-		print_verbose("decompiling " + f);
 		bool encrypted = f.get_extension().to_lower() == "gde";
-		Ref<Script> script = script_loader.custom_load(f, {}, ResourceInfo::NON_GLOBAL_LOAD, &err);
-		if (err) {
-			String err_string = decomp->get_error_message();
+		if (token.err) {
+			String err_string = token.error_message.is_empty() ? String(error_names[token.err]) : token.error_message;
 			// TODO: make it not fail hard on the first script that fails to decompile
 			if (encrypted) {
 				add_to_failed(i);
 				report->had_encryption_error = true;
-				ERR_FAIL_V_MSG(err, "error decompiling encrypted script " + f + ": " + err_string);
+				ERR_FAIL_V_MSG(token.err, "error decompiling encrypted script " + f + ": " + err_string);
 			} else {
 				report->failed_scripts.push_back(f);
 				WARN_PRINT("error decompiling " + f + ": " + err_string);
 			}
 		} else {
-			String text = script->get_source_code();
 			String out_path = p_out_dir.path_join(dest_file.replace("res://", ""));
 			Ref<FileAccess> fa = FileAccess::open(out_path, FileAccess::WRITE);
 			if (fa.is_null()) {
 				report->failed_scripts.push_back(f);
 				continue;
 			}
-			fa->store_string(text);
+			fa->store_string(token.text);
 			if (has_remaps && get_settings()->has_remap(dest_file, f)) {
 				remove_remap_and_autoconverted(dest_file, f, p_out_dir);
 			} else {
 				handle_auto_converted_file(f, p_out_dir);
 			}
 			// TODO: make "remove_remap" do this instead
-			if (da->file_exists(f.replace(".gdc", ".gd.remap").replace("res://", ""))) {
+			if (da.is_valid() && da->file_exists(f.replace(".gdc", ".gd.remap").replace("res://", ""))) {
 				da->remove(f.replace(".gdc", ".gd.remap").replace("res://", ""));
 			}
 			print_verbose("successfully decompiled " + f);
@@ -111,8 +111,17 @@ class ImportExporter : public RefCounted {
 		bool opt_write_md5_files;
 	};
 
+	struct ScriptDecompileToken {
+		String path;
+		String text;
+		Error err = OK;
+		String error_message;
+	};
+
 	Ref<ImportExporterReport> report;
 	void _do_export(uint32_t i, ExportToken *tokens);
+	void _do_decompile_script(uint32_t i, ScriptDecompileToken *tokens);
+	Error _decompile_scripts(const String &output_dir, const Vector<String> &files, EditorProgressGDDC *pr);
 	Error handle_auto_converted_file(const String &autoconverted_file, const String &output_dir);
 	Error rewrite_import_source(const String &rel_dest_path, const String &output_dir, const Ref<ImportInfo> &iinfo);
 	static Vector<String> get_v2_wildcards();
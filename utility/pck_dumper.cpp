@@ -2,6 +2,7 @@
 #include "core/error/error_list.h"
 #include "gdre_settings.h"
 
+#include "core/crypto/crypto_core.h"
 #include "core/io/dir_access.h"
 #include "core/io/file_access.h"
 #include "core/os/os.h"
@@ -159,46 +160,115 @@ Error PckDumper::pck_dump_to_dir(const String &dir, const Vector<String> &files_
 	return _pck_dump_to_dir(dir, files_to_extract, nullptr, t);
 }
 
-void PckDumper::_do_extract(uint32_t i, ExtractToken *tokens) {
-	auto &file = tokens[i].file;
-	auto &dir = tokens[i].output_dir;
+// Large enough that reading a pack is mostly sequential, small enough to give each worker its own
+constexpr int64_t EXTRACT_BUFFER_SIZE = 1024 * 1024;
+
+bool PckDumper::ExtractTokenOffsetOrder::operator()(const ExtractToken &a, const ExtractToken &b) const {
+	if (a.file->get_pack() != b.file->get_pack()) {
+		return a.file->get_pack() < b.file->get_pack();
+	}
+	return a.file->get_offset() < b.file->get_offset();
+}
+
+Error PckDumper::_extract_file(ExtractToken &token, bool read_from_pack, Ref<FileAccess> &r_pack_f, Vector<uint8_t> &r_buffer) {
+	auto &file = token.file;
 	Error err = OK;
-	Ref<FileAccess> pck_f = FileAccess::open(file->get_path(), FileAccess::READ, &err);
-	if (err || pck_f.is_null()) {
-		broken_cnt++;
-		last_completed++;
-		tokens[i].err = ERR_FILE_CANT_OPEN;
-		return;
+	Ref<FileAccess> src_f;
+	// Unencrypted files in a PCK are read straight out of the pack, so that the files of a run share one handle;
+	// everything else goes through the pack's own FileAccess.
+	if (read_from_pack && !file->is_encrypted()) {
+		if (r_pack_f.is_null() || r_pack_f->get_path() != file->pf.pack) {
+			r_pack_f = FileAccess::open(file->pf.pack, FileAccess::READ, &err);
+		}
+		if (r_pack_f.is_valid()) {
+			r_pack_f->seek(file->pf.offset);
+			src_f = r_pack_f;
+		}
+	} else {
+		src_f = FileAccess::open(file->get_path(), FileAccess::READ, &err);
+	}
+	if (err || src_f.is_null()) {
+		return ERR_FILE_CANT_OPEN;
 	}
-	String target_name = dir.path_join(file->get_path().replace("res://", ""));
+	String target_name = token.output_dir.path_join(file->get_path().replace("res://", ""));
 	err = gdre::ensure_dir(target_name.get_base_dir());
 	if (err != OK) {
-		broken_cnt++;
-		last_completed++;
-		tokens[i].err = ERR_CANT_CREATE;
-		return;
+		return ERR_CANT_CREATE;
 	}
 	Ref<FileAccess> fa = FileAccess::open(target_name, FileAccess::WRITE, &err);
 	if (err || fa.is_null()) {
-		broken_cnt++;
-		last_completed++;
-		tokens[i].err = ERR_FILE_CANT_WRITE;
-		return;
+		return ERR_FILE_CANT_WRITE;
 	}
 
+	// Loading an encrypted file automatically checks the md5
+	bool check_md5 = should_check_md5 && file->has_md5() && !file->is_encrypted();
+	CryptoCore::MD5Context ctx;
+	if (check_md5) {
+		ctx.start();
+	}
+	uint8_t *buf = r_buffer.ptrw();
 	int64_t rq_size = file->get_size();
-	uint8_t buf[16384];
 	while (rq_size > 0) {
-		int got = pck_f->get_buffer(buf, MIN(16384, rq_size));
+		int64_t got = src_f->get_buffer(buf, MIN(EXTRACT_BUFFER_SIZE, rq_size));
+		if (got <= 0) {
+			break;
+		}
+		if (check_md5) {
+			ctx.update(buf, got);
+		}
 		fa->store_buffer(buf, got);
-		rq_size -= 16384;
+		rq_size -= got;
 	}
 	fa->flush();
-	last_completed++;
+	if (rq_size > 0) {
+		return ERR_FILE_CANT_READ;
+	}
+	if (should_check_md5) {
+		if (!file->has_md5()) {
+			skipped_cnt++;
+		} else if (check_md5) {
+			uint8_t hash[16];
+			ctx.finish(hash);
+			file->set_md5_match(memcmp(hash, file->pf.md5, 16) == 0);
+			if (!file->md5_passed) {
+				print_error("Checksum failed for " + file->get_path());
+				// the file's already been written by now, so unless we've been told to keep them, get rid of it
+				if (!skip_failed_md5) {
+					fa.unref();
+					DirAccess::remove_absolute(target_name);
+				}
+				return ERR_FILE_CORRUPT;
+			}
+		} else {
+			// it opened, so the decrypted contents matched the MD5; reported separately, since we didn't check it here
+			file->set_md5_match(true);
+		}
+	}
 	if (file->is_malformed() && file->get_raw_path() != file->get_path()) {
 		print_line("Warning: " + file->get_raw_path() + " is a malformed path!\nSaving to " + file->get_path() + " instead.");
 	}
 	print_verbose("Extracted " + target_name);
+	return OK;
+}
+
+void PckDumper::_do_extract(uint32_t i, ExtractChunk *chunks) {
+	auto ext = GDRESettings::get_singleton()->get_pack_type();
+	bool read_from_pack = ext == GDRESettings::PackInfo::PCK || ext == GDRESettings::PackInfo::EXE;
+	Ref<FileAccess> pack_f;
+	Vector<uint8_t> buffer;
+	buffer.resize(EXTRACT_BUFFER_SIZE);
+	for (int64_t j = chunks[i].start; j < chunks[i].end; j++) {
+		// Taken care of in the main thread
+		if (unlikely(cancelled)) {
+			return;
+		}
+		ExtractToken &token = chunks[i].tokens[j];
+		token.err = _extract_file(token, read_from_pack, pack_f, buffer);
+		if (token.err != OK) {
+			broken_cnt++;
+		}
+		last_completed++;
+	}
 }
 
 Error PckDumper::_pck_dump_to_dir(
@@ -209,102 +279,118 @@ Error PckDumper::_pck_dump_to_dir(
 	ERR_FAIL_COND_V_MSG(!GDRESettings::get_singleton()->is_pack_loaded(), ERR_DOES_NOT_EXIST,
 			"Pack not loaded!");
 	reset();
-	Ref<DirAccess> da = DirAccess::create(DirAccess::ACCESS_FILESYSTEM);
 	auto files = GDRESettings::get_singleton()->get_file_info_list();
-	Vector<uint8_t> key = GDRESettings::get_singleton()->get_encryption_key();
 	uint64_t last_progress_upd = OS::get_singleton()->get_ticks_usec();
 
 	if (DirAccess::create(DirAccess::ACCESS_FILESYSTEM).is_null()) {
 		return ERR_FILE_CANT_WRITE;
 	}
-	int files_extracted = 0;
-	Error err;
-	if (opt_multi_thread) {
-		Vector<ExtractToken> tokens;
-		Vector<String> paths_to_extract;
-		int actual = 0;
-		HashSet<String> files_to_extract_set;
-		for (const String &f : files_to_extract) {
-			files_to_extract_set.insert(f);
+	Vector<ExtractToken> tokens;
+	HashSet<String> files_to_extract_set;
+	for (const String &f : files_to_extract) {
+		files_to_extract_set.insert(f);
+	}
+	int64_t total_size = 0;
+	for (int i = 0; i < files.size(); i++) {
+		if (!files_to_extract_set.is_empty() && !files_to_extract_set.has(files.get(i)->get_path())) {
+			continue;
 		}
-		for (int i = 0; i < files.size(); i++) {
-			if (!files_to_extract_set.is_empty() && !files_to_extract_set.has(files.get(i)->get_path())) {
-				continue;
-			}
-			actual++;
-			if (pr) {
-				paths_to_extract.push_back(files.get(i)->get_path());
-			}
-			tokens.push_back({ files.get(i), dir, OK });
+		total_size += files.get(i)->get_size();
+		tokens.push_back({ files.get(i), dir, OK });
+	}
+	// Extracting in the order the files are in the pack makes it one pass over the pack rather than a seek per file.
+	tokens.sort_custom<ExtractTokenOffsetOrder>();
+	Vector<String> paths_to_extract;
+	if (pr) {
+		paths_to_extract.resize(tokens.size());
+		for (int i = 0; i < tokens.size(); i++) {
+			paths_to_extract.write[i] = tokens[i].file->get_path();
 		}
-		tokens.resize(actual);
-		paths_to_extract.resize(actual);
+	}
+
+	// Each chunk is a run of about the same number of bytes, so that every worker reads its own part of the pack.
+	Vector<ExtractChunk> chunks;
+	int chunk_count = opt_multi_thread ? MIN(WorkerThreadPool::get_singleton()->get_thread_count() * 4, tokens.size()) : 1;
+	int64_t chunk_bytes = MAX(total_size / MAX(chunk_count, 1), 1);
+	int64_t chunk_start = 0;
+	int64_t current_bytes = 0;
+	for (int64_t i = 0; i < tokens.size(); i++) {
+		current_bytes += tokens[i].file->get_size();
+		if (current_bytes >= chunk_bytes || i == tokens.size() - 1) {
+			chunks.push_back({ tokens.ptrw(), chunk_start, i + 1 });
+			chunk_start = i + 1;
+			current_bytes = 0;
+		}
+	}
+
+	Error err = OK;
+	if (opt_multi_thread && chunks.size() > 1) {
 		WorkerThreadPool::GroupID group_task = WorkerThreadPool::get_singleton()->add_template_group_task(
 				this,
 				&PckDumper::_do_extract,
-				tokens.ptrw(),
-				tokens.size(), -1, true, SNAME("PckDumper::_pck_dump_to_dir"));
+				chunks.ptrw(),
+				chunks.size(), -1, true, SNAME("PckDumper::_pck_dump_to_dir"));
 		err = wait_for_task(group_task, paths_to_extract, pr);
-		files_extracted = last_completed + 1;
-		if (broken_cnt > 0) {
-			err = ERR_BUG;
-			for (int i = 0; i < tokens.size(); i++) {
-				if (tokens[i].err != OK) {
-					String err_type;
-					if (tokens[i].err == ERR_FILE_CANT_OPEN) {
-						err_type = "FileAccess error";
-					} else if (tokens[i].err == ERR_CANT_CREATE) {
-						err_type = "FileCreate error";
-					} else if (tokens[i].err == ERR_FILE_CANT_WRITE) {
-						err_type = "FileWrite error";
-					} else {
-						err_type = "Unknown error";
-					}
-					error_string += tokens[i].file->get_path() + "(" + itos(tokens[i].err) + ")\n";
-				}
-			}
-		}
 	} else {
-		for (int i = 0; i < files.size(); i++) {
-			if (files_to_extract.size() && !files_to_extract.has(files.get(i)->get_path())) {
-				continue;
-			}
-
+		auto ext = GDRESettings::get_singleton()->get_pack_type();
+		bool read_from_pack = ext == GDRESettings::PackInfo::PCK || ext == GDRESettings::PackInfo::EXE;
+		Ref<FileAccess> pack_f;
+		Vector<uint8_t> buffer;
+		buffer.resize(EXTRACT_BUFFER_SIZE);
+		for (int i = 0; i < tokens.size(); i++) {
 			if (pr) {
 				if (OS::get_singleton()->get_ticks_usec() - last_progress_upd > 20000) {
 					last_progress_upd = OS::get_singleton()->get_ticks_usec();
-					bool cancel = pr->step(files.get(i)->get_path(), i, true);
+					bool cancel = pr->step(paths_to_extract[i], i, true);
 					if (cancel) {
 						return ERR_PRINTER_ON_FIRE;
 					}
 				}
 			}
-			Ref<FileAccess> pck_f = FileAccess::open(files.get(i)->get_path(), FileAccess::READ, &err);
-			if (pck_f.is_null()) {
-				error_string += files.get(i)->get_path() + " (FileAccess error)\n";
-				continue;
+			ExtractToken &token = tokens.write[i];
+			token.err = _extract_file(token, read_from_pack, pack_f, buffer);
+			if (token.err != OK) {
+				broken_cnt++;
 			}
-			String target_name = dir.path_join(files.get(i)->get_path().replace("res://", ""));
-			gdre::ensure_dir(target_name.get_base_dir());
-			Ref<FileAccess> fa = FileAccess::open(target_name, FileAccess::WRITE);
-			if (fa.is_null()) {
-				error_string += files.get(i)->get_path() + " (FileWrite error)\n";
-				continue;
-			}
-
-			int64_t rq_size = files.get(i)->get_size();
-			uint8_t buf[16384];
-			while (rq_size > 0) {
-				int got = pck_f->get_buffer(buf, MIN(16384, rq_size));
-				fa->store_buffer(buf, got);
-				rq_size -= 16384;
+			last_completed++;
+		}
+	}
+	if (err == ERR_PRINTER_ON_FIRE) {
+		return err;
+	}
+	int files_extracted = last_completed + 1;
+	int md5_verified = 0;
+	int md5_encrypted = 0;
+	int md5_failed = 0;
+	for (int i = 0; i < tokens.size(); i++) {
+		if (tokens[i].err == OK && tokens[i].file->has_md5()) {
+			if (tokens[i].file->is_encrypted()) {
+				md5_encrypted++;
+			} else {
+				md5_verified++;
 			}
-			fa->flush();
-			files_extracted++;
-			if (files.get(i)->is_malformed() && files.get(i)->get_raw_path() != files.get(i)->get_path()) {
-				print_line("Warning: " + files.get(i)->get_raw_path() + " is a malformed path!\nSaving to " + files.get(i)->get_path() + " instead.");
+		}
+	}
+	if (broken_cnt > 0) {
+		for (int i = 0; i < tokens.size(); i++) {
+			if (tokens[i].err != OK) {
+				String err_type;
+				if (tokens[i].err == ERR_FILE_CANT_OPEN) {
+					err_type = "FileAccess error";
+				} else if (tokens[i].err == ERR_CANT_CREATE) {
+					err_type = "FileCreate error";
+				} else if (tokens[i].err == ERR_FILE_CANT_WRITE) {
+					err_type = "FileWrite error";
+				} else if (tokens[i].err == ERR_FILE_CANT_READ) {
+					err_type = "FileRead error";
+				} else if (tokens[i].err == ERR_FILE_CORRUPT) {
+					err_type = "MD5 mismatch";
+					md5_failed++;
+				} else {
+					err_type = "Unknown error";
+				}
+				error_string += tokens[i].file->get_path() + " (" + err_type + ")\n";
 			}
-			print_verbose("Extracted " + target_name);
 		}
 	}
 
@@ -315,6 +401,15 @@ Error PckDumper::_pck_dump_to_dir(
 		print_line("Extracted " + itos(files_extracted) + " files, no errors detected!");
 		//show_warning(RTR("No errors detected."), RTR("Read PCK"), RTR("The operation completed successfully!"));
 	}
+	if (should_check_md5) {
+		print_line("Verified " + itos(md5_verified) + " files, " + itos(md5_failed) + " failed, " + itos(md5_encrypted) + " encrypted (checked on decryption), " + itos(skipped_cnt) + " skipped (MD5 hash entry was empty)");
+		if (md5_failed > 0 && !skip_failed_md5) {
+			print_line("Files that failed the MD5 check were not kept");
+		}
+		if (md5_failed > 0) {
+			return ERR_BUG;
+		}
+	}
 	return OK;
 }
 
@@ -322,5 +417,9 @@ void PckDumper::_bind_methods() {
 	ClassDB::bind_method(D_METHOD("check_md5_all_files"), &PckDumper::check_md5_all_files);
 	ClassDB::bind_method(D_METHOD("pck_dump_to_dir", "dir", "files_to_extract"), &PckDumper::pck_dump_to_dir, DEFVAL(Vector<String>()));
 	ClassDB::bind_method(D_METHOD("set_multi_thread", "multi_thread"), &PckDumper::set_multi_thread);
+	ClassDB::bind_method(D_METHOD("set_check_md5_on_extract", "check_md5"), &PckDumper::set_check_md5_on_extract);
+	ClassDB::bind_method(D_METHOD("is_check_md5_on_extract"), &PckDumper::is_check_md5_on_extract);
+	ClassDB::bind_method(D_METHOD("set_skip_failed_md5", "skip_failed_md5"), &PckDumper::set_skip_failed_md5);
+	ClassDB::bind_method(D_METHOD("is_skip_failed_md5"), &PckDumper::is_skip_failed_md5);
 	//ClassDB::bind_method(D_METHOD("get_dumped_files"), &PckDumper::get_dumped_files);
 }
@@ -27,7 +27,17 @@ class PckDumper : public RefCounted {
 		String output_dir;
 		Error err = OK;
 	};
-	void _do_extract(uint32_t i, ExtractToken *tokens);
+	// A run of tokens, in pack offset order, that one worker extracts with one pack handle and one buffer
+	struct ExtractChunk {
+		ExtractToken *tokens = nullptr;
+		int64_t start = 0;
+		int64_t end = 0;
+	};
+	struct ExtractTokenOffsetOrder {
+		bool operator()(const ExtractToken &a, const ExtractToken &b) const;
+	};
+	Error _extract_file(ExtractToken &token, bool read_from_pack, Ref<FileAccess> &r_pack_f, Vector<uint8_t> &r_buffer);
+	void _do_extract(uint32_t i, ExtractChunk *chunks);
 	Error wait_for_task(WorkerThreadPool::GroupID group_task, const Vector<String> &paths_to_check, EditorProgressGDDC *pr);
 
 protected:
@@ -41,6 +51,12 @@ public:
 	Error pck_dump_to_dir(const String &dir, const Vector<String> &files_to_extract);
 
 	void set_multi_thread(bool multi_thread) { opt_multi_thread = multi_thread; }
+	// Verify the MD5 of each file while extracting it, instead of reading the pack again in `check_md5_all_files`
+	void set_check_md5_on_extract(bool check_md5) { should_check_md5 = check_md5; }
+	bool is_check_md5_on_extract() const { return should_check_md5; }
+	// When checking MD5s on extract, keep the files that fail the check instead of deleting them (they're still reported)
+	void set_skip_failed_md5(bool p_skip) { skip_failed_md5 = p_skip; }
+	bool is_skip_failed_md5() const { return skip_failed_md5; }
 	//Error pck_dump_to_dir(const String &dir, const Vector<String> &files_to_extract);
 };
 
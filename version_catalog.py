@@ -0,0 +1,280 @@
+"""An indexed view of the revisions in `misc/bytecode_versions.json`, for the generator and the other tools.
+
+The records are built once from the parsed catalogue, and looking a revision up by commit, bytecode version,
+engine version, token or built-in function name doesn't scan the list of revisions. The token and function
+differences between any two revisions are computed on first use and kept:
+
+    python3 version_catalog.py diff 3.1.0 3.5.0
+    python3 version_catalog.py with-token TK_PR_AWAIT
+    python3 version_catalog.py with-function lerp
+    python3 version_catalog.py show 5565f55
+
+A revision can be given by its commit (`5565f55`) or by an engine version (`3.5.0`), which is resolved the same way
+as `GDScriptDecomp::create_decomp_for_version`.
+"""
+
+import argparse
+import bisect
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from bytecode_generator import BytecodeClass, get_function_entries, our_dir, parse_version_number, read_bytecode_json
+
+VersionNumber = tuple[int, int, int, int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class RevisionRecord:
+    """One revision of the catalogue; the token and function names are in bytecode order."""
+
+    rev: str
+    rev_num: int
+    bytecode_version: int
+    date: str
+    engine_version: str
+    max_engine_version: str
+    min_number: VersionNumber
+    engine_ver_major: int
+    variant_ver_major: int
+    parent: str
+    is_dev: bool
+    tokens: tuple[str, ...]
+    functions: tuple[str, ...]
+    # (min_args, max_args) of each function; `max_args` is "INT_MAX" for varargs
+    arities: tuple[tuple[int, int | str], ...]
+
+    @classmethod
+    def from_bytecode_class(cls, bytecode_class: BytecodeClass) -> "RevisionRecord":
+        entries = get_function_entries(bytecode_class)
+        return cls(
+            rev=bytecode_class.bytecode_rev,
+            rev_num=int(bytecode_class.bytecode_rev, 16),
+            bytecode_version=bytecode_class.bytecode_version,
+            date=bytecode_class.date,
+            engine_version=bytecode_class.engine_version,
+            max_engine_version=bytecode_class.max_engine_version,
+            min_number=parse_version_number(bytecode_class.engine_version),
+            engine_ver_major=bytecode_class.engine_ver_major,
+            variant_ver_major=bytecode_class.variant_ver_major,
+            parent=bytecode_class.parent,
+            is_dev=bytecode_class.is_dev,
+            tokens=tuple(bytecode_class.tk_names),
+            functions=tuple(name for name, _ in entries),
+            arities=tuple(arity for _, arity in entries),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class RevisionDiff:
+    """What changed in the tokens and built-in functions going from revision `from_rev` to `to_rev`."""
+
+    from_rev: str
+    to_rev: str
+    added_tokens: tuple[str, ...]
+    removed_tokens: tuple[str, ...]
+    # (name, old ID, new ID) of the tokens both revisions have, but under a different ID
+    renumbered_tokens: tuple[tuple[str, int, int], ...]
+    added_functions: tuple[str, ...]
+    removed_functions: tuple[str, ...]
+    renumbered_functions: tuple[tuple[str, int, int], ...]
+    # (name, old arity, new arity)
+    arity_changed: tuple[tuple[str, tuple, tuple], ...]
+
+    @property
+    def is_empty(self) -> bool:
+        return not (
+            self.added_tokens
+            or self.removed_tokens
+            or self.renumbered_tokens
+            or self.added_functions
+            or self.removed_functions
+            or self.renumbered_functions
+            or self.arity_changed
+        )
+
+    def to_json(self) -> dict:
+        return {
+            "from": self.from_rev,
+            "to": self.to_rev,
+            "added_tokens": list(self.added_tokens),
+            "removed_tokens": list(self.removed_tokens),
+            "renumbered_tokens": [list(entry) for entry in self.renumbered_tokens],
+            "added_functions": list(self.added_functions),
+            "removed_functions": list(self.removed_functions),
+            "renumbered_functions": [list(entry) for entry in self.renumbered_functions],
+            "arity_changed": [[name, list(old), list(new)] for name, old, new in self.arity_changed],
+        }
+
+
+def _diff_names(old: tuple[str, ...], new: tuple[str, ...]):
+    old_ids = {name: i for i, name in enumerate(old)}
+    new_ids = {name: i for i, name in enumerate(new)}
+    added = tuple(name for name in new if name not in old_ids)
+    removed = tuple(name for name in old if name not in new_ids)
+    renumbered = tuple((name, old_ids[name], i) for i, name in enumerate(new) if old_ids.get(name, i) != i)
+    return added, removed, renumbered
+
+
+class VersionCatalog:
+    """The revisions of `misc/bytecode_versions.json`, indexed by commit, bytecode version, engine version and name."""
+
+    def __init__(self, bytecode_classes: list[BytecodeClass]):
+        # same order as the JSON file and `decomp_versions`
+        self.records = tuple(RevisionRecord.from_bytecode_class(bytecode_class) for bytecode_class in bytecode_classes)
+        self._by_rev: dict[str, RevisionRecord] = {}
+        self._by_rev_num: dict[int, RevisionRecord] = {}
+        by_bytecode_version: dict[int, list[RevisionRecord]] = {}
+        by_token: dict[str, list[RevisionRecord]] = {}
+        by_function: dict[str, list[RevisionRecord]] = {}
+        for record in self.records:
+            self._by_rev[record.rev] = record
+            self._by_rev_num[record.rev_num] = record
+            by_bytecode_version.setdefault(record.bytecode_version, []).append(record)
+            for name in record.tokens:
+                by_token.setdefault(name, []).append(record)
+            for name in record.functions:
+                by_function.setdefault(name, []).append(record)
+        self._by_bytecode_version = {key: tuple(value) for key, value in by_bytecode_version.items()}
+        self._by_token = {key: tuple(value) for key, value in by_token.items()}
+        self._by_function = {key: tuple(value) for key, value in by_function.items()}
+        # the non-dev revisions sorted by minimum version, like `decomp_version_intervals`
+        intervals = sorted((record.min_number, i) for i, record in enumerate(self.records) if not record.is_dev)
+        self._interval_keys = [min_number for min_number, _ in intervals]
+        self._interval_records = [self.records[i] for _, i in intervals]
+        self._resolved: dict[str, RevisionRecord] = {}
+        self._diffs: dict[tuple[str, str], RevisionDiff] = {}
+
+    @classmethod
+    def load(cls, path: Path = our_dir / "misc" / "bytecode_versions.json", use_cache: bool = True) -> "VersionCatalog":
+        return cls(read_bytecode_json(path, use_cache))
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def get(self, rev: str | int) -> RevisionRecord | None:
+        """The revision with the commit `rev`, given as a hex string or a number, or None."""
+        if isinstance(rev, int):
+            return self._by_rev_num.get(rev)
+        record = self._by_rev.get(rev.lower())
+        if record is None:
+            try:
+                record = self._by_rev_num.get(int(rev, 16))
+            except ValueError:
+                pass
+        return record
+
+    def with_bytecode_version(self, bytecode_version: int) -> tuple[RevisionRecord, ...]:
+        return self._by_bytecode_version.get(bytecode_version, ())
+
+    def with_token(self, name: str) -> tuple[RevisionRecord, ...]:
+        """The revisions that have the token `name` (`TK_...`), in catalogue order."""
+        return self._by_token.get(name, ())
+
+    def with_function(self, name: str) -> tuple[RevisionRecord, ...]:
+        """The revisions that have the built-in function `name`, in catalogue order."""
+        return self._by_function.get(name, ())
+
+    def for_engine_version(self, version: str | VersionNumber) -> RevisionRecord | None:
+        """The non-dev revision that `find_decomp_version_index` picks for `version`, or None."""
+        number = parse_version_number(version) if isinstance(version, str) else version
+        i = bisect.bisect_right(self._interval_keys, number)
+        if i == 0:
+            return None
+        record = self._interval_records[i - 1]
+        if record.min_number[0] != number[0]:
+            return None
+        return record
+
+    def resolve(self, spec: str) -> RevisionRecord:
+        """A revision by commit or by engine version; raises KeyError if neither matches."""
+        record = self._resolved.get(spec)
+        if record is not None:
+            return record
+        record = self.get(spec)
+        if record is None and "." in spec:
+            try:
+                record = self.for_engine_version(spec)
+            except Exception:
+                record = None
+        if record is None:
+            raise KeyError("No revision for " + spec)
+        self._resolved[spec] = record
+        return record
+
+    def diff(self, from_rev: str | RevisionRecord, to_rev: str | RevisionRecord) -> RevisionDiff:
+        """The token and function differences from `from_rev` to `to_rev`, which don't have to be parent and child."""
+        old = from_rev if isinstance(from_rev, RevisionRecord) else self.resolve(from_rev)
+        new = to_rev if isinstance(to_rev, RevisionRecord) else self.resolve(to_rev)
+        diff = self._diffs.get((old.rev, new.rev))
+        if diff is not None:
+            return diff
+        added_tokens, removed_tokens, renumbered_tokens = _diff_names(old.tokens, new.tokens)
+        added_functions, removed_functions, renumbered_functions = _diff_names(old.functions, new.functions)
+        old_arities = dict(zip(old.functions, old.arities))
+        arity_changed = tuple(
+            (name, old_arities[name], arity)
+            for name, arity in zip(new.functions, new.arities)
+            if name in old_arities and old_arities[name] != arity
+        )
+        diff = RevisionDiff(
+            old.rev,
+            new.rev,
+            added_tokens,
+            removed_tokens,
+            renumbered_tokens,
+            added_functions,
+            removed_functions,
+            renumbered_functions,
+            arity_changed,
+        )
+        self._diffs[(old.rev, new.rev)] = diff
+        return diff
+
+
+def _record_to_json(record: RevisionRecord) -> dict:
+    return {
+        "rev": record.rev,
+        "bytecode_version": record.bytecode_version,
+        "engine_version": record.engine_version,
+        "max_engine_version": record.max_engine_version,
+        "is_dev": record.is_dev,
+        "parent": record.parent,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--no-cache", action="store_true", help="don't use the parsed catalogue's cache")
+    commands = parser.add_subparsers(dest="command", required=True)
+    diff_parser = commands.add_parser("diff", help="token and function changes between two revisions")
+    diff_parser.add_argument("from_rev", help="commit or engine version")
+    diff_parser.add_argument("to_rev", help="commit or engine version")
+    commands.add_parser("with-token", help="revisions that have a token").add_argument("name", help="e.g. TK_PR_AWAIT")
+    commands.add_parser("with-function", help="revisions that have a built-in function").add_argument("name")
+    commands.add_parser("show", help="a revision's details").add_argument("rev", help="commit or engine version")
+    args = parser.parse_args()
+
+    catalog = VersionCatalog.load(use_cache=not args.no_cache)
+    try:
+        if args.command == "diff":
+            result = catalog.diff(args.from_rev, args.to_rev).to_json()
+        elif args.command == "with-token":
+            result = [_record_to_json(record) for record in catalog.with_token(args.name)]
+        elif args.command == "with-function":
+            result = [_record_to_json(record) for record in catalog.with_function(args.name)]
+        else:
+            record = catalog.resolve(args.rev)
+            result = dict(_record_to_json(record), tokens=list(record.tokens), functions=list(record.functions))
+    except KeyError as e:
+        print(e.args[0], file=sys.stderr)
+        sys.exit(1)
+    print(json.dumps(result, indent=1))
+
+
+if __name__ == "__main__":
+    main()